@@ -0,0 +1,21 @@
+"""
+Módulo de flota de sensores para ISSE_Simuladores.
+
+Simula muchos sensores independientes desde un único proceso, con
+temporización y pipeline de envío compartidos.
+
+Clases disponibles:
+    - SensorStream: Definición de un sensor (fuente, destino e intervalo).
+    - SensorFleet: Ejecuta la flota sobre una TimerWheel y un SendExecutor.
+    - SensorStats: Contadores y tasa de un sensor.
+    - FleetReport: Contadores por sensor y agregados de la flota.
+"""
+
+from .sensor_fleet import FleetReport, SensorFleet, SensorStats, SensorStream
+
+__all__ = [
+    "SensorStream",
+    "SensorFleet",
+    "SensorStats",
+    "FleetReport",
+]
@@ -0,0 +1,359 @@
+"""
+Flota de sensores simulados ejecutada desde un único proceso.
+
+Permite simular cientos o miles de sensores independientes (cada uno con
+su fuente de valores, destino e intervalo) compartiendo una rueda de
+temporizadores y un pipeline de envío, en lugar de lanzar un proceso
+por sensor.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from compartido.networking import (
+    ConnectionPool,
+    DropPolicy,
+    EphemeralSocketClient,
+    SendExecutor,
+)
+from compartido.scheduling import PeriodicScheduler, TimerWheel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SensorStream:
+    """
+    Definición de un sensor simulado.
+
+    Attributes:
+        name: Identificador único del sensor en la flota.
+        host: Dirección del servidor destino.
+        port: Puerto del servidor destino.
+        interval: Periodo de envío en segundos.
+        source: Función que recibe los segundos transcurridos desde el
+            inicio de la flota y retorna el valor a enviar.
+        decimals: Decimales con que se formatea el valor.
+    """
+
+    name: str
+    host: str
+    port: int
+    interval: float
+    source: Callable[[float], float]
+    decimals: int = 2
+
+
+@dataclass(frozen=True)
+class SensorStats:
+    """
+    Contadores de un sensor de la flota.
+
+    Attributes:
+        name: Identificador del sensor.
+        generated: Valores generados.
+        sent: Valores enviados con éxito.
+        failed: Envíos fallidos.
+        coalesced: Valores reemplazados por uno más reciente antes de enviarse.
+        source_errors: Ticks en que la fuente lanzó una excepción.
+        rate: Envíos exitosos por segundo.
+    """
+
+    name: str
+    generated: int
+    sent: int
+    failed: int
+    coalesced: int
+    source_errors: int
+    rate: float
+
+
+@dataclass(frozen=True)
+class FleetReport:
+    """
+    Resumen de la flota: contadores por sensor y agregados.
+
+    Attributes:
+        elapsed: Segundos de ejecución.
+        sensors: Contadores de cada sensor.
+        generated: Total de valores generados.
+        sent: Total de envíos exitosos.
+        failed: Total de envíos fallidos.
+        coalesced: Total de valores reemplazados.
+        source_errors: Total de ticks con error en la fuente.
+        rate: Envíos exitosos por segundo de toda la flota.
+    """
+
+    elapsed: float
+    sensors: List[SensorStats]
+    generated: int
+    sent: int
+    failed: int
+    coalesced: int
+    source_errors: int
+    rate: float
+
+
+class _SensorState:
+    """
+    Estado mutable de un sensor (contadores y cliente).
+
+    `pending` es el número de valor (según `generated`) cuyo envío está en
+    cola, o None si no hay ninguno.
+    """
+
+    __slots__ = ("stream", "client", "task_id", "pending",
+                 "generated", "sent", "failed", "coalesced", "source_errors")
+
+    def __init__(self, stream: SensorStream, client: EphemeralSocketClient):
+        self.stream = stream
+        self.client = client
+        self.task_id: Optional[int] = None
+        self.pending: Optional[int] = None
+        self.generated = 0
+        self.sent = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.source_errors = 0
+
+
+class SensorFleet:
+    """
+    Ejecuta una flota de sensores con temporización y envío compartidos.
+
+    Responsabilidad: Programar cada sensor en una única rueda de
+    temporizadores (un hilo) y delegar los envíos a un SendExecutor
+    acotado compartido con política COALESCE_LATEST por sensor: si un
+    envío aún está en cola cuando llega el siguiente valor, se reemplaza
+    y se cuenta como `coalesced`. Como hay a lo sumo un envío en cola
+    por sensor, la profundidad de la cola debe ser al menos la cantidad
+    de sensores. Si el ejecutor descarta el envío en cola de un sensor
+    sin ejecutarlo (p.ej. uno compartido con DROP_OLDEST), el valor se
+    cuenta como `failed`.
+
+    Example:
+        >>> fleet = SensorFleet()
+        >>> fleet.add(SensorStream("sala1", "127.0.0.1", 12000, 1.0,
+        ...                        variacion.calcular_temperatura))
+        >>> fleet.run(duration=60.0)
+        >>> fleet.report().rate
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_QUEUE_DEPTH = 4096
+
+    def __init__(
+        self,
+        streams: Iterable[SensorStream] = (),
+        scheduler: Optional[Union[TimerWheel, PeriodicScheduler]] = None,
+        executor: Optional[SendExecutor] = None,
+        pool: Optional[ConnectionPool] = None
+    ):
+        """
+        Inicializa la flota.
+
+        Args:
+            streams: Sensores iniciales.
+            scheduler: Planificador compartido. Por defecto, una TimerWheel.
+            executor: Pipeline de envío compartido. Por defecto, uno
+                propio con política COALESCE_LATEST.
+            pool: Pool keep-alive para los clientes (opcional).
+        """
+        self._scheduler = scheduler or TimerWheel()
+        self._executor = executor or SendExecutor(
+            max_workers=self.DEFAULT_MAX_WORKERS,
+            queue_depth=self.DEFAULT_QUEUE_DEPTH,
+            policy=DropPolicy.COALESCE_LATEST,
+        )
+        self._pool = pool
+        self._sensors: Dict[str, _SensorState] = {}
+        self._lock = threading.Lock()
+        self._active = False
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+        for stream in streams:
+            self.add(stream)
+
+    @property
+    def scheduler(self) -> Union[TimerWheel, PeriodicScheduler]:
+        """Planificador compartido por los sensores."""
+        return self._scheduler
+
+    @property
+    def executor(self) -> SendExecutor:
+        """Pipeline de envío compartido."""
+        return self._executor
+
+    def __len__(self) -> int:
+        """Cantidad de sensores en la flota."""
+        return len(self._sensors)
+
+    def add(self, stream: SensorStream) -> None:
+        """
+        Agrega un sensor a la flota.
+
+        Si la flota ya está en ejecución, el sensor empieza a enviar en
+        su próximo intervalo.
+
+        Args:
+            stream: Definición del sensor.
+
+        Raises:
+            ValueError: Si ya existe un sensor con el mismo nombre.
+        """
+        client = EphemeralSocketClient(stream.host, stream.port, pool=self._pool)
+        state = _SensorState(stream, client)
+        with self._lock:
+            if stream.name in self._sensors:
+                raise ValueError(f"Sensor duplicado: {stream.name}")
+            self._sensors[stream.name] = state
+        if self._active:
+            self._schedule(state)
+
+    def start(self) -> None:
+        """Programa todos los sensores; no bloquea (ver `run()`)."""
+        if self._active:
+            return
+        self._active = True
+        self._started_at = time.monotonic()
+        self._stopped_at = None
+        with self._lock:
+            states = list(self._sensors.values())
+        for state in states:
+            self._schedule(state)
+
+    def run(self, duration: Optional[float] = None) -> FleetReport:
+        """
+        Inicia la flota y bloquea hasta `duration` o `stop()`.
+
+        Args:
+            duration: Segundos de ejecución. None = hasta detener.
+
+        Returns:
+            Reporte final de la flota.
+        """
+        self.start()
+        try:
+            self._scheduler.run(duration=duration)
+        finally:
+            self._unschedule_all()
+        return self.report()
+
+    def stop(self) -> None:
+        """Detiene la rueda de temporizadores (retorna sin esperar)."""
+        self._scheduler.stop()
+
+    def report(self) -> FleetReport:
+        """
+        Retorna los contadores por sensor y agregados.
+
+        Returns:
+            FleetReport con tasas calculadas sobre el tiempo de ejecución.
+        """
+        elapsed = self._elapsed()
+        with self._lock:
+            sensors = [
+                SensorStats(
+                    name=name,
+                    generated=state.generated,
+                    sent=state.sent,
+                    failed=state.failed,
+                    coalesced=state.coalesced,
+                    source_errors=state.source_errors,
+                    rate=state.sent / elapsed if elapsed > 0 else 0.0,
+                )
+                for name, state in self._sensors.items()
+            ]
+
+        sent = sum(s.sent for s in sensors)
+        return FleetReport(
+            elapsed=elapsed,
+            sensors=sensors,
+            generated=sum(s.generated for s in sensors),
+            sent=sent,
+            failed=sum(s.failed for s in sensors),
+            coalesced=sum(s.coalesced for s in sensors),
+            source_errors=sum(s.source_errors for s in sensors),
+            rate=sent / elapsed if elapsed > 0 else 0.0,
+        )
+
+    # --- Ciclo de cada sensor (privado) ---
+
+    def _elapsed(self) -> float:
+        """Segundos transcurridos desde `start()`."""
+        if self._started_at is None:
+            return 0.0
+        end = self._stopped_at if self._stopped_at is not None else time.monotonic()
+        return end - self._started_at
+
+    def _schedule(self, state: _SensorState) -> None:
+        """Programa el sensor en la rueda."""
+        state.task_id = self._scheduler.schedule(
+            state.stream.interval, lambda: self._on_tick(state)
+        )
+
+    def _unschedule_all(self) -> None:
+        """Cancela todos los sensores y congela el tiempo de ejecución."""
+        with self._lock:
+            states = list(self._sensors.values())
+        for state in states:
+            if state.task_id is not None:
+                self._scheduler.cancel(state.task_id)
+                state.task_id = None
+        self._stopped_at = time.monotonic()
+        self._active = False
+
+    def _on_tick(self, state: _SensorState) -> None:
+        """Genera el valor del sensor y encola su envío (hilo de la rueda)."""
+        stream = state.stream
+        try:
+            value = stream.source(time.monotonic() - self._started_at)
+            message = f"{value:.{stream.decimals}f}"
+        except Exception:  # pylint: disable=broad-except
+            # Una fuente que falla no debe detener la rueda (ni a los
+            # demás sensores): se cuenta y se reintenta en el próximo tick
+            with self._lock:
+                state.source_errors += 1
+                first = state.source_errors == 1
+            if first:
+                logger.exception("Sensor %s: error en la fuente de valores", stream.name)
+            else:
+                logger.debug("Sensor %s: error en la fuente de valores", stream.name)
+            return
+
+        with self._lock:
+            state.generated += 1
+            if state.pending is not None:
+                state.coalesced += 1
+            number = state.pending = state.generated
+
+        accepted = self._executor.submit(
+            lambda: self._send(state, number, message),
+            key=stream.name,
+            on_drop=lambda: self._on_dropped(state, number),
+        )
+        if not accepted:
+            self._on_dropped(state, number)
+
+    def _on_dropped(self, state: _SensorState, number: int) -> None:
+        """Cuenta como fallido un valor descartado sin enviarse."""
+        with self._lock:
+            # Si otro valor ya lo reemplazó en la cola, fue coalescido
+            if state.pending == number:
+                state.pending = None
+                state.failed += 1
+
+    def _send(self, state: _SensorState, number: int, message: str) -> None:
+        """Envía el último valor del sensor (hilo trabajador)."""
+        with self._lock:
+            if state.pending == number:
+                state.pending = None
+        ok = state.client.send(message)
+        with self._lock:
+            if ok:
+                state.sent += 1
+            else:
+                state.failed += 1
@@ -9,18 +9,50 @@ Clases disponibles:
     - PersistentSocketClient: Para conexiones de larga duración.
     - EphemeralSocketClient: Para conexiones efímeras (fire-and-forget).
     - BaseSocketClient: Alias de PersistentSocketClient (compatibilidad).
+    - ConnectionPool: Pool de conexiones keep-alive por (host, puerto).
+    - SendExecutor: Hilos trabajadores acotados para envíos asíncronos.
 
     Servidores:
     - SocketServerBase: Clase base abstracta para servidores.
     - ClientSession: Maneja comunicación con un cliente individual.
     - BaseSocketServer: Servidor TCP con soporte multi-cliente.
+    - SelectorSocketServer: Servidor multi-cliente con un único hilo de E/S.
+
+    Captura de tráfico:
+    - TrafficRecorder: Log binario rotado de los mensajes recibidos.
+    - TrafficRecorderStats: Contadores del grabador.
+    - TrafficRecord: Mensaje capturado (timestamp, cliente, datos).
+    - TrafficLogReader: Lector perezoso de un log de tráfico.
+
+    Delimitación de mensajes:
+    - MessageFramer: Protocolo para delimitadores de mensajes.
+    - RawFramer: Cada chunk recibido es un mensaje (por defecto).
+    - NewlineFramer: Mensajes delimitados por salto de línea.
+    - LengthPrefixedFramer: Mensajes precedidos por su longitud.
+    - JsonObjectFramer: Mensajes delimitados por objetos JSON.
 """
 from .socket_client_base import SocketClientBase
 from .persistent_socket_client import PersistentSocketClient
+from .connection_pool import ConnectionPool
+from .send_executor import SendExecutor, SendExecutorStats, DropPolicy
 from .ephemeral_socket_client import EphemeralSocketClient
+from .message_framer import (
+    MessageFramer,
+    RawFramer,
+    NewlineFramer,
+    LengthPrefixedFramer,
+    JsonObjectFramer,
+)
+from .traffic_recorder import (
+    TrafficRecorder,
+    TrafficRecorderStats,
+    TrafficRecord,
+    TrafficLogReader,
+)
 from .socket_server_base import SocketServerBase
 from .client_session import ClientSession
 from .base_socket_server import BaseSocketServer
+from .selector_socket_server import SelectorSocketServer
 
 # Alias para compatibilidad hacia atrás
 BaseSocketClient = PersistentSocketClient
@@ -31,8 +63,24 @@ __all__ = [
     "PersistentSocketClient",
     "EphemeralSocketClient",
     "BaseSocketClient",
+    "ConnectionPool",
+    "SendExecutor",
+    "SendExecutorStats",
+    "DropPolicy",
     # Servidores
     "SocketServerBase",
     "ClientSession",
     "BaseSocketServer",
+    "SelectorSocketServer",
+    # Captura de tráfico
+    "TrafficRecorder",
+    "TrafficRecorderStats",
+    "TrafficRecord",
+    "TrafficLogReader",
+    # Delimitación de mensajes
+    "MessageFramer",
+    "RawFramer",
+    "NewlineFramer",
+    "LengthPrefixedFramer",
+    "JsonObjectFramer",
 ]
@@ -29,7 +29,7 @@ class BaseSocketServer(SocketServerBase):
         stopped: Emitida cuando el servidor se detiene.
         client_connected: Emitida cuando un cliente conecta (str: dirección).
         client_disconnected: Emitida cuando un cliente desconecta (str: dirección).
-        data_received: Emitida cuando se reciben datos (str: datos).
+        data_received: Emitida por cada mensaje recibido (str: datos).
         error_occurred: Emitida cuando ocurre un error (str: mensaje).
 
     Example:
@@ -199,7 +199,9 @@ class BaseSocketServer(SocketServerBase):
         Returns:
             Nueva instancia de ClientSession.
         """
-        return ClientSession(client_socket, client_addr)
+        return ClientSession(
+            client_socket, client_addr, framer=self._create_framer()
+        )
 
     def _register_session(self, session: ClientSession, client_addr: str) -> None:
         """Registra una sesión en el diccionario de sesiones activas."""
@@ -233,9 +235,9 @@ class BaseSocketServer(SocketServerBase):
             # Bucle de recepción manejado directamente para evitar
             # problemas de señales entre hilos
             while self.is_running() and session.is_active():
-                data = session.receive_once()
-                if data:
-                    self.data_received.emit(data)
+                for record in session.receive_records():
+                    self._record_message(client_addr, record)
+                    self.data_received.emit(record)
         finally:
             session.close()
             self._unregister_session(client_addr)
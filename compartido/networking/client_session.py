@@ -5,10 +5,12 @@ Encapsula la comunicación con un cliente individual conectado.
 Responsabilidad única: recibir datos de un cliente.
 """
 import socket
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .message_framer import MessageFramer, RawFramer
+
 
 class ClientSession(QObject):
     """
@@ -17,8 +19,12 @@ class ClientSession(QObject):
     Encapsula el socket del cliente y proporciona métodos para
     recibir datos. Emite señales cuando hay datos o errores.
 
+    Los bytes recibidos pasan por un MessageFramer que mantiene el
+    buffer de la sesión y entrega solo registros completos. Por defecto
+    se usa RawFramer (cada chunk de `recv()` es un registro).
+
     Signals:
-        data_received: Emitida cuando se reciben datos (str: datos).
+        data_received: Emitida por cada registro recibido (str: datos).
         disconnected: Emitida cuando el cliente se desconecta.
         error_occurred: Emitida cuando ocurre un error (str: mensaje).
 
@@ -40,7 +46,8 @@ class ClientSession(QObject):
         self,
         client_socket: socket.socket,
         address: str,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        framer: Optional[MessageFramer] = None
     ):
         """
         Inicializa la sesión del cliente.
@@ -49,11 +56,13 @@ class ClientSession(QObject):
             client_socket: Socket conectado del cliente.
             address: Dirección del cliente (ip:puerto).
             parent: Objeto padre de Qt (opcional).
+            framer: Delimitador de mensajes (RawFramer si None).
         """
         super().__init__(parent)
         self._socket = client_socket
         self._address = address
         self._active = True
+        self._framer = framer if framer is not None else RawFramer()
 
     @property
     def address(self) -> str:
@@ -69,18 +78,46 @@ class ClientSession(QObject):
         """
         return self._active
 
+    @property
+    def framer(self) -> MessageFramer:
+        """Retorna el delimitador de mensajes de la sesión."""
+        return self._framer
+
     def receive_once(self, timeout: Optional[float] = None) -> Optional[str]:
         """
         Intenta recibir datos una vez.
 
+        Con framers que delimitan mensajes, un mismo `recv()` puede
+        completar varios registros; en ese caso se retornan unidos por
+        salto de línea. Usar `receive_records()` para obtenerlos por separado.
+
         Args:
             timeout: Tiempo máximo de espera (usa DEFAULT_TIMEOUT si None).
 
         Returns:
-            Datos recibidos como string, o None si timeout/error.
+            Datos recibidos como string, o None si timeout/error/sin registros.
         """
-        if not self._active:
+        records = self.receive_records(timeout)
+        if not records:
             return None
+        return "\n".join(records)
+
+    def receive_records(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Recibe datos una vez y retorna los registros completos.
+
+        Emite `data_received` por cada registro. Los bytes de un
+        registro incompleto quedan en el buffer del framer hasta
+        el próximo `recv()`.
+
+        Args:
+            timeout: Tiempo máximo de espera (usa DEFAULT_TIMEOUT si None).
+
+        Returns:
+            Lista de registros decodificados (vacía si timeout/error).
+        """
+        if not self._active:
+            return []
 
         try:
             self._socket.settimeout(timeout or self.DEFAULT_TIMEOUT)
@@ -90,26 +127,46 @@ class ClientSession(QObject):
                 # Cliente cerró la conexión
                 self._active = False
                 self.disconnected.emit()
-                return None
+                return []
 
-            decoded = data.decode(self.ENCODING).strip()
-            if decoded:
-                self.data_received.emit(decoded)
-            return decoded
+            return self._decode_records(self._framer.feed(data))
 
         except socket.timeout:
             # Timeout normal, no es error
-            return None
+            return []
 
-        except UnicodeDecodeError as e:
-            self.error_occurred.emit(f"Error decodificando datos: {e}")
-            return None
+        except ValueError as e:
+            # Flujo inválido para el framer (el buffer ya fue descartado)
+            self.error_occurred.emit(f"Error delimitando mensaje: {e}")
+            return []
 
         except OSError as e:
             self._active = False
             self.error_occurred.emit(f"Error de socket: {e}")
             self.disconnected.emit()
-            return None
+            return []
+
+    def _decode_records(self, raw_records: List[bytes]) -> List[str]:
+        """
+        Decodifica registros y emite data_received por cada uno.
+
+        Args:
+            raw_records: Registros en bytes entregados por el framer.
+
+        Returns:
+            Registros decodificados no vacíos.
+        """
+        records = []
+        for raw in raw_records:
+            try:
+                decoded = raw.decode(self.ENCODING).strip()
+            except UnicodeDecodeError as e:
+                self.error_occurred.emit(f"Error decodificando datos: {e}")
+                continue
+            if decoded:
+                records.append(decoded)
+                self.data_received.emit(decoded)
+        return records
 
     def run_receive_loop(self, should_continue: Callable[[], bool]) -> None:
         """
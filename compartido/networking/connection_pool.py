@@ -0,0 +1,250 @@
+"""
+Pool de conexiones TCP keep-alive para clientes de envío.
+
+Reutiliza sockets ya conectados por destino (host, puerto) para evitar
+el handshake TCP y la acumulación de sockets en TIME_WAIT cuando se
+envían valores a intervalos cortos.
+"""
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class _IdleConnection:
+    """Socket conectado a la espera de ser reutilizado."""
+
+    sock: socket.socket
+    released_at: float
+
+
+class ConnectionPool:
+    """
+    Pool thread-safe de sockets TCP conectados, agrupados por destino.
+
+    Responsabilidad: Entregar un socket conectado para (host, puerto),
+    reutilizando uno ocioso cuando está sano y creando uno nuevo en
+    caso contrario.
+
+    Políticas:
+        - Desalojo por inactividad: los sockets ociosos más antiguos
+          que `idle_timeout` se cierran al consultarse el destino o al
+          llamar a `evict_idle()`.
+        - Health check: antes de reutilizar un socket se verifica, sin
+          bloquear, que el par no lo haya cerrado.
+        - Límite por destino: como máximo `max_idle_per_key` sockets
+          ociosos por destino; los sobrantes se cierran al liberarse.
+
+    Attributes:
+        created (int): Conexiones nuevas establecidas.
+        reused (int): Envíos servidos con una conexión reutilizada.
+        evicted (int): Conexiones cerradas por inactividad, fallas o exceso.
+
+    Example:
+        >>> pool = ConnectionPool.shared()
+        >>> client = EphemeralSocketClient("127.0.0.1", 12000, pool=pool)
+        >>> client.send("23.5")  # Reutiliza la conexión en envíos siguientes
+    """
+
+    DEFAULT_IDLE_TIMEOUT = 30.0
+    DEFAULT_MAX_IDLE_PER_KEY = 4
+
+    _shared: Optional["ConnectionPool"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_idle_per_key: int = DEFAULT_MAX_IDLE_PER_KEY
+    ):
+        """
+        Inicializa el pool.
+
+        Args:
+            idle_timeout: Segundos que un socket puede permanecer ocioso.
+            max_idle_per_key: Sockets ociosos máximos por destino.
+        """
+        self._idle_timeout = idle_timeout
+        self._max_idle_per_key = max_idle_per_key
+        self._idle: Dict[Tuple[str, int], List[_IdleConnection]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @classmethod
+    def shared(cls) -> "ConnectionPool":
+        """
+        Retorna el pool compartido por todo el proceso.
+
+        Returns:
+            Instancia única de ConnectionPool con parámetros por defecto.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        socket_factory: Callable[[], socket.socket]
+    ) -> Tuple[socket.socket, bool]:
+        """
+        Obtiene un socket conectado al destino.
+
+        El socket queda en uso exclusivo del llamador hasta que lo
+        devuelva con `release()` o lo descarte con `discard()`.
+
+        Args:
+            host: Dirección del servidor.
+            port: Puerto del servidor.
+            socket_factory: Crea un socket nuevo sin conectar.
+
+        Returns:
+            Tupla (socket, reutilizado). `reutilizado` es True si el
+            socket provino del pool.
+
+        Raises:
+            OSError: Si no se pudo establecer una conexión nueva.
+        """
+        key = (host, port)
+        now = time.monotonic()
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                entry = idle.pop() if idle else None
+            if entry is None:
+                break
+
+            expired = now - entry.released_at > self._idle_timeout
+            if not expired and self._is_healthy(entry.sock):
+                with self._lock:
+                    self.reused += 1
+                return entry.sock, True
+            self._close(entry.sock)
+
+        sock = socket_factory()
+        try:
+            sock.connect(key)
+        except OSError:
+            self._close(sock, count=False)
+            raise
+        with self._lock:
+            self.created += 1
+        return sock, False
+
+    def release(self, host: str, port: int, sock: socket.socket) -> None:
+        """
+        Devuelve un socket sano al pool para su reutilización.
+
+        Args:
+            host: Dirección del servidor.
+            port: Puerto del servidor.
+            sock: Socket obtenido con `acquire()`.
+        """
+        key = (host, port)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle_per_key:
+                idle.append(_IdleConnection(sock, time.monotonic()))
+                return
+        self._close(sock)
+
+    def discard(self, sock: socket.socket) -> None:
+        """
+        Cierra un socket que falló durante su uso.
+
+        Args:
+            sock: Socket obtenido con `acquire()`.
+        """
+        self._close(sock)
+
+    def evict_idle(self) -> int:
+        """
+        Cierra los sockets ociosos que superaron `idle_timeout`.
+
+        Returns:
+            Cantidad de sockets cerrados.
+        """
+        limite = time.monotonic() - self._idle_timeout
+        expired: List[socket.socket] = []
+        with self._lock:
+            for key, idle in self._idle.items():
+                expired.extend(e.sock for e in idle if e.released_at < limite)
+                self._idle[key] = [e for e in idle if e.released_at >= limite]
+
+        for sock in expired:
+            self._close(sock)
+        return len(expired)
+
+    def idle_count(self, host: Optional[str] = None,
+                   port: Optional[int] = None) -> int:
+        """
+        Retorna la cantidad de sockets ociosos.
+
+        Args:
+            host: Filtra por destino (junto con port). Si es None, cuenta todos.
+            port: Puerto del destino.
+
+        Returns:
+            Cantidad de sockets ociosos.
+        """
+        with self._lock:
+            if host is not None:
+                return len(self._idle.get((host, port), []))
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close_all(self) -> None:
+        """Cierra todos los sockets ociosos del pool."""
+        with self._lock:
+            entries = [e for idle in self._idle.values() for e in idle]
+            self._idle.clear()
+
+        for entry in entries:
+            self._close(entry.sock, count=False)
+
+    # --- Utilidades ---
+
+    @staticmethod
+    def _is_healthy(sock: socket.socket) -> bool:
+        """
+        Verifica sin bloquear que el par no haya cerrado la conexión.
+
+        Un `recv` con MSG_PEEK que retorna b"" indica FIN del par; datos
+        inesperados también invalidan el socket (protocolo solo de envío).
+
+        Args:
+            sock: Socket a verificar.
+
+        Returns:
+            True si el socket puede reutilizarse.
+        """
+        timeout = sock.gettimeout()
+        try:
+            sock.setblocking(False)
+            sock.recv(1, socket.MSG_PEEK)
+            return False
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            return False
+        finally:
+            try:
+                sock.settimeout(timeout)
+            except OSError:
+                pass
+
+    def _close(self, sock: socket.socket, count: bool = True) -> None:
+        """Cierra un socket ignorando errores."""
+        try:
+            sock.close()
+        except OSError:
+            pass
+        if count:
+            with self._lock:
+                self.evicted += 1
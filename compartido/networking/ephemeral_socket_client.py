@@ -3,13 +3,17 @@ Cliente TCP para conexiones efímeras con integración PyQt6.
 
 Implementa el patrón: conectar → enviar → cerrar (operación atómica).
 Ideal para simuladores que envían valores periódicamente sin mantener conexión.
+
+Opcionalmente puede usar un ConnectionPool (modo keep-alive) para
+reutilizar la conexión entre envíos.
 """
-import socket
-import threading
 from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .connection_pool import ConnectionPool
+from .message_framer import MessageFramer, NewlineFramer
+from .send_executor import SendExecutor
 from .socket_client_base import SocketClientBase
 
 
@@ -23,21 +27,42 @@ class EphemeralSocketClient(SocketClientBase):
     Este patrón es el usado por los simuladores de temperatura y
     batería según el protocolo de ISSE_Termostato.
 
+    Modo pool (opt-in): si se provee un ConnectionPool, los envíos
+    reutilizan conexiones abiertas hacia el mismo (host, puerto), con
+    reconexión transparente si el socket reutilizado falló. Como varios
+    mensajes viajan por la misma conexión, cada uno se delimita con el
+    framer indicado (NewlineFramer por defecto).
+
     Signals:
         data_sent: Emitida cuando los datos se enviaron exitosamente.
         error_occurred: Emitida cuando ocurre un error (str: mensaje).
+        send_dropped: Emitida cuando el ejecutor descarta un envío de
+            `send_async` ya encolado (no habrá data_sent ni error_occurred).
 
     Example:
         >>> client = EphemeralSocketClient("127.0.0.1", 12000)
         >>> client.data_sent.connect(on_success)
         >>> client.error_occurred.connect(on_error)
         >>> client.send("23.5")  # Conecta, envía, cierra
+        >>> pooled = EphemeralSocketClient(
+        ...     "127.0.0.1", 12000, pool=ConnectionPool.shared()
+        ... )
+        >>> pooled.send("23.5")  # Reutiliza la conexión si está sana
     """
 
-    # Señal específica para envío efímero
+    # Señales específicas para envío efímero
     data_sent = pyqtSignal()
-
-    def __init__(self, host: str, port: int, parent: Optional[QObject] = None):
+    send_dropped = pyqtSignal()
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        parent: Optional[QObject] = None,
+        pool: Optional[ConnectionPool] = None,
+        framer: Optional[MessageFramer] = None,
+        executor: Optional[SendExecutor] = None
+    ):
         """
         Inicializa el cliente TCP efímero.
 
@@ -45,8 +70,19 @@ class EphemeralSocketClient(SocketClientBase):
             host: Dirección IP o hostname del servidor.
             port: Puerto TCP del servidor.
             parent: Objeto padre de Qt (opcional).
+            pool: Pool de conexiones keep-alive (None = conexión por envío).
+            framer: Delimitador de mensajes en modo pool (NewlineFramer si None).
+            executor: Ejecutor para `send_async` (SendExecutor.shared() si None).
         """
         super().__init__(host, port, parent)
+        self._pool = pool
+        self._framer = framer if framer is not None else NewlineFramer()
+        self._executor = executor if executor is not None else SendExecutor.shared()
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        """Retorna el pool de conexiones, o None si es efímero puro."""
+        return self._pool
 
     def send(self, data: str) -> bool:
         """
@@ -63,6 +99,11 @@ class EphemeralSocketClient(SocketClientBase):
             usar `send_async()`.
         """
         try:
+            if self._pool is not None:
+                self._send_pooled(data.encode(self.ENCODING))
+                self.data_sent.emit()
+                return True
+
             with self._create_socket() as sock:
                 sock.connect((self._host, self._port))
                 sock.sendall(data.encode(self.ENCODING))
@@ -73,24 +114,57 @@ class EphemeralSocketClient(SocketClientBase):
             self._handle_connection_error(e)
             return False
 
-    def send_async(self, data: str) -> None:
+    def _send_pooled(self, payload: bytes) -> None:
         """
-        Conecta, envía datos y cierra la conexión en un hilo separado.
+        Envía por una conexión del pool, reconectando una vez si falla.
+
+        Args:
+            payload: Bytes del mensaje (sin delimitar).
+
+        Raises:
+            OSError: Si el envío falla también con una conexión nueva.
+        """
+        framed = self._framer.encode(payload)
+        sock, reused = self._pool.acquire(
+            self._host, self._port, self._create_socket
+        )
+        try:
+            sock.sendall(framed)
+        except OSError:
+            self._pool.discard(sock)
+            if not reused:
+                raise
+            # El par cerró la conexión reutilizada: reintentar con una nueva
+            sock, _ = self._pool.acquire(
+                self._host, self._port, self._create_socket
+            )
+            try:
+                sock.sendall(framed)
+            except OSError:
+                self._pool.discard(sock)
+                raise
+
+        self._pool.release(self._host, self._port, sock)
+
+    def send_async(self, data: str) -> bool:
+        """
+        Encola el envío en el ejecutor acotado (no bloqueante).
 
         Args:
             data: Cadena de texto a enviar.
 
+        Returns:
+            True si el envío fue encolado, False si el ejecutor lo
+            descartó por su política de cola llena.
+
         Note:
             El resultado se comunica mediante las señales
-            `data_sent` o `error_occurred`.
+            `data_sent` o `error_occurred`, o `send_dropped` si el
+            ejecutor desaloja el envío antes de ejecutarlo. La clave de
+            coalescencia es el destino (host, puerto).
         """
-        thread = threading.Thread(
-            target=self._send_thread,
-            args=(data,),
-            daemon=True
+        return self._executor.submit(
+            lambda: self.send(data),
+            key=(self._host, self._port),
+            on_drop=self.send_dropped.emit
         )
-        thread.start()
-
-    def _send_thread(self, data: str) -> None:
-        """Hilo interno para envío asíncrono."""
-        self.send(data)
@@ -0,0 +1,318 @@
+"""
+Delimitadores de mensajes (framers) para sesiones TCP.
+
+TCP entrega un flujo de bytes, no mensajes: un `recv()` puede traer
+varios mensajes juntos o solo una parte de uno. Los framers acumulan
+los bytes recibidos en un buffer por sesión y devuelven únicamente
+registros completos.
+
+Define el protocolo MessageFramer y cuatro implementaciones:
+    - RawFramer: Cada chunk recibido es un registro (comportamiento histórico).
+    - NewlineFramer: Registros delimitados por salto de línea.
+    - LengthPrefixedFramer: Registros precedidos por su longitud (big-endian).
+    - JsonObjectFramer: Registros delimitados por límites de objetos JSON.
+"""
+# pylint: disable=unnecessary-ellipsis
+import re
+import struct
+from typing import List, Protocol
+
+
+class MessageFramer(Protocol):
+    """
+    Protocolo para delimitadores de mensajes.
+
+    Permite inyectar distintas estrategias de delimitación en
+    ClientSession (y servidores) sin modificarlos (OCP/DIP).
+
+    Cada instancia mantiene estado (buffer de bytes pendientes), por lo
+    que debe crearse una por sesión.
+
+    Example:
+        framer = NewlineFramer()
+        framer.feed(b'{"a": 1}\\n{"a"')   # -> [b'{"a": 1}']
+        framer.feed(b': 2}\\n')           # -> [b'{"a": 2}']
+    """
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Agrega bytes recibidos y extrae los registros completos.
+
+        Args:
+            data: Bytes recibidos del socket.
+
+        Returns:
+            Lista de registros completos (puede estar vacía).
+
+        Raises:
+            ValueError: Si el flujo es inválido o excede el tamaño máximo.
+                El buffer se descarta para permitir resincronizar.
+        """
+        ...
+
+    def encode(self, payload: bytes) -> bytes:
+        """
+        Envuelve un registro para enviarlo con este formato.
+
+        Args:
+            payload: Contenido del registro.
+
+        Returns:
+            Bytes listos para enviar por el socket.
+        """
+        ...
+
+    def reset(self) -> None:
+        """Descarta los bytes pendientes."""
+        ...
+
+
+class _BufferedFramer:
+    """
+    Base común de los framers con buffer.
+
+    Mantiene un `bytearray` reutilizable por sesión que se compacta
+    solo cuando se consumen registros, evitando copias por chunk.
+    """
+
+    # Tamaño máximo de un registro pendiente (protege contra flujos sin fin)
+    MAX_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, max_buffer_size: int = MAX_BUFFER_SIZE):
+        """
+        Inicializa el buffer del framer.
+
+        Args:
+            max_buffer_size: Bytes máximos pendientes antes de descartar.
+        """
+        self._buffer = bytearray()
+        self._max_buffer_size = max_buffer_size
+
+    @property
+    def pending(self) -> int:
+        """Cantidad de bytes recibidos aún no entregados como registro."""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """Descarta los bytes pendientes."""
+        self._buffer.clear()
+
+    def _check_overflow(self) -> None:
+        """Descarta el buffer y lanza ValueError si excede el máximo."""
+        if len(self._buffer) > self._max_buffer_size:
+            size = len(self._buffer)
+            self.reset()
+            raise ValueError(
+                f"Registro excede el tamaño máximo "
+                f"({size} > {self._max_buffer_size} bytes)"
+            )
+
+
+class RawFramer:
+    """
+    Framer transparente: cada chunk recibido es un registro.
+
+    Reproduce el comportamiento histórico de ClientSession y es el
+    valor por defecto para mantener compatibilidad hacia atrás.
+    """
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Retorna el chunk recibido como único registro."""
+        return [data] if data else []
+
+    def encode(self, payload: bytes) -> bytes:
+        """Retorna el payload sin modificar."""
+        return payload
+
+    def reset(self) -> None:
+        """No mantiene estado."""
+
+
+class NewlineFramer(_BufferedFramer):
+    """
+    Framer para registros delimitados por un separador (default `\\n`).
+
+    Es el formato de EstadoTemperatura.to_string() y EstadoBateria.to_string().
+    """
+
+    def __init__(
+        self,
+        delimiter: bytes = b"\n",
+        max_buffer_size: int = _BufferedFramer.MAX_BUFFER_SIZE
+    ):
+        """
+        Inicializa el framer.
+
+        Args:
+            delimiter: Secuencia que separa registros.
+            max_buffer_size: Bytes máximos pendientes antes de descartar.
+        """
+        super().__init__(max_buffer_size)
+        self._delimiter = delimiter
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Extrae los registros terminados en el delimitador."""
+        # Un delimitador de varios bytes puede empezar al final de lo ya
+        # recibido: buscar desde ahí, sin re-escanear el resto del buffer
+        start = max(0, len(self._buffer) - len(self._delimiter) + 1)
+        self._buffer += data
+        if self._buffer.find(self._delimiter, start) < 0:
+            # Ningún registro nuevo pudo completarse con este chunk
+            self._check_overflow()
+            return []
+
+        *records, rest = bytes(self._buffer).split(self._delimiter)
+        self._buffer[:] = rest
+        self._check_overflow()
+        return [r for r in records if r.strip()]
+
+    def encode(self, payload: bytes) -> bytes:
+        """Agrega el delimitador al final del payload."""
+        return payload + self._delimiter
+
+
+class LengthPrefixedFramer(_BufferedFramer):
+    """
+    Framer para registros precedidos por su longitud.
+
+    Formato: entero sin signo big-endian de 4 bytes con la longitud
+    del payload, seguido del payload.
+    """
+
+    HEADER = struct.Struct(">I")
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Extrae los registros cuyo payload llegó completo."""
+        self._buffer += data
+        records = []
+        offset = 0
+        header_size = self.HEADER.size
+        available = len(self._buffer)
+
+        while available - offset >= header_size:
+            (length,) = self.HEADER.unpack_from(self._buffer, offset)
+            if length > self._max_buffer_size:
+                self.reset()
+                raise ValueError(
+                    f"Longitud de registro inválida: {length} bytes"
+                )
+            end = offset + header_size + length
+            if end > available:
+                break
+            records.append(bytes(self._buffer[offset + header_size:end]))
+            offset = end
+
+        if offset:
+            del self._buffer[:offset]
+        return records
+
+    def encode(self, payload: bytes) -> bytes:
+        """Antepone la longitud del payload."""
+        return self.HEADER.pack(len(payload)) + payload
+
+
+class JsonObjectFramer(_BufferedFramer):
+    """
+    Framer que separa objetos/arrays JSON concatenados.
+
+    Sigue la profundidad de llaves y corchetes (ignorando los que
+    aparecen dentro de strings), por lo que acepta tanto JSON seguido
+    de salto de línea como objetos pegados sin separador. El escaneo
+    es incremental: los bytes ya analizados no se vuelven a recorrer.
+
+    El texto que aparezca fuera de un objeto (p.ej. un valor suelto)
+    se entrega como registro propio para que el consumidor reporte
+    el error de parseo en lugar de descartarlo en silencio.
+    """
+
+    _STRUCTURAL = re.compile(rb'[{}\[\]"\\]')
+    _IN_STRING = re.compile(rb'["\\]')
+    _OPENERS = frozenset(b"{[")
+    _CLOSERS = frozenset(b"}]")
+
+    def __init__(self, max_buffer_size: int = _BufferedFramer.MAX_BUFFER_SIZE):
+        """
+        Inicializa el framer y su estado de escaneo.
+
+        Args:
+            max_buffer_size: Bytes máximos pendientes antes de descartar.
+        """
+        super().__init__(max_buffer_size)
+        self._reset_scan()
+
+    def reset(self) -> None:
+        """Descarta los bytes pendientes y el estado de escaneo."""
+        super().reset()
+        self._reset_scan()
+
+    def _reset_scan(self) -> None:
+        """Reinicia el estado del escáner."""
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Extrae los objetos JSON completos."""
+        self._buffer += data
+        records = []
+        consumed = 0
+        buf = self._buffer
+        pos = self._scan_pos
+
+        while pos < len(buf):
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+
+            pattern = self._IN_STRING if self._in_string else self._STRUCTURAL
+            match = pattern.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+
+            pos = match.start()
+            char = buf[pos]
+
+            if self._in_string:
+                if char == 0x5C:  # backslash
+                    self._escape = True
+                else:
+                    self._in_string = False
+            elif char == 0x22:  # comilla
+                self._in_string = True
+            elif char in self._OPENERS:
+                if self._depth == 0:
+                    # Texto suelto antes del objeto: entregarlo aparte
+                    loose = bytes(buf[consumed:pos]).strip()
+                    if loose:
+                        records.append(loose)
+                    consumed = pos
+                self._depth += 1
+            elif char in self._CLOSERS and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    records.append(bytes(buf[consumed:pos + 1]))
+                    consumed = pos + 1
+            pos += 1
+
+        if self._depth == 0 and not self._in_string:
+            # Texto suelto terminado en salto de línea sin objeto posterior
+            newline = buf.rfind(b"\n", consumed)
+            if newline != -1:
+                loose = bytes(buf[consumed:newline]).strip()
+                if loose:
+                    records.append(loose)
+                consumed = newline + 1
+
+        if consumed:
+            del buf[:consumed]
+            pos -= consumed
+        self._scan_pos = pos
+        self._check_overflow()
+        return records
+
+    def encode(self, payload: bytes) -> bytes:
+        """Agrega un salto de línea para facilitar la lectura humana."""
+        return payload + b"\n"
@@ -10,6 +10,7 @@ from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .send_executor import SendExecutor
 from .socket_client_base import SocketClientBase
 
 
@@ -40,7 +41,13 @@ class PersistentSocketClient(SocketClientBase):
     disconnected = pyqtSignal()
     data_received = pyqtSignal(str)
 
-    def __init__(self, host: str, port: int, parent: Optional[QObject] = None):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        parent: Optional[QObject] = None,
+        executor: Optional[SendExecutor] = None
+    ):
         """
         Inicializa el cliente TCP persistente.
 
@@ -48,8 +55,10 @@ class PersistentSocketClient(SocketClientBase):
             host: Dirección IP o hostname del servidor.
             port: Puerto TCP del servidor.
             parent: Objeto padre de Qt (opcional).
+            executor: Ejecutor para `send_data_async` (compartido si None).
         """
         super().__init__(host, port, parent)
+        self._executor = executor if executor is not None else SendExecutor.shared()
         self._socket: Optional[socket.socket] = None
         self._connected = False
         self._lock = threading.Lock()
@@ -118,26 +127,21 @@ class PersistentSocketClient(SocketClientBase):
                 self.disconnected.emit()
                 return False
 
-    def send_data_async(self, data: str) -> None:
+    def send_data_async(self, data: str) -> bool:
         """
-        Envía datos al servidor en un hilo separado.
+        Encola el envío en el ejecutor acotado (no bloqueante).
 
         Args:
             data: Cadena de texto a enviar.
 
+        Returns:
+            True si el envío fue encolado, False si fue descartado.
+
         Note:
-            El resultado se comunica mediante señales.
+            El resultado se comunica mediante señales. Los mensajes de
+            una conexión persistente no se coalescen entre sí.
         """
-        thread = threading.Thread(
-            target=self._send_thread,
-            args=(data,),
-            daemon=True
-        )
-        thread.start()
-
-    def _send_thread(self, data: str) -> None:
-        """Hilo interno para envío asíncrono."""
-        self.send_data(data)
+        return self._executor.submit(lambda: self.send_data(data))
 
     def receive_data(self, timeout: Optional[float] = None) -> Optional[str]:
         """
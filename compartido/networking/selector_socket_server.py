@@ -0,0 +1,306 @@
+"""
+Servidor TCP basado en selectores con integración PyQt6.
+
+Alternativa a BaseSocketServer que atiende todas las conexiones
+desde un único hilo de E/S usando el módulo `selectors`.
+"""
+import selectors
+import socket
+import threading
+from typing import Optional, Dict
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .message_framer import MessageFramer
+from .socket_server_base import SocketServerBase
+
+
+class SelectorSocketServer(SocketServerBase):
+    """
+    Servidor TCP multi-cliente con un único hilo de E/S.
+
+    Responsabilidad: Aceptar conexiones y recibir datos de todos los
+    clientes mediante multiplexación (epoll/kqueue/select), sin crear
+    un hilo por sesión ni despertar periódicamente por timeouts.
+
+    Expone la misma interfaz pública y las mismas señales que
+    BaseSocketServer, por lo que puede usarse como reemplazo directo
+    cuando se esperan decenas o cientos de clientes concurrentes.
+
+    Signals:
+        started: Emitida cuando el servidor inicia correctamente.
+        stopped: Emitida cuando el servidor se detiene.
+        client_connected: Emitida cuando un cliente conecta (str: dirección).
+        client_disconnected: Emitida cuando un cliente desconecta (str: dirección).
+        data_received: Emitida por cada mensaje recibido (str: datos).
+        error_occurred: Emitida cuando ocurre un error (str: mensaje).
+
+    Example:
+        >>> server = SelectorSocketServer("0.0.0.0", 14001)
+        >>> server.data_received.connect(on_data)
+        >>> server.start()
+        >>> # ... recibir datos de muchos publicadores ...
+        >>> server.stop()
+    """
+
+    # Señales específicas del servidor (idénticas a BaseSocketServer)
+    started = pyqtSignal()
+    stopped = pyqtSignal()
+    client_connected = pyqtSignal(str)
+    client_disconnected = pyqtSignal(str)
+    data_received = pyqtSignal(str)
+
+    # Backlog mayor que el del servidor por hilos: está pensado para
+    # ráfagas de conexiones simultáneas
+    BACKLOG = 128
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        parent: Optional[QObject] = None
+    ):
+        """
+        Inicializa el servidor TCP basado en selectores.
+
+        Args:
+            host: Dirección IP donde escuchar (ej: "0.0.0.0" para todas).
+            port: Puerto TCP donde escuchar.
+            parent: Objeto padre de Qt (opcional).
+        """
+        super().__init__(host, port, parent)
+        self._server_socket: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._running = False
+        self._io_thread: Optional[threading.Thread] = None
+        self._clients: Dict[socket.socket, str] = {}
+        self._framers: Dict[socket.socket, MessageFramer] = {}
+        self._lock = threading.Lock()
+        # Par de sockets para despertar al selector al detener
+        self._wakeup_reader: Optional[socket.socket] = None
+        self._wakeup_writer: Optional[socket.socket] = None
+
+    def is_running(self) -> bool:
+        """
+        Verifica si el servidor está ejecutándose.
+
+        Returns:
+            True si el servidor está activo, False en caso contrario.
+        """
+        with self._lock:
+            return self._running
+
+    def start(self) -> bool:
+        """
+        Inicia el servidor y su hilo de E/S.
+
+        Returns:
+            True si el servidor inició correctamente, False si hubo error.
+        """
+        with self._lock:
+            if self._running:
+                return True
+
+            try:
+                self._server_socket = self._create_server_socket()
+                self._server_socket.bind((self._host, self._port))
+                self._server_socket.listen(self.BACKLOG)
+                self._server_socket.setblocking(False)
+
+                self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+                self._wakeup_reader.setblocking(False)
+
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(
+                    self._server_socket, selectors.EVENT_READ, self._accept
+                )
+                self._selector.register(
+                    self._wakeup_reader, selectors.EVENT_READ, None
+                )
+                self._running = True
+
+            except OSError as e:
+                self._cleanup_resources()
+                self._handle_bind_error(e)
+                return False
+
+        self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+        self._io_thread.start()
+        self.started.emit()
+        return True
+
+    def stop(self) -> None:
+        """
+        Detiene el servidor y cierra todas las conexiones.
+
+        Es seguro llamar este método aunque el servidor no esté activo.
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+
+        self._wakeup()
+        if self._io_thread is not None:
+            self._io_thread.join(timeout=2.0)
+            self._io_thread = None
+
+        self.stopped.emit()
+
+    def get_client_count(self) -> int:
+        """
+        Retorna el número de clientes conectados actualmente.
+
+        Returns:
+            Cantidad de clientes conectados.
+        """
+        with self._lock:
+            return len(self._clients)
+
+    # --- Bucle de E/S (privado, ejecutado en el hilo de E/S) ---
+
+    def _io_loop(self) -> None:
+        """Bucle principal: despacha eventos de lectura hasta detenerse."""
+        try:
+            while self.is_running():
+                for key, _ in self._selector.select():
+                    if key.data is None:
+                        # Señal de despertar: el bucle re-evalúa is_running()
+                        self._drain_wakeup()
+                        continue
+                    key.data(key.fileobj)
+        except OSError as e:
+            self.error_occurred.emit(f"Error en bucle de E/S: {e}")
+        finally:
+            self._close_all_clients()
+            self._cleanup_resources()
+
+    def _accept(self, server_socket: socket.socket) -> None:
+        """Acepta todas las conexiones pendientes en el socket de escucha."""
+        while True:
+            try:
+                client_socket, address = server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self.error_occurred.emit(f"Error aceptando conexión: {e}")
+                return
+
+            client_addr = f"{address[0]}:{address[1]}"
+            client_socket.setblocking(False)
+            with self._lock:
+                self._clients[client_socket] = client_addr
+            self._framers[client_socket] = self._create_framer()
+            self._selector.register(
+                client_socket, selectors.EVENT_READ, self._read
+            )
+            self.client_connected.emit(client_addr)
+
+    def _read(self, client_socket: socket.socket) -> None:
+        """Lee los datos disponibles de un cliente y emite los mensajes."""
+        client_addr = self._clients.get(client_socket, "")
+        try:
+            data = client_socket.recv(self.BUFFER_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._handle_client_error(client_addr, e)
+            self._close_client(client_socket)
+            return
+
+        if not data:
+            # Cliente cerró la conexión
+            self._close_client(client_socket)
+            return
+
+        try:
+            records = self._framers[client_socket].feed(data)
+        except ValueError as e:
+            self._handle_client_error(client_addr, e)
+            return
+
+        for record in records:
+            try:
+                decoded = record.decode(self.ENCODING).strip()
+            except UnicodeDecodeError as e:
+                self._handle_client_error(client_addr, e)
+                continue
+            if decoded:
+                self._record_message(client_addr, decoded)
+                self.data_received.emit(decoded)
+
+    def _close_client(self, client_socket: socket.socket) -> None:
+        """Desregistra y cierra un cliente, emitiendo client_disconnected."""
+        with self._lock:
+            client_addr = self._clients.pop(client_socket, None)
+        if client_addr is None:
+            return
+        self._framers.pop(client_socket, None)
+
+        try:
+            self._selector.unregister(client_socket)
+        except (KeyError, ValueError):
+            pass
+        try:
+            client_socket.close()
+        except OSError:
+            pass
+
+        self.client_disconnected.emit(client_addr)
+
+    def _close_all_clients(self) -> None:
+        """Cierra todas las conexiones de clientes activas."""
+        with self._lock:
+            clients = list(self._clients)
+        for client_socket in clients:
+            self._close_client(client_socket)
+
+    # --- Utilidades ---
+
+    def _wakeup(self) -> None:
+        """Despierta al selector para que procese un cambio de estado."""
+        if self._wakeup_writer is not None:
+            try:
+                self._wakeup_writer.send(b"\0")
+            except OSError:
+                pass
+
+    def _drain_wakeup(self) -> None:
+        """Vacía los bytes de despertar pendientes."""
+        try:
+            while self._wakeup_reader.recv(self.BUFFER_SIZE):
+                pass
+        except (BlockingIOError, InterruptedError, OSError):
+            pass
+
+    def _cleanup_resources(self) -> None:
+        """Cierra el selector, el socket de escucha y el par de despertar."""
+        if self._selector is not None:
+            try:
+                self._selector.close()
+            except OSError:
+                pass
+            self._selector = None
+
+        for sock in (self._server_socket, self._wakeup_reader,
+                     self._wakeup_writer):
+            if sock is not None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+        self._server_socket = None
+        self._wakeup_reader = None
+        self._wakeup_writer = None
+
+    def __del__(self):
+        """Destructor: asegura que el servidor se detenga."""
+        try:
+            with self._lock:
+                running = self._running
+                self._running = False
+            if running:
+                self._wakeup()
+        except (AttributeError, RuntimeError):
+            pass
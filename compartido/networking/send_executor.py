@@ -0,0 +1,293 @@
+"""
+Ejecutor acotado para envíos asíncronos.
+
+Reemplaza el patrón "un hilo nuevo por envío" por un conjunto fijo de
+hilos trabajadores y una cola de profundidad limitada, con una política
+de descarte explícita cuando el destino no responde.
+"""
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Dict, Hashable, List, Optional
+
+
+class DropPolicy(Enum):
+    """Política de descarte de envíos encolados."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Con la cola llena, descarta el envío más antiguo para aceptar el nuevo."""
+
+    DROP_NEWEST = "drop_newest"
+    """Con la cola llena, rechaza el envío nuevo y conserva los ya encolados."""
+
+    COALESCE_LATEST = "coalesce_latest"
+    """
+    Reemplaza el envío en cola con la misma clave por el más reciente,
+    esté o no llena la cola. Los envíos sin clave, o sin otro en cola con
+    su clave, se tratan como con DROP_OLDEST.
+    """
+
+
+@dataclass(frozen=True)
+class SendExecutorStats:
+    """
+    Contadores instantáneos de un SendExecutor.
+
+    Attributes:
+        queued: Envíos esperando un hilo trabajador.
+        in_flight: Envíos ejecutándose en este momento.
+        dropped: Envíos descartados (por cola llena o reemplazados).
+        completed: Envíos ejecutados (con éxito o error).
+    """
+
+    queued: int
+    in_flight: int
+    dropped: int
+    completed: int
+
+
+class _Task:
+    """Envío pendiente; mutable para permitir el reemplazo al coalescer."""
+
+    __slots__ = ("key", "fn", "on_drop")
+
+    def __init__(
+        self,
+        key: Optional[Hashable],
+        fn: Callable[[], None],
+        on_drop: Optional[Callable[[], None]]
+    ):
+        self.key = key
+        self.fn = fn
+        self.on_drop = on_drop
+
+
+class SendExecutor:
+    """
+    Pool acotado de hilos trabajadores para envíos en segundo plano.
+
+    Responsabilidad: Ejecutar funciones de envío con concurrencia y
+    memoria acotadas. Los hilos se crean bajo demanda hasta
+    `max_workers` y viven mientras el proceso (daemon).
+
+    Con `COALESCE_LATEST` los envíos se agrupan por clave (p.ej. el
+    destino host:puerto): en cada `submit()` con clave, si ya hay uno en
+    cola con la misma clave se reemplaza su función por la nueva
+    conservando su posición, aunque la cola no esté llena.
+
+    Un envío aceptado puede no ejecutarse nunca: lo desaloja otro más
+    nuevo (DROP_OLDEST), lo reemplaza otro con la misma clave
+    (COALESCE_LATEST) o se descarta en `shutdown()`. En esos casos se
+    llama a su `on_drop`, para que quien lo encoló no quede esperando un
+    resultado que no llegará.
+
+    Example:
+        >>> executor = SendExecutor(max_workers=2, queue_depth=16)
+        >>> executor.submit(lambda: client.send("23.5"), key=("127.0.0.1", 12000))
+        >>> executor.stats.dropped
+        0
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_QUEUE_DEPTH = 64
+
+    _shared: Optional["SendExecutor"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+        policy: DropPolicy = DropPolicy.DROP_OLDEST
+    ):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            max_workers: Hilos trabajadores máximos.
+            queue_depth: Envíos máximos en cola (sin contar los en curso).
+            policy: Política de descarte (ver DropPolicy).
+
+        Raises:
+            ValueError: Si max_workers o queue_depth no son positivos.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers debe ser positivo: {max_workers}")
+        if queue_depth < 1:
+            raise ValueError(f"queue_depth debe ser positivo: {queue_depth}")
+
+        self._max_workers = max_workers
+        self._queue_depth = queue_depth
+        self._policy = policy
+        self._queue: Deque[_Task] = deque()
+        self._by_key: Dict[Hashable, _Task] = {}
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._in_flight = 0
+        self._dropped = 0
+        self._completed = 0
+        self._shutdown = False
+
+    @classmethod
+    def shared(cls) -> "SendExecutor":
+        """
+        Retorna el ejecutor compartido por todo el proceso.
+
+        Returns:
+            Instancia única de SendExecutor con parámetros por defecto.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def policy(self) -> DropPolicy:
+        """Política de descarte configurada."""
+        return self._policy
+
+    @property
+    def stats(self) -> SendExecutorStats:
+        """Contadores actuales (queued, in_flight, dropped, completed)."""
+        with self._cond:
+            return SendExecutorStats(
+                queued=len(self._queue),
+                in_flight=self._in_flight,
+                dropped=self._dropped,
+                completed=self._completed,
+            )
+
+    def submit(
+        self,
+        fn: Callable[[], None],
+        key: Optional[Hashable] = None,
+        on_drop: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """
+        Encola un envío para ejecutarse en un hilo trabajador.
+
+        Args:
+            fn: Función sin argumentos que realiza el envío.
+            key: Clave de agrupación para COALESCE_LATEST (opcional).
+            on_drop: Función sin argumentos a llamar si el envío, una vez
+                aceptado, se descarta sin ejecutarse (opcional). Se llama
+                sin el lock tomado, en el hilo que provocó el descarte.
+
+        Returns:
+            True si el envío quedó encolado (o reemplazó a uno en cola),
+            False si fue descartado (en ese caso no se llama a on_drop).
+        """
+        evicted: Optional[Callable[[], None]] = None
+        with self._cond:
+            if self._shutdown:
+                self._dropped += 1
+                return False
+
+            pending = None
+            if self._policy is DropPolicy.COALESCE_LATEST and key is not None:
+                pending = self._by_key.get(key)
+
+            if pending is not None:
+                evicted = pending.on_drop
+                pending.fn = fn
+                pending.on_drop = on_drop
+                self._dropped += 1
+            else:
+                if len(self._queue) >= self._queue_depth:
+                    if self._policy is DropPolicy.DROP_NEWEST:
+                        self._dropped += 1
+                        return False
+                    oldest = self._queue.popleft()
+                    self._forget(oldest)
+                    evicted = oldest.on_drop
+                    self._dropped += 1
+
+                task = _Task(key, fn, on_drop)
+                self._queue.append(task)
+                if self._policy is DropPolicy.COALESCE_LATEST and key is not None:
+                    self._by_key[key] = task
+
+                if self._idle_workers == 0 and len(self._workers) < self._max_workers:
+                    self._spawn_worker()
+                else:
+                    self._cond.notify()
+
+        if evicted is not None:
+            _notify_dropped([evicted])
+        return True
+
+    def shutdown(self, wait: bool = True, timeout: float = 2.0) -> None:
+        """
+        Detiene los hilos trabajadores descartando los envíos en cola
+        (llamando a su `on_drop`).
+
+        Args:
+            wait: Si True, espera a que terminen los envíos en curso.
+            timeout: Espera máxima por hilo en segundos.
+        """
+        with self._cond:
+            self._shutdown = True
+            self._dropped += len(self._queue)
+            evicted = [task.on_drop for task in self._queue if task.on_drop is not None]
+            self._queue.clear()
+            self._by_key.clear()
+            self._cond.notify_all()
+            workers = list(self._workers)
+
+        _notify_dropped(evicted)
+
+        if wait:
+            for worker in workers:
+                worker.join(timeout=timeout)
+
+    # --- Hilos trabajadores (privado) ---
+
+    def _spawn_worker(self) -> None:
+        """Crea un hilo trabajador (debe llamarse con el lock tomado)."""
+        worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _forget(self, task: _Task) -> None:
+        """Quita la tarea del índice por clave (con el lock tomado)."""
+        if task.key is not None and self._by_key.get(task.key) is task:
+            del self._by_key[task.key]
+
+    def _worker_loop(self) -> None:
+        """Toma envíos de la cola y los ejecuta hasta el shutdown."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._shutdown:
+                    self._idle_workers += 1
+                    self._cond.wait()
+                    self._idle_workers -= 1
+                if self._shutdown:
+                    self._workers.remove(threading.current_thread())
+                    return
+                task = self._queue.popleft()
+                self._forget(task)
+                self._in_flight += 1
+
+            try:
+                task.fn()
+            except Exception:  # pylint: disable=broad-except
+                # Los envíos reportan sus errores por señales; un fallo
+                # inesperado no debe matar al hilo trabajador
+                pass
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._completed += 1
+
+
+def _notify_dropped(callbacks: List[Callable[[], None]]) -> None:
+    """Llama a los `on_drop` de envíos descartados (sin el lock tomado)."""
+    for on_drop in callbacks:
+        try:
+            on_drop()
+        except Exception:  # pylint: disable=broad-except
+            # Un aviso fallido no debe afectar al envío que provocó el
+            # descarte ni a los demás avisos
+            pass
@@ -9,6 +9,9 @@ from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .message_framer import MessageFramer, RawFramer
+from .traffic_recorder import TrafficRecorder
+
 
 class SocketServerBase(QObject):
     """
@@ -52,6 +55,7 @@ class SocketServerBase(QObject):
         super().__init__(parent)
         self._host = host
         self._port = port
+        self._recorder: Optional[TrafficRecorder] = None
 
     @property
     def host(self) -> str:
@@ -63,6 +67,36 @@ class SocketServerBase(QObject):
         """Retorna el puerto de escucha."""
         return self._port
 
+    @property
+    def recorder(self) -> Optional[TrafficRecorder]:
+        """Retorna el grabador de tráfico (None si no se captura)."""
+        return self._recorder
+
+    def set_recorder(self, recorder: Optional[TrafficRecorder]) -> None:
+        """
+        Configura la captura de los mensajes recibidos.
+
+        Cada mensaje emitido por `data_received` se copia al grabador
+        junto con la dirección del cliente. El servidor no cierra el
+        grabador: su ciclo de vida es del llamador.
+
+        Args:
+            recorder: Grabador de tráfico, o None para dejar de capturar.
+        """
+        self._recorder = recorder
+
+    def _record_message(self, client_addr: str, message: str) -> None:
+        """
+        Copia un mensaje recibido al grabador de tráfico, si hay uno.
+
+        Args:
+            client_addr: Dirección del cliente.
+            message: Mensaje tal como se emite en data_received.
+        """
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record(client_addr, message)
+
     def _create_server_socket(self) -> socket.socket:
         """
         Crea y configura un socket de servidor.
@@ -77,6 +111,18 @@ class SocketServerBase(QObject):
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         return sock
 
+    def _create_framer(self) -> MessageFramer:
+        """
+        Crea el delimitador de mensajes para una nueva sesión.
+
+        Se invoca una vez por cliente (cada sesión tiene su propio buffer).
+        Puede ser sobrescrito para usar otro formato de mensajes (DIP).
+
+        Returns:
+            RawFramer por defecto: cada chunk recibido es un mensaje.
+        """
+        return RawFramer()
+
     def _handle_bind_error(self, error: Exception) -> None:
         """
         Maneja errores de binding emitiendo la señal apropiada.
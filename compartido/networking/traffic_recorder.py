@@ -0,0 +1,383 @@
+"""
+Captura del tráfico recibido por los servidores TCP.
+
+Guarda cada mensaje recibido (con marca de tiempo monotónica y la
+dirección del cliente) en un log binario de solo anexado, rotado por
+tamaño. La escritura se hace en un hilo propio: el hilo de recepción
+solo encola el mensaje.
+
+Formato de cada archivo:
+    Cabecera: b"ISTL" + versión (uint16) + reservado (uint16).
+    Registros: timestamp_ns (int64) + largo de la dirección (uint16) +
+    largo del mensaje (uint32), seguidos de la dirección (utf-8) y el
+    mensaje. Todo en little-endian.
+"""
+import os
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_MAGIC = b"ISTL"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sHH")
+_RECORD_HEADER = struct.Struct("<qHI")
+
+
+@dataclass(frozen=True)
+class TrafficRecord:
+    """
+    Mensaje capturado.
+
+    Attributes:
+        timestamp_ns: Instante de recepción (time.monotonic_ns()).
+        peer: Dirección del cliente (ip:puerto).
+        payload: Mensaje recibido, tal como se emitió en data_received.
+    """
+
+    timestamp_ns: int
+    peer: str
+    payload: bytes
+
+
+@dataclass(frozen=True)
+class TrafficRecorderStats:
+    """
+    Contadores instantáneos de un TrafficRecorder.
+
+    Attributes:
+        recorded: Mensajes aceptados por record().
+        written: Mensajes escritos en disco.
+        dropped: Mensajes descartados (cola llena o grabador cerrado).
+        rotations: Rotaciones de archivo realizadas.
+    """
+
+    recorded: int
+    written: int
+    dropped: int
+    rotations: int
+
+
+class TrafficRecorder:
+    """
+    Log binario de solo anexado con escritura en segundo plano.
+
+    Responsabilidad: Persistir los mensajes recibidos sin bloquear el
+    hilo de recepción. `record()` solo toma la marca de tiempo y encola;
+    el hilo escritor vacía la cola por lotes, escribe con buffer y hace
+    flush cuando la cola queda vacía.
+
+    Al superar `max_bytes` el archivo se rota como en
+    `logging.handlers.RotatingFileHandler`: `captura.bin` pasa a
+    `captura.bin.1`, `.1` a `.2`, etc., conservando `backup_count`
+    archivos anteriores.
+
+    Si la cola supera `queue_depth` (disco más lento que la red) los
+    mensajes nuevos se descartan y se cuentan en `stats.dropped`.
+
+    Example:
+        >>> recorder = TrafficRecorder("captura.bin")
+        >>> server.set_recorder(recorder)
+        >>> # ... sesión ...
+        >>> recorder.close()
+        >>> for record in TrafficLogReader("captura.bin"):
+        ...     print(record.peer, record.payload)
+    """
+
+    DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+    DEFAULT_BACKUP_COUNT = 5
+    DEFAULT_QUEUE_DEPTH = 10000
+
+    def __init__(
+        self,
+        path: PathLike,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH
+    ):
+        """
+        Abre (o continúa) el log e inicia el hilo escritor.
+
+        Args:
+            path: Ruta del archivo activo.
+            max_bytes: Tamaño a partir del cual se rota el archivo.
+            backup_count: Archivos rotados a conservar (0: se descartan).
+            queue_depth: Mensajes máximos pendientes de escritura.
+
+        Raises:
+            ValueError: Si algún límite no es válido o el archivo
+                existente no es un log de tráfico.
+            OSError: Si no se puede abrir el archivo.
+        """
+        if max_bytes <= _FILE_HEADER.size:
+            raise ValueError(f"max_bytes demasiado chico: {max_bytes}")
+        if backup_count < 0:
+            raise ValueError(f"backup_count no puede ser negativo: {backup_count}")
+        if queue_depth < 1:
+            raise ValueError(f"queue_depth debe ser positivo: {queue_depth}")
+
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue_depth = queue_depth
+        self._queue: Deque[Tuple[int, str, bytes]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._busy = False
+        self._recorded = 0
+        self._written = 0
+        self._dropped = 0
+        self._rotations = 0
+
+        self._file, self._size = self._open()
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> Path:
+        """Ruta del archivo activo."""
+        return self._path
+
+    @property
+    def stats(self) -> TrafficRecorderStats:
+        """Contadores instantáneos del grabador."""
+        with self._cond:
+            return TrafficRecorderStats(
+                recorded=self._recorded,
+                written=self._written,
+                dropped=self._dropped,
+                rotations=self._rotations,
+            )
+
+    def record(self, peer: str, payload: Union[bytes, str]) -> bool:
+        """
+        Encola un mensaje recibido. No bloquea por E/S.
+
+        Es seguro llamarlo desde cualquier hilo.
+
+        Args:
+            peer: Dirección del cliente (ip:puerto).
+            payload: Mensaje recibido (str se codifica en utf-8).
+
+        Returns:
+            True si se encoló, False si se descartó.
+        """
+        timestamp_ns = time.monotonic_ns()
+        with self._cond:
+            if self._closed or len(self._queue) >= self._queue_depth:
+                self._dropped += 1
+                return False
+            self._queue.append((timestamp_ns, peer, payload))
+            self._recorded += 1
+            self._cond.notify()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que los mensajes encolados lleguen al archivo.
+
+        Args:
+            timeout: Segundos máximos de espera (None: sin límite).
+
+        Returns:
+            True si la cola quedó vacía y escrita.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Escribe lo pendiente, detiene el hilo y cierra el archivo.
+
+        Es seguro llamarlo más de una vez. Los record() posteriores se
+        descartan.
+
+        Args:
+            timeout: Segundos máximos de espera por el hilo escritor.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __enter__(self) -> "TrafficRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # --- Hilo escritor (privado) ---
+
+    def _writer_loop(self) -> None:
+        """Vacía la cola por lotes hasta que se cierre el grabador."""
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._queue or self._closed)
+                    if not self._queue:
+                        return
+                    batch = list(self._queue)
+                    self._queue.clear()
+                    self._busy = True
+
+                for timestamp_ns, peer, payload in batch:
+                    self._write(timestamp_ns, peer, payload)
+                self._file.flush()
+
+                with self._cond:
+                    self._written += len(batch)
+                    self._busy = False
+                    self._cond.notify_all()
+        finally:
+            self._file.close()
+            with self._cond:
+                # Si la escritura falló, los record() siguientes se descartan
+                self._closed = True
+                self._dropped += len(self._queue)
+                self._queue.clear()
+                self._busy = False
+                self._cond.notify_all()
+
+    def _write(self, timestamp_ns: int, peer: str, payload: Union[bytes, str]) -> None:
+        """Serializa un registro, rotando antes si no entra en el archivo."""
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        peer_bytes = peer.encode("utf-8")
+        header = _RECORD_HEADER.pack(timestamp_ns, len(peer_bytes), len(payload))
+        size = len(header) + len(peer_bytes) + len(payload)
+
+        if self._size > _FILE_HEADER.size and self._size + size > self._max_bytes:
+            self._rotate()
+
+        self._file.write(header)
+        self._file.write(peer_bytes)
+        self._file.write(payload)
+        self._size += size
+
+    def _open(self) -> Tuple[BinaryIO, int]:
+        """Abre el archivo activo en modo anexado, escribiendo la cabecera."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path.exists() and self._path.stat().st_size > 0:
+            _check_header(self._path)
+        file = open(self._path, "ab")  # pylint: disable=consider-using-with
+        size = file.tell()
+        if size == 0:
+            file.write(_FILE_HEADER.pack(_MAGIC, _VERSION, 0))
+            size = _FILE_HEADER.size
+        return file, size
+
+    def _rotate(self) -> None:
+        """Desplaza los archivos rotados y abre un archivo activo nuevo."""
+        self._file.close()
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                source = _backup_path(self._path, index)
+                if source.exists():
+                    os.replace(source, _backup_path(self._path, index + 1))
+            os.replace(self._path, _backup_path(self._path, 1))
+        else:
+            self._path.unlink()
+        self._file, self._size = self._open()
+        with self._cond:
+            self._rotations += 1
+
+
+class TrafficLogReader:
+    """
+    Lector perezoso de un log de tráfico y sus archivos rotados.
+
+    Itera los registros en orden cronológico: primero el archivo rotado
+    más antiguo (`.N`) y por último el activo. Cada iteración vuelve a
+    abrir los archivos y lee registro a registro, por lo que sirve para
+    capturas de cualquier tamaño. Un registro final incompleto (proceso
+    terminado a mitad de una escritura) se ignora.
+
+    Example:
+        >>> for record in TrafficLogReader("captura.bin"):
+        ...     estado = json.loads(record.payload)
+    """
+
+    def __init__(self, path: PathLike, include_backups: bool = True):
+        """
+        Inicializa el lector.
+
+        Args:
+            path: Ruta del archivo activo.
+            include_backups: Si True, incluye los archivos rotados.
+
+        Raises:
+            FileNotFoundError: Si no existe ningún archivo del log.
+        """
+        self._path = Path(path)
+        self._include_backups = include_backups
+        if not self.files:
+            raise FileNotFoundError(f"No existe el log de tráfico: {self._path}")
+
+    @property
+    def files(self) -> List[Path]:
+        """Archivos del log existentes, del más antiguo al más reciente."""
+        files = []
+        if self._include_backups:
+            index = 1
+            while _backup_path(self._path, index).exists():
+                files.append(_backup_path(self._path, index))
+                index += 1
+            files.reverse()
+        if self._path.exists():
+            files.append(self._path)
+        return files
+
+    def __iter__(self) -> Iterator[TrafficRecord]:
+        for path in self.files:
+            yield from _read_file(path)
+
+
+def _backup_path(path: Path, index: int) -> Path:
+    """Ruta del archivo rotado número `index`."""
+    return path.with_name(f"{path.name}.{index}")
+
+
+def _check_header(path: Path) -> None:
+    """Verifica que el archivo empiece con la cabecera de un log de tráfico."""
+    with open(path, "rb") as file:
+        _read_header(file, path)
+
+
+def _read_header(file: BinaryIO, path: Path) -> None:
+    """Lee y valida la cabecera de archivo."""
+    header = file.read(_FILE_HEADER.size)
+    if len(header) < _FILE_HEADER.size:
+        raise ValueError(f"{path}: cabecera incompleta")
+    magic, version, _ = _FILE_HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise ValueError(f"{path}: no es un log de tráfico")
+    if version != _VERSION:
+        raise ValueError(f"{path}: versión no soportada {version}")
+
+
+def _read_file(path: Path) -> Iterator[TrafficRecord]:
+    """Itera los registros completos de un archivo del log."""
+    with open(path, "rb") as file:
+        _read_header(file, path)
+        while True:
+            header = file.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            timestamp_ns, peer_len, payload_len = _RECORD_HEADER.unpack(header)
+            body = file.read(peer_len + payload_len)
+            if len(body) < peer_len + payload_len:
+                return
+            yield TrafficRecord(
+                timestamp_ns=timestamp_ns,
+                peer=body[:peer_len].decode("utf-8", errors="replace"),
+                payload=body[peer_len:],
+            )
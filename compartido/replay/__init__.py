@@ -0,0 +1,42 @@
+"""
+Módulo de reproducción de trazas para ISSE_Simuladores.
+
+Reproduce series grabadas en campo (tiempo, valor) hacia los servicios
+de envío, leyendo los archivos de forma perezosa para soportar trazas
+de millones de filas.
+
+Clases disponibles:
+    - TraceReader: Protocolo para fuentes de trazas.
+    - CsvTrace: Traza CSV leída línea a línea.
+    - BinaryTrace: Traza columnar binaria mapeada en memoria (mmap).
+    - TraceReplayer: Emite los valores de una traza según sus tiempos.
+
+Funciones disponibles:
+    - open_trace: Abre una traza eligiendo el lector por extensión.
+    - write_binary_trace: Escribe muestras en formato binario.
+    - convert_csv_to_binary: Convierte un CSV al formato binario.
+"""
+
+from .trace_file import (
+    BINARY_SUFFIX,
+    BinaryTrace,
+    CsvTrace,
+    TraceReader,
+    TraceSample,
+    convert_csv_to_binary,
+    open_trace,
+    write_binary_trace,
+)
+from .trace_replayer import TraceReplayer
+
+__all__ = [
+    "BINARY_SUFFIX",
+    "BinaryTrace",
+    "CsvTrace",
+    "TraceReader",
+    "TraceReplayer",
+    "TraceSample",
+    "convert_csv_to_binary",
+    "open_trace",
+    "write_binary_trace",
+]
@@ -0,0 +1,304 @@
+"""
+Lectura perezosa de trazas grabadas (tiempo, valor).
+
+Las trazas de campo pueden tener millones de filas, por lo que ningún
+lector las carga completas en memoria:
+    - CsvTrace: Recorre el CSV línea a línea en cada iteración.
+    - BinaryTrace: Formato columnar compacto abierto con `mmap`; el SO
+      pagina solo las partes que se recorren.
+
+Formato binario (little-endian):
+    cabecera  "<4sHHQ": magic b"ISTR", versión, reservado, cantidad N
+    columna   N × float64: tiempos (segundos)
+    columna   N × float32: valores
+
+12 bytes por fila frente a ~15-20 de un CSV equivalente; float32 conserva
+~7 cifras significativas, de sobra para los 1-2 decimales que se envían.
+"""
+# pylint: disable=unnecessary-ellipsis
+import csv
+import mmap
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Protocol, Tuple, Union
+
+TraceSample = Tuple[float, float]
+"""Muestra de una traza: (tiempo en segundos, valor)."""
+
+PathLike = Union[str, Path]
+
+BINARY_MAGIC = b"ISTR"
+BINARY_VERSION = 1
+BINARY_SUFFIX = ".trace"
+
+_HEADER = struct.Struct("<4sHHQ")
+_TIME = struct.Struct("<d")
+_VALUE = struct.Struct("<f")
+
+
+class TraceReader(Protocol):
+    """
+    Protocolo para fuentes de trazas.
+
+    Cada llamada a `__iter__` recorre la traza desde el principio, lo
+    que permite reproducirla en bucle sin retener las muestras.
+    """
+
+    def __iter__(self) -> Iterator[TraceSample]:
+        """Itera las muestras (tiempo, valor) en orden de archivo."""
+        ...
+
+    def close(self) -> None:
+        """Libera el archivo subyacente."""
+        ...
+
+
+class CsvTrace:
+    """
+    Traza en CSV leída línea a línea.
+
+    Una primera fila no numérica se toma como encabezado. Si
+    `time_column` es None, las filas se consideran equiespaciadas cada
+    `interval` segundos.
+
+    Example:
+        >>> for t, valor in CsvTrace("sala_3.csv"):
+        ...     print(t, valor)
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        time_column: Optional[int] = 0,
+        value_column: int = 1,
+        interval: float = 1.0,
+        delimiter: str = ","
+    ):
+        """
+        Inicializa el lector sin abrir el archivo.
+
+        Args:
+            path: Ruta al CSV.
+            time_column: Índice de la columna de tiempo (segundos), o None.
+            value_column: Índice de la columna de valores.
+            interval: Segundos entre filas si no hay columna de tiempo.
+            delimiter: Separador de columnas.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+        """
+        self._path = Path(path)
+        if not self._path.is_file():
+            raise FileNotFoundError(self._path)
+        self._time_column = time_column
+        self._value_column = value_column
+        self._interval = interval
+        self._delimiter = delimiter
+
+    @property
+    def path(self) -> Path:
+        """Ruta del archivo."""
+        return self._path
+
+    def __iter__(self) -> Iterator[TraceSample]:
+        """
+        Itera las muestras (tiempo, valor).
+
+        Raises:
+            ValueError: Si una fila de datos no es numérica.
+        """
+        with open(self._path, newline="", encoding="utf-8") as archivo:
+            filas = csv.reader(archivo, delimiter=self._delimiter)
+            for indice, fila in enumerate(filas):
+                if not fila:
+                    continue
+                try:
+                    valor = float(fila[self._value_column])
+                    if self._time_column is None:
+                        tiempo = indice * self._interval
+                    else:
+                        tiempo = float(fila[self._time_column])
+                except ValueError:
+                    if indice == 0:
+                        continue  # Encabezado
+                    raise ValueError(
+                        f"{self._path}:{indice + 1}: fila no numérica {fila!r}"
+                    ) from None
+                yield tiempo, valor
+
+    def close(self) -> None:
+        """El archivo solo está abierto durante la iteración."""
+
+    def __enter__(self) -> "CsvTrace":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BinaryTrace:
+    """
+    Traza en formato columnar binario mapeada en memoria.
+
+    Soporta `len()` e indexado O(1) sin recorrer el archivo.
+
+    Example:
+        >>> with BinaryTrace("sala_3.trace") as traza:
+        ...     len(traza), traza[0]
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Abre y mapea el archivo.
+
+        Args:
+            path: Ruta al archivo `.trace`.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si la cabecera o el tamaño son inválidos.
+        """
+        self._path = Path(path)
+        self._file = open(self._path, "rb")  # pylint: disable=consider-using-with
+        try:
+            cabecera = self._file.read(_HEADER.size)
+            if len(cabecera) < _HEADER.size:
+                raise ValueError(f"{self._path}: cabecera incompleta")
+            magic, version, _, cantidad = _HEADER.unpack(cabecera)
+            if magic != BINARY_MAGIC or version != BINARY_VERSION:
+                raise ValueError(f"{self._path}: no es una traza v{BINARY_VERSION}")
+
+            esperado = _HEADER.size + cantidad * (_TIME.size + _VALUE.size)
+            tamano = self._path.stat().st_size
+            if tamano != esperado:
+                raise ValueError(
+                    f"{self._path}: tamaño {tamano} != {esperado} para {cantidad} filas"
+                )
+
+            self._len = cantidad
+            self._mmap: Optional[mmap.mmap] = None
+            if cantidad:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._times_offset = _HEADER.size
+        self._values_offset = _HEADER.size + cantidad * _TIME.size
+
+    @property
+    def path(self) -> Path:
+        """Ruta del archivo."""
+        return self._path
+
+    def __len__(self) -> int:
+        """Cantidad de muestras."""
+        return self._len
+
+    def __getitem__(self, indice: int) -> TraceSample:
+        """
+        Retorna la muestra en la posición indicada.
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+        """
+        if indice < 0:
+            indice += self._len
+        if not 0 <= indice < self._len:
+            raise IndexError(indice)
+        tiempo, = _TIME.unpack_from(self._mmap, self._times_offset + indice * _TIME.size)
+        valor, = _VALUE.unpack_from(self._mmap, self._values_offset + indice * _VALUE.size)
+        return tiempo, valor
+
+    def __iter__(self) -> Iterator[TraceSample]:
+        """Itera las muestras recorriendo ambas columnas en paralelo."""
+        if not self._len:
+            return iter(())
+        vista = memoryview(self._mmap)
+        tiempos = _TIME.iter_unpack(vista[self._times_offset:self._values_offset])
+        valores = _VALUE.iter_unpack(
+            vista[self._values_offset:self._values_offset + self._len * _VALUE.size]
+        )
+        return ((t, v) for (t,), (v,) in zip(tiempos, valores))
+
+    def close(self) -> None:
+        """Libera el mapeo y el archivo."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Hay iteradores vivos: se libera al recolectarlos
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "BinaryTrace":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_binary_trace(path: PathLike, samples: Iterable[TraceSample]) -> int:
+    """
+    Escribe una traza binaria sin retener las muestras en memoria.
+
+    Los tiempos se escriben directo al destino y los valores a un
+    temporal que se anexa al final.
+
+    Args:
+        path: Ruta destino (por convención con sufijo `.trace`).
+        samples: Muestras (tiempo, valor) en orden.
+
+    Returns:
+        Cantidad de muestras escritas.
+    """
+    cantidad = 0
+    with open(path, "wb") as destino, tempfile.TemporaryFile() as valores:
+        destino.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, 0))
+        for tiempo, valor in samples:
+            destino.write(_TIME.pack(tiempo))
+            valores.write(_VALUE.pack(valor))
+            cantidad += 1
+        valores.seek(0)
+        shutil.copyfileobj(valores, destino)
+        destino.seek(0)
+        destino.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, cantidad))
+    return cantidad
+
+
+def convert_csv_to_binary(
+    csv_path: PathLike,
+    binary_path: Optional[PathLike] = None,
+    **csv_options
+) -> Path:
+    """
+    Convierte una traza CSV al formato binario.
+
+    Args:
+        csv_path: Ruta al CSV.
+        binary_path: Ruta destino. Si es None, reemplaza el sufijo por `.trace`.
+        **csv_options: Opciones de CsvTrace (columnas, intervalo, separador).
+
+    Returns:
+        Ruta del archivo binario escrito.
+    """
+    destino = Path(binary_path) if binary_path else Path(csv_path).with_suffix(BINARY_SUFFIX)
+    write_binary_trace(destino, CsvTrace(csv_path, **csv_options))
+    return destino
+
+
+def open_trace(path: PathLike, **csv_options) -> TraceReader:
+    """
+    Abre una traza eligiendo el lector por extensión.
+
+    Args:
+        path: `.csv` o `.txt` para CSV; cualquier otra se lee como binaria.
+        **csv_options: Opciones de CsvTrace (solo para CSV).
+
+    Returns:
+        Lector de la traza.
+    """
+    if Path(path).suffix.lower() in (".csv", ".txt"):
+        return CsvTrace(path, **csv_options)
+    return BinaryTrace(path)
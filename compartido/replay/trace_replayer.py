@@ -0,0 +1,183 @@
+"""
+Reproducción temporizada de trazas grabadas.
+
+TraceReplayer recorre un TraceReader y emite cada valor en el instante
+indicado por su marca de tiempo (dividida por la velocidad), usando un
+Clock de compartido.scheduling. Solo hay una muestra leída por
+adelantado: la traza nunca se carga completa en memoria.
+"""
+from typing import Iterator, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from compartido.scheduling import Clock, RealClock
+
+from .trace_file import TraceReader, TraceSample
+
+
+class TraceReplayer(QObject):
+    """
+    Emite los valores de una traza respetando sus tiempos.
+
+    Responsabilidad: Programar cada muestra en el reloj según
+    (t - t0) / velocidad y, en modo bucle, volver a empezar al final.
+
+    Al reiniciar un bucle la traza se desplaza en su duración más el
+    último intervalo observado, para que el paso entre la última y la
+    primera muestra sea el mismo que el habitual.
+
+    Signals:
+        sample_ready(float): Valor de la muestra vencida.
+        finished(): La traza terminó (sin bucle) o está vacía.
+
+    Example:
+        >>> replayer = TraceReplayer(BinaryTrace("sala.trace"), speed=10, loop=True)
+        >>> replayer.sample_ready.connect(on_valor)
+        >>> replayer.start()
+    """
+
+    sample_ready = pyqtSignal(float)
+    finished = pyqtSignal()
+
+    def __init__(
+        self,
+        trace: TraceReader,
+        speed: float = 1.0,
+        loop: bool = False,
+        clock: Optional[Clock] = None,
+        parent: Optional[QObject] = None
+    ):
+        """
+        Inicializa el reproductor detenido.
+
+        Args:
+            trace: Traza a reproducir.
+            speed: Factor sobre los tiempos de la traza (> 0).
+            loop: Si True, reinicia la traza al terminar.
+            clock: Reloj de referencia. Si es None, usa un RealClock.
+            parent: Objeto padre Qt opcional.
+
+        Raises:
+            ValueError: Si la velocidad no es positiva.
+        """
+        if speed <= 0:
+            raise ValueError(f"speed debe ser positiva: {speed}")
+        super().__init__(parent)
+        self._trace = trace
+        self._speed = speed
+        self._loop = loop
+        self._clock: Clock = clock or RealClock(self)
+
+        self._samples: Optional[Iterator[TraceSample]] = None
+        self._next: Optional[TraceSample] = None
+        self._handle: Optional[int] = None
+        self._origin_ns = 0
+        self._t0 = 0.0
+        self._offset = 0.0
+        self._last_step = 0.0
+        self._active = False
+        self.emitted = 0
+        self.loops = 0
+
+    @property
+    def speed(self) -> float:
+        """Factor sobre los tiempos de la traza."""
+        return self._speed
+
+    @property
+    def loop(self) -> bool:
+        """Indica si la traza se reproduce en bucle."""
+        return self._loop
+
+    @property
+    def clock(self) -> Clock:
+        """Reloj de referencia."""
+        return self._clock
+
+    def isActive(self) -> bool:  # pylint: disable=invalid-name
+        """Retorna True si la reproducción está en curso."""
+        return self._active
+
+    def start(self) -> None:
+        """Inicia (o reinicia) la reproducción desde el principio."""
+        self.stop()
+        self._samples = iter(self._trace)
+        self._next = next(self._samples, None)
+        if self._next is None:
+            self._samples = None
+            self.finished.emit()
+            return
+
+        self._t0 = self._next[0]
+        self._offset = 0.0
+        self._last_step = 0.0
+        self._origin_ns = self._clock.now_ns()
+        self._active = True
+        self._schedule()
+
+    def stop(self) -> None:
+        """Detiene la reproducción y libera el iterador de la traza."""
+        self._active = False
+        if self._handle is not None:
+            self._clock.cancel(self._handle)
+            self._handle = None
+        self._samples = None
+        self._next = None
+
+    # --- Reproducción (privado) ---
+
+    def _schedule(self) -> None:
+        """Programa la muestra leída por adelantado."""
+        tiempo = self._next[0] + self._offset - self._t0
+        deadline = self._origin_ns + int(tiempo / self._speed * 1e9)
+        self._handle = self._clock.call_at(deadline, self._on_due)
+
+    def _on_due(self) -> None:
+        """Emite la muestra vencida y programa la siguiente."""
+        if sip.isdeleted(self):
+            return
+        self._handle = None
+        tiempo, valor = self._next
+        self.emitted += 1
+        self.sample_ready.emit(valor)
+        if not self._active or self._handle is not None:
+            return  # Detenido o reiniciado desde un slot
+
+        siguiente = next(self._samples, None)
+        if siguiente is None:
+            siguiente = self._restart()
+            if siguiente is None:
+                return
+        elif siguiente[0] < tiempo:
+            # Marcas no monótonas: se emite sin esperar en lugar de retroceder
+            siguiente = (tiempo, siguiente[1])
+        else:
+            self._last_step = siguiente[0] - tiempo
+
+        self._next = siguiente
+        self._schedule()
+
+    def _restart(self) -> Optional[TraceSample]:
+        """Reinicia la traza en modo bucle o finaliza la reproducción."""
+        if not self._loop:
+            self._active = False
+            self._samples = None
+            self.finished.emit()
+            return None
+
+        desplazamiento = self._next[0] - self._t0 + self._last_step
+        if desplazamiento <= 0:
+            # Traza de una sola marca de tiempo: el bucle no avanzaría
+            self.stop()
+            self.finished.emit()
+            return None
+
+        self.loops += 1
+        self._offset += desplazamiento
+        self._samples = iter(self._trace)
+        primera = next(self._samples, None)
+        if primera is None:
+            self.stop()
+            self.finished.emit()
+        return primera
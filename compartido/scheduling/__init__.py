@@ -0,0 +1,41 @@
+"""
+Módulo de planificación para ISSE_Simuladores.
+
+Utilidades de temporización. PeriodicScheduler y TimerWheel no
+dependen del event loop de Qt, para ejecutar el plano de datos de los
+simuladores sin QApplication; MonotonicTimer reemplaza a QTimer en los
+generadores con vencimientos sin deriva, medidos con un Clock
+intercambiable (real, acelerado o virtual).
+
+Clases disponibles:
+    - PeriodicScheduler: Ejecuta callbacks periódicos desde un único hilo.
+    - TimerWheel: Rueda de temporizadores para muchas tareas periódicas.
+    - MonotonicTimer: Temporizador Qt sin deriva basado en monotonic_ns.
+    - MissedTickPolicy: Política de MonotonicTimer ante ticks perdidos.
+    - TickStats: Estadísticas de puntualidad de MonotonicTimer.
+    - Clock: Protocolo de relojes de simulación.
+    - RealClock: Reloj de tiempo real.
+    - ScaledClock: Reloj acelerado por un factor.
+    - VirtualClock: Reloj virtual tan rápido como sea posible.
+
+Funciones disponibles:
+    - create_clock: Crea el reloj correspondiente a un factor de velocidad.
+"""
+
+from .clock import Clock, RealClock, ScaledClock, VirtualClock, create_clock
+from .monotonic_timer import MissedTickPolicy, MonotonicTimer, TickStats
+from .periodic_scheduler import PeriodicScheduler
+from .timer_wheel import TimerWheel
+
+__all__ = [
+    "Clock",
+    "MissedTickPolicy",
+    "MonotonicTimer",
+    "PeriodicScheduler",
+    "RealClock",
+    "ScaledClock",
+    "TickStats",
+    "TimerWheel",
+    "VirtualClock",
+    "create_clock",
+]
@@ -0,0 +1,339 @@
+"""
+Relojes intercambiables para la generación periódica.
+
+Los generadores y los servicios de envío leen el tiempo y programan sus
+ticks a través de un Clock en lugar de `time` y QTimer directamente,
+para poder ejecutar escenarios largos (p. ej. un periodo senoidal de
+24 h) más rápido que el tiempo real.
+
+Define el protocolo Clock y tres implementaciones:
+    - RealClock: Tiempo real (`time.monotonic_ns`).
+    - ScaledClock: Tiempo real acelerado por un factor (x10, x1000...).
+    - VirtualClock: Tiempo virtual que salta al próximo vencimiento tan
+      rápido como lo permita el event loop.
+
+`create_clock()` elige la implementación a partir de un factor de
+velocidad (1 = real, >1 = acelerado, 0 = tan rápido como sea posible).
+"""
+# pylint: disable=unnecessary-ellipsis
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+
+class Clock(Protocol):
+    """
+    Protocolo para relojes de simulación.
+
+    Los tiempos son nanosegundos monotónicos del propio reloj: solo las
+    diferencias tienen significado.
+
+    Los callbacks programados con `call_at` se ejecutan en el hilo del
+    event loop Qt que creó el reloj.
+
+    Example:
+        reloj = ScaledClock(1000.0)
+        handle = reloj.call_at(reloj.now_ns() + 60 * 10**9, callback)
+        # callback se ejecuta tras ~60 ms reales
+    """
+
+    def now_ns(self) -> int:
+        """Tiempo actual del reloj en nanosegundos."""
+        ...
+
+    def now(self) -> float:
+        """Tiempo actual del reloj en segundos."""
+        ...
+
+    def call_at(self, deadline_ns: int, callback: Callable[[], None]) -> int:
+        """
+        Programa un callback de un solo disparo.
+
+        Args:
+            deadline_ns: Vencimiento en tiempo del reloj.
+            callback: Función sin argumentos a ejecutar.
+
+        Returns:
+            Identificador para `cancel()`.
+        """
+        ...
+
+    def cancel(self, handle: int) -> None:
+        """
+        Cancela un callback programado. Ignora identificadores vencidos.
+
+        Args:
+            handle: Identificador retornado por `call_at()`.
+        """
+        ...
+
+    def hold(self) -> None:
+        """Pide que el tiempo no avance (solo afecta a VirtualClock)."""
+        ...
+
+    def release(self) -> None:
+        """Libera un `hold()` previo."""
+        ...
+
+
+class _WallClock(QObject):
+    """
+    Base común de los relojes atados al tiempo real.
+
+    Cada `call_at` usa un QTimer de un disparo (PreciseTimer) con la
+    espera real equivalente al vencimiento.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """Inicializa el reloj sin callbacks programados."""
+        super().__init__(parent)
+        self._ids = itertools.count(1)
+        self._timers: Dict[int, QTimer] = {}
+
+    def now_ns(self) -> int:
+        """Tiempo actual del reloj en nanosegundos."""
+        raise NotImplementedError
+
+    def now(self) -> float:
+        """Tiempo actual del reloj en segundos."""
+        return self.now_ns() / 1e9
+
+    def call_at(self, deadline_ns: int, callback: Callable[[], None]) -> int:
+        """Programa un callback de un solo disparo (ver Clock)."""
+        handle = next(self._ids)
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.TimerType.PreciseTimer)
+        timer.timeout.connect(lambda: self._fire(handle, callback))
+        self._timers[handle] = timer
+        timer.start(self._wall_delay_ms(deadline_ns - self.now_ns()))
+        return handle
+
+    def cancel(self, handle: int) -> None:
+        """Cancela un callback programado (ver Clock)."""
+        timer = self._timers.pop(handle, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+
+    def hold(self) -> None:
+        """El tiempo real no se detiene: no hace nada."""
+
+    def release(self) -> None:
+        """El tiempo real no se detiene: no hace nada."""
+
+    def _wall_delay_ms(self, delta_ns: int) -> int:
+        """Milisegundos reales para que el reloj avance `delta_ns`."""
+        raise NotImplementedError
+
+    def _fire(self, handle: int, callback: Callable[[], None]) -> None:
+        """Libera el QTimer y ejecuta el callback."""
+        timer = self._timers.pop(handle, None)
+        if timer is None:
+            return
+        timer.deleteLater()
+        callback()
+
+
+class RealClock(_WallClock):
+    """Reloj de tiempo real basado en `time.monotonic_ns()`."""
+
+    def now_ns(self) -> int:
+        """Tiempo monotónico real en nanosegundos."""
+        return time.monotonic_ns()
+
+    def _wall_delay_ms(self, delta_ns: int) -> int:
+        """Redondea hacia arriba para no disparar antes del vencimiento."""
+        return max(0, -(-delta_ns // 1_000_000))
+
+
+class ScaledClock(_WallClock):
+    """
+    Reloj que avanza `factor` veces más rápido que el tiempo real.
+
+    Con factor 1000 un periodo de 24 h transcurre en ~86 s. Las esperas
+    reales menores a 1 ms se redondean a 1 ms (resolución de QTimer), por
+    lo que intervalos muy cortos con factores altos quedan limitados por
+    el event loop; para eso conviene VirtualClock.
+    """
+
+    def __init__(self, factor: float, parent: Optional[QObject] = None):
+        """
+        Inicializa el reloj en 0 con el origen en el instante actual.
+
+        Args:
+            factor: Aceleración respecto al tiempo real (> 0).
+            parent: Objeto padre Qt opcional.
+
+        Raises:
+            ValueError: Si el factor no es positivo.
+        """
+        if factor <= 0:
+            raise ValueError(f"factor debe ser positivo: {factor}")
+        super().__init__(parent)
+        self._factor = factor
+        self._origen_real_ns = time.monotonic_ns()
+
+    @property
+    def factor(self) -> float:
+        """Aceleración respecto al tiempo real."""
+        return self._factor
+
+    def now_ns(self) -> int:
+        """Tiempo escalado en nanosegundos desde la creación."""
+        return int((time.monotonic_ns() - self._origen_real_ns) * self._factor)
+
+    def _wall_delay_ms(self, delta_ns: int) -> int:
+        """Convierte la espera del reloj a milisegundos reales."""
+        if delta_ns <= 0:
+            return 0
+        return max(1, -(-int(delta_ns / self._factor) // 1_000_000))
+
+
+class VirtualClock(QObject):
+    """
+    Reloj virtual que avanza tan rápido como sea posible.
+
+    El tiempo solo avanza al ejecutar callbacks: cada vuelta del event
+    loop ejecuta el callback con vencimiento más próximo y lleva el
+    reloj a ese instante. Entre callbacks el event loop sigue atendiendo
+    sockets y señales encoladas.
+
+    Contrapresión: mientras haya `hold()` activos no se ejecutan
+    callbacks, por lo que el tiempo queda detenido. Los servicios de
+    envío retienen el reloj durante cada envío en curso para que ninguna
+    muestra se pierda por correr más rápido que la red.
+
+    Example:
+        >>> reloj = VirtualClock()
+        >>> generador = GeneradorTemperatura(config, reloj=reloj)
+        >>> generador.iniciar()  # Un día de muestras en lo que tarde la red
+    """
+
+    def __init__(self, start_ns: int = 0, parent: Optional[QObject] = None):
+        """
+        Inicializa el reloj detenido en `start_ns`.
+
+        Args:
+            start_ns: Tiempo inicial en nanosegundos.
+            parent: Objeto padre Qt opcional.
+        """
+        super().__init__(parent)
+        self._now_ns = start_ns
+        self._ids = itertools.count(1)
+        self._heap: List[Tuple[int, int]] = []
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._holds = 0
+        self.executed = 0
+
+        self._pump = QTimer(self)
+        self._pump.setSingleShot(True)
+        self._pump.setInterval(0)
+        self._pump.timeout.connect(self._on_pump)
+
+    @property
+    def held(self) -> bool:
+        """Indica si el tiempo está retenido por algún `hold()`."""
+        return self._holds > 0
+
+    @property
+    def pending(self) -> int:
+        """Callbacks programados aún no ejecutados."""
+        return len(self._callbacks)
+
+    def now_ns(self) -> int:
+        """Tiempo virtual en nanosegundos."""
+        return self._now_ns
+
+    def now(self) -> float:
+        """Tiempo virtual en segundos."""
+        return self._now_ns / 1e9
+
+    def call_at(self, deadline_ns: int, callback: Callable[[], None]) -> int:
+        """Programa un callback de un solo disparo (ver Clock)."""
+        handle = next(self._ids)
+        self._callbacks[handle] = callback
+        heapq.heappush(self._heap, (deadline_ns, handle))
+        self._schedule_pump()
+        return handle
+
+    def cancel(self, handle: int) -> None:
+        """Cancela un callback programado (ver Clock)."""
+        self._callbacks.pop(handle, None)
+
+    def hold(self) -> None:
+        """Detiene el avance del tiempo hasta el `release()` correspondiente."""
+        self._holds += 1
+
+    def release(self) -> None:
+        """Libera un `hold()` y reanuda el avance si no quedan otros."""
+        if self._holds > 0:
+            self._holds -= 1
+        if self._holds == 0:
+            self._schedule_pump()
+
+    def advance(self, seconds: float) -> None:
+        """
+        Avanza el tiempo de forma síncrona, ejecutando los vencidos.
+
+        Ignora los `hold()`: pensado para tests y para control manual.
+
+        Args:
+            seconds: Segundos virtuales a avanzar (>= 0).
+        """
+        limite = self._now_ns + int(seconds * 1e9)
+        while self._heap and self._heap[0][0] <= limite:
+            self._run_next()
+        self._now_ns = max(self._now_ns, limite)
+
+    # --- Ejecución (privado) ---
+
+    def _schedule_pump(self) -> None:
+        """Programa una vuelta de ejecución si corresponde."""
+        if self._callbacks and self._holds == 0 and not self._pump.isActive():
+            self._pump.start()
+
+    def _on_pump(self) -> None:
+        """Ejecuta el próximo callback y reprograma la siguiente vuelta."""
+        if self._holds == 0:
+            self._run_next()
+        self._schedule_pump()
+
+    def _run_next(self) -> None:
+        """Ejecuta el callback vigente con vencimiento más próximo."""
+        while self._heap:
+            deadline_ns, handle = heapq.heappop(self._heap)
+            callback = self._callbacks.pop(handle, None)
+            if callback is None:
+                continue  # Cancelado
+            self._now_ns = max(self._now_ns, deadline_ns)
+            self.executed += 1
+            callback()
+            return
+
+
+def create_clock(speed: float, parent: Optional[QObject] = None) -> Clock:
+    """
+    Crea el reloj correspondiente a un factor de velocidad.
+
+    Args:
+        speed: 1 = tiempo real, > 1 = acelerado (ScaledClock),
+            0 = virtual tan rápido como sea posible (VirtualClock).
+        parent: Objeto padre Qt opcional.
+
+    Returns:
+        Reloj listo para inyectar en generadores y servicios.
+
+    Raises:
+        ValueError: Si la velocidad es negativa.
+    """
+    if speed < 0:
+        raise ValueError(f"speed no puede ser negativa: {speed}")
+    if speed == 0:
+        return VirtualClock(parent=parent)
+    if speed == 1:
+        return RealClock(parent)
+    return ScaledClock(speed, parent)
@@ -0,0 +1,208 @@
+"""
+Temporizador periódico Qt con compensación de deriva.
+
+QTimer reprograma cada disparo relativo al anterior, por lo que la
+latencia del event loop se acumula y el periodo efectivo se alarga bajo
+carga. MonotonicTimer calcula cada vencimiento en tiempo absoluto del
+reloj (por defecto `time.monotonic_ns()`) y programa un único disparo
+hasta el siguiente vencimiento.
+"""
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .clock import Clock, RealClock
+
+
+class MissedTickPolicy(Enum):
+    """Qué hacer con los ticks vencidos cuando el event loop se atrasa."""
+
+    SKIP = "skip"
+    """Descarta los ticks perdidos y se alinea al próximo vencimiento."""
+
+    CATCH_UP = "catch_up"
+    """Emite los ticks perdidos de inmediato (hasta `max_catch_up`)."""
+
+
+@dataclass(frozen=True)
+class TickStats:
+    """
+    Estadísticas de puntualidad de un MonotonicTimer.
+
+    Attributes:
+        ticks: Ticks emitidos.
+        skipped: Ticks descartados por atraso (política SKIP o tope de
+            CATCH_UP).
+        last_lateness_ms: Atraso del último tick respecto a su vencimiento.
+        max_lateness_ms: Mayor atraso registrado en la ventana.
+        mean_lateness_ms: Atraso promedio en la ventana.
+    """
+
+    ticks: int
+    skipped: int
+    last_lateness_ms: float
+    max_lateness_ms: float
+    mean_lateness_ms: float
+
+
+class MonotonicTimer(QObject):
+    """
+    Temporizador periódico sin deriva basado en reloj monotónico.
+
+    Responsabilidad: Emitir `timeout` en los instantes
+    inicio + k × intervalo, registrando el atraso de cada tick.
+
+    Misma interfaz básica que QTimer (`start`, `stop`, `isActive`,
+    `interval`), para reemplazarlo en los generadores. El intervalo se
+    mide en tiempo del reloj inyectado: con un ScaledClock o un
+    VirtualClock los ticks se aceleran sin cambiar el intervalo.
+
+    Signals:
+        timeout(): Emitida en cada tick.
+
+    Example:
+        >>> timer = MonotonicTimer(parent=self)
+        >>> timer.timeout.connect(self._on_tick)
+        >>> timer.start(100)
+        >>> timer.stats.max_lateness_ms
+    """
+
+    timeout = pyqtSignal()
+
+    LATENESS_WINDOW = 256
+    DEFAULT_MAX_CATCH_UP = 10
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        policy: MissedTickPolicy = MissedTickPolicy.SKIP,
+        max_catch_up: int = DEFAULT_MAX_CATCH_UP,
+        clock: Optional[Clock] = None
+    ):
+        """
+        Inicializa el temporizador detenido.
+
+        Args:
+            parent: Objeto padre Qt opcional.
+            policy: Política ante ticks perdidos.
+            max_catch_up: Ticks perdidos máximos a emitir por disparo
+                con CATCH_UP; el resto se descarta.
+            clock: Reloj de referencia. Si es None, usa un RealClock.
+        """
+        super().__init__(parent)
+        self._policy = policy
+        self._max_catch_up = max_catch_up
+        self._interval_ns = 0
+        self._deadline_ns = 0
+        self._active = False
+        self._ticks = 0
+        self._skipped = 0
+        self._lateness_ns: Deque[int] = deque(maxlen=self.LATENESS_WINDOW)
+        self._clock: Clock = clock or RealClock(self)
+        self._handle: Optional[int] = None
+
+    @property
+    def policy(self) -> MissedTickPolicy:
+        """Política ante ticks perdidos."""
+        return self._policy
+
+    @property
+    def clock(self) -> Clock:
+        """Reloj de referencia."""
+        return self._clock
+
+    @property
+    def stats(self) -> TickStats:
+        """Estadísticas de puntualidad de la ventana reciente."""
+        muestras = self._lateness_ns
+        return TickStats(
+            ticks=self._ticks,
+            skipped=self._skipped,
+            last_lateness_ms=muestras[-1] / 1e6 if muestras else 0.0,
+            max_lateness_ms=max(muestras) / 1e6 if muestras else 0.0,
+            mean_lateness_ms=sum(muestras) / len(muestras) / 1e6 if muestras else 0.0,
+        )
+
+    def interval(self) -> int:
+        """Intervalo en milisegundos."""
+        return self._interval_ns // 1_000_000
+
+    def isActive(self) -> bool:  # pylint: disable=invalid-name
+        """Retorna True si el temporizador está corriendo."""
+        return self._active
+
+    def start(self, interval_ms: int) -> None:
+        """
+        Inicia (o reinicia) el temporizador.
+
+        El primer tick vence un intervalo después de la llamada.
+
+        Args:
+            interval_ms: Periodo en milisegundos (> 0).
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms debe ser positivo: {interval_ms}")
+
+        self._interval_ns = interval_ms * 1_000_000
+        self._deadline_ns = self._clock.now_ns() + self._interval_ns
+        self._active = True
+        self._arm()
+
+    def stop(self) -> None:
+        """Detiene el temporizador."""
+        self._active = False
+        self._disarm()
+
+    # --- Disparo (privado) ---
+
+    def _arm(self) -> None:
+        """Programa el disparo del próximo vencimiento."""
+        self._disarm()
+        self._handle = self._clock.call_at(self._deadline_ns, self._on_fire)
+
+    def _disarm(self) -> None:
+        """Cancela el disparo programado, si hay."""
+        if self._handle is not None:
+            self._clock.cancel(self._handle)
+            self._handle = None
+
+    def _on_fire(self) -> None:
+        """Emite los ticks vencidos y reprograma el siguiente."""
+        if sip.isdeleted(self):
+            # El reloj (externo) sobrevivió al temporizador y a su padre
+            return
+        self._handle = None
+        now_ns = self._clock.now_ns()
+        if now_ns < self._deadline_ns:
+            # Disparo anticipado (resolución del timer del SO)
+            self._arm()
+            return
+
+        atrasados = (now_ns - self._deadline_ns) // self._interval_ns
+        emitir = 1
+        if atrasados:
+            if self._policy is MissedTickPolicy.CATCH_UP:
+                extra = min(atrasados, self._max_catch_up)
+                emitir += extra
+                self._skipped += atrasados - extra
+            else:
+                self._skipped += atrasados
+
+        self._lateness_ns.append(now_ns - self._deadline_ns)
+        self._deadline_ns += (atrasados + 1) * self._interval_ns
+
+        for _ in range(emitir):
+            if not self._active:
+                return
+            self._ticks += 1
+            self.timeout.emit()
+
+        if self._active:
+            self._arm()
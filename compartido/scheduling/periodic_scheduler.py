@@ -0,0 +1,182 @@
+"""
+Planificador periódico liviano, sin dependencias de Qt.
+
+Permite ejecutar el plano de datos de los simuladores (generar y enviar
+valores) sin QApplication ni event loop: las tareas se ejecutan en el
+hilo que llama a `run()`.
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class PeriodicScheduler:
+    """
+    Ejecuta callbacks a intervalo fijo desde un único hilo.
+
+    Responsabilidad: Mantener las próximas ejecuciones ordenadas por
+    vencimiento (heap) y dormir hasta la siguiente. Los vencimientos se
+    calculan sobre el anterior (no sobre el instante de ejecución), por
+    lo que la latencia de un callback no acumula deriva; si el hilo se
+    atrasa más de un intervalo, las ejecuciones perdidas se omiten.
+
+    Thread-safety: `schedule()`, `cancel()` y `stop()` pueden llamarse
+    desde cualquier hilo; los callbacks se ejecutan en el hilo de `run()`.
+
+    Example:
+        >>> scheduler = PeriodicScheduler()
+        >>> scheduler.schedule(1.0, lambda: print("tick"))
+        >>> scheduler.run(duration=5.0)  # Bloquea 5 segundos
+    """
+
+    def __init__(self):
+        """Inicializa el planificador sin tareas."""
+        self._heap: List[Tuple[float, int]] = []
+        self._tasks: Dict[int, Tuple[float, Callable[[], None]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = False
+        self._stop_requested = False
+        self.executed = 0
+        self.skipped = 0
+
+    def is_running(self) -> bool:
+        """Retorna True si `run()` está en ejecución."""
+        return self._running
+
+    def task_count(self) -> int:
+        """Retorna la cantidad de tareas programadas."""
+        with self._lock:
+            return len(self._tasks)
+
+    def schedule(
+        self,
+        interval: float,
+        callback: Callable[[], None],
+        delay: Optional[float] = None
+    ) -> int:
+        """
+        Programa un callback periódico.
+
+        Args:
+            interval: Periodo en segundos (> 0).
+            callback: Función sin argumentos a ejecutar.
+            delay: Espera hasta la primera ejecución. Por defecto, un
+                intervalo completo (igual que QTimer).
+
+        Returns:
+            Identificador de la tarea para `cancel()`.
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        if interval <= 0:
+            raise ValueError(f"interval debe ser positivo: {interval}")
+
+        first = time.monotonic() + (interval if delay is None else delay)
+        with self._lock:
+            task_id = next(self._ids)
+            self._tasks[task_id] = (interval, callback)
+            heapq.heappush(self._heap, (first, task_id))
+        self._wakeup.set()
+        return task_id
+
+    def cancel(self, task_id: int) -> bool:
+        """
+        Cancela una tarea programada.
+
+        Args:
+            task_id: Identificador retornado por `schedule()`.
+
+        Returns:
+            True si la tarea existía.
+        """
+        with self._lock:
+            # La entrada del heap se descarta al vencer
+            return self._tasks.pop(task_id, None) is not None
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Ejecuta las tareas hasta `stop()` o hasta agotar `duration`.
+
+        Args:
+            duration: Segundos máximos de ejecución. None = sin límite.
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        self._running = True
+        self._stop_requested = False
+        try:
+            while not self._stop_requested:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    break
+
+                due = self._pop_due(now)
+                if due is None:
+                    self._sleep_until_next(now, deadline)
+                    continue
+
+                _, callback = due
+                try:
+                    callback()
+                finally:
+                    self.executed += 1
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Solicita detener `run()`; retorna sin esperar."""
+        self._stop_requested = True
+        self._wakeup.set()
+
+    # --- Utilidades ---
+
+    def _pop_due(
+        self, now: float
+    ) -> Optional[Tuple[int, Callable[[], None]]]:
+        """
+        Extrae la próxima tarea vencida y reprograma su siguiente ejecución.
+
+        Args:
+            now: Instante actual (time.monotonic()).
+
+        Returns:
+            Tupla (id, callback) o None si no hay tareas vencidas.
+        """
+        with self._lock:
+            while self._heap:
+                when, task_id = self._heap[0]
+                task = self._tasks.get(task_id)
+                if task is None:
+                    heapq.heappop(self._heap)
+                    continue
+                if when > now:
+                    return None
+
+                interval, callback = task
+                next_when = when + interval
+                if next_when <= now:
+                    # Atrasado más de un periodo: se omiten las perdidas
+                    missed = int((now - when) // interval)
+                    self.skipped += missed
+                    next_when = when + (missed + 1) * interval
+                heapq.heapreplace(self._heap, (next_when, task_id))
+                return task_id, callback
+            return None
+
+    def _sleep_until_next(self, now: float, deadline: Optional[float]) -> None:
+        """Duerme hasta el próximo vencimiento, el fin de `run()` o un cambio."""
+        # Se limpia antes de leer el heap: un schedule() posterior despierta
+        self._wakeup.clear()
+        if self._stop_requested:
+            return
+        with self._lock:
+            wake_at = self._heap[0][0] if self._heap else None
+        if deadline is not None:
+            wake_at = deadline if wake_at is None else min(wake_at, deadline)
+
+        timeout = None if wake_at is None else max(0.0, wake_at - now)
+        self._wakeup.wait(timeout)
@@ -0,0 +1,226 @@
+"""
+Rueda de temporizadores (hashed timer wheel) para muchas tareas periódicas.
+
+Con cientos o miles de tareas, un heap cuesta O(log n) por ejecución;
+la rueda agrupa los vencimientos en ranuras de resolución fija y cada
+avance de tick solo revisa una ranura.
+"""
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _WheelTask:
+    """Tarea periódica registrada en la rueda."""
+
+    __slots__ = ("interval_ticks", "callback", "deadline")
+
+    def __init__(self, interval_ticks: int, callback: Callable[[], None],
+                 deadline: int):
+        self.interval_ticks = interval_ticks
+        self.callback = callback
+        self.deadline = deadline
+
+
+class TimerWheel:
+    """
+    Planificador periódico basado en una rueda de ranuras.
+
+    Responsabilidad: Ejecutar desde un único hilo muchos callbacks
+    periódicos con costo O(1) por programación y por tick. Los
+    intervalos se redondean a múltiplos de `tick` (mínimo un tick).
+
+    Misma interfaz que PeriodicScheduler (`schedule`, `cancel`, `run`,
+    `stop`), por lo que son intercambiables. Los callbacks deben ser
+    breves (p.ej. encolar un envío): se ejecutan en el hilo de `run()`.
+
+    Los vencimientos se cuentan en ticks absolutos desde el inicio, así
+    que no hay deriva acumulada; si el hilo se atrasa más de un periodo,
+    las ejecuciones perdidas de cada tarea se omiten (`skipped`).
+
+    Example:
+        >>> wheel = TimerWheel(tick=0.005)
+        >>> for sensor in sensores:
+        ...     wheel.schedule(1.0, sensor.enviar)
+        >>> wheel.run(duration=60.0)
+    """
+
+    DEFAULT_TICK = 0.005
+    DEFAULT_SLOTS = 512
+
+    def __init__(self, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS):
+        """
+        Inicializa la rueda.
+
+        Args:
+            tick: Resolución en segundos de cada ranura.
+            slots: Cantidad de ranuras de la rueda.
+
+        Raises:
+            ValueError: Si tick o slots no son positivos.
+        """
+        if tick <= 0:
+            raise ValueError(f"tick debe ser positivo: {tick}")
+        if slots < 1:
+            raise ValueError(f"slots debe ser positivo: {slots}")
+
+        self._tick = tick
+        self._slots: List[Dict[int, _WheelTask]] = [{} for _ in range(slots)]
+        self._tasks: Dict[int, _WheelTask] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._origin = time.monotonic()
+        self._current_tick = 0
+        self._running = False
+        self._stop_requested = False
+        self.executed = 0
+        self.skipped = 0
+
+    @property
+    def tick(self) -> float:
+        """Resolución de la rueda en segundos."""
+        return self._tick
+
+    def is_running(self) -> bool:
+        """Retorna True si `run()` está en ejecución."""
+        return self._running
+
+    def task_count(self) -> int:
+        """Retorna la cantidad de tareas programadas."""
+        with self._lock:
+            return len(self._tasks)
+
+    def schedule(
+        self,
+        interval: float,
+        callback: Callable[[], None],
+        delay: Optional[float] = None
+    ) -> int:
+        """
+        Programa un callback periódico.
+
+        Args:
+            interval: Periodo en segundos (> 0), redondeado a ticks.
+            callback: Función sin argumentos a ejecutar.
+            delay: Espera hasta la primera ejecución. Por defecto, un
+                intervalo completo.
+
+        Returns:
+            Identificador de la tarea para `cancel()`.
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        if interval <= 0:
+            raise ValueError(f"interval debe ser positivo: {interval}")
+
+        interval_ticks = self._to_ticks(interval)
+        delay_ticks = interval_ticks if delay is None else self._to_ticks(delay)
+        with self._lock:
+            task_id = next(self._ids)
+            task = _WheelTask(
+                interval_ticks, callback, self._current_tick + delay_ticks
+            )
+            self._tasks[task_id] = task
+            self._slot_for(task.deadline)[task_id] = task
+        return task_id
+
+    def cancel(self, task_id: int) -> bool:
+        """
+        Cancela una tarea programada.
+
+        Args:
+            task_id: Identificador retornado por `schedule()`.
+
+        Returns:
+            True si la tarea existía.
+        """
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+            self._slot_for(task.deadline).pop(task_id, None)
+            return True
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Avanza la rueda hasta `stop()` o hasta agotar `duration`.
+
+        Args:
+            duration: Segundos máximos de ejecución. None = sin límite.
+        """
+        start = time.monotonic()
+        deadline = None if duration is None else start + duration
+        # El tick actual corresponde al inicio: el tiempo sin ejecutar
+        # entre llamadas a run() no cuenta como atraso
+        self._origin = start - self._current_tick * self._tick
+        self._running = True
+        self._stop_requested = False
+        self._wakeup.clear()
+        try:
+            while not self._stop_requested:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    break
+
+                target = int((now - self._origin) / self._tick)
+                while self._current_tick < target and not self._stop_requested:
+                    self._advance(target)
+
+                wake_at = self._origin + (self._current_tick + 1) * self._tick
+                if deadline is not None:
+                    wake_at = min(wake_at, deadline)
+                self._wakeup.wait(max(0.0, wake_at - time.monotonic()))
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Solicita detener `run()`; retorna sin esperar."""
+        self._stop_requested = True
+        self._wakeup.set()
+
+    # --- Utilidades ---
+
+    def _to_ticks(self, seconds: float) -> int:
+        """Convierte segundos a ticks (mínimo uno)."""
+        return max(1, round(seconds / self._tick))
+
+    def _slot_for(self, tick: int) -> Dict[int, _WheelTask]:
+        """Retorna la ranura que corresponde a un tick absoluto."""
+        return self._slots[tick % len(self._slots)]
+
+    def _advance(self, target: int) -> None:
+        """
+        Avanza un tick y ejecuta las tareas vencidas en su ranura.
+
+        Args:
+            target: Tick correspondiente al instante actual, para
+                detectar ejecuciones atrasadas.
+        """
+        with self._lock:
+            self._current_tick += 1
+            tick = self._current_tick
+            slot = self._slot_for(tick)
+            due: List[Tuple[int, _WheelTask]] = [
+                (task_id, task) for task_id, task in slot.items()
+                if task.deadline <= tick
+            ]
+            for task_id, task in due:
+                del slot[task_id]
+                next_deadline = task.deadline + task.interval_ticks
+                if next_deadline <= target:
+                    missed = (target - task.deadline) // task.interval_ticks
+                    self.skipped += missed
+                    next_deadline = task.deadline + (missed + 1) * task.interval_ticks
+                task.deadline = next_deadline
+                self._slot_for(next_deadline)[task_id] = task
+
+        for task_id, task in due:
+            if task_id not in self._tasks:
+                continue
+            try:
+                task.callback()
+            finally:
+                self.executed += 1
@@ -0,0 +1,167 @@
+"""Tests para AnimationClock."""
+import gc
+
+import pytest
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+from compartido.scheduling import VirtualClock
+from compartido.widgets import AnimationClock
+
+
+@pytest.fixture
+def virtual_clock(qapp):
+    """Reloj virtual que solo avanza con advance()."""
+    return VirtualClock()
+
+
+@pytest.fixture
+def clock(virtual_clock):
+    """AnimationClock sobre el reloj virtual."""
+    return AnimationClock(clock=virtual_clock)
+
+
+class Recorder:
+    """Registra las fases recibidas por un método ligado."""
+
+    def __init__(self):
+        self.phases = []
+
+    def on_phase(self, phase: int) -> None:
+        """Callback de fase."""
+        self.phases.append(phase)
+
+
+class TestAnimationClock:
+    """Tests del reloj de animación."""
+
+    def test_idle_without_subscribers(self, clock, virtual_clock):
+        """Sin suscriptores no hay vencimientos programados."""
+        assert not clock.active
+        assert virtual_clock.pending == 0
+
+    def test_notifies_each_period(self, clock, virtual_clock):
+        """El callback recibe fases consecutivas una vez por periodo."""
+        recorder = Recorder()
+        clock.subscribe(recorder.on_phase, 500)
+
+        virtual_clock.advance(1.6)
+
+        assert recorder.phases == [1, 2, 3]
+
+    def test_stops_when_last_subscriber_leaves(self, clock, virtual_clock):
+        """El reloj se detiene al cancelar la última suscripción."""
+        recorder = Recorder()
+        handle = clock.subscribe(recorder.on_phase, 500)
+        assert clock.active
+
+        clock.unsubscribe(handle)
+        virtual_clock.advance(2.0)
+
+        assert not clock.active
+        assert recorder.phases == []
+        assert clock.wakeups == 0
+
+    def test_same_period_shares_wakeups(self, clock, virtual_clock):
+        """Suscripciones del mismo periodo cambian de fase juntas."""
+        first, second = Recorder(), Recorder()
+        clock.subscribe(first.on_phase, 500)
+        virtual_clock.advance(0.2)
+        clock.subscribe(second.on_phase, 500)
+
+        virtual_clock.advance(1.0)
+
+        assert first.phases == [1, 2]
+        assert second.phases == [1, 2]
+        assert clock.wakeups == 2
+
+    def test_phases_within_a_frame_are_coalesced(self, virtual_clock):
+        """Vencimientos dentro del mismo frame se notifican en un despertar."""
+        clock = AnimationClock(frame_ms=16, clock=virtual_clock)
+        fast, slow = Recorder(), Recorder()
+        clock.subscribe(fast.on_phase, 495)
+        clock.subscribe(slow.on_phase, 500)
+
+        virtual_clock.advance(0.5)
+
+        assert fast.phases == [1]
+        assert slow.phases == [1]
+        assert clock.wakeups == 1
+
+    def test_different_periods(self, clock, virtual_clock):
+        """Cada suscripción avanza con su propio periodo."""
+        fast, slow = Recorder(), Recorder()
+        clock.subscribe(fast.on_phase, 250)
+        clock.subscribe(slow.on_phase, 1000)
+
+        virtual_clock.advance(1.0)
+
+        assert fast.phases == [1, 2, 3, 4]
+        assert slow.phases == [1]
+        assert clock.wakeups == 4
+
+    def test_callback_can_unsubscribe_others(self, clock, virtual_clock):
+        """Una suscripción cancelada durante el despertar no se notifica."""
+        recorder = Recorder()
+        handles = {}
+
+        def first(_phase):
+            clock.unsubscribe(handles["second"])
+
+        handles["first"] = clock.subscribe(first, 500)
+        handles["second"] = clock.subscribe(recorder.on_phase, 500)
+
+        virtual_clock.advance(0.5)
+
+        assert recorder.phases == []
+        assert clock.subscriber_count == 1
+
+    def test_bound_methods_are_weak(self, clock, virtual_clock):
+        """Suscribirse no mantiene vivo al dueño del método."""
+        recorder = Recorder()
+        clock.subscribe(recorder.on_phase, 500)
+
+        del recorder
+        gc.collect()
+        virtual_clock.advance(0.5)
+
+        assert clock.subscriber_count == 0
+        assert not clock.active
+
+    def test_deleted_qobject_is_dropped(self, clock, virtual_clock):
+        """Un QObject destruido por Qt deja de recibir fases."""
+        class Owner(QObject):
+            """QObject con callback de fase."""
+            calls = 0
+
+            def on_phase(self, _phase):
+                """Callback de fase."""
+                Owner.calls += 1
+
+        owner = Owner()
+        clock.subscribe(owner.on_phase, 500)
+
+        sip.delete(owner)
+        virtual_clock.advance(0.5)
+
+        assert Owner.calls == 0
+        assert clock.subscriber_count == 0
+
+    def test_invalid_period(self, clock):
+        """El periodo debe ser positivo."""
+        with pytest.raises(ValueError):
+            clock.subscribe(lambda phase: None, 0)
+
+    def test_shared_is_singleton(self, qapp):
+        """Verifica la instancia compartida."""
+        assert AnimationClock.shared() is AnimationClock.shared()
+
+    def test_real_time(self, qtbot):
+        """Con el reloj real las fases llegan a través del event loop."""
+        clock = AnimationClock()
+        recorder = Recorder()
+        clock.subscribe(recorder.on_phase, 20)
+
+        qtbot.waitUntil(lambda: len(recorder.phases) >= 2, timeout=1000)
+
+        assert recorder.phases[1] > recorder.phases[0]
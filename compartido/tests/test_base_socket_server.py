@@ -9,7 +9,12 @@ import time
 
 import pytest
 
-from compartido.networking import BaseSocketServer, SocketServerBase, ClientSession
+from compartido.networking import (
+    BaseSocketServer,
+    SocketServerBase,
+    ClientSession,
+    NewlineFramer,
+)
 
 
 @pytest.fixture
@@ -404,6 +409,21 @@ class TestClientSession:
 
         assert blocker.args[0] == "signal test"
 
+    def test_receive_records_with_framer(self, socket_pair, app, qtbot):
+        """Verifica que el framer entregue un registro por mensaje."""
+        client_sock, conn_sock = socket_pair
+        session = ClientSession(
+            conn_sock, "127.0.0.1:12345", framer=NewlineFramer()
+        )
+
+        client_sock.sendall(b"23.5\n24.0\n24")
+        time.sleep(0.1)
+        assert session.receive_records(timeout=2.0) == ["23.5", "24.0"]
+
+        client_sock.sendall(b".5\n")
+        time.sleep(0.1)
+        assert session.receive_records(timeout=2.0) == ["24.5"]
+
     def test_close_deactivates_session(self, socket_pair):
         """Verifica que close desactive la sesión."""
         _, conn_sock = socket_pair
@@ -0,0 +1,183 @@
+"""
+Tests unitarios para los relojes de simulación.
+"""
+import pytest
+
+from compartido.scheduling import (
+    MonotonicTimer,
+    RealClock,
+    ScaledClock,
+    VirtualClock,
+    create_clock,
+)
+
+
+class TestRealClock:
+    """Tests del reloj de tiempo real."""
+
+    def test_call_at_fires_after_deadline(self, qapp, qtbot):
+        """Verifica que el callback no se ejecute antes del vencimiento."""
+        reloj = RealClock()
+        disparos = []
+        deadline = reloj.now_ns() + 30_000_000
+
+        reloj.call_at(deadline, lambda: disparos.append(reloj.now_ns()))
+        qtbot.waitUntil(lambda: len(disparos) == 1, timeout=1000)
+
+        assert disparos[0] >= deadline
+
+    def test_cancel(self, qapp, qtbot):
+        """Verifica que cancel() evite la ejecución."""
+        reloj = RealClock()
+        disparos = []
+
+        handle = reloj.call_at(reloj.now_ns() + 10_000_000, lambda: disparos.append(1))
+        reloj.cancel(handle)
+        qtbot.wait(40)
+
+        assert disparos == []
+
+
+class TestScaledClock:
+    """Tests del reloj acelerado."""
+
+    def test_rejects_non_positive_factor(self, qapp):
+        """Verifica la validación del factor."""
+        with pytest.raises(ValueError):
+            ScaledClock(0)
+
+    def test_advances_faster_than_real_time(self, qapp, qtbot):
+        """Verifica que el tiempo avance `factor` veces más rápido."""
+        reloj = ScaledClock(100.0)
+        inicio = reloj.now()
+
+        qtbot.wait(50)
+
+        assert reloj.now() - inicio >= 4.5
+
+    def test_call_at_scales_wait(self, qapp, qtbot):
+        """Verifica que 1 s de reloj con factor 100 tarde ~10 ms reales."""
+        reloj = ScaledClock(100.0)
+        disparos = []
+
+        reloj.call_at(reloj.now_ns() + 1_000_000_000, lambda: disparos.append(1))
+        qtbot.waitUntil(lambda: len(disparos) == 1, timeout=200)
+
+
+class TestVirtualClock:
+    """Tests del reloj virtual."""
+
+    def test_starts_stopped(self, qapp, qtbot):
+        """Verifica que sin callbacks el tiempo no avance."""
+        reloj = VirtualClock(start_ns=5)
+        qtbot.wait(20)
+
+        assert reloj.now_ns() == 5
+
+    def test_runs_callbacks_in_deadline_order(self, qapp, qtbot):
+        """Verifica el orden y el salto de tiempo a cada vencimiento."""
+        reloj = VirtualClock()
+        orden = []
+
+        reloj.call_at(3_000, lambda: orden.append((3, reloj.now_ns())))
+        reloj.call_at(1_000, lambda: orden.append((1, reloj.now_ns())))
+        reloj.call_at(2_000, lambda: orden.append((2, reloj.now_ns())))
+        qtbot.waitUntil(lambda: len(orden) == 3, timeout=1000)
+
+        assert orden == [(1, 1_000), (2, 2_000), (3, 3_000)]
+        assert reloj.executed == 3
+
+    def test_cancel(self, qapp, qtbot):
+        """Verifica que un callback cancelado no se ejecute."""
+        reloj = VirtualClock()
+        disparos = []
+
+        handle = reloj.call_at(1_000, lambda: disparos.append(1))
+        reloj.cancel(handle)
+        qtbot.wait(20)
+
+        assert disparos == []
+        assert reloj.pending == 0
+
+    def test_hold_stops_time(self, qapp, qtbot):
+        """Verifica que hold() detenga los callbacks hasta release()."""
+        reloj = VirtualClock()
+        disparos = []
+        reloj.hold()
+
+        reloj.call_at(1_000, lambda: disparos.append(1))
+        qtbot.wait(20)
+        assert disparos == []
+        assert reloj.held
+
+        reloj.release()
+        qtbot.waitUntil(lambda: len(disparos) == 1, timeout=1000)
+        assert not reloj.held
+
+    def test_advance_runs_due_callbacks(self, qapp):
+        """Verifica advance() síncrono."""
+        reloj = VirtualClock()
+        disparos = []
+        reloj.call_at(500_000_000, lambda: disparos.append(reloj.now_ns()))
+        reloj.call_at(2_000_000_000, lambda: disparos.append(reloj.now_ns()))
+
+        reloj.advance(1.0)
+
+        assert disparos == [500_000_000]
+        assert reloj.now() == 1.0
+
+    def test_drives_monotonic_timer_faster_than_real_time(self, qapp, qtbot):
+        """Verifica que un MonotonicTimer de 1 s emita sin esperas reales."""
+        reloj = VirtualClock()
+        timer = MonotonicTimer(clock=reloj)
+        ticks = []
+
+        def on_tick():
+            ticks.append(reloj.now())
+            if len(ticks) == 100:
+                timer.stop()
+
+        timer.timeout.connect(on_tick)
+        timer.start(1000)
+        qtbot.waitUntil(lambda: len(ticks) == 100, timeout=2000)
+
+        assert ticks[:3] == [1.0, 2.0, 3.0]
+        assert ticks[-1] == 100.0
+        assert timer.stats.max_lateness_ms == 0.0
+
+    def test_timers_sharing_clock_interleave(self, qapp, qtbot):
+        """Verifica que timers con distinto intervalo no se adelanten entre sí."""
+        reloj = VirtualClock()
+        rapido = MonotonicTimer(clock=reloj)
+        lento = MonotonicTimer(clock=reloj)
+        eventos = []
+        rapido.timeout.connect(lambda: eventos.append("r"))
+        lento.timeout.connect(lambda: eventos.append("l"))
+
+        rapido.start(100)
+        lento.start(250)
+        qtbot.waitUntil(lambda: len(eventos) >= 7, timeout=1000)
+        rapido.stop()
+        lento.stop()
+
+        assert eventos[:7] == ["r", "r", "l", "r", "r", "l", "r"]
+        assert rapido.stats.skipped == 0
+
+
+class TestCreateClock:
+    """Tests de create_clock()."""
+
+    @pytest.mark.parametrize("speed, tipo", [
+        (1, RealClock),
+        (10, ScaledClock),
+        (1000.0, ScaledClock),
+        (0, VirtualClock),
+    ])
+    def test_selects_implementation(self, qapp, speed, tipo):
+        """Verifica la implementación elegida por velocidad."""
+        assert type(create_clock(speed)) is tipo
+
+    def test_rejects_negative_speed(self, qapp):
+        """Verifica la validación de la velocidad."""
+        with pytest.raises(ValueError):
+            create_clock(-1)
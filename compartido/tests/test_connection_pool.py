@@ -0,0 +1,206 @@
+"""
+Tests unitarios para ConnectionPool y el modo pool de EphemeralSocketClient.
+
+Usa un servidor TCP real en localhost que acepta conexiones y
+acumula los bytes recibidos por conexión.
+"""
+import socket
+import threading
+import time
+
+import pytest
+
+from compartido.networking import ConnectionPool, EphemeralSocketClient
+
+
+@pytest.fixture
+def app(qapp):
+    """Fixture que proporciona la aplicación Qt."""
+    return qapp
+
+
+class _RecordingServer:
+    """Servidor TCP mínimo que registra conexiones y bytes recibidos."""
+
+    def __init__(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(16)
+        self.port = self._sock.getsockname()[1]
+        self.connections = []
+        self.data = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections.append(conn)
+            threading.Thread(
+                target=self._read_loop, args=(conn,), daemon=True
+            ).start()
+
+    def _read_loop(self, conn):
+        while True:
+            try:
+                chunk = conn.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            with self._lock:
+                self.data.append(chunk)
+
+    def received(self) -> bytes:
+        with self._lock:
+            return b"".join(self.data)
+
+    def close_connections(self):
+        with self._lock:
+            for conn in self.connections:
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                conn.close()
+
+    def close(self):
+        self.close_connections()
+        self._sock.close()
+
+
+@pytest.fixture
+def server():
+    """Servidor de registro en un puerto libre."""
+    srv = _RecordingServer()
+    yield srv
+    srv.close()
+
+
+def wait_until(condition, timeout=2.0):
+    """Espera activa hasta que se cumpla la condición."""
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def factory():
+    """Crea sockets TCP con timeout corto."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(2.0)
+    return sock
+
+
+class TestConnectionPool:
+    """Tests del pool de conexiones."""
+
+    def test_release_and_reuse(self, server):
+        """Verifica que un socket liberado se reutilice."""
+        pool = ConnectionPool()
+        sock1, reused1 = pool.acquire("127.0.0.1", server.port, factory)
+        pool.release("127.0.0.1", server.port, sock1)
+        sock2, reused2 = pool.acquire("127.0.0.1", server.port, factory)
+
+        assert reused1 is False
+        assert reused2 is True
+        assert sock2 is sock1
+        assert pool.created == 1
+        assert pool.reused == 1
+        pool.discard(sock2)
+
+    def test_closed_by_peer_is_not_reused(self, server):
+        """Verifica el health check ante un cierre del servidor."""
+        pool = ConnectionPool()
+        sock, _ = pool.acquire("127.0.0.1", server.port, factory)
+        pool.release("127.0.0.1", server.port, sock)
+
+        assert wait_until(lambda: len(server.connections) == 1)
+        server.close_connections()
+        time.sleep(0.05)
+
+        nuevo, reused = pool.acquire("127.0.0.1", server.port, factory)
+        assert reused is False
+        assert nuevo is not sock
+        assert pool.evicted == 1
+        pool.discard(nuevo)
+
+    def test_evict_idle(self, server):
+        """Verifica el desalojo de sockets ociosos vencidos."""
+        pool = ConnectionPool(idle_timeout=0.0)
+        sock, _ = pool.acquire("127.0.0.1", server.port, factory)
+        pool.release("127.0.0.1", server.port, sock)
+        time.sleep(0.01)
+
+        assert pool.evict_idle() == 1
+        assert pool.idle_count() == 0
+
+    def test_max_idle_per_key(self, server):
+        """Verifica que se cierren los sockets que exceden el límite."""
+        pool = ConnectionPool(max_idle_per_key=1)
+        sock1, _ = pool.acquire("127.0.0.1", server.port, factory)
+        sock2, _ = pool.acquire("127.0.0.1", server.port, factory)
+        pool.release("127.0.0.1", server.port, sock1)
+        pool.release("127.0.0.1", server.port, sock2)
+
+        assert pool.idle_count("127.0.0.1", server.port) == 1
+        pool.close_all()
+        assert pool.idle_count() == 0
+
+    def test_connect_error_propagates(self):
+        """Verifica que un error de conexión se propague."""
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        with pytest.raises(OSError):
+            ConnectionPool().acquire("127.0.0.1", port, factory)
+
+
+class TestEphemeralSocketClientPooled:
+    """Tests del modo pool de EphemeralSocketClient."""
+
+    def test_sends_share_one_connection(self, server, app):
+        """Verifica que varios envíos usen una sola conexión delimitada."""
+        pool = ConnectionPool()
+        client = EphemeralSocketClient("127.0.0.1", server.port, pool=pool)
+
+        for valor in ("23.50", "23.60", "23.70"):
+            assert client.send(valor) is True
+
+        assert wait_until(lambda: server.received() == b"23.50\n23.60\n23.70\n")
+        assert len(server.connections) == 1
+        assert pool.created == 1
+        pool.close_all()
+
+    def test_transparent_reconnect(self, server, app):
+        """Verifica la reconexión cuando el servidor cerró la conexión."""
+        pool = ConnectionPool()
+        client = EphemeralSocketClient("127.0.0.1", server.port, pool=pool)
+
+        assert client.send("1") is True
+        assert wait_until(lambda: len(server.connections) == 1)
+        server.close_connections()
+        time.sleep(0.05)
+
+        assert client.send("2") is True
+        assert wait_until(lambda: server.received().endswith(b"2\n"))
+        assert len(server.connections) == 2
+        pool.close_all()
+
+    def test_without_pool_keeps_ephemeral_behavior(self, server, app):
+        """Verifica que sin pool cada envío use una conexión nueva."""
+        client = EphemeralSocketClient("127.0.0.1", server.port)
+        assert client.pool is None
+
+        client.send("a")
+        client.send("b")
+
+        assert wait_until(lambda: len(server.connections) == 2)
+        assert wait_until(lambda: server.received() in (b"ab", b"ba"))
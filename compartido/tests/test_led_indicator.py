@@ -8,6 +8,7 @@ from compartido.widgets import (
     LEDColor,
     LEDColorProvider,
     DefaultLEDColorProvider,
+    LEDPixmapCache,
 )
 
 
@@ -272,6 +273,79 @@ class TestLEDIndicatorRendering:
         led.update.assert_called_once()
 
 
+class TestLEDIndicatorPixmapCache:
+    """Tests del uso del caché de pixmaps."""
+
+    class _MagentaProvider:
+        def get_color_on(self, color: LEDColor) -> QColor:
+            return QColor(255, 0, 255)
+
+        def get_color_off(self, color: LEDColor) -> QColor:
+            return QColor(50, 0, 50)
+
+    def _led(self, qtbot, **kwargs):
+        led = LEDIndicator(pixmap_cache=LEDPixmapCache(), **kwargs)
+        qtbot.addWidget(led)
+        return led
+
+    def test_uses_shared_cache_by_default(self, qtbot):
+        """Verifica que por defecto se use el caché del proceso."""
+        led = LEDIndicator()
+        qtbot.addWidget(led)
+
+        assert led._pixmap_cache is LEDPixmapCache.shared()
+
+    def test_leds_share_pixmaps(self, qtbot):
+        """Verifica que LEDs iguales rendericen una sola vez."""
+        cache = LEDPixmapCache()
+        leds = [LEDIndicator(state=True, pixmap_cache=cache) for _ in range(5)]
+        for led in leds:
+            qtbot.addWidget(led)
+            led.grab()
+
+        assert cache.misses == 1
+        assert len(cache) == 1
+
+    def test_toggle_reuses_widget_pixmaps(self, qtbot):
+        """Verifica que alternar el estado no consulte el caché otra vez."""
+        led = self._led(qtbot)
+        led.grab()
+        led.toggle()
+        led.grab()
+        assert led._pixmap_cache.misses == 2
+
+        for _ in range(4):
+            led.toggle()
+            led.grab()
+
+        assert led._pixmap_cache.hits + led._pixmap_cache.misses == 2
+
+    def test_set_color_provider_invalidates(self, qtbot):
+        """Verifica que cambiar el proveedor vuelva a resolver el color."""
+        led = self._led(qtbot, state=True)
+        led.grab()
+        default_key = led._current_pixmap().cacheKey()
+
+        led.set_color_provider(self._MagentaProvider())
+
+        assert led._current_pixmap().cacheKey() != default_key
+        center = led._current_pixmap().toImage().pixelColor(13, 13)
+        assert center.red() > center.green()
+        assert center.blue() > center.green()
+
+    def test_set_color_and_size_invalidate(self, qtbot):
+        """Verifica que cambiar color o tamaño descarte los pixmaps del widget."""
+        led = self._led(qtbot, state=True)
+        green = led._current_pixmap().cacheKey()
+
+        led.set_color(LEDColor.RED)
+        red = led._current_pixmap()
+        led.set_size(30)
+
+        assert red.cacheKey() != green
+        assert led._current_pixmap().width() == 30 * led._current_pixmap().devicePixelRatio()
+
+
 class TestLEDColorProvider:
     """Tests del proveedor de colores."""
 
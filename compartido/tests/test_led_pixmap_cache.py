@@ -0,0 +1,93 @@
+"""Tests para LEDPixmapCache."""
+import pytest
+from PyQt6.QtGui import QColor
+
+from compartido.widgets import LEDPixmapCache, render_led_pixmap
+
+
+class TestRenderLEDPixmap:
+    """Tests del renderizado de un LED."""
+
+    def test_size_and_ratio(self, qapp):
+        """Verifica el tamaño físico y la densidad del pixmap."""
+        pixmap = render_led_pixmap(True, QColor(0, 255, 0), 20, 2.0)
+
+        assert pixmap.width() == 40
+        assert pixmap.height() == 40
+        assert pixmap.devicePixelRatio() == 2.0
+
+    def test_corners_are_transparent(self, qapp):
+        """Verifica que el fondo fuera del LED apagado sea transparente."""
+        image = render_led_pixmap(False, QColor(0, 80, 0), 20).toImage()
+
+        assert image.pixelColor(0, 0).alpha() == 0
+
+    def test_center_uses_color(self, qapp):
+        """Verifica que el LED encendido use el color dado."""
+        image = render_led_pixmap(True, QColor(255, 0, 0), 20).toImage()
+        pixel = image.pixelColor(13, 13)
+
+        assert pixel.red() > pixel.green()
+        assert pixel.red() > pixel.blue()
+
+
+class TestLEDPixmapCache:
+    """Tests del caché LRU."""
+
+    def test_hit_returns_same_pixmap(self, qapp):
+        """Verifica que la misma clave reutilice el pixmap."""
+        cache = LEDPixmapCache()
+
+        first = cache.get(True, QColor(0, 255, 0), 20, 1.0)
+        second = cache.get(True, QColor(0, 255, 0), 20, 1.0)
+
+        assert first.cacheKey() == second.cacheKey()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.parametrize("other", [
+        (False, QColor(0, 255, 0), 20, 1.0),
+        (True, QColor(255, 0, 0), 20, 1.0),
+        (True, QColor(0, 255, 0), 24, 1.0),
+        (True, QColor(0, 255, 0), 20, 2.0),
+    ])
+    def test_key_components(self, qapp, other):
+        """Verifica que estado, color, tamaño y densidad formen parte de la clave."""
+        cache = LEDPixmapCache()
+        cache.get(True, QColor(0, 255, 0), 20, 1.0)
+
+        cache.get(*other)
+
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+    def test_evicts_least_recently_used(self, qapp):
+        """Verifica el descarte LRU."""
+        cache = LEDPixmapCache(max_pixmaps=2)
+        cache.get(True, QColor(1, 0, 0), 10, 1.0)
+        cache.get(True, QColor(2, 0, 0), 10, 1.0)
+        cache.get(True, QColor(1, 0, 0), 10, 1.0)
+
+        cache.get(True, QColor(3, 0, 0), 10, 1.0)
+        cache.get(True, QColor(1, 0, 0), 10, 1.0)
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.hits == 2
+
+    def test_clear(self, qapp):
+        """Verifica el descarte de todos los pixmaps."""
+        cache = LEDPixmapCache()
+        cache.get(True, QColor(0, 255, 0), 20, 1.0)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_max_pixmaps(self):
+        """Verifica que la capacidad deba ser positiva."""
+        with pytest.raises(ValueError):
+            LEDPixmapCache(max_pixmaps=0)
+
+    def test_shared_is_singleton(self):
+        """Verifica la instancia compartida."""
+        assert LEDPixmapCache.shared() is LEDPixmapCache.shared()
@@ -0,0 +1,122 @@
+"""Tests para LogBuffer y LogRecord."""
+from datetime import datetime
+
+import pytest
+
+from compartido.widgets import LogBuffer, LogLevel, LogRecord
+
+
+def record(message: str, level: LogLevel = LogLevel.INFO) -> LogRecord:
+    """Crea un registro con timestamp fijo."""
+    return LogRecord(datetime(2024, 1, 15, 10, 30, 45), level, message)
+
+
+class TestLogBuffer:
+    """Tests del anillo de registros."""
+
+    def test_empty(self):
+        """Verifica el buffer recién creado."""
+        buffer = LogBuffer(max_records=3)
+
+        assert len(buffer) == 0
+        assert list(buffer) == []
+        assert buffer.max_records == 3
+
+    def test_keeps_newest_records(self):
+        """Verifica que se descarten los registros más antiguos."""
+        buffer = LogBuffer(max_records=3)
+
+        for i in range(5):
+            buffer.append(record(f"msg {i}"))
+
+        assert [r.message for r in buffer] == ["msg 2", "msg 3", "msg 4"]
+        assert buffer[0].message == "msg 2"
+        assert buffer[-1].message == "msg 4"
+
+    def test_shrink_drops_oldest(self):
+        """Verifica que reducir la capacidad conserve los más recientes."""
+        buffer = LogBuffer(max_records=5)
+        for i in range(5):
+            buffer.append(record(f"msg {i}"))
+
+        buffer.max_records = 2
+
+        assert [r.message for r in buffer] == ["msg 3", "msg 4"]
+
+    def test_minimum_capacity_is_one(self):
+        """Verifica que la capacidad mínima sea 1."""
+        buffer = LogBuffer(max_records=0)
+        buffer.max_records = -3
+
+        assert buffer.max_records == 1
+
+    def test_clear(self):
+        """Verifica el descarte de todos los registros."""
+        buffer = LogBuffer()
+        buffer.append(record("msg"))
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+
+
+class TestLogBufferIndex:
+    """Tests del acceso por secuencia y del índice por nivel."""
+
+    def test_sequences_are_consecutive(self):
+        """Verifica las secuencias asignadas y el acceso por secuencia."""
+        buffer = LogBuffer(max_records=3)
+
+        seqs = [buffer.append(record(f"msg {i}")) for i in range(5)]
+
+        assert seqs == [0, 1, 2, 3, 4]
+        assert buffer.first_sequence == 2
+        assert buffer.next_sequence == 5
+        assert buffer.get(3).message == "msg 3"
+
+    def test_get_discarded_raises(self):
+        """Verifica que pedir un registro descartado lance IndexError."""
+        buffer = LogBuffer(max_records=2)
+        for i in range(3):
+            buffer.append(record(f"msg {i}"))
+
+        with pytest.raises(IndexError):
+            buffer.get(0)
+        with pytest.raises(IndexError):
+            buffer.get(3)
+
+    def test_level_index_follows_evictions(self):
+        """Verifica que el índice por nivel descarte junto con el anillo."""
+        buffer = LogBuffer(max_records=4)
+        levels = [LogLevel.ERROR, LogLevel.INFO, LogLevel.ERROR, LogLevel.INFO,
+                  LogLevel.INFO, LogLevel.ERROR]
+        for i, level in enumerate(levels):
+            buffer.append(record(f"msg {i}", level))
+
+        assert buffer.sequences(LogLevel.ERROR) == [2, 5]
+        assert buffer.sequences(LogLevel.INFO) == [3, 4]
+        assert buffer.sequences(LogLevel.INFO, since=4) == [4]
+        assert buffer.count(LogLevel.ERROR) == 2
+        assert buffer.count(LogLevel.DEBUG) == 0
+
+    def test_shrink_prunes_level_index(self):
+        """Verifica que reducir la capacidad actualice el índice."""
+        buffer = LogBuffer(max_records=5)
+        for i in range(5):
+            buffer.append(record(f"msg {i}", LogLevel.WARNING))
+
+        buffer.max_records = 2
+        buffer.append(record("msg 5", LogLevel.WARNING))
+
+        assert buffer.sequences(LogLevel.WARNING) == [4, 5]
+        assert [r.message for r in buffer] == ["msg 4", "msg 5"]
+
+    def test_clear_keeps_sequences(self):
+        """Verifica que limpiar no reutilice secuencias."""
+        buffer = LogBuffer()
+        buffer.append(record("msg"))
+        buffer.clear()
+
+        assert buffer.append(record("otro")) == 1
+        assert buffer.first_sequence == 1
+        assert buffer.sequences(LogLevel.INFO) == [1]
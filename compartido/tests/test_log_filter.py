@@ -0,0 +1,179 @@
+"""Tests para LogQuery y LogFilter."""
+from datetime import datetime
+
+import pytest
+
+from compartido.widgets import LogBuffer, LogFilter, LogLevel, LogQuery, LogRecord
+
+
+def record(message: str, level: LogLevel = LogLevel.INFO) -> LogRecord:
+    """Crea un registro con timestamp fijo."""
+    return LogRecord(datetime(2024, 1, 15, 10, 30, 45), level, message)
+
+
+def filled_buffer(*records: LogRecord, max_records: int = 100) -> LogBuffer:
+    """Crea un buffer con los registros dados."""
+    buffer = LogBuffer(max_records)
+    for r in records:
+        buffer.append(r)
+    return buffer
+
+
+class TestLogQuery:
+    """Tests del criterio de búsqueda."""
+
+    def test_empty_query(self):
+        """Verifica que la consulta por defecto acepte todo."""
+        assert LogQuery().is_empty
+        assert LogQuery(levels=set(LogLevel)).is_empty
+        assert not LogQuery(text="x").is_empty
+        assert LogQuery().matches(record("cualquier cosa", LogLevel.DEBUG))
+
+    def test_levels_are_normalized(self):
+        """Verifica que los niveles se guarden como frozenset."""
+        query = LogQuery(levels=[LogLevel.ERROR])
+
+        assert query.levels == frozenset({LogLevel.ERROR})
+        assert query == LogQuery(levels={LogLevel.ERROR})
+
+    def test_substring_is_case_insensitive_by_default(self):
+        """Verifica la búsqueda de texto sin distinguir mayúsculas."""
+        query = LogQuery(text="timeout")
+
+        assert query.matches(record("Timeout de conexión"))
+        assert not query.matches(record("Mensaje recibido"))
+        assert not LogQuery(text="timeout", case_sensitive=True).matches(
+            record("Timeout de conexión")
+        )
+
+    def test_regex(self):
+        """Verifica la búsqueda por expresión regular."""
+        query = LogQuery(text=r"puerto \d+", regex=True)
+
+        assert query.matches(record("Escuchando en PUERTO 14001"))
+        assert not query.matches(record("puerto desconocido"))
+
+    def test_invalid_regex_raises_value_error(self):
+        """Verifica que una expresión inválida lance ValueError."""
+        with pytest.raises(ValueError):
+            LogQuery(text="(", regex=True)
+
+    def test_levels_and_text_combined(self):
+        """Verifica que nivel y texto se combinen con AND."""
+        query = LogQuery(levels={LogLevel.ERROR}, text="conexión")
+
+        assert query.matches(record("Error de conexión", LogLevel.ERROR))
+        assert not query.matches(record("Conexión establecida", LogLevel.INFO))
+
+    @pytest.mark.parametrize("new, old, expected", [
+        (LogQuery(text="error"), LogQuery(text="err"), True),
+        (LogQuery(text="err"), LogQuery(text="error"), False),
+        (LogQuery(text="x"), LogQuery(), True),
+        (LogQuery(levels={LogLevel.ERROR}), LogQuery(levels={LogLevel.ERROR, LogLevel.INFO}), True),
+        (LogQuery(), LogQuery(levels={LogLevel.ERROR}), False),
+        (LogQuery(text="ab", regex=True), LogQuery(text="a", regex=True), False),
+        (LogQuery(text="ERROR"), LogQuery(text="err"), True),
+        (LogQuery(text="error", case_sensitive=True), LogQuery(text="err"), False),
+    ])
+    def test_narrows(self, new, old, expected):
+        """Verifica cuándo una consulta restringe a otra."""
+        assert new.narrows(old) is expected
+
+
+class TestLogFilter:
+    """Tests del filtro incremental."""
+
+    def test_initial_scan(self):
+        """Verifica los resultados sobre un buffer existente."""
+        buffer = filled_buffer(
+            record("Conexión establecida"),
+            record("Error de conexión", LogLevel.ERROR),
+            record("Mensaje recibido"),
+            record("Error de parseo", LogLevel.ERROR),
+        )
+
+        log_filter = LogFilter(buffer, LogQuery(levels={LogLevel.ERROR}))
+
+        assert len(log_filter) == 2
+        assert log_filter.sequences() == [1, 3]
+        assert [r.message for r in log_filter.records()] == [
+            "Error de conexión", "Error de parseo",
+        ]
+
+    def test_update_scans_only_new_records(self):
+        """Verifica que update() solo retorne los registros nuevos que cumplen."""
+        buffer = filled_buffer(record("Error 1", LogLevel.ERROR))
+        log_filter = LogFilter(buffer, LogQuery(text="error"))
+
+        buffer.append(record("Mensaje recibido"))
+        buffer.append(record("Error 2", LogLevel.ERROR))
+
+        assert log_filter.update() == [2]
+        assert log_filter.update() == []
+        assert len(log_filter) == 2
+
+    def test_discarded_records_leave_results(self):
+        """Verifica que los registros descartados por el buffer salgan del filtro."""
+        buffer = LogBuffer(max_records=3)
+        log_filter = LogFilter(buffer, LogQuery(levels={LogLevel.WARNING}))
+
+        for i in range(10):
+            buffer.append(record(f"msg {i}", LogLevel.WARNING if i % 2 else LogLevel.INFO))
+        log_filter.update()
+
+        assert log_filter.sequences() == [7, 9]
+        assert [r.message for r in log_filter.records(-1)] == ["msg 9"]
+
+    def test_narrowing_reuses_results(self):
+        """Verifica que restringir la consulta incluya los registros aún no escaneados."""
+        buffer = filled_buffer(
+            record("Error de conexión", LogLevel.ERROR),
+            record("Error de parseo", LogLevel.ERROR),
+        )
+        log_filter = LogFilter(buffer, LogQuery(text="error"))
+        buffer.append(record("Error de conexión", LogLevel.ERROR))
+
+        log_filter.set_query(LogQuery(text="error de con"))
+
+        assert log_filter.sequences() == [0, 2]
+
+    def test_widening_rescans_buffer(self):
+        """Verifica que ampliar la consulta vuelva a escanear el buffer."""
+        buffer = filled_buffer(record("a"), record("b", LogLevel.ERROR), record("c"))
+        log_filter = LogFilter(buffer, LogQuery(levels={LogLevel.ERROR}))
+
+        log_filter.set_query(LogQuery())
+
+        assert log_filter.sequences() == [0, 1, 2]
+
+    def test_multiple_levels_are_merged_in_order(self):
+        """Verifica que varios niveles se combinen en orden de llegada."""
+        buffer = filled_buffer(
+            record("e1", LogLevel.ERROR),
+            record("w1", LogLevel.WARNING),
+            record("i1"),
+            record("e2", LogLevel.ERROR),
+            record("w2", LogLevel.WARNING),
+        )
+
+        log_filter = LogFilter(buffer, LogQuery(levels={LogLevel.ERROR, LogLevel.WARNING}))
+
+        assert [r.message for r in log_filter.records()] == ["e1", "w1", "e2", "w2"]
+
+    def test_slices(self):
+        """Verifica los tramos de resultados con índices negativos."""
+        buffer = filled_buffer(*(record(f"msg {i}") for i in range(10)))
+        log_filter = LogFilter(buffer)
+
+        assert log_filter.sequences(-3) == [7, 8, 9]
+        assert log_filter.sequences(2, 4) == [2, 3]
+
+    def test_buffer_clear_empties_results(self):
+        """Verifica que limpiar el buffer deje el filtro vacío."""
+        buffer = filled_buffer(record("msg"))
+        log_filter = LogFilter(buffer)
+
+        buffer.clear()
+
+        assert len(log_filter) == 0
+        assert log_filter.update() == []
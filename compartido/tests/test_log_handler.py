@@ -0,0 +1,166 @@
+"""Tests para LogViewerHandler."""
+import logging
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from compartido.widgets import LogLevel, LogViewer, LogViewerHandler, level_from_logging
+
+
+@pytest.fixture
+def viewer(qtbot):
+    """LogViewer registrado en qtbot."""
+    viewer = LogViewer(max_lines=1000)
+    qtbot.addWidget(viewer)
+    return viewer
+
+
+@pytest.fixture
+def logger():
+    """Logger aislado sin propagación."""
+    logger = logging.getLogger("test_log_handler")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    logger.handlers.clear()
+
+
+class TestLevelFromLogging:
+    """Tests de la conversión de niveles."""
+
+    @pytest.mark.parametrize("levelno, expected", [
+        (logging.DEBUG, LogLevel.DEBUG),
+        (logging.INFO, LogLevel.INFO),
+        (logging.WARNING, LogLevel.WARNING),
+        (logging.ERROR, LogLevel.ERROR),
+        (logging.CRITICAL, LogLevel.ERROR),
+    ])
+    def test_levels(self, levelno, expected):
+        """Verifica el nivel equivalente."""
+        assert level_from_logging(levelno) == expected
+
+
+class TestLogViewerHandler:
+    """Tests del volcado por lotes."""
+
+    def test_records_are_queued_until_drain(self, viewer, logger):
+        """Los registros se encolan y se vuelcan juntos."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+
+        logger.info("Conexión %s", "establecida")
+        logger.warning("Timeout")
+
+        assert viewer.line_count == 0
+        assert handler.pending == 2
+
+        assert handler.drain() == 2
+        assert [(r.message, r.level) for r in viewer.records] == [
+            ("Conexión establecida", LogLevel.INFO),
+            ("Timeout", LogLevel.WARNING),
+        ]
+        assert handler.pending == 0
+
+    def test_drain_uses_single_batch(self, viewer, logger):
+        """Cada volcado llama una sola vez a add_records."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+        viewer.add_records = Mock(wraps=viewer.add_records)
+
+        for i in range(20):
+            logger.info("msg %d", i)
+        handler.drain()
+
+        viewer.add_records.assert_called_once()
+        assert viewer.line_count == 20
+
+    def test_timer_drains_periodically(self, viewer, logger, qtbot):
+        """El timer vuelca los registros sin intervención."""
+        handler = LogViewerHandler(viewer, interval_ms=10)
+        logger.addHandler(handler)
+
+        logger.error("Error de conexión")
+
+        qtbot.waitUntil(lambda: viewer.line_count == 1, timeout=1000)
+        assert "Error de conexión" in viewer.get_text()
+
+    def test_overflow_drops_oldest_and_counts(self, viewer, logger):
+        """Con la cola llena se descartan los más antiguos y se cuentan."""
+        handler = LogViewerHandler(viewer, interval_ms=10000, max_queue=3)
+        logger.addHandler(handler)
+
+        for i in range(5):
+            logger.info("msg %d", i)
+        handler.drain()
+
+        assert handler.dropped == 2
+        assert [r.message for r in viewer.records] == ["msg 2", "msg 3", "msg 4"]
+
+    def test_emit_from_worker_threads(self, viewer, logger):
+        """Varios hilos pueden loguear a la vez sin perder registros."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+
+        def worker(n):
+            for i in range(100):
+                logger.debug("hilo %d msg %d", n, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        handler.drain()
+
+        assert viewer.line_count == 400
+        assert handler.dropped == 0
+
+    def test_logger_does_not_take_handler_lock(self, viewer, logger):
+        """Loguear por un Logger no espera al lock del handler."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+        worker = threading.Thread(target=logger.info, args=("desde hilo",))
+
+        with handler.lock:
+            worker.start()
+            worker.join(timeout=2.0)
+
+        assert not worker.is_alive()
+        assert handler.pending == 1
+
+    def test_logger_applies_handler_filters(self, viewer, logger):
+        """Los filtros del handler se aplican al loguear por un Logger."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        handler.addFilter(lambda record: "secreto" not in record.getMessage())
+        logger.addHandler(handler)
+
+        logger.info("visible")
+        logger.info("secreto")
+        handler.drain()
+
+        assert [r.message for r in viewer.records] == ["visible"]
+
+    def test_exception_text_is_included(self, viewer, logger):
+        """El traceback forma parte del mensaje mostrado."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+
+        try:
+            raise ValueError("dato inválido")
+        except ValueError:
+            logger.exception("Fallo al parsear")
+        handler.drain()
+
+        assert viewer.line_count == 1
+        assert "ValueError: dato inválido" in viewer.records[0].message
+
+    def test_close_drains_pending(self, viewer, logger):
+        """close() vuelca lo pendiente y detiene el timer."""
+        handler = LogViewerHandler(viewer, interval_ms=10000)
+        logger.addHandler(handler)
+        logger.info("Último mensaje")
+
+        handler.close()
+
+        assert viewer.line_count == 1
@@ -7,6 +7,8 @@ from PyQt6.QtGui import QColor  # pylint: disable=no-name-in-module
 from compartido.widgets import (
     LogViewer,
     LogViewerLabels,
+    LogRecord,
+    LogQuery,
     LogLevel,
     LogColorProvider,
     DefaultLogColorProvider,
@@ -227,6 +229,221 @@ class TestLogViewerLineLimit:
         assert viewer.max_lines == 1
 
 
+    def test_document_blocks_match_line_count(self, qtbot):
+        """Verifica que el documento tenga un bloque por registro conservado."""
+        viewer = LogViewer(max_lines=50)
+        qtbot.addWidget(viewer)
+
+        for i in range(200):
+            viewer.add_log(f"Message {i}", LogLevel.INFO)
+
+        assert viewer.line_count == 50
+        assert viewer._text_area.document().blockCount() == 50
+        lines = viewer.get_text().splitlines()
+        assert len(lines) == 50
+        assert lines[0].endswith("Message 150")
+        assert lines[-1].endswith("Message 199")
+
+    def test_multiline_message_is_one_record(self, qtbot):
+        """Verifica que un mensaje con saltos de línea cuente como un registro."""
+        viewer = LogViewer(max_lines=2)
+        qtbot.addWidget(viewer)
+
+        viewer.add_log("Traceback\n  linea 1\n  linea 2", LogLevel.ERROR)
+        viewer.add_log("Second", LogLevel.INFO)
+
+        assert viewer._text_area.document().blockCount() == 2
+        assert "linea 2" in viewer.get_text()
+
+        viewer.add_log("Third", LogLevel.INFO)
+
+        assert "Traceback" not in viewer.get_text()
+        assert viewer._text_area.document().blockCount() == 2
+
+    def test_records_keep_raw_messages(self, qtbot):
+        """Verifica que records conserve timestamp, nivel y mensaje sin formato."""
+        viewer = LogViewer(max_lines=2)
+        qtbot.addWidget(viewer)
+        custom_time = datetime(2024, 1, 15, 10, 30, 45)
+
+        viewer.add_log("First", LogLevel.INFO)
+        viewer.add_log("Second", LogLevel.WARNING, timestamp=custom_time)
+        viewer.add_log("Third", LogLevel.ERROR)
+
+        assert [r.message for r in viewer.records] == ["Second", "Third"]
+        assert viewer.records[0].level == LogLevel.WARNING
+        assert viewer.records[0].timestamp == custom_time
+
+
+class TestLogViewerAddRecords:
+    """Tests del agregado por lotes."""
+
+    def test_adds_all_records_in_order(self, qtbot):
+        """Verifica que el lote se agrega en orden y emite log_added por registro."""
+        viewer = LogViewer()
+        qtbot.addWidget(viewer)
+        received = []
+        viewer.log_added.connect(lambda msg, level: received.append((msg, level)))
+        now = datetime.now()
+
+        viewer.add_records([
+            LogRecord(now, LogLevel.INFO, "First"),
+            LogRecord(now, LogLevel.ERROR, "Second"),
+        ])
+
+        assert viewer.line_count == 2
+        assert viewer.get_text().index("First") < viewer.get_text().index("Second")
+        assert received == [("First", LogLevel.INFO), ("Second", LogLevel.ERROR)]
+
+    def test_batch_larger_than_max_lines(self, qtbot):
+        """Verifica que de un lote grande solo quedan los últimos max_lines."""
+        viewer = LogViewer(max_lines=3)
+        qtbot.addWidget(viewer)
+        now = datetime.now()
+
+        viewer.add_records(LogRecord(now, LogLevel.INFO, f"msg {i}") for i in range(10))
+
+        assert [r.message for r in viewer.records] == ["msg 7", "msg 8", "msg 9"]
+        assert viewer._text_area.document().blockCount() == 3
+
+    def test_empty_batch_is_noop(self, qtbot):
+        """Verifica que un lote vacío no modifica el visor."""
+        viewer = LogViewer()
+        qtbot.addWidget(viewer)
+
+        viewer.add_records([])
+
+        assert viewer.line_count == 0
+        assert viewer.get_text() == ""
+
+
+class TestLogViewerFilter:
+    """Tests del filtrado del historial."""
+
+    def _viewer(self, qtbot, **kwargs):
+        viewer = LogViewer(**kwargs)
+        qtbot.addWidget(viewer)
+        return viewer
+
+    def test_filter_by_level(self, qtbot):
+        """Verifica que solo se muestren los niveles filtrados."""
+        viewer = self._viewer(qtbot)
+        viewer.add_info("Mensaje recibido")
+        viewer.add_error("Error de conexión")
+        viewer.add_info("Mensaje recibido")
+
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}))
+
+        assert viewer.line_count == 1
+        assert viewer.match_count == 1
+        assert "Error de conexión" in viewer.get_text()
+        assert "Mensaje recibido" not in viewer.get_text()
+
+    def test_new_records_respect_filter(self, qtbot):
+        """Verifica que los registros nuevos se filtren al llegar."""
+        viewer = self._viewer(qtbot)
+        viewer.set_filter(LogQuery(text="timeout"))
+
+        viewer.add_info("Mensaje recibido")
+        viewer.add_warning("Timeout detectado")
+
+        assert viewer.line_count == 1
+        assert "Timeout detectado" in viewer.get_text()
+        assert len(viewer.records) == 2
+
+    def test_clear_filter_restores_all(self, qtbot):
+        """Verifica que quitar el filtro muestre todo el historial."""
+        viewer = self._viewer(qtbot)
+        viewer.add_info("uno")
+        viewer.add_error("dos")
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}))
+
+        viewer.clear_filter()
+
+        assert viewer.filter_query is None
+        assert viewer.line_count == 2
+
+    def test_filter_searches_history_beyond_max_lines(self, qtbot):
+        """Verifica que el filtro busque en todo el historial y muestre max_lines."""
+        viewer = self._viewer(qtbot, max_lines=5, history_size=1000)
+        for i in range(500):
+            viewer.add_error(f"Error {i}") if i % 100 == 0 else viewer.add_info(f"msg {i}")
+
+        assert viewer.line_count == 5
+
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}))
+
+        assert viewer.match_count == 5
+        assert viewer.line_count == 5
+        assert "Error 0" in viewer.get_text()
+
+        viewer.set_filter(LogQuery(text="msg 4"))
+
+        assert viewer.match_count == 110
+        assert viewer.line_count == 5
+        assert viewer._text_area.document().blockCount() == 5
+        assert "msg 499" in viewer.get_text()
+
+    def test_history_size_never_below_max_lines(self, qtbot):
+        """Verifica la capacidad del historial."""
+        assert self._viewer(qtbot, max_lines=50, history_size=10).history_size == 50
+        assert self._viewer(qtbot, max_lines=50).history_size == 50
+
+    def test_search_box_applies_text_filter(self, qtbot):
+        """Verifica que el cuadro de búsqueda filtre conservando los niveles."""
+        viewer = self._viewer(qtbot)
+        viewer.add_error("Error de conexión")
+        viewer.add_error("Error de parseo")
+        viewer.add_info("Conexión establecida")
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}))
+
+        viewer._filter_edit.setText("conexión")
+
+        assert viewer.filter_query == LogQuery(levels={LogLevel.ERROR}, text="conexión")
+        assert viewer.line_count == 1
+
+    def test_search_box_invalid_regex_keeps_filter(self, qtbot):
+        """Verifica que una regex incompleta no cambie el filtro."""
+        viewer = self._viewer(qtbot)
+        viewer.add_info("x1")
+        viewer.add_info("y2")
+        previo = LogQuery(text="x", regex=True)
+        viewer.set_filter(previo)
+
+        viewer._filter_edit.setText("(")
+
+        assert viewer.filter_query == previo
+        assert viewer.line_count == 1
+        assert viewer._filter_edit.toolTip() != ""
+
+        viewer._filter_edit.setText("(y)")
+
+        assert viewer.filter_query == LogQuery(text="(y)", regex=True)
+        assert viewer._filter_edit.toolTip() == ""
+
+    def test_set_filter_updates_search_box(self, qtbot):
+        """Verifica que set_filter refleje el texto en el cuadro de búsqueda."""
+        viewer = self._viewer(qtbot)
+
+        viewer.set_filter(LogQuery(text="timeout"))
+        assert viewer._filter_edit.text() == "timeout"
+
+        viewer.clear_filter()
+        assert viewer._filter_edit.text() == ""
+
+    def test_clear_logs_with_filter(self, qtbot):
+        """Verifica que limpiar deje el filtro activo y vacío."""
+        viewer = self._viewer(qtbot)
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}))
+        viewer.add_error("Error")
+
+        viewer.clear_logs()
+        viewer.add_error("Otro error")
+
+        assert viewer.match_count == 1
+        assert viewer.line_count == 1
+
+
 class TestLogViewerClear:
     """Tests de limpieza de logs."""
 
@@ -287,6 +504,19 @@ class TestLogViewerAutoScroll:
         assert viewer.auto_scroll is False
         assert viewer._auto_scroll_checkbox.isChecked() is False
 
+    def test_auto_scroll_once_per_event_loop(self, qtbot):
+        """Verifica que el scroll al final se haga tras procesar los eventos."""
+        viewer = LogViewer(auto_scroll=True)
+        qtbot.addWidget(viewer)
+        viewer.resize(300, 100)
+        viewer.show()
+
+        for i in range(100):
+            viewer.add_log(f"Message {i}", LogLevel.INFO)
+        scrollbar = viewer._text_area.verticalScrollBar()
+
+        qtbot.waitUntil(lambda: scrollbar.maximum() > 0 and scrollbar.value() == scrollbar.maximum())
+
     def test_checkbox_updates_auto_scroll(self, qtbot):
         """Verifica que checkbox actualiza auto_scroll."""
         viewer = LogViewer(auto_scroll=True)
@@ -0,0 +1,132 @@
+"""
+Tests unitarios para los delimitadores de mensajes (framers).
+
+Verifican que los registros se entreguen completos sin importar
+cómo se fragmenten los bytes entre llamadas a `recv()`.
+"""
+import json
+
+import pytest
+
+from compartido.networking import (
+    RawFramer,
+    NewlineFramer,
+    LengthPrefixedFramer,
+    JsonObjectFramer,
+)
+
+
+def feed_bytewise(framer, data: bytes):
+    """Alimenta el framer de a un byte y acumula los registros."""
+    records = []
+    for i in range(len(data)):
+        records.extend(framer.feed(data[i:i + 1]))
+    return records
+
+
+class TestRawFramer:
+    """Tests del framer transparente."""
+
+    def test_chunk_is_single_record(self):
+        """Verifica que cada chunk sea un registro."""
+        assert RawFramer().feed(b"23.5") == [b"23.5"]
+
+    def test_empty_chunk_has_no_records(self):
+        """Verifica que un chunk vacío no genere registros."""
+        assert RawFramer().feed(b"") == []
+
+
+class TestNewlineFramer:
+    """Tests del framer por salto de línea."""
+
+    def test_splits_multiple_records(self):
+        """Verifica la separación de varios registros en un chunk."""
+        framer = NewlineFramer()
+        assert framer.feed(b"23.5\n24.0\n") == [b"23.5", b"24.0"]
+        assert framer.pending == 0
+
+    def test_keeps_partial_record(self):
+        """Verifica que un registro incompleto quede pendiente."""
+        framer = NewlineFramer()
+        assert framer.feed(b"23.5\n24") == [b"23.5"]
+        assert framer.pending == 2
+        assert framer.feed(b".0\n") == [b"24.0"]
+
+    def test_multibyte_delimiter_split_across_chunks(self):
+        """Verifica que se detecte un delimitador partido entre chunks."""
+        framer = NewlineFramer(delimiter=b"\r\n")
+        assert framer.feed(b"23.5\r") == []
+        assert framer.feed(b"\n24") == [b"23.5"]
+        assert framer.feed(b".0\r") == []
+        assert framer.feed(b"\n") == [b"24.0"]
+        assert framer.pending == 0
+
+    def test_skips_blank_lines(self):
+        """Verifica que se ignoren líneas vacías."""
+        assert NewlineFramer().feed(b"\n\n1\n\n") == [b"1"]
+
+    def test_overflow_raises_and_resets(self):
+        """Verifica que un registro gigante se descarte."""
+        framer = NewlineFramer(max_buffer_size=8)
+        with pytest.raises(ValueError):
+            framer.feed(b"0123456789")
+        assert framer.pending == 0
+
+    def test_encode_appends_delimiter(self):
+        """Verifica que encode agregue el delimitador."""
+        assert NewlineFramer().encode(b"23.5") == b"23.5\n"
+
+
+class TestLengthPrefixedFramer:
+    """Tests del framer con prefijo de longitud."""
+
+    def test_roundtrip(self):
+        """Verifica que encode/feed sean inversos."""
+        framer = LengthPrefixedFramer()
+        data = framer.encode(b"hola") + framer.encode(b"mundo\n")
+        assert framer.feed(data) == [b"hola", b"mundo\n"]
+
+    def test_bytewise_delivery(self):
+        """Verifica la entrega con fragmentación extrema."""
+        framer = LengthPrefixedFramer()
+        data = framer.encode(b"abc") + framer.encode(b"")
+        assert feed_bytewise(framer, data) == [b"abc", b""]
+
+    def test_invalid_length_raises(self):
+        """Verifica que una longitud absurda se rechace."""
+        framer = LengthPrefixedFramer(max_buffer_size=16)
+        with pytest.raises(ValueError):
+            framer.feed(b"\xff\xff\xff\xff")
+        assert framer.pending == 0
+
+
+class TestJsonObjectFramer:
+    """Tests del framer por objetos JSON."""
+
+    def test_back_to_back_objects(self):
+        """Verifica objetos concatenados sin separador."""
+        records = JsonObjectFramer().feed(b'{"a": 1}{"a": 2}\n{"a": 3}')
+        assert [json.loads(r) for r in records] == [
+            {"a": 1}, {"a": 2}, {"a": 3}
+        ]
+
+    def test_object_split_across_chunks(self):
+        """Verifica un objeto partido en varios segmentos."""
+        mensaje = json.dumps({
+            "temperatura_actual": 22.5,
+            "nested": {"lista": [1, 2, {"x": "}"}]},
+        }).encode()
+        framer = JsonObjectFramer()
+        assert feed_bytewise(framer, mensaje) == [mensaje]
+        assert framer.pending == 0
+
+    def test_braces_inside_strings_are_ignored(self):
+        """Verifica que llaves y comillas escapadas dentro de strings no cuenten."""
+        mensaje = b'{"texto": "a}b{c \\"}\\" \\\\"}'
+        assert JsonObjectFramer().feed(mensaje) == [mensaje]
+
+    def test_loose_text_is_delivered(self):
+        """Verifica que texto fuera de objetos se entregue como registro."""
+        framer = JsonObjectFramer()
+        assert framer.feed(b"no es json\n") == [b"no es json"]
+        assert framer.feed(b'basura {"a": 1}') == [b"basura", b'{"a": 1}']
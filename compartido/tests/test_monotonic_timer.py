@@ -0,0 +1,161 @@
+"""
+Tests unitarios para MonotonicTimer.
+"""
+import time
+
+import pytest
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+from compartido.scheduling import (
+    MissedTickPolicy,
+    MonotonicTimer,
+    TickStats,
+    VirtualClock,
+)
+
+
+@pytest.fixture
+def timer(qapp):
+    """Temporizador con política por defecto."""
+    t = MonotonicTimer()
+    yield t
+    t.stop()
+
+
+class TestMonotonicTimer:
+    """Tests del temporizador sin deriva."""
+
+    def test_initial_state(self, timer):
+        """Verifica que arranque detenido y sin estadísticas."""
+        assert not timer.isActive()
+        assert timer.policy is MissedTickPolicy.SKIP
+        assert timer.stats == TickStats(0, 0, 0.0, 0.0, 0.0)
+
+    def test_start_rejects_non_positive_interval(self, timer):
+        """Verifica la validación del intervalo."""
+        with pytest.raises(ValueError):
+            timer.start(0)
+
+    def test_emits_periodically(self, timer, qtbot):
+        """Verifica la cantidad de ticks en una ventana de tiempo."""
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        timer.start(20)
+        qtbot.wait(210)
+
+        assert 8 <= len(ticks) <= 11
+        assert timer.stats.ticks == len(ticks)
+        assert timer.interval() == 20
+
+    def test_restart_does_not_duplicate(self, timer, qtbot):
+        """Verifica que start() repetido reinicie en lugar de duplicar."""
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        for _ in range(3):
+            timer.start(50)
+        qtbot.wait(230)
+
+        assert 3 <= len(ticks) <= 5
+
+    def test_stop_halts_emission(self, timer, qtbot):
+        """Verifica que no haya ticks después de stop()."""
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        timer.start(20)
+        qtbot.wait(70)
+        timer.stop()
+        emitidos = len(ticks)
+        qtbot.wait(80)
+
+        assert not timer.isActive()
+        assert len(ticks) == emitidos
+
+    def test_no_drift_with_slow_slot(self, timer, qtbot):
+        """Verifica que la latencia del slot no desplace los vencimientos."""
+        ticks = []
+
+        def lento():
+            ticks.append(time.monotonic())
+            time.sleep(0.008)
+
+        timer.timeout.connect(lento)
+        timer.start(20)
+        qtbot.wait(410)
+
+        # Con QTimer relativo el periodo efectivo sería ~28 ms (≈14 ticks)
+        assert len(ticks) >= 18
+        assert timer.stats.mean_lateness_ms < 20
+
+    def test_skip_policy_drops_missed_ticks(self, timer, qapp):
+        """Verifica que SKIP descarte los ticks perdidos por un bloqueo."""
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        timer.start(10)
+        time.sleep(0.055)  # Bloquea el event loop ~5 intervalos
+        qapp.processEvents()
+
+        stats = timer.stats
+        assert len(ticks) == 1
+        assert stats.skipped >= 4
+        assert stats.max_lateness_ms >= 40
+
+    def test_catch_up_policy_emits_missed_ticks(self, qapp):
+        """Verifica que CATCH_UP emita los ticks perdidos."""
+        timer = MonotonicTimer(policy=MissedTickPolicy.CATCH_UP)
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        timer.start(10)
+        time.sleep(0.055)
+        qapp.processEvents()
+        timer.stop()
+
+        assert len(ticks) >= 5
+        assert timer.stats.skipped == 0
+
+    def test_catch_up_is_capped(self, qapp):
+        """Verifica el tope max_catch_up."""
+        timer = MonotonicTimer(policy=MissedTickPolicy.CATCH_UP, max_catch_up=2)
+        ticks = []
+        timer.timeout.connect(lambda: ticks.append(1))
+
+        timer.start(10)
+        time.sleep(0.065)
+        qapp.processEvents()
+        timer.stop()
+
+        assert len(ticks) == 3
+        assert timer.stats.skipped >= 3
+
+    def test_stop_inside_slot_halts_catch_up(self, qapp, qtbot):
+        """Verifica que stop() desde el slot corte los ticks pendientes."""
+        timer = MonotonicTimer(policy=MissedTickPolicy.CATCH_UP)
+        ticks = []
+
+        def slot():
+            ticks.append(1)
+            timer.stop()
+
+        timer.timeout.connect(slot)
+        timer.start(10)
+        time.sleep(0.055)
+        qtbot.wait(30)
+
+        assert ticks == [1]
+
+    def test_deleted_timer_ignores_shared_clock(self, qapp, qtbot):
+        """Verifica que un reloj externo no dispare un timer ya destruido."""
+        reloj = VirtualClock()
+        padre = QObject()
+        timer = MonotonicTimer(padre, clock=reloj)
+
+        timer.start(10)
+        sip.delete(padre)
+        qtbot.wait(20)
+
+        assert reloj.pending == 0
@@ -0,0 +1,95 @@
+"""
+Tests unitarios para PeriodicScheduler.
+
+El planificador no depende de Qt, por lo que no se usa qapp.
+"""
+import threading
+import time
+
+import pytest
+
+from compartido.scheduling import PeriodicScheduler
+
+
+class TestPeriodicScheduler:
+    """Tests del planificador periódico."""
+
+    def test_runs_task_periodically(self):
+        """Verifica la cantidad de ejecuciones en una ventana de tiempo."""
+        scheduler = PeriodicScheduler()
+        ticks = []
+        scheduler.schedule(0.02, lambda: ticks.append(time.monotonic()))
+
+        scheduler.run(duration=0.21)
+
+        assert 9 <= len(ticks) <= 11
+        assert scheduler.executed == len(ticks)
+
+    def test_first_run_after_delay(self):
+        """Verifica que delay=0 ejecute de inmediato."""
+        scheduler = PeriodicScheduler()
+        ticks = []
+        scheduler.schedule(10.0, lambda: ticks.append(1), delay=0)
+
+        scheduler.run(duration=0.05)
+
+        assert ticks == [1]
+
+    def test_no_drift_with_slow_callback(self):
+        """Verifica que la latencia del callback no desplace los vencimientos."""
+        scheduler = PeriodicScheduler()
+        ticks = []
+
+        def lento():
+            ticks.append(time.monotonic())
+            time.sleep(0.01)
+
+        scheduler.schedule(0.03, lento)
+        scheduler.run(duration=0.315)
+
+        assert len(ticks) >= 9
+
+    def test_skips_missed_ticks(self):
+        """Verifica que un atraso grande omita las ejecuciones perdidas."""
+        scheduler = PeriodicScheduler()
+        ticks = []
+
+        def bloquea_una_vez():
+            ticks.append(1)
+            if len(ticks) == 1:
+                time.sleep(0.1)
+
+        scheduler.schedule(0.02, bloquea_una_vez, delay=0)
+        scheduler.run(duration=0.11)
+
+        assert scheduler.skipped >= 4
+        assert len(ticks) <= 2
+
+    def test_cancel(self):
+        """Verifica que una tarea cancelada no se ejecute más."""
+        scheduler = PeriodicScheduler()
+        ticks = []
+        task_id = scheduler.schedule(0.01, lambda: ticks.append(1))
+
+        assert scheduler.cancel(task_id) is True
+        assert scheduler.cancel(task_id) is False
+        scheduler.run(duration=0.05)
+
+        assert ticks == []
+        assert scheduler.task_count() == 0
+
+    def test_stop_from_other_thread(self):
+        """Verifica que stop() desbloquee run() sin tareas."""
+        scheduler = PeriodicScheduler()
+        threading.Timer(0.05, scheduler.stop).start()
+
+        inicio = time.monotonic()
+        scheduler.run()
+
+        assert time.monotonic() - inicio < 1.0
+        assert scheduler.is_running() is False
+
+    def test_invalid_interval(self):
+        """Verifica la validación del intervalo."""
+        with pytest.raises(ValueError):
+            PeriodicScheduler().schedule(0, lambda: None)
@@ -0,0 +1,169 @@
+"""
+Tests unitarios para SelectorSocketServer.
+
+Usa sockets reales en localhost para verificar que el servidor
+basado en selectores se comporte igual que BaseSocketServer.
+"""
+import socket
+import time
+
+import pytest
+
+from compartido.networking import SelectorSocketServer, SocketServerBase
+
+
+@pytest.fixture
+def app(qapp):
+    """Fixture que proporciona la aplicación Qt."""
+    return qapp
+
+
+def get_free_port():
+    """Obtiene un puerto libre del sistema."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until(condition, timeout=2.0):
+    """Espera activa hasta que se cumpla la condición o expire el timeout."""
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def started_server(app, qtbot):
+    """Fixture que crea y arranca un servidor."""
+    srv = SelectorSocketServer("127.0.0.1", get_free_port())
+    srv.start()
+    yield srv
+    srv.stop()
+
+
+class TestSelectorSocketServerInit:
+    """Tests de inicialización."""
+
+    def test_inherits_from_socket_server_base(self):
+        """Verifica la jerarquía de herencia."""
+        server = SelectorSocketServer("127.0.0.1", 14001)
+        assert isinstance(server, SocketServerBase)
+
+    def test_init_not_running(self):
+        """Verifica que el servidor inicie detenido."""
+        server = SelectorSocketServer("127.0.0.1", 14001)
+        assert server.is_running() is False
+        assert server.get_client_count() == 0
+
+
+class TestSelectorSocketServerStartStop:
+    """Tests de inicio y detención."""
+
+    def test_start_and_stop_emit_signals(self, app, qtbot):
+        """Verifica que start y stop emitan sus señales."""
+        server = SelectorSocketServer("127.0.0.1", get_free_port())
+
+        with qtbot.waitSignal(server.started, timeout=2000):
+            assert server.start() is True
+        assert server.is_running() is True
+
+        with qtbot.waitSignal(server.stopped, timeout=2000):
+            server.stop()
+        assert server.is_running() is False
+
+    def test_start_twice_returns_true(self, app, qtbot):
+        """Verifica que iniciar dos veces no cause error."""
+        server = SelectorSocketServer("127.0.0.1", get_free_port())
+        try:
+            server.start()
+            assert server.start() is True
+        finally:
+            server.stop()
+
+    def test_stop_when_not_running_is_safe(self):
+        """Verifica que stop sea seguro sin estar corriendo."""
+        server = SelectorSocketServer("127.0.0.1", 14001)
+        server.stop()
+        assert server.is_running() is False
+
+    def test_start_on_used_port_emits_error(self, app, qtbot):
+        """Verifica error al iniciar en puerto ocupado."""
+        port = get_free_port()
+        blocker = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        blocker.bind(("127.0.0.1", port))
+        blocker.listen(1)
+
+        try:
+            server = SelectorSocketServer("127.0.0.1", port)
+            with qtbot.waitSignal(server.error_occurred, timeout=2000):
+                assert server.start() is False
+            assert server.is_running() is False
+        finally:
+            blocker.close()
+
+    def test_stop_closes_client_connections(self, started_server, app, qtbot):
+        """Verifica que stop cierre las conexiones abiertas."""
+        client = socket.create_connection(("127.0.0.1", started_server.port))
+        assert wait_until(lambda: started_server.get_client_count() == 1)
+
+        started_server.stop()
+
+        client.settimeout(2.0)
+        assert client.recv(16) == b""
+        assert started_server.get_client_count() == 0
+        client.close()
+
+
+class TestSelectorSocketServerClients:
+    """Tests de conexión y recepción."""
+
+    def test_client_connect_and_disconnect_emit_signals(
+        self, started_server, app, qtbot
+    ):
+        """Verifica las señales de conexión y desconexión."""
+        with qtbot.waitSignal(
+            started_server.client_connected, timeout=2000
+        ) as blocker:
+            client = socket.create_connection(
+                ("127.0.0.1", started_server.port)
+            )
+        assert "127.0.0.1" in blocker.args[0]
+
+        with qtbot.waitSignal(
+            started_server.client_disconnected, timeout=2000
+        ):
+            client.close()
+
+    def test_receive_data_emits_signal(self, started_server, app, qtbot):
+        """Verifica que datos recibidos emitan data_received."""
+        client = socket.create_connection(("127.0.0.1", started_server.port))
+
+        with qtbot.waitSignal(
+            started_server.data_received, timeout=2000
+        ) as blocker:
+            client.sendall(b"ambiente: 23.5\n")
+
+        assert blocker.args[0] == "ambiente: 23.5"
+        client.close()
+
+    def test_many_concurrent_clients_single_io_thread(
+        self, started_server, app, qtbot
+    ):
+        """Verifica que muchas sesiones no creen un hilo por cliente."""
+        import threading
+
+        hilos_antes = threading.active_count()
+        clients = [
+            socket.create_connection(("127.0.0.1", started_server.port))
+            for _ in range(50)
+        ]
+
+        assert wait_until(lambda: started_server.get_client_count() == 50)
+        assert threading.active_count() == hilos_antes
+
+        for client in clients:
+            client.close()
+        assert wait_until(lambda: started_server.get_client_count() == 0)
@@ -0,0 +1,219 @@
+"""
+Tests unitarios para SendExecutor.
+
+Usan eventos para bloquear a los trabajadores y así controlar de forma
+determinista el contenido de la cola.
+"""
+import threading
+import time
+
+import pytest
+
+from compartido.networking import (
+    DropPolicy,
+    EphemeralSocketClient,
+    SendExecutor,
+)
+
+
+def wait_until(condition, timeout=2.0):
+    """Espera activa hasta que se cumpla la condición."""
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def gate():
+    """Evento que mantiene bloqueado al trabajador hasta liberarlo."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def make_executor(gate, policy, queue_depth=2):
+    """Crea un ejecutor de un hilo con el trabajador ocupado."""
+    executor = SendExecutor(max_workers=1, queue_depth=queue_depth, policy=policy)
+    executor.submit(gate.wait)
+    assert wait_until(lambda: executor.stats.in_flight == 1)
+    return executor
+
+
+class TestSendExecutor:
+    """Tests del ejecutor acotado."""
+
+    def test_runs_submitted_functions(self):
+        """Verifica que las funciones se ejecuten."""
+        executor = SendExecutor(max_workers=2)
+        done = []
+        for i in range(10):
+            executor.submit(lambda i=i: done.append(i))
+
+        assert wait_until(lambda: executor.stats.completed == 10)
+        assert sorted(done) == list(range(10))
+        executor.shutdown()
+
+    def test_worker_count_is_bounded(self, gate):
+        """Verifica que no se creen más hilos que max_workers."""
+        executor = SendExecutor(max_workers=3, queue_depth=100)
+        hilos_antes = threading.active_count()
+        for _ in range(20):
+            executor.submit(gate.wait)
+
+        assert wait_until(lambda: executor.stats.in_flight == 3)
+        assert threading.active_count() - hilos_antes == 3
+        assert executor.stats.queued == 17
+        gate.set()
+        executor.shutdown()
+
+    def test_drop_oldest(self, gate):
+        """Verifica que se descarte el envío más antiguo."""
+        executor = make_executor(gate, DropPolicy.DROP_OLDEST)
+        done = []
+        for i in range(4):
+            assert executor.submit(lambda i=i: done.append(i)) is True
+
+        assert executor.stats.dropped == 2
+        gate.set()
+        assert wait_until(lambda: executor.stats.completed == 3)
+        assert done == [2, 3]
+
+    def test_drop_newest(self, gate):
+        """Verifica que se rechace el envío nuevo."""
+        executor = make_executor(gate, DropPolicy.DROP_NEWEST)
+        done = []
+        results = [executor.submit(lambda i=i: done.append(i)) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        gate.set()
+        assert wait_until(lambda: executor.stats.completed == 3)
+        assert done == [0, 1]
+
+    def test_coalesce_latest(self, gate):
+        """Verifica que se conserve solo el último envío por clave."""
+        executor = make_executor(gate, DropPolicy.COALESCE_LATEST, queue_depth=8)
+        done = []
+        for i in range(5):
+            executor.submit(lambda i=i: done.append(("a", i)), key="a")
+        executor.submit(lambda: done.append(("b", 0)), key="b")
+
+        stats = executor.stats
+        assert stats.queued == 2
+        assert stats.dropped == 4
+        gate.set()
+        assert wait_until(lambda: executor.stats.completed == 3)
+        assert done == [("a", 4), ("b", 0)]
+
+    def test_on_drop_when_evicted(self, gate):
+        """Verifica que se avise el descarte de un envío desalojado."""
+        executor = make_executor(gate, DropPolicy.DROP_OLDEST)
+        dropped = []
+        for i in range(4):
+            executor.submit(lambda: None, on_drop=lambda i=i: dropped.append(i))
+
+        assert dropped == [0, 1]
+        gate.set()
+        assert wait_until(lambda: executor.stats.completed == 3)
+        assert dropped == [0, 1]
+
+    def test_on_drop_when_coalesced(self, gate):
+        """Verifica que se avise al reemplazar un envío con la misma clave."""
+        executor = make_executor(gate, DropPolicy.COALESCE_LATEST, queue_depth=8)
+        dropped = []
+        for i in range(3):
+            executor.submit(lambda: None, key="a", on_drop=lambda i=i: dropped.append(i))
+
+        assert dropped == [0, 1]
+        gate.set()
+        assert wait_until(lambda: executor.stats.completed == 2)
+        assert dropped == [0, 1]
+
+    def test_on_drop_on_shutdown(self, gate):
+        """Verifica que se avise el descarte de los envíos en cola al detener."""
+        executor = make_executor(gate, DropPolicy.DROP_OLDEST)
+        dropped = []
+        executor.submit(lambda: None, on_drop=lambda: dropped.append(0))
+
+        executor.shutdown(wait=False)
+        assert dropped == [0]
+
+    def test_on_drop_not_called_when_rejected(self, gate):
+        """Verifica que un envío rechazado no avise (submit ya retorna False)."""
+        executor = make_executor(gate, DropPolicy.DROP_NEWEST, queue_depth=1)
+        dropped = []
+        executor.submit(lambda: None, on_drop=lambda: dropped.append(0))
+        assert executor.submit(lambda: None, on_drop=lambda: dropped.append(1)) is False
+        assert dropped == []
+
+    def test_failing_on_drop_does_not_reject_submit(self, gate):
+        """Verifica que un on_drop que lanza no afecte al envío nuevo."""
+        executor = make_executor(gate, DropPolicy.DROP_OLDEST, queue_depth=1)
+
+        def falla():
+            raise RuntimeError("boom")
+
+        executor.submit(lambda: None, on_drop=falla)
+        assert executor.submit(lambda: None) is True
+        assert executor.stats.queued == 1
+
+    def test_exception_does_not_kill_worker(self):
+        """Verifica que un envío que lanza no detenga al trabajador."""
+        executor = SendExecutor(max_workers=1)
+
+        def falla():
+            raise RuntimeError("boom")
+
+        executor.submit(falla)
+        done = []
+        executor.submit(lambda: done.append(1))
+        assert wait_until(lambda: done == [1])
+        executor.shutdown()
+
+    def test_invalid_parameters(self):
+        """Verifica la validación de parámetros."""
+        with pytest.raises(ValueError):
+            SendExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            SendExecutor(queue_depth=0)
+
+    def test_submit_after_shutdown_is_dropped(self):
+        """Verifica que tras el shutdown los envíos se descarten."""
+        executor = SendExecutor()
+        executor.shutdown()
+        assert executor.submit(lambda: None) is False
+        assert executor.stats.dropped == 1
+
+
+class TestEphemeralSocketClientExecutor:
+    """Tests de integración de send_async con el ejecutor."""
+
+    def test_send_async_uses_executor_with_destination_key(self, qapp):
+        """Verifica que send_async encole con clave (host, puerto)."""
+        calls = []
+
+        class _Recorder(SendExecutor):
+            def submit(self, fn, key=None, on_drop=None):
+                calls.append(key)
+                return True
+
+        client = EphemeralSocketClient(
+            "127.0.0.1", 12000, executor=_Recorder()
+        )
+        assert client.send_async("23.5") is True
+        assert calls == [("127.0.0.1", 12000)]
+
+    def test_send_dropped_when_evicted(self, qapp, gate):
+        """Verifica que un envío desalojado de la cola emita send_dropped."""
+        executor = make_executor(gate, DropPolicy.DROP_OLDEST, queue_depth=1)
+        client = EphemeralSocketClient("127.0.0.1", 12000, executor=executor)
+        dropped = []
+        client.send_dropped.connect(lambda: dropped.append(True))
+
+        assert client.send_async("23.5") is True
+        executor.submit(lambda: None)
+
+        assert dropped == [True]
+        executor.shutdown(wait=False)
@@ -0,0 +1,189 @@
+"""
+Tests unitarios para SensorFleet.
+
+Usa un servidor TCP real en localhost que registra cada conexión
+efímera como un valor recibido.
+"""
+import socket
+import threading
+import time
+
+import pytest
+
+from compartido.fleet import SensorFleet, SensorStream
+from compartido.networking import DropPolicy, SendExecutor
+
+
+class _CollectingServer:
+    """Servidor TCP que acumula lo recibido en cada conexión."""
+
+    def __init__(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(128)
+        self.port = self._sock.getsockname()[1]
+        self.values = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn:
+                data = b""
+                while True:
+                    chunk = conn.recv(1024)
+                    if not chunk:
+                        break
+                    data += chunk
+            with self._lock:
+                self.values.append(data.decode())
+
+    def received(self):
+        with self._lock:
+            return list(self.values)
+
+    def close(self):
+        self._sock.close()
+
+
+@pytest.fixture
+def server():
+    """Servidor de registro en un puerto libre."""
+    srv = _CollectingServer()
+    yield srv
+    srv.close()
+
+
+def wait_until(condition, timeout=2.0):
+    """Espera activa hasta que se cumpla la condición."""
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSensorFleet:
+    """Tests de la flota de sensores."""
+
+    def test_streams_send_their_own_values(self, server, qapp):
+        """Verifica que cada sensor envíe los valores de su fuente."""
+        fleet = SensorFleet([
+            SensorStream("a", "127.0.0.1", server.port, 0.05, lambda t: 1.0),
+            SensorStream("b", "127.0.0.1", server.port, 0.05, lambda t: 2.5, decimals=1),
+        ])
+
+        fleet.run(duration=0.22)
+
+        assert wait_until(lambda: fleet.report().sent == fleet.report().generated)
+        valores = server.received()
+        assert "1.00" in valores
+        assert "2.5" in valores
+        assert set(valores) == {"1.00", "2.5"}
+
+    def test_report_per_sensor_and_aggregate(self, server, qapp):
+        """Verifica los contadores por sensor y agregados."""
+        streams = [
+            SensorStream(f"s{i}", "127.0.0.1", server.port, 0.05, lambda t: 0.0)
+            for i in range(20)
+        ]
+        fleet = SensorFleet(streams)
+
+        fleet.run(duration=0.27)
+        assert wait_until(lambda: fleet.report().sent == fleet.report().generated)
+
+        reporte = fleet.report()
+        assert len(reporte.sensors) == 20
+        assert all(s.generated >= 4 for s in reporte.sensors)
+        assert reporte.sent == sum(s.sent for s in reporte.sensors)
+        assert reporte.rate == pytest.approx(reporte.sent / reporte.elapsed)
+        assert len(server.received()) == reporte.sent
+
+    def test_failed_sends_are_counted(self, qapp):
+        """Verifica el conteo de envíos a un destino sin servidor."""
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        fleet = SensorFleet([SensorStream("x", "127.0.0.1", port, 0.02, lambda t: 0.0)])
+        fleet.run(duration=0.1)
+
+        assert wait_until(lambda: fleet.report().failed >= 3)
+        assert fleet.report().sent == 0
+
+    def test_slow_pipeline_coalesces_per_sensor(self, qapp):
+        """Verifica que con el pipeline ocupado solo quede el último valor."""
+        gate = threading.Event()
+        executor = SendExecutor(
+            max_workers=1, queue_depth=8, policy=DropPolicy.COALESCE_LATEST
+        )
+        executor.submit(gate.wait)
+
+        fleet = SensorFleet(
+            [SensorStream("x", "127.0.0.1", 1, 0.01, lambda t: t)],
+            executor=executor,
+        )
+        fleet.run(duration=0.1)
+        reporte = fleet.report()
+        gate.set()
+
+        assert reporte.generated >= 5
+        assert reporte.coalesced == reporte.generated - 1
+        assert executor.stats.queued <= 1
+
+    def test_evicted_sends_are_counted_as_failed(self, qapp):
+        """Verifica que un envío desalojado de la cola no quede pendiente."""
+        gate = threading.Event()
+        executor = SendExecutor(
+            max_workers=1, queue_depth=1, policy=DropPolicy.DROP_OLDEST
+        )
+        executor.submit(gate.wait)
+        assert wait_until(lambda: executor.stats.in_flight == 1)
+
+        fleet = SensorFleet(
+            [
+                SensorStream("a", "127.0.0.1", 1, 0.01, lambda t: t),
+                SensorStream("b", "127.0.0.1", 1, 0.01, lambda t: t),
+            ],
+            executor=executor,
+        )
+        fleet.run(duration=0.1)
+        reporte = fleet.report()
+        queued = executor.stats.queued
+        executor.shutdown(wait=False)
+        gate.set()
+
+        # DROP_OLDEST nunca coalesce: todo valor no enviado es un fallo
+        assert reporte.generated >= 4
+        assert reporte.coalesced == 0
+        assert reporte.failed + queued == reporte.generated
+
+    def test_failing_source_does_not_stop_fleet(self, server, qapp):
+        """Verifica que una fuente que lanza no detenga a los demás sensores."""
+        def falla(_t):
+            raise RuntimeError("sensor roto")
+
+        fleet = SensorFleet([
+            SensorStream("roto", "127.0.0.1", server.port, 0.02, falla),
+            SensorStream("sano", "127.0.0.1", server.port, 0.02, lambda t: 1.0),
+        ])
+        reporte = fleet.run(duration=0.2)
+
+        roto, sano = reporte.sensors
+        assert roto.source_errors >= 3
+        assert roto.generated == 0
+        assert sano.generated >= 3
+        assert sano.source_errors == 0
+        assert reporte.source_errors == roto.source_errors
+        assert wait_until(lambda: fleet.report().sent >= 1)
+
+    def test_duplicate_name_rejected(self, qapp):
+        """Verifica que los nombres de sensor sean únicos."""
+        fleet = SensorFleet([SensorStream("a", "127.0.0.1", 1, 1.0, lambda t: 0.0)])
+        with pytest.raises(ValueError):
+            fleet.add(SensorStream("a", "127.0.0.1", 2, 1.0, lambda t: 0.0))
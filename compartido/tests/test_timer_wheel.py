@@ -0,0 +1,93 @@
+"""
+Tests unitarios para TimerWheel.
+
+La rueda no depende de Qt, por lo que no se usa qapp.
+"""
+import threading
+import time
+
+import pytest
+
+from compartido.scheduling import TimerWheel
+
+
+class TestTimerWheel:
+    """Tests de la rueda de temporizadores."""
+
+    def test_runs_many_tasks(self):
+        """Verifica que cada tarea se ejecute a su intervalo."""
+        wheel = TimerWheel(tick=0.005, slots=16)
+        counts = [0] * 200
+        for i in range(200):
+            wheel.schedule(0.05, lambda i=i: counts.__setitem__(i, counts[i] + 1))
+
+        wheel.run(duration=0.26)
+
+        assert all(4 <= c <= 5 for c in counts)
+
+    def test_intervals_longer_than_wheel(self):
+        """Verifica intervalos que dan más de una vuelta a la rueda."""
+        wheel = TimerWheel(tick=0.005, slots=4)
+        ticks = []
+        wheel.schedule(0.05, lambda: ticks.append(1))
+
+        wheel.run(duration=0.125)
+
+        assert len(ticks) == 2
+
+    def test_rounds_to_tick(self):
+        """Verifica que un intervalo menor al tick use un tick."""
+        wheel = TimerWheel(tick=0.01)
+        ticks = []
+        wheel.schedule(0.001, lambda: ticks.append(1))
+
+        wheel.run(duration=0.105)
+
+        assert 8 <= len(ticks) <= 11
+
+    def test_cancel(self):
+        """Verifica que una tarea cancelada no se ejecute."""
+        wheel = TimerWheel()
+        ticks = []
+        task_id = wheel.schedule(0.01, lambda: ticks.append(1))
+
+        assert wheel.cancel(task_id) is True
+        assert wheel.cancel(task_id) is False
+        wheel.run(duration=0.05)
+
+        assert ticks == []
+
+    def test_skips_missed_ticks(self):
+        """Verifica que un callback lento no provoque ráfagas de ejecuciones."""
+        wheel = TimerWheel(tick=0.005)
+        ticks = []
+
+        def bloquea_una_vez():
+            ticks.append(1)
+            if len(ticks) == 1:
+                time.sleep(0.1)
+
+        wheel.schedule(0.01, bloquea_una_vez)
+        wheel.run(duration=0.12)
+
+        assert wheel.skipped >= 5
+        assert len(ticks) <= 4
+
+    def test_stop_from_other_thread(self):
+        """Verifica que stop() desbloquee run()."""
+        wheel = TimerWheel()
+        threading.Timer(0.05, wheel.stop).start()
+
+        inicio = time.monotonic()
+        wheel.run()
+
+        assert time.monotonic() - inicio < 1.0
+
+    def test_invalid_parameters(self):
+        """Verifica la validación de parámetros."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(slots=0)
+        with pytest.raises(ValueError):
+            TimerWheel().schedule(-1, lambda: None)
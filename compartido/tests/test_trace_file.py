@@ -0,0 +1,157 @@
+"""
+Tests unitarios para la lectura de trazas (CSV y binaria).
+
+No dependen de Qt.
+"""
+import pytest
+
+from compartido.replay import (
+    BINARY_SUFFIX,
+    BinaryTrace,
+    CsvTrace,
+    convert_csv_to_binary,
+    open_trace,
+    write_binary_trace,
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV con encabezado y tres filas."""
+    ruta = tmp_path / "sala.csv"
+    ruta.write_text("tiempo_s,temperatura\n0,20.5\n1.5,21.0\n3,21.25\n", encoding="utf-8")
+    return ruta
+
+
+class TestCsvTrace:
+    """Tests del lector CSV."""
+
+    def test_reads_samples_skipping_header(self, csv_path):
+        """Verifica las muestras y que el encabezado se ignore."""
+        assert list(CsvTrace(csv_path)) == [(0.0, 20.5), (1.5, 21.0), (3.0, 21.25)]
+
+    def test_iterates_again_from_start(self, csv_path):
+        """Verifica que cada iteración recorra el archivo completo."""
+        traza = CsvTrace(csv_path)
+        assert list(traza) == list(traza)
+
+    def test_without_time_column_uses_interval(self, tmp_path):
+        """Verifica filas equiespaciadas cuando no hay columna de tiempo."""
+        ruta = tmp_path / "valores.csv"
+        ruta.write_text("12.0\n12.5\n13.0\n", encoding="utf-8")
+
+        traza = CsvTrace(ruta, time_column=None, value_column=0, interval=0.5)
+
+        assert list(traza) == [(0.0, 12.0), (0.5, 12.5), (1.0, 13.0)]
+
+    def test_custom_columns_and_delimiter(self, tmp_path):
+        """Verifica columnas y separador configurables."""
+        ruta = tmp_path / "campo.csv"
+        ruta.write_text("sensor;v;t\nA;3.7;10\nA;3.6;20\n", encoding="utf-8")
+
+        traza = CsvTrace(ruta, time_column=2, value_column=1, delimiter=";")
+
+        assert list(traza) == [(10.0, 3.7), (20.0, 3.6)]
+
+    def test_invalid_row_raises(self, tmp_path):
+        """Verifica el error con número de línea en filas no numéricas."""
+        ruta = tmp_path / "roto.csv"
+        ruta.write_text("0,20\n1,N/A\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match=":2:"):
+            list(CsvTrace(ruta))
+
+    def test_missing_file_raises(self, tmp_path):
+        """Verifica el error si el archivo no existe."""
+        with pytest.raises(FileNotFoundError):
+            CsvTrace(tmp_path / "no_existe.csv")
+
+
+class TestBinaryTrace:
+    """Tests del formato binario mapeado en memoria."""
+
+    def test_roundtrip(self, tmp_path):
+        """Verifica escritura y lectura (valores en float32)."""
+        ruta = tmp_path / "sala.trace"
+        muestras = [(i * 0.25, 20.0 + i / 8) for i in range(1000)]
+
+        assert write_binary_trace(ruta, iter(muestras)) == 1000
+
+        with BinaryTrace(ruta) as traza:
+            assert len(traza) == 1000
+            assert list(traza) == muestras  # Múltiplos de 1/8: exactos en float32
+            assert traza[10] == muestras[10]
+            assert traza[-1] == muestras[-1]
+
+    def test_row_size_is_compact(self, tmp_path):
+        """Verifica 12 bytes por fila más la cabecera."""
+        ruta = tmp_path / "sala.trace"
+        write_binary_trace(ruta, ((float(i), 1.0) for i in range(100)))
+
+        assert ruta.stat().st_size == 16 + 100 * 12
+
+    def test_index_out_of_range(self, tmp_path):
+        """Verifica IndexError fuera de rango."""
+        ruta = tmp_path / "sala.trace"
+        write_binary_trace(ruta, [(0.0, 1.0)])
+
+        with BinaryTrace(ruta) as traza, pytest.raises(IndexError):
+            traza[1]  # pylint: disable=pointless-statement
+
+    def test_empty_trace(self, tmp_path):
+        """Verifica una traza vacía."""
+        ruta = tmp_path / "vacia.trace"
+        write_binary_trace(ruta, [])
+
+        with BinaryTrace(ruta) as traza:
+            assert len(traza) == 0
+            assert list(traza) == []
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Verifica el rechazo de archivos sin la cabecera esperada."""
+        ruta = tmp_path / "otro.trace"
+        ruta.write_bytes(b"no es una traza binaria")
+
+        with pytest.raises(ValueError):
+            BinaryTrace(ruta)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """Verifica el rechazo de archivos truncados."""
+        ruta = tmp_path / "sala.trace"
+        write_binary_trace(ruta, [(0.0, 1.0), (1.0, 2.0)])
+        ruta.write_bytes(ruta.read_bytes()[:-4])
+
+        with pytest.raises(ValueError, match="tamaño"):
+            BinaryTrace(ruta)
+
+    def test_close_with_live_iterator(self, tmp_path):
+        """Verifica que close() no falle con un iterador sin agotar."""
+        ruta = tmp_path / "sala.trace"
+        write_binary_trace(ruta, [(0.0, 1.0), (1.0, 2.0)])
+        traza = BinaryTrace(ruta)
+        iterador = iter(traza)
+        next(iterador)
+
+        traza.close()
+
+
+class TestOpenTrace:
+    """Tests de open_trace() y convert_csv_to_binary()."""
+
+    def test_selects_reader_by_suffix(self, csv_path, tmp_path):
+        """Verifica el lector elegido por extensión."""
+        binaria = tmp_path / "sala.trace"
+        write_binary_trace(binaria, [(0.0, 1.0)])
+
+        assert isinstance(open_trace(csv_path), CsvTrace)
+        traza = open_trace(binaria)
+        assert isinstance(traza, BinaryTrace)
+        traza.close()
+
+    def test_convert_csv_to_binary(self, csv_path):
+        """Verifica la conversión con el sufijo por defecto."""
+        destino = convert_csv_to_binary(csv_path)
+
+        assert destino.suffix == BINARY_SUFFIX
+        with BinaryTrace(destino) as traza:
+            assert list(traza) == [(0.0, 20.5), (1.5, 21.0), (3.0, 21.25)]
@@ -0,0 +1,124 @@
+"""
+Tests unitarios para TraceReplayer.
+
+Usan VirtualClock para verificar los tiempos sin esperas reales.
+"""
+import pytest
+
+from compartido.replay import TraceReplayer
+from compartido.scheduling import VirtualClock
+
+
+@pytest.fixture
+def reloj(qapp):
+    """Reloj virtual."""
+    return VirtualClock()
+
+
+def _grabar(replayer, reloj):
+    """Conecta el reproductor y retorna la lista de (tiempo, valor) emitidos."""
+    emitidos = []
+    replayer.sample_ready.connect(lambda v: emitidos.append((reloj.now(), v)))
+    return emitidos
+
+
+class TestTraceReplayer:
+    """Tests del reproductor de trazas."""
+
+    def test_rejects_non_positive_speed(self, reloj):
+        """Verifica la validación de la velocidad."""
+        with pytest.raises(ValueError):
+            TraceReplayer([], speed=0, clock=reloj)
+
+    def test_emits_at_trace_timestamps(self, reloj, qtbot):
+        """Verifica valores y tiempos relativos a la primera muestra."""
+        replayer = TraceReplayer([(100.0, 1.0), (101.0, 2.0), (103.5, 3.0)], clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+
+        with qtbot.waitSignal(replayer.finished, timeout=1000):
+            replayer.start()
+
+        assert emitidos == [(0.0, 1.0), (1.0, 2.0), (3.5, 3.0)]
+        assert replayer.emitted == 3
+        assert not replayer.isActive()
+
+    def test_speed_scales_timestamps(self, reloj, qtbot):
+        """Verifica que la velocidad divida los tiempos de la traza."""
+        replayer = TraceReplayer([(0.0, 1.0), (10.0, 2.0)], speed=10, clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+
+        with qtbot.waitSignal(replayer.finished, timeout=1000):
+            replayer.start()
+
+        assert emitidos[-1] == (1.0, 2.0)
+
+    def test_loop_keeps_regular_step(self, reloj, qtbot):
+        """Verifica que el bucle continúe con el último intervalo observado."""
+        replayer = TraceReplayer([(0.0, 1.0), (2.0, 2.0)], loop=True, clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+
+        replayer.start()
+        qtbot.waitUntil(lambda: len(emitidos) >= 5, timeout=1000)
+        replayer.stop()
+
+        assert emitidos[:5] == [(0.0, 1.0), (2.0, 2.0), (4.0, 1.0), (6.0, 2.0), (8.0, 1.0)]
+        assert replayer.loops >= 2
+
+    def test_stop_halts_emission(self, reloj, qtbot):
+        """Verifica que stop() desde un slot corte la reproducción."""
+        replayer = TraceReplayer([(float(i), float(i)) for i in range(10)], clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+        replayer.sample_ready.connect(lambda v: v >= 2 and replayer.stop())
+
+        replayer.start()
+        qtbot.wait(30)
+
+        assert [v for _, v in emitidos] == [0.0, 1.0, 2.0]
+
+    def test_empty_trace_finishes(self, reloj, qtbot):
+        """Verifica que una traza vacía emita finished sin muestras."""
+        replayer = TraceReplayer([], clock=reloj)
+
+        with qtbot.waitSignal(replayer.finished, timeout=100):
+            replayer.start()
+
+        assert replayer.emitted == 0
+
+    def test_single_timestamp_loop_finishes(self, reloj, qtbot):
+        """Verifica que un bucle sin duración no quede girando."""
+        replayer = TraceReplayer([(5.0, 1.0)], loop=True, clock=reloj)
+
+        with qtbot.waitSignal(replayer.finished, timeout=1000):
+            replayer.start()
+
+        assert replayer.emitted == 1
+
+    def test_non_monotonic_timestamps_do_not_go_back(self, reloj, qtbot):
+        """Verifica que una marca anterior se emita sin retroceder el tiempo."""
+        replayer = TraceReplayer([(0.0, 1.0), (5.0, 2.0), (3.0, 3.0), (6.0, 4.0)], clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+
+        with qtbot.waitSignal(replayer.finished, timeout=1000):
+            replayer.start()
+
+        assert emitidos == [(0.0, 1.0), (5.0, 2.0), (5.0, 3.0), (6.0, 4.0)]
+
+    def test_reads_one_sample_ahead(self, reloj, qtbot):
+        """Verifica que la traza se consuma de forma perezosa."""
+        leidas = []
+
+        class TrazaContada:
+            def __iter__(self):
+                for i in range(1000):
+                    leidas.append(i)
+                    yield float(i), float(i)
+
+        replayer = TraceReplayer(TrazaContada(), clock=reloj)
+        emitidos = _grabar(replayer, reloj)
+        replayer.sample_ready.connect(lambda v: v >= 4 and replayer.stop())
+
+        replayer.start()
+        qtbot.wait(30)
+
+        assert len(emitidos) == 5
+        assert len(leidas) == 5
@@ -0,0 +1,198 @@
+"""
+Tests unitarios para TrafficRecorder y TrafficLogReader.
+
+La escritura usa archivos reales en un directorio temporal; la
+integración con los servidores usa sockets reales en localhost.
+"""
+import socket
+import threading
+
+import pytest
+
+from compartido.networking import (
+    BaseSocketServer,
+    NewlineFramer,
+    SelectorSocketServer,
+    TrafficLogReader,
+    TrafficRecorder,
+)
+
+
+def get_free_port():
+    """Obtiene un puerto libre del sistema."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Ruta del log de tráfico."""
+    return tmp_path / "captura.bin"
+
+
+class TestTrafficRecorder:
+    """Tests de escritura del log."""
+
+    def test_roundtrip(self, log_path):
+        """Verifica que los registros se lean en orden y completos."""
+        with TrafficRecorder(log_path) as recorder:
+            recorder.record("10.0.0.5:50000", '{"temperatura_actual": 22.5}')
+            recorder.record("10.0.0.6:50001", b"\x00binario\xff")
+
+        registros = list(TrafficLogReader(log_path))
+
+        assert [r.peer for r in registros] == ["10.0.0.5:50000", "10.0.0.6:50001"]
+        assert registros[0].payload == b'{"temperatura_actual": 22.5}'
+        assert registros[1].payload == b"\x00binario\xff"
+        assert registros[0].timestamp_ns <= registros[1].timestamp_ns
+
+    def test_flush_writes_pending(self, log_path):
+        """Verifica que flush() deje los registros en disco sin cerrar."""
+        recorder = TrafficRecorder(log_path)
+        try:
+            for i in range(100):
+                recorder.record("a:1", str(i))
+
+            assert recorder.flush(timeout=2.0)
+            assert len(list(TrafficLogReader(log_path))) == 100
+            assert recorder.stats.written == 100
+        finally:
+            recorder.close()
+
+    def test_concurrent_producers(self, log_path):
+        """Verifica que varios hilos de recepción puedan grabar a la vez."""
+        recorder = TrafficRecorder(log_path)
+
+        def producir(peer):
+            for i in range(200):
+                recorder.record(peer, str(i))
+
+        hilos = [threading.Thread(target=producir, args=(f"p{n}:1",)) for n in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        recorder.close()
+
+        registros = list(TrafficLogReader(log_path))
+        assert len(registros) == 800
+        for n in range(4):
+            propios = [r.payload for r in registros if r.peer == f"p{n}:1"]
+            assert propios == [str(i).encode() for i in range(200)]
+
+    def test_rotation_keeps_backups_in_order(self, log_path):
+        """Verifica la rotación por tamaño y la lectura cronológica."""
+        with TrafficRecorder(log_path, max_bytes=200, backup_count=10) as recorder:
+            for i in range(50):
+                recorder.record("a:1", f"mensaje-{i:03d}")
+
+        lector = TrafficLogReader(log_path)
+
+        assert len(lector.files) > 1
+        assert all(f.stat().st_size <= 200 for f in lector.files)
+        assert [r.payload for r in lector] == [
+            f"mensaje-{i:03d}".encode() for i in range(50)
+        ]
+        assert recorder.stats.rotations == len(lector.files) - 1
+
+    def test_rotation_discards_beyond_backup_count(self, log_path):
+        """Verifica que solo se conserven backup_count archivos rotados."""
+        with TrafficRecorder(log_path, max_bytes=100, backup_count=2) as recorder:
+            for i in range(50):
+                recorder.record("a:1", f"mensaje-{i:03d}")
+
+        lector = TrafficLogReader(log_path)
+        payloads = [r.payload for r in lector]
+
+        assert len(lector.files) == 3
+        assert payloads[-1] == b"mensaje-049"
+        assert payloads == sorted(payloads)
+        assert len(payloads) < 50
+
+    def test_reopen_appends(self, log_path):
+        """Verifica que reabrir el log continúe el archivo existente."""
+        with TrafficRecorder(log_path) as recorder:
+            recorder.record("a:1", "primero")
+        with TrafficRecorder(log_path) as recorder:
+            recorder.record("a:1", "segundo")
+
+        assert [r.payload for r in TrafficLogReader(log_path)] == [b"primero", b"segundo"]
+
+    def test_rejects_foreign_file(self, log_path):
+        """Verifica que no se anexe a un archivo que no es un log de tráfico."""
+        log_path.write_bytes(b"otro contenido")
+
+        with pytest.raises(ValueError):
+            TrafficRecorder(log_path)
+
+    def test_full_queue_drops_instead_of_blocking(self, log_path):
+        """Verifica que la cola llena descarte sin bloquear al receptor."""
+        recorder = TrafficRecorder(log_path, queue_depth=1)
+        try:
+            # El hilo escritor no puede tomar el lote mientras se retiene el lock
+            with recorder._cond:  # pylint: disable=protected-access
+                aceptados = [recorder.record("a:1", str(i)) for i in range(5)]
+        finally:
+            recorder.close()
+
+        assert aceptados == [True, False, False, False, False]
+        assert recorder.stats.dropped == 4
+        assert recorder.stats.written == 1
+
+    def test_record_after_close_is_dropped(self, log_path):
+        """Verifica que record() tras close() se descarte."""
+        recorder = TrafficRecorder(log_path)
+        recorder.close()
+
+        assert recorder.record("a:1", "tarde") is False
+        assert recorder.stats.dropped == 1
+
+
+class TestTrafficLogReader:
+    """Tests del lector perezoso."""
+
+    def test_missing_log_raises(self, log_path):
+        """Verifica el error si no existe el log."""
+        with pytest.raises(FileNotFoundError):
+            TrafficLogReader(log_path)
+
+    def test_truncated_tail_is_ignored(self, log_path):
+        """Verifica que un registro final incompleto se ignore."""
+        with TrafficRecorder(log_path) as recorder:
+            recorder.record("a:1", "completo")
+            recorder.record("a:1", "incompleto")
+        log_path.write_bytes(log_path.read_bytes()[:-3])
+
+        assert [r.payload for r in TrafficLogReader(log_path)] == [b"completo"]
+
+
+class TestServerCapture:
+    """Tests de la captura desde los servidores."""
+
+    @pytest.mark.parametrize("server_class", [BaseSocketServer, SelectorSocketServer])
+    def test_server_records_received_messages(
+        self, server_class, log_path, qapp, qtbot
+    ):
+        """Verifica que cada mensaje emitido quede capturado con su cliente."""
+        server = server_class("127.0.0.1", get_free_port())
+        server._create_framer = NewlineFramer  # pylint: disable=protected-access
+        recorder = TrafficRecorder(log_path)
+        server.set_recorder(recorder)
+        recibidos = []
+        server.data_received.connect(recibidos.append)
+        server.start()
+
+        try:
+            with socket.create_connection(("127.0.0.1", server.port)) as client:
+                local = "%s:%d" % client.getsockname()
+                client.sendall(b"ambiente: 23.5\nambiente: 23.6\n")
+                qtbot.waitUntil(lambda: len(recibidos) == 2, timeout=2000)
+        finally:
+            server.stop()
+            recorder.close()
+
+        registros = list(TrafficLogReader(log_path))
+        assert [r.payload for r in registros] == [b"ambiente: 23.5", b"ambiente: 23.6"]
+        assert {r.peer for r in registros} == {local}
+        assert server.recorder is recorder
@@ -6,13 +6,18 @@ entre los simuladores y la interfaz UX.
 """
 from .led_color_provider import LEDColor, LEDColorProvider, DefaultLEDColorProvider
 from .led_indicator import LEDIndicator
+from .led_pixmap_cache import LEDPixmapCache, render_led_pixmap
 from .ip_validator import IPValidator, DefaultIPValidator
 from .status_indicator import StatusIndicator, LEDStatusIndicator
 from .validation_feedback import ValidationFeedbackProvider, BorderValidationFeedback
 from .config_panel import ConfigPanel, ConfigPanelLabels
 from .log_color_provider import LogLevel, LogColorProvider, DefaultLogColorProvider
 from .log_formatter import LogFormatter, TimestampLogFormatter
+from .log_buffer import LogBuffer, LogRecord
+from .log_filter import LogFilter, LogQuery
 from .log_viewer import LogViewer, LogViewerLabels
+from .log_handler import LogViewerHandler, level_from_logging
+from .animation_clock import AnimationClock
 
 __all__ = [
     # LED Indicator
@@ -20,6 +25,8 @@ __all__ = [
     "LEDColor",
     "LEDColorProvider",
     "DefaultLEDColorProvider",
+    "LEDPixmapCache",
+    "render_led_pixmap",
     # Status Indicator
     "StatusIndicator",
     "LEDStatusIndicator",
@@ -40,4 +47,12 @@ __all__ = [
     "DefaultLogColorProvider",
     "LogFormatter",
     "TimestampLogFormatter",
+    "LogBuffer",
+    "LogRecord",
+    "LogFilter",
+    "LogQuery",
+    "LogViewerHandler",
+    "level_from_logging",
+    # Animation
+    "AnimationClock",
 ]
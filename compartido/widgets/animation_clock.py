@@ -0,0 +1,209 @@
+"""
+Reloj de animación compartido para widgets que parpadean o pulsan.
+
+En lugar de un QTimer por widget, los widgets animados se suscriben a un
+AnimationClock con el periodo de su animación. El reloj programa un
+único vencimiento a la vez (el próximo de todas las suscripciones) y
+solo mientras haya suscriptores.
+"""
+# pylint: disable=no-name-in-module
+import itertools
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+from compartido.scheduling import Clock, RealClock
+
+DEFAULT_FRAME_MS = 16
+
+_NS_POR_MS = 1_000_000
+
+
+@dataclass
+class _Subscription:
+    """Suscripción activa: callback, periodo y última fase notificada."""
+    callback: Callable[[], Optional[Callable[[int], None]]]
+    period_ns: int
+    phase: int
+
+
+class AnimationClock(QObject):
+    """
+    Reloj de animación compartido.
+
+    Las fases se cuentan desde un origen común: la fase de una suscripción
+    de periodo P es `(ahora - origen) // P`. Por eso todas las
+    suscripciones con el mismo periodo cambian de fase en el mismo
+    instante (dos LEDs que parpadean lo hacen al unísono) y se notifican
+    en el mismo despertar. Las que vencen dentro del mismo frame
+    (`frame_ms`) también se notifican juntas, de modo que sus `update()`
+    se agrupan en un único repintado.
+
+    El callback recibe el número de fase; una animación de parpadeo puede
+    usar `fase % 2` para quedar sincronizada con las demás.
+
+    Los métodos ligados (`widget.metodo`) se guardan como referencias
+    débiles: suscribirse no mantiene vivo al widget. Si el dueño del
+    método fue recolectado o Qt ya destruyó el QObject, la suscripción se
+    descarta en su próximo vencimiento.
+
+    Debe usarse desde el hilo de la GUI.
+
+    Example:
+        reloj = AnimationClock.shared()
+        handle = reloj.subscribe(self._on_fase, 500)
+        ...
+        reloj.unsubscribe(handle)
+    """
+
+    _shared: "AnimationClock | None" = None
+
+    def __init__(
+        self,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        clock: Clock | None = None,
+        parent: QObject | None = None
+    ):
+        """
+        Inicializa el reloj sin suscripciones (detenido).
+
+        Args:
+            frame_ms: Tolerancia para notificar juntas las fases que
+                vencen en el mismo frame (ms).
+            clock: Reloj de tiempo (opcional, por defecto RealClock).
+            parent: Objeto padre Qt opcional.
+        """
+        super().__init__(parent)
+        self._frame_ns = max(0, frame_ms) * _NS_POR_MS
+        self._clock = clock if clock is not None else RealClock(self)
+        self._origin_ns = self._clock.now_ns()
+        self._ids = itertools.count(1)
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._pending: Optional[int] = None
+        self._pending_ns: Optional[int] = None
+        self.wakeups = 0
+
+    @classmethod
+    def shared(cls) -> "AnimationClock":
+        """
+        Retorna el reloj compartido por todo el proceso.
+
+        Returns:
+            Instancia única con parámetros por defecto.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def active(self) -> bool:
+        """Indica si hay un vencimiento programado."""
+        return self._pending is not None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Retorna la cantidad de suscripciones activas."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        callback: Callable[[int], None],
+        period_ms: int
+    ) -> int:
+        """
+        Suscribe un callback a los cambios de fase de un periodo.
+
+        Args:
+            callback: Función que recibe el número de fase.
+            period_ms: Periodo de la animación (ms, > 0).
+
+        Returns:
+            Identificador para `unsubscribe()`.
+
+        Raises:
+            ValueError: Si el periodo no es positivo.
+        """
+        if period_ms <= 0:
+            raise ValueError(f"period_ms debe ser positivo: {period_ms}")
+
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # pylint: disable=unnecessary-lambda-assignment
+
+        handle = next(self._ids)
+        period_ns = period_ms * _NS_POR_MS
+        self._subscriptions[handle] = _Subscription(ref, period_ns, self._phase(period_ns))
+        self._reschedule()
+        return handle
+
+    def unsubscribe(self, handle: int) -> None:
+        """
+        Cancela una suscripción. Ignora identificadores desconocidos.
+
+        Args:
+            handle: Identificador retornado por `subscribe()`.
+        """
+        if self._subscriptions.pop(handle, None) is not None:
+            self._reschedule()
+
+    def _phase(self, period_ns: int) -> int:
+        """Fase actual de un periodo."""
+        return (self._clock.now_ns() - self._origin_ns) // period_ns
+
+    def _next_deadline(self, subscription: _Subscription) -> int:
+        """Instante del próximo cambio de fase de una suscripción."""
+        return self._origin_ns + (subscription.phase + 1) * subscription.period_ns
+
+    def _reschedule(self) -> None:
+        """Programa el próximo vencimiento, o detiene el reloj sin suscriptores."""
+        if not self._subscriptions:
+            if self._pending is not None:
+                self._clock.cancel(self._pending)
+            self._pending = None
+            self._pending_ns = None
+            return
+
+        deadline = min(self._next_deadline(s) for s in self._subscriptions.values())
+        if self._pending is not None:
+            if deadline == self._pending_ns:
+                return
+            self._clock.cancel(self._pending)
+        self._pending = self._clock.call_at(deadline, self._on_deadline)
+        self._pending_ns = deadline
+
+    def _on_deadline(self) -> None:
+        """Notifica todas las suscripciones que cambian de fase en este frame."""
+        self._pending = None
+        self._pending_ns = None
+        self.wakeups += 1
+
+        limit = self._clock.now_ns() + self._frame_ns
+        due = []
+        for handle, subscription in list(self._subscriptions.items()):
+            if self._next_deadline(subscription) > limit:
+                continue
+            callback = subscription.callback()
+            if callback is None or _is_deleted(getattr(callback, "__self__", None)):
+                # El dueño del método fue recolectado o destruido por Qt
+                del self._subscriptions[handle]
+                continue
+            subscription.phase = max(
+                subscription.phase + 1, self._phase(subscription.period_ns)
+            )
+            due.append((handle, callback, subscription.phase))
+
+        for handle, callback, phase in due:
+            # Un callback anterior pudo cancelar esta suscripción
+            if handle in self._subscriptions:
+                callback(phase)
+
+        self._reschedule()
+
+
+def _is_deleted(owner: object) -> bool:
+    """Indica si owner es un QObject cuyo objeto C++ ya fue destruido."""
+    return isinstance(owner, QObject) and sip.isdeleted(owner)
@@ -7,9 +7,10 @@ encendido o apagado, con colores configurables y efecto de brillo.
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import pyqtSignal, QSize
-from PyQt6.QtGui import QPainter, QColor, QRadialGradient, QPen
+from PyQt6.QtGui import QPainter, QPixmap
 
 from .led_color_provider import LEDColor, LEDColorProvider, DefaultLEDColorProvider
+from .led_pixmap_cache import LEDPixmapCache
 
 
 class LEDIndicator(QWidget):
@@ -22,6 +23,13 @@ class LEDIndicator(QWidget):
     El color del LED se obtiene mediante un LEDColorProvider inyectable,
     permitiendo personalizar los colores sin modificar esta clase (OCP).
 
+    El LED se dibuja copiando un pixmap pre-renderizado de un
+    LEDPixmapCache compartido por el proceso. El widget guarda el pixmap
+    de cada estado, así que alternar el estado (p.ej. un pulso) no
+    consulta al proveedor ni al caché. Los colores se leen del proveedor
+    al cambiar color, tamaño o proveedor: si un proveedor cambia su
+    paleta, volver a pasarlo con `set_color_provider()`.
+
     Attributes:
         state_changed: Señal emitida cuando cambia el estado.
 
@@ -42,7 +50,8 @@ class LEDIndicator(QWidget):
         color: LEDColor = LEDColor.GREEN,
         size: int = 20,
         state: bool = False,
-        color_provider: LEDColorProvider | None = None
+        color_provider: LEDColorProvider | None = None,
+        pixmap_cache: LEDPixmapCache | None = None
     ):
         """
         Inicializa el indicador LED.
@@ -54,12 +63,16 @@ class LEDIndicator(QWidget):
             state: Estado inicial (True=encendido, False=apagado).
             color_provider: Proveedor de colores (opcional).
                            Si no se especifica, usa DefaultLEDColorProvider.
+            pixmap_cache: Caché de pixmaps (opcional).
+                          Si no se especifica, usa LEDPixmapCache.shared().
         """
         super().__init__(parent)
         self._color = color
         self._size = size
         self._state = state
         self._color_provider = color_provider or DefaultLEDColorProvider()
+        self._pixmap_cache = pixmap_cache if pixmap_cache is not None else LEDPixmapCache.shared()
+        self._pixmaps: dict[bool, QPixmap] = {}
 
         self.setFixedSize(size, size)
 
@@ -119,6 +132,7 @@ class LEDIndicator(QWidget):
         """
         if self._color != color:
             self._color = color
+            self._pixmaps.clear()
             self.update()
 
     def set_size(self, size: int) -> None:
@@ -130,6 +144,7 @@ class LEDIndicator(QWidget):
         """
         if self._size != size:
             self._size = size
+            self._pixmaps.clear()
             self.setFixedSize(size, size)
             self.update()
 
@@ -141,6 +156,7 @@ class LEDIndicator(QWidget):
             provider: Nuevo proveedor de colores.
         """
         self._color_provider = provider
+        self._pixmaps.clear()
         self.update()
 
     def toggle(self) -> None:
@@ -155,120 +171,21 @@ class LEDIndicator(QWidget):
         """Retorna el tamaño mínimo del widget."""
         return QSize(self._size, self._size)
 
+    def _current_pixmap(self) -> QPixmap:
+        """Retorna el pixmap del estado actual para la densidad de la pantalla."""
+        device_pixel_ratio = self.devicePixelRatioF()
+        pixmap = self._pixmaps.get(self._state)
+        if pixmap is None or pixmap.devicePixelRatio() != device_pixel_ratio:
+            if self._state:
+                color = self._color_provider.get_color_on(self._color)
+            else:
+                color = self._color_provider.get_color_off(self._color)
+            pixmap = self._pixmap_cache.get(self._state, color, self._size, device_pixel_ratio)
+            self._pixmaps[self._state] = pixmap
+        return pixmap
+
     def paintEvent(self, event) -> None:  # pylint: disable=invalid-name,unused-argument
         """Dibuja el LED con efecto de brillo si está encendido."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Calcular dimensiones
-        margin = 2
-        diameter = self._size - (margin * 2)
-        center_x = self._size / 2
-        center_y = self._size / 2
-        radius = diameter / 2
-
-        if self._state:
-            self._draw_led_on(painter, center_x, center_y, radius)
-        else:
-            self._draw_led_off(painter, center_x, center_y, radius)
-
+        painter.drawPixmap(0, 0, self._current_pixmap())
         painter.end()
-
-    def _draw_led_on(
-        self,
-        painter: QPainter,
-        center_x: float,
-        center_y: float,
-        radius: float
-    ) -> None:
-        """Dibuja el LED en estado encendido con efecto de brillo."""
-        base_color = self._color_provider.get_color_on(self._color)
-
-        # Efecto de resplandor exterior (glow)
-        glow_gradient = QRadialGradient(center_x, center_y, radius * 1.3)
-        glow_color = QColor(base_color)
-        glow_color.setAlpha(100)
-        glow_gradient.setColorAt(0, glow_color)
-        glow_color_transparent = QColor(base_color)
-        glow_color_transparent.setAlpha(0)
-        glow_gradient.setColorAt(1, glow_color_transparent)
-
-        painter.setPen(QPen(QColor(0, 0, 0, 0)))
-        painter.setBrush(glow_gradient)
-        painter.drawEllipse(
-            int(center_x - radius * 1.3),
-            int(center_y - radius * 1.3),
-            int(radius * 2.6),
-            int(radius * 2.6)
-        )
-
-        # Gradiente principal del LED encendido
-        gradient = QRadialGradient(
-            center_x - radius * 0.3,
-            center_y - radius * 0.3,
-            radius * 1.2
-        )
-
-        # Color brillante en el centro (reflejo)
-        highlight = QColor(255, 255, 255, 200)
-        gradient.setColorAt(0, highlight)
-        gradient.setColorAt(0.3, base_color)
-
-        # Color más oscuro en el borde
-        dark_color = QColor(base_color)
-        dark_color.setRed(int(dark_color.red() * 0.6))
-        dark_color.setGreen(int(dark_color.green() * 0.6))
-        dark_color.setBlue(int(dark_color.blue() * 0.6))
-        gradient.setColorAt(1, dark_color)
-
-        # Dibujar el LED
-        painter.setBrush(gradient)
-        painter.setPen(QPen(dark_color, 1))
-        painter.drawEllipse(
-            int(center_x - radius),
-            int(center_y - radius),
-            int(radius * 2),
-            int(radius * 2)
-        )
-
-    def _draw_led_off(
-        self,
-        painter: QPainter,
-        center_x: float,
-        center_y: float,
-        radius: float
-    ) -> None:
-        """Dibuja el LED en estado apagado."""
-        off_color = self._color_provider.get_color_off(self._color)
-
-        # Gradiente para dar volumen al LED apagado
-        gradient = QRadialGradient(
-            center_x - radius * 0.3,
-            center_y - radius * 0.3,
-            radius * 1.2
-        )
-
-        # Ligeramente más claro en el centro
-        light_off = QColor(off_color)
-        light_off.setRed(min(255, int(light_off.red() * 1.3)))
-        light_off.setGreen(min(255, int(light_off.green() * 1.3)))
-        light_off.setBlue(min(255, int(light_off.blue() * 1.3)))
-        gradient.setColorAt(0, light_off)
-        gradient.setColorAt(0.5, off_color)
-
-        # Más oscuro en el borde
-        dark_off = QColor(off_color)
-        dark_off.setRed(int(dark_off.red() * 0.7))
-        dark_off.setGreen(int(dark_off.green() * 0.7))
-        dark_off.setBlue(int(dark_off.blue() * 0.7))
-        gradient.setColorAt(1, dark_off)
-
-        # Dibujar el LED
-        painter.setBrush(gradient)
-        painter.setPen(QPen(dark_off, 1))
-        painter.drawEllipse(
-            int(center_x - radius),
-            int(center_y - radius),
-            int(radius * 2),
-            int(radius * 2)
-        )
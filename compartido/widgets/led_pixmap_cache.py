@@ -0,0 +1,244 @@
+"""
+Caché de pixmaps pre-renderizados para LEDIndicator.
+
+Dibujar un LED (gradientes radiales y elipses con antialiasing) es caro
+comparado con copiar un pixmap. Como todos los LEDs de un mismo color,
+estado, tamaño y densidad de píxeles se ven igual, se renderizan una vez
+por proceso y cada repintado se reduce a un `drawPixmap`.
+"""
+# pylint: disable=no-name-in-module
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap, QRadialGradient
+
+DEFAULT_MAX_PIXMAPS = 128
+
+# (encendido, color RGBA, tamaño, device pixel ratio)
+_Key = tuple[bool, int, int, float]
+
+
+class LEDPixmapCache:
+    """
+    Caché LRU de pixmaps de LED compartido por todo el proceso.
+
+    La clave usa el color ya resuelto por el LEDColorProvider (RGBA), no
+    el proveedor en sí: dos proveedores con la misma paleta comparten
+    pixmaps y un proveedor nuevo nunca recibe pixmaps de otro. Debe
+    usarse desde el hilo de la GUI.
+
+    Example:
+        cache = LEDPixmapCache.shared()
+        pixmap = cache.get(True, QColor(0, 255, 0), 20, 2.0)
+        painter.drawPixmap(0, 0, pixmap)
+    """
+
+    _shared: "LEDPixmapCache | None" = None
+
+    def __init__(self, max_pixmaps: int = DEFAULT_MAX_PIXMAPS):
+        """
+        Inicializa el caché vacío.
+
+        Args:
+            max_pixmaps: Pixmaps máximos retenidos (LRU).
+
+        Raises:
+            ValueError: Si max_pixmaps no es positivo.
+        """
+        if max_pixmaps < 1:
+            raise ValueError(f"max_pixmaps debe ser positivo: {max_pixmaps}")
+
+        self._max_pixmaps = max_pixmaps
+        self._pixmaps: "OrderedDict[_Key, QPixmap]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def shared(cls) -> "LEDPixmapCache":
+        """
+        Retorna el caché compartido por todo el proceso.
+
+        Returns:
+            Instancia única con parámetros por defecto.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def max_pixmaps(self) -> int:
+        """Retorna la cantidad máxima de pixmaps retenidos."""
+        return self._max_pixmaps
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de pixmaps retenidos."""
+        return len(self._pixmaps)
+
+    def get(self, state: bool, color: QColor, size: int, device_pixel_ratio: float) -> QPixmap:
+        """
+        Retorna el pixmap del LED, renderizándolo si no existe.
+
+        Args:
+            state: True para el LED encendido.
+            color: Color resuelto por el proveedor para ese estado.
+            size: Lado del widget en píxeles lógicos.
+            device_pixel_ratio: Densidad de píxeles de la pantalla.
+
+        Returns:
+            QPixmap de size x size píxeles lógicos.
+        """
+        key = (state, color.rgba(), size, device_pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        pixmap = render_led_pixmap(state, color, size, device_pixel_ratio)
+        self._pixmaps[key] = pixmap
+        self.misses += 1
+        while len(self._pixmaps) > self._max_pixmaps:
+            self._pixmaps.popitem(last=False)
+            self.evictions += 1
+        return pixmap
+
+    def clear(self) -> None:
+        """Descarta todos los pixmaps."""
+        self._pixmaps.clear()
+
+
+def render_led_pixmap(
+    state: bool, color: QColor, size: int, device_pixel_ratio: float = 1.0
+) -> QPixmap:
+    """
+    Renderiza un LED en un pixmap transparente.
+
+    Args:
+        state: True para el LED encendido (con brillo).
+        color: Color base del estado.
+        size: Lado en píxeles lógicos.
+        device_pixel_ratio: Densidad de píxeles de la pantalla.
+
+    Returns:
+        QPixmap con el LED dibujado.
+    """
+    side = max(1, round(size * device_pixel_ratio))
+    pixmap = QPixmap(side, side)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Calcular dimensiones
+    margin = 2
+    diameter = size - (margin * 2)
+    center_x = size / 2
+    center_y = size / 2
+    radius = diameter / 2
+
+    if state:
+        _draw_led_on(painter, color, center_x, center_y, radius)
+    else:
+        _draw_led_off(painter, color, center_x, center_y, radius)
+
+    painter.end()
+    return pixmap
+
+
+def _draw_led_on(
+    painter: QPainter,
+    base_color: QColor,
+    center_x: float,
+    center_y: float,
+    radius: float
+) -> None:
+    """Dibuja el LED en estado encendido con efecto de brillo."""
+    # Efecto de resplandor exterior (glow)
+    glow_gradient = QRadialGradient(center_x, center_y, radius * 1.3)
+    glow_color = QColor(base_color)
+    glow_color.setAlpha(100)
+    glow_gradient.setColorAt(0, glow_color)
+    glow_color_transparent = QColor(base_color)
+    glow_color_transparent.setAlpha(0)
+    glow_gradient.setColorAt(1, glow_color_transparent)
+
+    painter.setPen(QPen(QColor(0, 0, 0, 0)))
+    painter.setBrush(glow_gradient)
+    painter.drawEllipse(
+        int(center_x - radius * 1.3),
+        int(center_y - radius * 1.3),
+        int(radius * 2.6),
+        int(radius * 2.6)
+    )
+
+    # Gradiente principal del LED encendido
+    gradient = QRadialGradient(
+        center_x - radius * 0.3,
+        center_y - radius * 0.3,
+        radius * 1.2
+    )
+
+    # Color brillante en el centro (reflejo)
+    highlight = QColor(255, 255, 255, 200)
+    gradient.setColorAt(0, highlight)
+    gradient.setColorAt(0.3, base_color)
+
+    # Color más oscuro en el borde
+    dark_color = QColor(base_color)
+    dark_color.setRed(int(dark_color.red() * 0.6))
+    dark_color.setGreen(int(dark_color.green() * 0.6))
+    dark_color.setBlue(int(dark_color.blue() * 0.6))
+    gradient.setColorAt(1, dark_color)
+
+    # Dibujar el LED
+    painter.setBrush(gradient)
+    painter.setPen(QPen(dark_color, 1))
+    painter.drawEllipse(
+        int(center_x - radius),
+        int(center_y - radius),
+        int(radius * 2),
+        int(radius * 2)
+    )
+
+
+def _draw_led_off(
+    painter: QPainter,
+    off_color: QColor,
+    center_x: float,
+    center_y: float,
+    radius: float
+) -> None:
+    """Dibuja el LED en estado apagado."""
+    # Gradiente para dar volumen al LED apagado
+    gradient = QRadialGradient(
+        center_x - radius * 0.3,
+        center_y - radius * 0.3,
+        radius * 1.2
+    )
+
+    # Ligeramente más claro en el centro
+    light_off = QColor(off_color)
+    light_off.setRed(min(255, int(light_off.red() * 1.3)))
+    light_off.setGreen(min(255, int(light_off.green() * 1.3)))
+    light_off.setBlue(min(255, int(light_off.blue() * 1.3)))
+    gradient.setColorAt(0, light_off)
+    gradient.setColorAt(0.5, off_color)
+
+    # Más oscuro en el borde
+    dark_off = QColor(off_color)
+    dark_off.setRed(int(dark_off.red() * 0.7))
+    dark_off.setGreen(int(dark_off.green() * 0.7))
+    dark_off.setBlue(int(dark_off.blue() * 0.7))
+    gradient.setColorAt(1, dark_off)
+
+    # Dibujar el LED
+    painter.setBrush(gradient)
+    painter.setPen(QPen(dark_off, 1))
+    painter.drawEllipse(
+        int(center_x - radius),
+        int(center_y - radius),
+        int(radius * 2),
+        int(radius * 2)
+    )
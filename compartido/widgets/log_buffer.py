@@ -0,0 +1,179 @@
+"""
+Buffer acotado de registros para LogViewer.
+
+Guarda los últimos N registros (timestamp, nivel, mensaje) en un anillo
+de tamaño fijo, independiente del documento de texto que los muestra.
+
+Cada registro recibe un número de secuencia creciente que no se reutiliza
+(ni siquiera al limpiar el buffer), con acceso O(1) por secuencia y un
+índice de secuencias por nivel, para que LogFilter pueda buscar sin
+recorrer el documento ni re-escanear lo ya visto.
+"""
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator
+
+from .log_color_provider import LogLevel
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    """
+    Registro de log mostrado por LogViewer.
+
+    Attributes:
+        timestamp: Momento del log.
+        level: Nivel del log.
+        message: Mensaje sin formatear.
+    """
+    timestamp: datetime
+    level: LogLevel
+    message: str
+
+
+class LogBuffer:
+    """
+    Anillo acotado de LogRecord indexado por secuencia y nivel.
+
+    Agregar un registro con el buffer lleno descarta el más antiguo en
+    O(1), sin recorrer los registros restantes. Los registros conservados
+    tienen secuencias consecutivas en [first_sequence, next_sequence).
+
+    Example:
+        buffer = LogBuffer(max_records=3)
+        for i in range(5):
+            buffer.append(LogRecord(datetime.now(), LogLevel.INFO, f"msg {i}"))
+        [r.message for r in buffer]  # ["msg 2", "msg 3", "msg 4"]
+        buffer.first_sequence         # 2
+        buffer.get(4).message         # "msg 4"
+    """
+
+    def __init__(self, max_records: int = 1000):
+        """
+        Inicializa el buffer vacío.
+
+        Args:
+            max_records: Cantidad máxima de registros (mínimo 1).
+        """
+        self._capacity = max(1, max_records)
+        self._slots: list[LogRecord | None] = [None] * self._capacity
+        self._by_level: dict[LogLevel, deque[int]] = {level: deque() for level in LogLevel}
+        self._first = 0
+        self._next = 0
+
+    @property
+    def max_records(self) -> int:
+        """Retorna la cantidad máxima de registros."""
+        return self._capacity
+
+    @max_records.setter
+    def max_records(self, value: int) -> None:
+        """Cambia la capacidad, descartando los registros más antiguos que sobren."""
+        capacity = max(1, value)
+        first = max(self._first, self._next - capacity)
+        records = [self.get(seq) for seq in range(first, self._next)]
+
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        for seq, record in zip(range(first, self._next), records):
+            self._slots[seq % capacity] = record
+        for index in self._by_level.values():
+            while index and index[0] < first:
+                index.popleft()
+        self._first = first
+
+    @property
+    def first_sequence(self) -> int:
+        """Retorna la secuencia del registro más antiguo conservado."""
+        return self._first
+
+    @property
+    def next_sequence(self) -> int:
+        """Retorna la secuencia que recibirá el próximo registro."""
+        return self._next
+
+    def append(self, record: LogRecord) -> int:
+        """
+        Agrega un registro, descartando el más antiguo si está lleno.
+
+        Args:
+            record: Registro a agregar.
+
+        Returns:
+            Secuencia asignada al registro.
+        """
+        seq = self._next
+        slot = seq % self._capacity
+        if seq - self._first == self._capacity:
+            self._by_level[self._slots[slot].level].popleft()
+            self._first += 1
+        self._slots[slot] = record
+        self._by_level[record.level].append(seq)
+        self._next = seq + 1
+        return seq
+
+    def get(self, seq: int) -> LogRecord:
+        """
+        Retorna el registro con la secuencia indicada.
+
+        Args:
+            seq: Secuencia en [first_sequence, next_sequence).
+
+        Raises:
+            IndexError: Si el registro fue descartado o no existe.
+        """
+        if not self._first <= seq < self._next:
+            raise IndexError(f"secuencia fuera del buffer: {seq}")
+        return self._slots[seq % self._capacity]
+
+    def sequences(self, level: LogLevel, since: int = 0) -> list[int]:
+        """
+        Retorna las secuencias conservadas de un nivel, en orden.
+
+        Recorre el índice desde el final, por lo que pedir solo las
+        secuencias nuevas cuesta proporcional a su cantidad.
+
+        Args:
+            level: Nivel de log.
+            since: Secuencia mínima (inclusive).
+        """
+        index = self._by_level[level]
+        if since <= self._first:
+            return list(index)
+        tail = []
+        for seq in reversed(index):
+            if seq < since:
+                break
+            tail.append(seq)
+        tail.reverse()
+        return tail
+
+    def count(self, level: LogLevel) -> int:
+        """Retorna la cantidad de registros conservados de un nivel."""
+        return len(self._by_level[level])
+
+    def clear(self) -> None:
+        """Descarta todos los registros (las secuencias no se reinician)."""
+        self._slots = [None] * self._capacity
+        for index in self._by_level.values():
+            index.clear()
+        self._first = self._next
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de registros."""
+        return self._next - self._first
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        """Itera los registros del más antiguo al más reciente."""
+        slots, capacity = self._slots, self._capacity
+        return (slots[seq % capacity] for seq in range(self._first, self._next))
+
+    def __getitem__(self, index: int) -> LogRecord:
+        """Retorna el registro en la posición indicada (0 es el más antiguo)."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("índice fuera del buffer")
+        return self._slots[(self._first + index) % self._capacity]
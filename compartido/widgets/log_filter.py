@@ -0,0 +1,237 @@
+"""
+Filtros incrementales sobre un LogBuffer.
+
+Define la consulta (niveles + texto o expresión regular) y un filtro que
+mantiene las secuencias que la cumplen, escaneando solo los registros
+nuevos en cada actualización.
+"""
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .log_buffer import LogBuffer, LogRecord
+from .log_color_provider import LogLevel
+
+
+@dataclass(frozen=True)
+class LogQuery:
+    """
+    Criterio de búsqueda de registros.
+
+    Attributes:
+        levels: Niveles a incluir (None: todos).
+        text: Texto a buscar en el mensaje ("" no filtra por texto).
+        regex: Si `text` es una expresión regular.
+        case_sensitive: Si la búsqueda distingue mayúsculas.
+
+    Raises:
+        ValueError: Si `regex` es True y `text` no es una expresión válida.
+    """
+    levels: frozenset[LogLevel] | None = None
+    text: str = ""
+    regex: bool = False
+    case_sensitive: bool = False
+    _pattern: re.Pattern | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _needle: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normaliza los niveles y prepara la búsqueda una sola vez."""
+        if self.levels is not None and not isinstance(self.levels, frozenset):
+            object.__setattr__(self, "levels", frozenset(self.levels))
+        object.__setattr__(
+            self, "_needle", self.text if self.case_sensitive else self.text.lower()
+        )
+        if self.text and self.regex:
+            flags = 0 if self.case_sensitive else re.IGNORECASE
+            try:
+                object.__setattr__(self, "_pattern", re.compile(self.text, flags))
+            except re.error as e:
+                raise ValueError(f"expresión regular inválida: {e}") from e
+
+    @property
+    def is_empty(self) -> bool:
+        """Retorna True si la consulta acepta todos los registros."""
+        return not self.text and (self.levels is None or self.levels >= set(LogLevel))
+
+    def matches(self, record: LogRecord) -> bool:
+        """
+        Verifica si un registro cumple la consulta.
+
+        Args:
+            record: Registro a evaluar.
+        """
+        if self.levels is not None and record.level not in self.levels:
+            return False
+        return self.matches_text(record.message)
+
+    def matches_text(self, message: str) -> bool:
+        """
+        Verifica si un mensaje cumple la parte de texto de la consulta.
+
+        Args:
+            message: Mensaje sin formatear.
+        """
+        if not self.text:
+            return True
+        if self._pattern is not None:
+            return self._pattern.search(message) is not None
+        if self.case_sensitive:
+            return self._needle in message
+        return self._needle in message.lower()
+
+    def narrows(self, other: "LogQuery") -> bool:
+        """
+        Verifica si todo registro que cumple esta consulta cumple `other`.
+
+        Es el caso típico al tipear en el cuadro de búsqueda ("err" →
+        "error"), y permite re-filtrar solo los resultados anteriores.
+
+        Args:
+            other: Consulta anterior.
+        """
+        if other.levels is not None and (self.levels is None or not self.levels <= other.levels):
+            return False
+        if not other.text:
+            return True
+        if (self.regex, self.case_sensitive) != (other.regex, other.case_sensitive):
+            return False
+        if self.regex:
+            return self.text == other.text
+        return other._needle in self._needle  # pylint: disable=protected-access
+
+
+class LogFilter:
+    """
+    Resultados de una LogQuery sobre un LogBuffer, mantenidos en forma incremental.
+
+    Guarda las secuencias de los registros que cumplen la consulta.
+    `update()` descarta las que el buffer ya no conserva y escanea solo
+    los registros agregados desde la última llamada. Si la consulta tiene
+    niveles, solo se examinan los registros de esos niveles (índice del
+    buffer). Al restringir la consulta (`LogQuery.narrows`) se re-evalúan
+    solo los resultados anteriores.
+
+    Example:
+        log_filter = LogFilter(buffer, LogQuery(levels={LogLevel.ERROR}))
+        buffer.append(record)
+        nuevos = log_filter.update()     # secuencias nuevas que cumplen
+        log_filter.records(-50)          # últimos 50 resultados
+    """
+
+    def __init__(self, buffer: LogBuffer, query: LogQuery | None = None):
+        """
+        Inicializa el filtro y escanea el buffer completo.
+
+        Args:
+            buffer: Buffer a filtrar.
+            query: Consulta inicial (None: acepta todo).
+        """
+        self._buffer = buffer
+        self._query = query or LogQuery()
+        self._matches: list[int] = []
+        self._start = 0
+        self._scanned = buffer.first_sequence
+        self.update()
+
+    @property
+    def query(self) -> LogQuery:
+        """Retorna la consulta actual."""
+        return self._query
+
+    @property
+    def buffer(self) -> LogBuffer:
+        """Retorna el buffer filtrado."""
+        return self._buffer
+
+    def set_query(self, query: LogQuery) -> None:
+        """
+        Cambia la consulta, reutilizando los resultados si la restringe.
+
+        Args:
+            query: Nueva consulta.
+        """
+        previous = self._query
+        self._query = query
+        if query.narrows(previous):
+            get = self._buffer.get
+            matches = [seq for seq in self.sequences() if query.matches(get(seq))]
+            matches.extend(self._scan(max(self._scanned, self._buffer.first_sequence)))
+        else:
+            matches = self._scan(self._buffer.first_sequence)
+        self._matches = matches
+        self._start = 0
+        self._scanned = self._buffer.next_sequence
+
+    def update(self) -> list[int]:
+        """
+        Incorpora los registros agregados al buffer desde la última llamada.
+
+        Returns:
+            Secuencias nuevas que cumplen la consulta, en orden.
+        """
+        self._prune()
+        new = self._scan(max(self._scanned, self._buffer.first_sequence))
+        self._matches.extend(new)
+        self._scanned = self._buffer.next_sequence
+        return new
+
+    def sequences(self, start: int = 0, stop: int | None = None) -> list[int]:
+        """
+        Retorna un tramo de las secuencias que cumplen la consulta.
+
+        Args:
+            start: Posición inicial en los resultados (admite negativos).
+            stop: Posición final exclusiva (None: hasta el final).
+        """
+        self._prune()
+        begin, end, _ = slice(start, stop).indices(len(self._matches) - self._start)
+        return self._matches[self._start + begin:self._start + end]
+
+    def records(self, start: int = 0, stop: int | None = None) -> list[LogRecord]:
+        """
+        Retorna un tramo de los registros que cumplen la consulta.
+
+        Args:
+            start: Posición inicial en los resultados (admite negativos).
+            stop: Posición final exclusiva (None: hasta el final).
+        """
+        get = self._buffer.get
+        return [get(seq) for seq in self.sequences(start, stop)]
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de registros que cumplen la consulta."""
+        self._prune()
+        return len(self._matches) - self._start
+
+    def _prune(self) -> None:
+        """Olvida las secuencias que el buffer ya descartó."""
+        first = self._buffer.first_sequence
+        matches = self._matches
+        start = self._start
+        while start < len(matches) and matches[start] < first:
+            start += 1
+        # Compactar de vez en cuando para que la lista no crezca sin límite
+        if start > len(matches) // 2:
+            del matches[:start]
+            start = 0
+        self._start = start
+
+    def _scan(self, since: int) -> list[int]:
+        """Retorna las secuencias >= since del buffer que cumplen la consulta."""
+        buffer = self._buffer
+        query = self._query
+        candidates: Iterable[int]
+        if query.levels is None:
+            candidates = range(since, buffer.next_sequence)
+        else:
+            candidates = heapq.merge(
+                *(buffer.sequences(level, since) for level in query.levels)
+            )
+        if not query.text:
+            return list(candidates)
+        get = buffer.get
+        matches_text = query.matches_text
+        return [seq for seq in candidates if matches_text(get(seq).message)]
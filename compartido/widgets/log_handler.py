@@ -0,0 +1,169 @@
+"""
+Puente entre el módulo logging y LogViewer.
+
+Permite mostrar en un LogViewer los logs emitidos desde cualquier hilo
+(p.ej. los hilos de sockets) sin bloquearlos: los registros se encolan
+sin lock y el hilo de la GUI los vuelca por lotes en cada frame.
+"""
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+
+from PyQt6.QtCore import QTimer  # pylint: disable=no-name-in-module
+
+from .log_buffer import LogRecord
+from .log_color_provider import LogLevel
+from .log_viewer import LogViewer
+
+
+def level_from_logging(levelno: int) -> LogLevel:
+    """
+    Convierte un nivel numérico de logging a LogLevel.
+
+    Args:
+        levelno: Nivel de logging (logging.DEBUG, logging.INFO, ...).
+
+    Returns:
+        LogLevel equivalente (CRITICAL se muestra como ERROR).
+    """
+    if levelno >= logging.ERROR:
+        return LogLevel.ERROR
+    if levelno >= logging.WARNING:
+        return LogLevel.WARNING
+    if levelno >= logging.INFO:
+        return LogLevel.INFO
+    return LogLevel.DEBUG
+
+
+class LogViewerHandler(logging.Handler):
+    """
+    logging.Handler que muestra los registros en un LogViewer.
+
+    `emit()` puede llamarse desde cualquier hilo: formatea el registro y
+    lo agrega a una cola acotada (`collections.deque`, cuyo append es
+    atómico), sin tomar el lock del handler (ver `handle()`). Un QTimer en el hilo de la
+    GUI vacía la cola cada `interval_ms` con una única llamada a
+    `LogViewer.add_records()`.
+
+    Si la cola se llena se descartan los registros más antiguos y se
+    cuentan en `dropped`, de modo que el logging nunca bloquea ni hace
+    crecer la memoria de los hilos de red.
+
+    Debe crearse en el hilo de la GUI.
+
+    Example:
+        viewer = LogViewer()
+        handler = LogViewerHandler(viewer)
+        logging.getLogger().addHandler(handler)
+    """
+
+    def __init__(
+        self,
+        viewer: LogViewer,
+        level: int = logging.NOTSET,
+        interval_ms: int = 50,
+        max_queue: int = 10000
+    ):
+        """
+        Inicializa el handler e inicia el timer de volcado.
+
+        Args:
+            viewer: Visor donde mostrar los registros.
+            level: Nivel mínimo de los registros a mostrar.
+            interval_ms: Intervalo entre volcados a la GUI (ms).
+            max_queue: Registros pendientes máximos antes de descartar.
+        """
+        super().__init__(level)
+        self._viewer = viewer
+        self._queue: deque[LogRecord] = deque(maxlen=max(1, max_queue))
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+        self._timer = QTimer(viewer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.drain)
+        self._timer.start()
+
+    def handle(self, record: logging.LogRecord) -> bool | logging.LogRecord:
+        """
+        Filtra y emite el registro sin tomar el lock del handler.
+
+        emit() es seguro entre hilos sin él; así los hilos de red no se
+        serializan al loguear.
+
+        Args:
+            record: Registro de logging.
+
+        Returns:
+            El resultado de los filtros (falso si el registro se descartó).
+        """
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):
+            # Desde Python 3.12 un filtro puede reemplazar el registro
+            record = result
+        if result:
+            self.emit(record)
+        return result
+
+    @property
+    def viewer(self) -> LogViewer:
+        """Retorna el visor asociado."""
+        return self._viewer
+
+    @property
+    def pending(self) -> int:
+        """Retorna la cantidad de registros esperando el próximo volcado."""
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        """Retorna la cantidad de registros descartados por cola llena."""
+        return self._dropped
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Encola un registro (seguro desde cualquier hilo, no bloquea).
+
+        Args:
+            record: Registro de logging.
+        """
+        try:
+            message = self.format(record)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+
+        if len(self._queue) >= self._queue.maxlen:
+            with self._dropped_lock:
+                self._dropped += 1
+        self._queue.append(LogRecord(
+            datetime.fromtimestamp(record.created),
+            level_from_logging(record.levelno),
+            message,
+        ))
+
+    def drain(self) -> int:
+        """
+        Vuelca los registros pendientes en el visor (hilo de la GUI).
+
+        Returns:
+            Cantidad de registros volcados.
+        """
+        queue = self._queue
+        count = len(queue)
+        if not count:
+            return 0
+        batch = [queue.popleft() for _ in range(count)]
+        self._viewer.add_records(batch)
+        return count
+
+    def close(self) -> None:
+        """Detiene el timer, vuelca lo pendiente y cierra el handler."""
+        try:
+            self._timer.stop()
+            self.drain()
+        except RuntimeError:
+            # El visor (y su timer) ya fue destruido por Qt
+            self._queue.clear()
+        super().close()
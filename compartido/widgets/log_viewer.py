@@ -3,24 +3,34 @@ Widget LogViewer para mostrar logs en tiempo real.
 
 Proporciona un área de texto con scroll automático, colores por nivel
 de log, timestamp automático y límite configurable de líneas.
+
+Los registros se guardan en un LogBuffer acotado y se muestran en un
+QPlainTextEdit con `maximumBlockCount`, por lo que descartar las líneas
+más antiguas no recorre el documento. Un LogFilter opcional restringe
+los registros mostrados por nivel y texto.
 """
 # pylint: disable=no-name-in-module
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import Iterable
 
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QCheckBox,
+    QLineEdit,
 )
-from PyQt6.QtGui import QTextCharFormat, QTextCursor, QColor
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QTextCharFormat, QTextCursor
+from PyQt6.QtCore import QTimer, pyqtSignal
 
+from .log_buffer import LogBuffer, LogRecord
 from .log_color_provider import LogLevel, LogColorProvider, DefaultLogColorProvider
+from .log_filter import LogFilter, LogQuery
 from .log_formatter import LogFormatter, TimestampLogFormatter
+from .validation_feedback import BorderValidationFeedback, ValidationFeedbackProvider
 
 
 @dataclass
@@ -33,6 +43,7 @@ class LogViewerLabels:
     """
     clear_button: str = "Limpiar"
     auto_scroll_checkbox: str = "Auto-scroll"
+    filter_placeholder: str = "Filtrar..."
 
 
 class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
@@ -42,10 +53,27 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
     Muestra mensajes de log con colores según nivel, timestamp automático
     y funcionalidades de auto-scroll y límite de líneas.
 
+    Cada mensaje ocupa un bloque del documento (los saltos de línea del
+    mensaje se muestran como separadores de línea dentro del bloque), de
+    modo que el límite nativo de bloques del documento y el LogBuffer
+    descartan los mismos registros. El formato de color se calcula una
+    vez por nivel y el scroll al final se hace una vez por iteración del
+    event loop, no por mensaje.
+
+    El historial (`history_size`) puede ser mayor que las líneas
+    mostradas. Con un filtro activo (`set_filter()` o el cuadro de
+    búsqueda) el documento se regenera solo con los últimos `max_lines`
+    registros que lo cumplen, y los registros nuevos se evalúan contra el
+    filtro de forma incremental, sin re-escanear el historial. Si el
+    texto del cuadro no es una expresión regular válida (filtro con
+    `regex=True`), se conserva el filtro anterior y el cuadro se marca
+    como inválido.
+
     Todas las dependencias son inyectables para cumplir con DIP:
     - LogColorProvider: colores según nivel de log
     - LogFormatter: formato de los mensajes
     - LogViewerLabels: textos de la interfaz
+    - ValidationFeedbackProvider: feedback del cuadro de búsqueda
 
     Attributes:
         log_added: Señal emitida cuando se agrega un log.
@@ -58,6 +86,10 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         viewer.add_log("Timeout detectado", LogLevel.WARNING)
         viewer.add_log("Error de conexión", LogLevel.ERROR)
 
+        # Filtrar los errores de un historial largo
+        viewer = LogViewer(history_size=100_000)
+        viewer.set_filter(LogQuery(levels={LogLevel.ERROR}, text="timeout"))
+
         # Con dependencias personalizadas
         viewer = LogViewer(
             color_provider=DarkThemeColors(),
@@ -76,7 +108,9 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         formatter: LogFormatter | None = None,
         labels: LogViewerLabels | None = None,
         max_lines: int = 1000,
-        auto_scroll: bool = True
+        auto_scroll: bool = True,
+        history_size: int | None = None,
+        validation_feedback: ValidationFeedbackProvider | None = None
     ):
         """
         Inicializa el visor de logs.
@@ -90,6 +124,10 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
             labels: Etiquetas de texto (opcional).
             max_lines: Número máximo de líneas a mantener.
             auto_scroll: Si activar auto-scroll inicialmente.
+            history_size: Registros a conservar para filtrar (opcional).
+                          Nunca es menor que max_lines.
+            validation_feedback: Feedback del cuadro de búsqueda (opcional).
+                          Si no se especifica, usa BorderValidationFeedback.
         """
         super().__init__(parent)
 
@@ -97,10 +135,16 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         self._color_provider = color_provider or DefaultLogColorProvider()
         self._formatter = formatter or TimestampLogFormatter()
         self._labels = labels or LogViewerLabels()
+        self._validation_feedback = validation_feedback or BorderValidationFeedback()
 
-        self._max_lines = max_lines
+        self._max_lines = max(1, max_lines)
+        self._history_size = history_size or 0
         self._auto_scroll = auto_scroll
+        self._buffer = LogBuffer(max(self._max_lines, self._history_size))
+        self._filter: LogFilter | None = None
         self._line_count = 0
+        self._formats: dict[LogLevel, QTextCharFormat] = {}
+        self._scroll_pending = False
 
         self._setup_ui()
         self._connect_signals()
@@ -124,7 +168,11 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         self._auto_scroll_checkbox.setChecked(self._auto_scroll)
         controls_layout.addWidget(self._auto_scroll_checkbox)
 
-        controls_layout.addStretch()
+        # Cuadro de búsqueda
+        self._filter_edit = QLineEdit()
+        self._filter_edit.setPlaceholderText(self._labels.filter_placeholder)
+        self._filter_edit.setClearButtonEnabled(True)
+        controls_layout.addWidget(self._filter_edit, 1)
 
         # Botón limpiar
         self._clear_button = QPushButton(self._labels.clear_button)
@@ -133,15 +181,17 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
 
         layout.addLayout(controls_layout)
 
-    def _create_text_area(self) -> QTextEdit:
+    def _create_text_area(self) -> QPlainTextEdit:
         """Crea y configura el área de texto."""
-        text_area = QTextEdit()
+        text_area = QPlainTextEdit()
         text_area.setReadOnly(True)
-        text_area.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        text_area.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        text_area.setMaximumBlockCount(self._max_lines)
+        text_area.setUndoRedoEnabled(False)
 
         # Estilo para fondo oscuro
         text_area.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 font-family: 'Consolas', 'Monaco', monospace;
@@ -156,33 +206,73 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         """Conecta las señales internas."""
         self._clear_button.clicked.connect(self.clear_logs)
         self._auto_scroll_checkbox.stateChanged.connect(self._on_auto_scroll_changed)
+        self._filter_edit.textChanged.connect(self._on_filter_text_changed)
 
     def _on_auto_scroll_changed(self, state: int) -> None:
         """Maneja cambios en el checkbox de auto-scroll."""
         self._auto_scroll = state == 2  # Qt.CheckState.Checked = 2
 
-    def _apply_line_limit(self) -> None:
-        """Aplica el límite de líneas eliminando las más antiguas."""
-        if self._line_count <= self._max_lines:
+    def _on_filter_text_changed(self, text: str) -> None:
+        """Aplica el texto del cuadro de búsqueda conservando los niveles."""
+        try:
+            query = replace(self.filter_query or LogQuery(), text=text)
+        except ValueError as e:
+            # Expresión regular incompleta mientras se tipea: conservar
+            # el filtro anterior
+            self._validation_feedback.show_invalid(self._filter_edit, str(e))
             return
+        self.set_filter(query)
 
-        cursor = self._text_area.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-
-        # Calcular líneas a eliminar
-        lines_to_remove = self._line_count - self._max_lines
-
-        for _ in range(lines_to_remove):
-            cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor)
-
-        cursor.removeSelectedText()
-        self._line_count = self._max_lines
+    def _schedule_scroll(self) -> None:
+        """Programa un único scroll al final para los mensajes de esta iteración."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(0, self._scroll_to_bottom)
 
     def _scroll_to_bottom(self) -> None:
         """Desplaza el área de texto al final."""
+        self._scroll_pending = False
         scrollbar = self._text_area.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def _insert(self, records: list[LogRecord]) -> None:
+        """Agrega registros al documento con una única edición."""
+        cursor = QTextCursor(self._text_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for record in records:
+            # Un bloque por registro
+            text = self._formatter.format(record.message, record.level, record.timestamp)
+            if self._line_count:
+                cursor.insertBlock()
+            cursor.insertText(text.replace("\n", "\u2028"), self._format_for(record.level))
+            self._line_count += 1
+        cursor.endEditBlock()
+        self._line_count = min(self._line_count, self._max_lines)
+
+        if self._auto_scroll:
+            self._schedule_scroll()
+
+    def _render(self) -> None:
+        """Regenera el documento con los últimos max_lines registros visibles."""
+        self._text_area.clear()
+        self._line_count = 0
+        if self._filter is None:
+            size = len(self._buffer)
+            records = [self._buffer[i] for i in range(max(0, size - self._max_lines), size)]
+        else:
+            records = self._filter.records(-self._max_lines)
+        self._insert(records)
+
+    def _format_for(self, level: LogLevel) -> QTextCharFormat:
+        """Retorna el formato de color del nivel (creado una vez por proveedor)."""
+        char_format = self._formats.get(level)
+        if char_format is None:
+            char_format = QTextCharFormat()
+            char_format.setForeground(self._color_provider.get_color(level))
+            self._formats[level] = char_format
+        return char_format
+
     # === Propiedades ===
 
     @property
@@ -209,7 +299,14 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
     def max_lines(self, value: int) -> None:
         """Establece el límite máximo de líneas."""
         self._max_lines = max(1, value)
-        self._apply_line_limit()
+        self._buffer.max_records = max(self._max_lines, self._history_size)
+        self._text_area.setMaximumBlockCount(self._max_lines)
+        self._line_count = min(self._line_count, self._max_lines)
+
+    @property
+    def history_size(self) -> int:
+        """Retorna la cantidad de registros conservados para filtrar."""
+        return self._buffer.max_records
 
     @property
     def auto_scroll(self) -> bool:
@@ -224,9 +321,24 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
 
     @property
     def line_count(self) -> int:
-        """Retorna el número actual de líneas."""
+        """Retorna el número actual de líneas mostradas."""
         return self._line_count
 
+    @property
+    def records(self) -> LogBuffer:
+        """Retorna el historial de registros, del más antiguo al más reciente."""
+        return self._buffer
+
+    @property
+    def filter_query(self) -> LogQuery | None:
+        """Retorna el filtro activo (None si se muestran todos los registros)."""
+        return self._filter.query if self._filter is not None else None
+
+    @property
+    def match_count(self) -> int:
+        """Retorna cuántos registros del historial cumplen el filtro activo."""
+        return len(self._filter) if self._filter is not None else len(self._buffer)
+
     # === Métodos públicos ===
 
     def set_color_provider(self, provider: LogColorProvider) -> None:
@@ -237,6 +349,7 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
             provider: Nuevo proveedor de colores.
         """
         self._color_provider = provider
+        self._formats.clear()
 
     def set_formatter(self, formatter: LogFormatter) -> None:
         """
@@ -247,6 +360,38 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         """
         self._formatter = formatter
 
+    def set_filter(self, query: LogQuery | None) -> None:
+        """
+        Muestra solo los registros que cumplen la consulta.
+
+        Si la nueva consulta restringe la anterior (p.ej. al seguir
+        tipeando) solo se re-evalúan los resultados anteriores.
+
+        Args:
+            query: Consulta a aplicar (None o vacía: mostrar todo).
+        """
+        if query is not None and query.is_empty:
+            query = None
+        if query is None:
+            self._filter = None
+        elif self._filter is None:
+            self._filter = LogFilter(self._buffer, query)
+        else:
+            self._filter.set_query(query)
+
+        text = query.text if query is not None else ""
+        self._validation_feedback.show_valid(self._filter_edit)
+        if self._filter_edit.text() != text:
+            self._filter_edit.blockSignals(True)
+            self._filter_edit.setText(text)
+            self._filter_edit.blockSignals(False)
+
+        self._render()
+
+    def clear_filter(self) -> None:
+        """Quita el filtro y muestra los últimos registros del historial."""
+        self.set_filter(None)
+
     def add_log(
         self,
         message: str,
@@ -263,35 +408,34 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         """
         if timestamp is None:
             timestamp = datetime.now()
+        self.add_records((LogRecord(timestamp, level, message),))
 
-        # Formatear mensaje
-        formatted_message = self._formatter.format(message, level, timestamp)
-
-        # Obtener color
-        color = self._color_provider.get_color(level)
-
-        # Insertar texto con color
-        self._append_colored_text(formatted_message, color)
-
-        self._line_count += 1
-        self._apply_line_limit()
+    def add_records(self, records: Iterable[LogRecord]) -> None:
+        """
+        Agrega varios registros con una única edición del documento.
 
-        if self._auto_scroll:
-            self._scroll_to_bottom()
+        Emite `log_added` por cada registro. Solo se insertan en el
+        documento los últimos `max_lines` que cumplen el filtro activo
+        (los demás se descartarían igual).
 
-        self.log_added.emit(message, level)
+        Args:
+            records: Registros a agregar, del más antiguo al más reciente.
+        """
+        records = list(records)
+        if not records:
+            return
 
-    def _append_colored_text(self, text: str, color: QColor) -> None:
-        """Agrega texto con color al área de texto."""
-        cursor = self._text_area.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        for record in records:
+            self._buffer.append(record)
 
-        # Configurar formato
-        char_format = QTextCharFormat()
-        char_format.setForeground(color)
+        if self._filter is None:
+            self._insert(records[-self._max_lines:])
+        else:
+            get = self._buffer.get
+            self._insert([get(seq) for seq in self._filter.update()[-self._max_lines:]])
 
-        # Insertar con formato
-        cursor.insertText(text + "\n", char_format)
+        for record in records:
+            self.log_added.emit(record.message, record.level)
 
     def add_info(self, message: str) -> None:
         """Agrega un log de nivel INFO."""
@@ -312,6 +456,7 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
     def clear_logs(self) -> None:
         """Limpia todos los logs."""
         self._text_area.clear()
+        self._buffer.clear()
         self._line_count = 0
         self.logs_cleared.emit()
 
@@ -320,6 +465,8 @@ class LogViewer(QWidget):  # pylint: disable=too-many-instance-attributes
         Retorna todo el texto de los logs.
 
         Returns:
-            Contenido completo del visor de logs.
+            Contenido completo del visor de logs, una línea por registro.
         """
-        return self._text_area.toPlainText()
+        if not self._line_count:
+            return ""
+        return self._text_area.toPlainText() + "\n"
@@ -8,7 +8,7 @@ from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from compartido.networking import EphemeralSocketClient
+from compartido.networking import ConnectionPool, EphemeralSocketClient
 from ..dominio.estado_bateria import EstadoBateria
 
 logger = logging.getLogger(__name__)
@@ -28,16 +28,21 @@ class ClienteBateria(QObject):
             Parámetro: float con el voltaje enviado.
         error_conexion: Emitida cuando ocurre un error de conexión.
             Parámetro: str con el mensaje de error.
+        envio_descartado: Emitida cuando un envío asíncrono ya encolado
+            se descarta sin ejecutarse (no habrá dato_enviado ni
+            error_conexion para ese valor).
     """
 
     dato_enviado = pyqtSignal(float)
     error_conexion = pyqtSignal(str)
+    envio_descartado = pyqtSignal()
 
     def __init__(
         self,
         host: str,
         port: int,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        pool: Optional[ConnectionPool] = None
     ) -> None:
         """Inicializa el cliente de batería.
 
@@ -45,14 +50,16 @@ class ClienteBateria(QObject):
             host: Dirección IP del servidor ISSE_Termostato.
             port: Puerto TCP del servidor (default 11000).
             parent: Objeto padre Qt opcional.
+            pool: Pool de conexiones keep-alive (None = conexión por envío).
         """
         super().__init__(parent)
         self._host = host
         self._port = port
-        self._cliente = EphemeralSocketClient(host, port, self)
+        self._cliente = EphemeralSocketClient(host, port, self, pool=pool)
 
         self._cliente.data_sent.connect(self._on_data_sent)
         self._cliente.error_occurred.connect(self._on_error)
+        self._cliente.send_dropped.connect(self._on_send_dropped)
 
         self._ultimo_valor: Optional[float] = None
 
@@ -94,7 +101,7 @@ class ClienteBateria(QObject):
             self.error_conexion.emit(str(e))
             return False
 
-    def enviar_voltaje_async(self, voltaje: float) -> None:
+    def enviar_voltaje_async(self, voltaje: float) -> bool:
         """Envía un valor de voltaje de forma asíncrona.
 
         Similar a enviar_voltaje pero no bloquea. El resultado
@@ -102,16 +109,20 @@ class ClienteBateria(QObject):
 
         Args:
             voltaje: Valor de voltaje en Volts.
+
+        Returns:
+            True si el envío quedó encolado, False si fue descartado.
         """
         try:
             self._ultimo_valor = voltaje
             mensaje = f"{voltaje:.2f}"
 
             logger.debug("Enviando voltaje (async): %s", mensaje)
-            self._cliente.send_async(mensaje)
+            return self._cliente.send_async(mensaje)
         except Exception as e:
             logger.error("Error al enviar voltaje async: %s", str(e))
             self.error_conexion.emit(str(e))
+            return False
 
     def enviar_estado(self, estado: EstadoBateria) -> bool:
         """Envía un EstadoBateria al servidor.
@@ -127,13 +138,16 @@ class ClienteBateria(QObject):
         """
         return self.enviar_voltaje(estado.voltaje)
 
-    def enviar_estado_async(self, estado: EstadoBateria) -> None:
+    def enviar_estado_async(self, estado: EstadoBateria) -> bool:
         """Envía un EstadoBateria de forma asíncrona.
 
         Args:
             estado: Objeto EstadoBateria con el valor a enviar.
+
+        Returns:
+            True si el envío quedó encolado, False si fue descartado.
         """
-        self.enviar_voltaje_async(estado.voltaje)
+        return self.enviar_voltaje_async(estado.voltaje)
 
     def _on_data_sent(self) -> None:
         """Callback interno cuando los datos se envían exitosamente."""
@@ -151,3 +165,11 @@ class ClienteBateria(QObject):
             self._host, self._port, mensaje
         )
         self.error_conexion.emit(mensaje)
+
+    def _on_send_dropped(self) -> None:
+        """Callback interno cuando el ejecutor descarta un envío encolado."""
+        logger.warning(
+            "Envío descartado antes de ejecutarse -> %s:%d",
+            self._host, self._port
+        )
+        self.envio_descartado.emit()
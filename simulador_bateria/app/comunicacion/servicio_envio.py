@@ -4,12 +4,15 @@ Conecta el generador de valores con el cliente TCP para envío automático
 de voltajes al servidor ISSE_Termostato.
 """
 import logging
-from typing import Optional
+from typing import Optional, Union
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from compartido.scheduling import Clock
+
 from .cliente_bateria import ClienteBateria
 from ..dominio.generador_bateria import GeneradorBateria
+from ..dominio.generador_traza import GeneradorTrazaBateria
 from ..dominio.estado_bateria import EstadoBateria
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,18 @@ class ServicioEnvioBateria(QObject):
     Conecta las señales del GeneradorBateria con el ClienteBateria
     para enviar automáticamente cada valor generado al servidor.
 
+    Coalescencia bajo contrapresión: como solo importa el valor más
+    reciente del sensor, hay como máximo un envío en curso hacia el
+    destino. Los valores generados mientras tanto reemplazan al pendiente
+    y se cuentan en `muestras_reemplazadas`; al completarse el envío en
+    curso (éxito, error o descarte por el ejecutor de envíos) se envía
+    el último valor pendiente.
+
+    Mientras hay un envío en curso el servicio retiene el reloj de
+    simulación (`Clock.hold()`). Con un VirtualClock el tiempo simulado
+    avanza entonces al ritmo que admite el servidor y no se reemplazan
+    muestras; con tiempo real o acelerado la retención no tiene efecto.
+
     Signals:
         envio_exitoso: Emitida cuando un valor se envía correctamente.
             Parámetro: float con el voltaje enviado.
@@ -37,24 +52,33 @@ class ServicioEnvioBateria(QObject):
 
     def __init__(
         self,
-        generador: GeneradorBateria,
+        generador: Union[GeneradorBateria, GeneradorTrazaBateria],
         cliente: ClienteBateria,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        reloj: Optional[Clock] = None
     ) -> None:
         """Inicializa el servicio de envío.
 
         Args:
-            generador: Generador de valores de voltaje.
+            generador: Generador de valores de voltaje (sintético o
+                GeneradorTrazaBateria).
             cliente: Cliente TCP para enviar al servidor.
             parent: Objeto padre Qt opcional.
+            reloj: Reloj a retener durante cada envío. Si es None, usa
+                el del generador.
         """
         super().__init__(parent)
         self._generador = generador
         self._cliente = cliente
+        self._reloj: Clock = reloj or generador.reloj
         self._activo = False
+        self._envio_en_curso = False
+        self._pendiente: Optional[EstadoBateria] = None
+        self._muestras_reemplazadas = 0
 
         self._cliente.dato_enviado.connect(self._on_dato_enviado)
         self._cliente.error_conexion.connect(self._on_error_conexion)
+        self._cliente.envio_descartado.connect(self._on_envio_descartado)
 
         logger.info("ServicioEnvioBateria inicializado")
 
@@ -64,7 +88,17 @@ class ServicioEnvioBateria(QObject):
         return self._activo
 
     @property
-    def generador(self) -> GeneradorBateria:
+    def muestras_reemplazadas(self) -> int:
+        """Valores descartados por llegar otro más reciente antes de enviarse."""
+        return self._muestras_reemplazadas
+
+    @property
+    def envio_en_curso(self) -> bool:
+        """Indica si hay un envío esperando confirmación del cliente."""
+        return self._envio_en_curso
+
+    @property
+    def generador(self) -> Union[GeneradorBateria, GeneradorTrazaBateria]:
         """Generador de batería asociado."""
         return self._generador
 
@@ -84,6 +118,8 @@ class ServicioEnvioBateria(QObject):
             return
 
         self._generador.valor_generado.connect(self._on_valor_generado)
+        self._liberar_destino()
+        self._pendiente = None
         self._generador.iniciar()
         self._activo = True
 
@@ -101,23 +137,74 @@ class ServicioEnvioBateria(QObject):
 
         self._generador.detener()
         self._generador.valor_generado.disconnect(self._on_valor_generado)
+        self._liberar_destino()
+        self._pendiente = None
         self._activo = False
 
-        logger.info("ServicioEnvioBateria detenido")
+        logger.info(
+            "ServicioEnvioBateria detenido (%d muestras reemplazadas)",
+            self._muestras_reemplazadas
+        )
         self.servicio_detenido.emit()
 
     def _on_valor_generado(self, estado: EstadoBateria) -> None:
-        """Callback cuando el generador produce un nuevo valor."""
+        """Callback cuando el generador produce un nuevo valor.
+
+        Si hay un envío en curso, el valor queda pendiente reemplazando
+        al anterior en lugar de encolar otro envío.
+        """
+        if self._envio_en_curso:
+            if self._pendiente is not None:
+                self._muestras_reemplazadas += 1
+            self._pendiente = estado
+            return
+        self._enviar(estado)
+
+    def _enviar(self, estado: EstadoBateria) -> None:
+        """Inicia el envío de un valor y marca el destino como ocupado.
+
+        Si el cliente no acepta el envío (retorna un valor falso), no
+        llegará confirmación y el destino queda libre de inmediato.
+        """
+        # Se marca antes de enviar: la confirmación puede llegar de forma
+        # síncrona y debe poder liberar el destino
+        self._ocupar_destino()
         try:
-            self._cliente.enviar_estado_async(estado)
+            if not self._cliente.enviar_estado_async(estado):
+                self._liberar_destino()
         except Exception as e:
+            self._liberar_destino()
             logger.error("Error al procesar valor generado: %s", str(e))
             self.envio_fallido.emit(str(e))
 
+    def _ocupar_destino(self) -> None:
+        """Marca un envío en curso y retiene el reloj de simulación."""
+        self._envio_en_curso = True
+        self._reloj.hold()
+
+    def _liberar_destino(self) -> None:
+        """Marca el destino libre y libera el reloj, si estaba ocupado."""
+        if self._envio_en_curso:
+            self._envio_en_curso = False
+            self._reloj.release()
+
+    def _enviar_pendiente(self) -> None:
+        """Libera el destino y envía el último valor pendiente, si hay."""
+        self._liberar_destino()
+        estado, self._pendiente = self._pendiente, None
+        if estado is not None and self._activo:
+            self._enviar(estado)
+
     def _on_dato_enviado(self, voltaje: float) -> None:
         """Callback cuando el cliente envía exitosamente."""
         self.envio_exitoso.emit(voltaje)
+        self._enviar_pendiente()
 
     def _on_error_conexion(self, mensaje: str) -> None:
         """Callback cuando ocurre un error de conexión."""
         self.envio_fallido.emit(mensaje)
+        self._enviar_pendiente()
+
+    def _on_envio_descartado(self) -> None:
+        """Callback cuando el ejecutor descarta el envío en curso sin ejecutarlo."""
+        self._enviar_pendiente()
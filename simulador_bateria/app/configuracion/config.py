@@ -12,6 +12,8 @@ from .constantes import (
     DEFAULT_VOLTAJE_MIN,
     DEFAULT_VOLTAJE_MAX,
     DEFAULT_VOLTAJE_INICIAL,
+    DEFAULT_CONEXION_PERSISTENTE,
+    DEFAULT_VELOCIDAD_SIMULACION,
 )
 
 
@@ -26,6 +28,10 @@ class ConfigSimuladorBateria:
         voltaje_minimo: Voltaje minimo del slider (V).
         voltaje_maximo: Voltaje maximo del slider (V).
         voltaje_inicial: Voltaje inicial al iniciar (V).
+        conexion_persistente: Usa el pool de conexiones keep-alive.
+        velocidad_simulacion: Velocidad del reloj de simulacion
+            (1 = real, >1 = acelerado, 0 = virtual tan rapido como sea
+            posible).
     """
 
     host: str
@@ -34,6 +40,8 @@ class ConfigSimuladorBateria:
     voltaje_minimo: float
     voltaje_maximo: float
     voltaje_inicial: float
+    conexion_persistente: bool = DEFAULT_CONEXION_PERSISTENTE
+    velocidad_simulacion: float = DEFAULT_VELOCIDAD_SIMULACION
 
     @classmethod
     def desde_defaults(cls) -> "ConfigSimuladorBateria":
@@ -119,6 +127,12 @@ class ConfigManager:
             voltaje_minimo=simulador.get("voltaje_minimo", DEFAULT_VOLTAJE_MIN),
             voltaje_maximo=simulador.get("voltaje_maximo", DEFAULT_VOLTAJE_MAX),
             voltaje_inicial=simulador.get("voltaje_inicial", DEFAULT_VOLTAJE_INICIAL),
+            conexion_persistente=simulador.get(
+                "conexion_persistente", DEFAULT_CONEXION_PERSISTENTE
+            ),
+            velocidad_simulacion=simulador.get(
+                "velocidad_simulacion", DEFAULT_VELOCIDAD_SIMULACION
+            ),
         )
 
     @property
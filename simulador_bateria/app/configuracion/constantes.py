@@ -11,6 +11,8 @@ DEFAULT_INTERVALO_MS: int = 1000
 DEFAULT_VOLTAJE_MIN: float = 0.0
 DEFAULT_VOLTAJE_MAX: float = 5.0
 DEFAULT_VOLTAJE_INICIAL: float = 2.5
+DEFAULT_CONEXION_PERSISTENTE: bool = False  # Pool keep-alive (opt-in)
+DEFAULT_VELOCIDAD_SIMULACION: float = 1.0  # 1 = real, >1 = acelerado, 0 = virtual
 
 # Rutas
 CONFIG_FILENAME: str = "config.json"
@@ -3,11 +3,14 @@
 Contiene la lógica de negocio:
 - EstadoBateria: Modelo de datos inmutable
 - GeneradorBateria: Generador de valores de voltaje
+- GeneradorTrazaBateria: Reproduce una traza grabada
 """
 from .estado_bateria import EstadoBateria
 from .generador_bateria import GeneradorBateria
+from .generador_traza import GeneradorTrazaBateria
 
 __all__ = [
     "EstadoBateria",
     "GeneradorBateria",
+    "GeneradorTrazaBateria",
 ]
@@ -1,7 +1,9 @@
 """Generador de valores de voltaje de bateria."""
 from typing import Optional
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from compartido.scheduling import Clock, MonotonicTimer, RealClock, TickStats
 
 from .estado_bateria import EstadoBateria
 from ..configuracion.config import ConfigSimuladorBateria
@@ -11,7 +13,8 @@ class GeneradorBateria(QObject):
     """Genera valores de voltaje de bateria (solo modo manual).
 
     El usuario controla el voltaje mediante un slider.
-    Los valores se emiten periodicamente para envio TCP.
+    Los valores se emiten periodicamente para envio TCP, con un
+    MonotonicTimer sin deriva acumulada.
 
     Signals:
         valor_generado: Emitido cada vez que se genera un nuevo valor.
@@ -24,19 +27,22 @@ class GeneradorBateria(QObject):
     def __init__(
         self,
         config: ConfigSimuladorBateria,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        reloj: Optional[Clock] = None
     ) -> None:
         """Inicializa el generador de bateria.
 
         Args:
             config: Configuracion del simulador.
             parent: Objeto padre Qt opcional.
+            reloj: Reloj de simulacion. Si es None, usa tiempo real.
         """
         super().__init__(parent)
         self._config = config
+        self._reloj: Clock = reloj or RealClock(self)
         self._voltaje_actual: float = config.voltaje_inicial
 
-        self._timer = QTimer(self)
+        self._timer = MonotonicTimer(self, clock=self._reloj)
         self._timer.timeout.connect(self._on_timer_timeout)
 
     @property
@@ -44,6 +50,16 @@ class GeneradorBateria(QObject):
         """Retorna el voltaje actual."""
         return self._voltaje_actual
 
+    @property
+    def reloj(self) -> Clock:
+        """Reloj de simulacion."""
+        return self._reloj
+
+    @property
+    def estadisticas_timer(self) -> TickStats:
+        """Puntualidad de la emision periodica (atraso por tick)."""
+        return self._timer.stats
+
     def set_voltaje(self, voltaje: float) -> None:
         """Establece el voltaje actual.
 
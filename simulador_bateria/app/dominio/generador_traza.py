@@ -0,0 +1,105 @@
+"""Generador de voltajes que reproduce una traza grabada."""
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from compartido.replay import TraceReader, TraceReplayer
+from compartido.scheduling import Clock, RealClock
+
+from .estado_bateria import EstadoBateria
+from ..configuracion.config import ConfigSimuladorBateria
+
+
+class GeneradorTrazaBateria(QObject):
+    """Reproduce voltajes grabados en campo en lugar del slider manual.
+
+    Expone la interfaz de GeneradorBateria que usa ServicioEnvioBateria
+    (`valor_generado`, `iniciar`, `detener`, `reloj`), por lo que se
+    conecta al servicio sin cambios. Los valores de la traza no se
+    clampean: los fuera de rango se marcan con `en_rango=False`.
+
+    Signals:
+        valor_generado: Emitido con cada muestra de la traza.
+        voltaje_cambiado: Emitido cuando el voltaje cambia.
+        traza_finalizada: Emitido al terminar la traza (sin bucle).
+    """
+
+    valor_generado = pyqtSignal(object)  # EstadoBateria
+    voltaje_cambiado = pyqtSignal(float)
+    traza_finalizada = pyqtSignal()
+
+    def __init__(
+        self,
+        config: ConfigSimuladorBateria,
+        traza: TraceReader,
+        velocidad: float = 1.0,
+        en_bucle: bool = False,
+        parent: Optional[QObject] = None,
+        reloj: Optional[Clock] = None
+    ) -> None:
+        """Inicializa el generador detenido.
+
+        Args:
+            config: Configuracion del simulador (rango de validacion).
+            traza: Traza de voltajes (V) a reproducir.
+            velocidad: Factor sobre los tiempos de la traza.
+            en_bucle: Si True, reinicia la traza al terminar.
+            parent: Objeto padre Qt opcional.
+            reloj: Reloj de simulacion. Si es None, usa tiempo real.
+
+        Raises:
+            ValueError: Si la velocidad no es positiva.
+        """
+        super().__init__(parent)
+        self._config = config
+        self._reloj: Clock = reloj or RealClock(self)
+        self._reproductor = TraceReplayer(
+            traza, speed=velocidad, loop=en_bucle, clock=self._reloj, parent=self
+        )
+        self._reproductor.sample_ready.connect(self._on_muestra)
+        self._reproductor.finished.connect(self.traza_finalizada)
+        self._voltaje_actual: float = config.voltaje_inicial
+
+    @property
+    def reloj(self) -> Clock:
+        """Reloj de simulacion."""
+        return self._reloj
+
+    @property
+    def reproductor(self) -> TraceReplayer:
+        """Reproductor subyacente (velocidad, bucles y muestras emitidas)."""
+        return self._reproductor
+
+    @property
+    def voltaje_actual(self) -> float:
+        """Ultimo voltaje reproducido (el inicial antes de empezar)."""
+        return self._voltaje_actual
+
+    def generar_valor(self) -> EstadoBateria:
+        """Emite el voltaje actual sin avanzar la traza.
+
+        Returns:
+            EstadoBateria con el valor actual.
+        """
+        estado = EstadoBateria(voltaje=self._voltaje_actual)
+        estado.validar_rango(
+            self._config.voltaje_minimo,
+            self._config.voltaje_maximo
+        )
+        self.valor_generado.emit(estado)
+        return estado
+
+    def iniciar(self) -> None:
+        """Inicia la reproduccion desde el principio de la traza."""
+        self._reproductor.start()
+
+    def detener(self) -> None:
+        """Detiene la reproduccion."""
+        self._reproductor.stop()
+
+    def _on_muestra(self, voltaje: float) -> None:
+        """Callback del reproductor con la muestra vencida."""
+        if voltaje != self._voltaje_actual:
+            self._voltaje_actual = voltaje
+            self.voltaje_cambiado.emit(voltaje)
+        self.generar_valor()
@@ -5,8 +5,12 @@ configuración consistente y facilitando testing con mocks.
 """
 from typing import Dict, Optional
 
+from compartido.networking import ConnectionPool
+from compartido.replay import TraceReader
+from compartido.scheduling import Clock, create_clock
 from app.configuracion.config import ConfigSimuladorBateria
 from app.dominio.generador_bateria import GeneradorBateria
+from app.dominio.generador_traza import GeneradorTrazaBateria
 from app.comunicacion.cliente_bateria import ClienteBateria
 from app.comunicacion.servicio_envio import ServicioEnvioBateria
 
@@ -35,7 +39,27 @@ class ComponenteFactory:
         Returns:
             GeneradorBateria configurado.
         """
-        return GeneradorBateria(self._config)
+        return GeneradorBateria(self._config, reloj=self._crear_reloj())
+
+    def crear_generador_traza(
+        self,
+        traza: TraceReader,
+        velocidad: float = 1.0,
+        en_bucle: bool = False
+    ) -> GeneradorTrazaBateria:
+        """Crea un generador que reproduce una traza grabada.
+
+        Args:
+            traza: Traza abierta con `compartido.replay.open_trace`.
+            velocidad: Factor sobre los tiempos de la traza.
+            en_bucle: Si True, reinicia la traza al terminar.
+
+        Returns:
+            GeneradorTrazaBateria detenido.
+        """
+        return GeneradorTrazaBateria(
+            self._config, traza, velocidad, en_bucle, reloj=self._crear_reloj()
+        )
 
     def crear_cliente(
         self,
@@ -49,13 +73,25 @@ class ComponenteFactory:
             port: Puerto del servidor (usa config si no se especifica).
 
         Returns:
-            ClienteBateria configurado.
+            ClienteBateria configurado. Si la configuración tiene
+            `conexion_persistente`, usa el pool compartido.
         """
         return ClienteBateria(
             host=host or self._config.host,
-            port=port or self._config.puerto
+            port=port or self._config.puerto,
+            pool=self._crear_pool()
         )
 
+    def _crear_reloj(self) -> Clock:
+        """Crea el reloj de simulación según `velocidad_simulacion`."""
+        return create_clock(self._config.velocidad_simulacion)
+
+    def _crear_pool(self) -> Optional[ConnectionPool]:
+        """Retorna el pool keep-alive compartido si está habilitado."""
+        if self._config.conexion_persistente:
+            return ConnectionPool.shared()
+        return None
+
     def crear_servicio(
         self,
         generador: GeneradorBateria,
@@ -0,0 +1,73 @@
+"""Flota de sensores de batería para pruebas de carga.
+
+Construye SensorStream independientes, cada uno con su propio voltaje,
+para ejecutarlos con compartido.fleet.SensorFleet desde un único proceso.
+"""
+import random
+from typing import List, Optional
+
+from compartido.fleet import SensorStream
+
+from .configuracion.config import ConfigSimuladorBateria
+
+
+def sensor_bateria(
+    nombre: str,
+    voltaje: float,
+    host: str,
+    puerto: int,
+    intervalo_ms: int
+) -> SensorStream:
+    """Crea la definición de un sensor de batería de voltaje constante.
+
+    Args:
+        nombre: Identificador del sensor.
+        voltaje: Voltaje que envía el sensor (V).
+        host: IP del servidor destino.
+        puerto: Puerto TCP destino.
+        intervalo_ms: Intervalo de envío en milisegundos.
+
+    Returns:
+        SensorStream con el mismo formato que ClienteBateria.
+    """
+    return SensorStream(
+        name=nombre,
+        host=host,
+        port=puerto,
+        interval=intervalo_ms / 1000.0,
+        source=lambda _tiempo: voltaje,
+        decimals=2,
+    )
+
+
+def crear_sensores_bateria(
+    config: ConfigSimuladorBateria,
+    cantidad: int,
+    host: Optional[str] = None,
+    puerto: Optional[int] = None,
+    semilla: int = 0
+) -> List[SensorStream]:
+    """Crea `cantidad` sensores con voltajes al azar dentro del rango.
+
+    Args:
+        config: Configuración base del simulador.
+        cantidad: Cantidad de sensores.
+        host: IP destino. Si es None, usa la de la configuración.
+        puerto: Puerto destino. Si es None, usa el de la configuración.
+        semilla: Semilla para los voltajes (reproducible).
+
+    Returns:
+        Lista de SensorStream con nombres "bateria-<n>".
+    """
+    rng = random.Random(semilla)
+    host = host or config.host
+    puerto = puerto or config.puerto
+
+    return [
+        sensor_bateria(
+            f"bateria-{indice}",
+            round(rng.uniform(config.voltaje_minimo, config.voltaje_maximo), 2),
+            host, puerto, config.intervalo_envio_ms
+        )
+        for indice in range(cantidad)
+    ]
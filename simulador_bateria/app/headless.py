@@ -0,0 +1,149 @@
+"""Ejecución headless del Simulador de Batería.
+
+Genera y envía voltajes sin QApplication ni widgets: reutiliza el
+dominio (EstadoBateria) y el ClienteBateria, y usa un PeriodicScheduler
+en lugar de QTimer. Pensado para CI y para hosts de carga donde solo
+interesa el plano de datos.
+"""
+import logging
+from typing import Optional
+
+from compartido.networking import ConnectionPool
+from compartido.scheduling import PeriodicScheduler
+
+from .comunicacion.cliente_bateria import ClienteBateria
+from .configuracion.config import ConfigSimuladorBateria
+from .dominio.estado_bateria import EstadoBateria
+
+logger = logging.getLogger(__name__)
+
+
+class SimuladorBateriaHeadless:
+    """Simulador de batería sin interfaz gráfica.
+
+    El voltaje es constante (igual que el modo manual de la UI) y puede
+    cambiarse con `set_voltaje()`.
+
+    Los envíos son síncronos y se ejecutan en el hilo del planificador:
+    como el cliente y el planificador comparten hilo, las señales del
+    cliente se entregan de forma directa sin event loop.
+
+    Attributes:
+        enviados (int): Valores enviados con éxito.
+        fallidos (int): Envíos que fallaron.
+
+    Example:
+        >>> config = ConfigManager().cargar()
+        >>> simulador = SimuladorBateriaHeadless(config)
+        >>> simulador.ejecutar(duracion=10.0)
+    """
+
+    def __init__(
+        self,
+        config: ConfigSimuladorBateria,
+        cliente: Optional[ClienteBateria] = None,
+        scheduler: Optional[PeriodicScheduler] = None
+    ) -> None:
+        """Inicializa el simulador headless.
+
+        Args:
+            config: Configuración del simulador.
+            cliente: Cliente TCP. Si es None, se crea según la configuración.
+            scheduler: Planificador a usar. Si es None, se crea uno propio.
+        """
+        self._config = config
+        self._cliente = cliente or self._crear_cliente()
+        self._scheduler = scheduler or PeriodicScheduler()
+        self._voltaje_actual = config.voltaje_inicial
+        self._tarea: Optional[int] = None
+        self.enviados = 0
+        self.fallidos = 0
+
+    @property
+    def cliente(self) -> ClienteBateria:
+        """Cliente TCP asociado."""
+        return self._cliente
+
+    @property
+    def scheduler(self) -> PeriodicScheduler:
+        """Planificador que dispara los envíos."""
+        return self._scheduler
+
+    @property
+    def voltaje_actual(self) -> float:
+        """Voltaje que se envía en cada ciclo."""
+        return self._voltaje_actual
+
+    def set_voltaje(self, voltaje: float) -> None:
+        """Establece el voltaje, acotado a [voltaje_minimo, voltaje_maximo].
+
+        Args:
+            voltaje: Voltaje a establecer (V).
+        """
+        self._voltaje_actual = max(
+            self._config.voltaje_minimo,
+            min(voltaje, self._config.voltaje_maximo)
+        )
+
+    def generar_valor(self) -> EstadoBateria:
+        """Genera un nuevo valor de voltaje.
+
+        Returns:
+            EstadoBateria con el valor generado.
+        """
+        estado = EstadoBateria(voltaje=self._voltaje_actual)
+        estado.validar_rango(
+            self._config.voltaje_minimo,
+            self._config.voltaje_maximo
+        )
+        return estado
+
+    def iniciar(self) -> None:
+        """Programa la generación periódica en el planificador."""
+        if self._tarea is not None:
+            return
+        self._tarea = self._scheduler.schedule(
+            self._config.intervalo_envio_ms / 1000.0, self._on_tick
+        )
+        logger.info(
+            "Simulador headless iniciado -> %s:%d cada %d ms",
+            self._cliente.host, self._cliente.port,
+            self._config.intervalo_envio_ms
+        )
+
+    def detener(self) -> None:
+        """Cancela la generación periódica."""
+        if self._tarea is None:
+            return
+        self._scheduler.cancel(self._tarea)
+        self._tarea = None
+        logger.info(
+            "Simulador headless detenido (%d enviados, %d fallidos)",
+            self.enviados, self.fallidos
+        )
+
+    def ejecutar(self, duracion: Optional[float] = None) -> None:
+        """Inicia el simulador y bloquea hasta `duracion` o `scheduler.stop()`.
+
+        Args:
+            duracion: Segundos de ejecución. None = hasta detener.
+        """
+        self.iniciar()
+        try:
+            self._scheduler.run(duration=duracion)
+        finally:
+            self.detener()
+
+    def _crear_cliente(self) -> ClienteBateria:
+        """Crea el cliente TCP según la configuración."""
+        pool = ConnectionPool.shared() if self._config.conexion_persistente else None
+        return ClienteBateria(
+            self._config.host, self._config.puerto, pool=pool
+        )
+
+    def _on_tick(self) -> None:
+        """Genera un valor y lo envía de forma síncrona."""
+        if self._cliente.enviar_estado(self.generar_valor()):
+            self.enviados += 1
+        else:
+            self.fallidos += 1
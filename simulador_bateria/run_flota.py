@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Punto de entrada de la flota de sensores de batería.
+
+Simula muchos sensores de batería independientes desde un único
+proceso headless, compartiendo temporizador y pipeline de envío.
+
+Uso:
+    python run_flota.py --sensores 500 --host 127.0.0.1 --duracion 60
+"""
+import argparse
+import logging
+import signal
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from compartido.fleet import FleetReport, SensorFleet
+from compartido.networking import ConnectionPool
+
+from app.flota import crear_sensores_bateria
+from run_headless import construir_config
+
+logger = logging.getLogger(__name__)
+
+
+def parsear_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos.
+
+    Args:
+        argv: Argumentos a parsear. Si es None, usa sys.argv.
+
+    Returns:
+        Namespace con los argumentos; los omitidos quedan en None.
+    """
+    parser = argparse.ArgumentParser(
+        description="Flota de sensores de batería sin interfaz gráfica"
+    )
+    parser.add_argument("--sensores", type=int, default=10, help="Cantidad de sensores")
+    parser.add_argument("--host", help="IP del servidor destino")
+    parser.add_argument("--puerto", type=int, help="Puerto TCP destino")
+    parser.add_argument("--intervalo-ms", type=int, help="Intervalo de envío (ms)")
+    parser.add_argument("--duracion", type=float, help="Segundos de ejecución")
+    parser.add_argument(
+        "--persistente", action="store_true", default=None,
+        help="Reutiliza las conexiones TCP entre envíos"
+    )
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de voltajes")
+    parser.add_argument(
+        "--reporte-s", type=float, default=5.0,
+        help="Intervalo del reporte agregado en segundos (0 = sin reporte)"
+    )
+    parser.add_argument("--detalle", action="store_true", help="Reporte por sensor al final")
+    parser.add_argument("--config", type=Path, help="Ruta a config.json")
+    return parser.parse_args(argv)
+
+
+def loguear_reporte(reporte: FleetReport, detalle: bool = False) -> None:
+    """Escribe el reporte de la flota en el log.
+
+    Args:
+        reporte: Reporte a escribir.
+        detalle: Si True, incluye una línea por sensor.
+    """
+    logger.info(
+        "Flota: %d sensores, %.1f s, %d enviados (%.1f/s), %d fallidos, %d coalescidos, "
+        "%d errores de fuente",
+        len(reporte.sensors), reporte.elapsed, reporte.sent, reporte.rate,
+        reporte.failed, reporte.coalesced, reporte.source_errors
+    )
+    if detalle:
+        for sensor in reporte.sensors:
+            logger.info(
+                "  %s: %d enviados (%.2f/s), %d fallidos, %d coalescidos, "
+                "%d errores de fuente",
+                sensor.name, sensor.sent, sensor.rate, sensor.failed, sensor.coalesced,
+                sensor.source_errors
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Función principal de la flota.
+
+    Args:
+        argv: Argumentos de línea de comandos (opcional).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    args = parsear_argumentos(argv)
+    config = construir_config(args)
+    pool = ConnectionPool.shared() if config.conexion_persistente else None
+    flota = SensorFleet(
+        crear_sensores_bateria(config, args.sensores, semilla=args.semilla),
+        pool=pool,
+    )
+
+    if args.reporte_s > 0:
+        flota.scheduler.schedule(args.reporte_s, lambda: loguear_reporte(flota.report()))
+
+    signal.signal(signal.SIGINT, lambda *_: flota.stop())
+    signal.signal(signal.SIGTERM, lambda *_: flota.stop())
+
+    loguear_reporte(flota.run(duration=args.duracion), detalle=args.detalle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
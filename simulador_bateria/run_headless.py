@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Punto de entrada headless para el Simulador de Batería.
+
+Ejecuta solo el plano de datos (generador + cliente TCP) sin
+QApplication, QtWidgets ni pyqtgraph, para CI y hosts de carga.
+
+Uso:
+    python run_headless.py --host 127.0.0.1 --puerto 11000 --duracion 60
+"""
+import argparse
+import logging
+import signal
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.configuracion.config import ConfigManager, ConfigSimuladorBateria
+from app.headless import SimuladorBateriaHeadless
+
+logger = logging.getLogger(__name__)
+
+
+def parsear_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos.
+
+    Args:
+        argv: Argumentos a parsear. Si es None, usa sys.argv.
+
+    Returns:
+        Namespace con los argumentos; los omitidos quedan en None.
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulador de Batería sin interfaz gráfica"
+    )
+    parser.add_argument("--host", help="IP del servidor destino")
+    parser.add_argument("--puerto", type=int, help="Puerto TCP destino")
+    parser.add_argument("--intervalo-ms", type=int, help="Intervalo de envío (ms)")
+    parser.add_argument("--voltaje", type=float, help="Voltaje a enviar (V)")
+    parser.add_argument("--duracion", type=float, help="Segundos de ejecución")
+    parser.add_argument(
+        "--persistente", action="store_true", default=None,
+        help="Reutiliza la conexión TCP entre envíos"
+    )
+    parser.add_argument("--config", type=Path, help="Ruta a config.json")
+    return parser.parse_args(argv)
+
+
+def construir_config(args: argparse.Namespace) -> ConfigSimuladorBateria:
+    """Combina config.json con los argumentos de línea de comandos.
+
+    Args:
+        args: Argumentos parseados.
+
+    Returns:
+        Configuración resultante.
+    """
+    config = ConfigManager().cargar(args.config)
+    cambios = {
+        "host": args.host,
+        "puerto": args.puerto,
+        "intervalo_envio_ms": args.intervalo_ms,
+        "conexion_persistente": args.persistente,
+    }
+    return replace(config, **{k: v for k, v in cambios.items() if v is not None})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Función principal del modo headless.
+
+    Args:
+        argv: Argumentos de línea de comandos (opcional).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = parsear_argumentos(argv)
+    simulador = SimuladorBateriaHeadless(construir_config(args))
+    if args.voltaje is not None:
+        simulador.set_voltaje(args.voltaje)
+
+    signal.signal(signal.SIGINT, lambda *_: simulador.scheduler.stop())
+    signal.signal(signal.SIGTERM, lambda *_: simulador.scheduler.stop())
+
+    simulador.ejecutar(duracion=args.duracion)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
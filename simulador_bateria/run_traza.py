@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Reproduce una traza de voltajes grabada hacia el servidor.
+
+Lee la traza de forma perezosa (CSV línea a línea o `.trace` binario
+con mmap) y la envía con ServicioEnvioBateria, igual que el
+generador manual. Usa QCoreApplication: no crea widgets.
+
+Uso:
+    python run_traza.py bateria_dron.csv --convertir        # -> bateria_dron.trace
+    python run_traza.py bateria_dron.trace --velocidad 60 --bucle --duracion 600
+"""
+import argparse
+import logging
+import signal
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PyQt6.QtCore import QCoreApplication, QTimer
+
+from compartido.replay import convert_csv_to_binary, open_trace
+
+from app.factory import ComponenteFactory
+from run_headless import construir_config
+
+logger = logging.getLogger(__name__)
+
+INTERVALO_SENALES_MS = 200
+"""Cada cuánto se devuelve el control a Python para atender Ctrl+C."""
+
+
+def parsear_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos.
+
+    Args:
+        argv: Argumentos a parsear. Si es None, usa sys.argv.
+
+    Returns:
+        Namespace con los argumentos; los omitidos quedan en None.
+    """
+    parser = argparse.ArgumentParser(
+        description="Reproduce una traza de voltajes grabada"
+    )
+    parser.add_argument("traza", type=Path, help="Archivo .csv o .trace")
+    parser.add_argument("--host", help="IP del servidor destino")
+    parser.add_argument("--puerto", type=int, help="Puerto TCP destino")
+    parser.add_argument(
+        "--velocidad", type=float, default=1.0,
+        help="Factor sobre los tiempos de la traza (default: 1)"
+    )
+    parser.add_argument(
+        "--bucle", action="store_true", help="Reinicia la traza al terminar"
+    )
+    parser.add_argument("--duracion", type=float, help="Segundos de ejecución")
+    parser.add_argument(
+        "--persistente", action="store_true", default=None,
+        help="Reutiliza la conexión TCP entre envíos"
+    )
+    parser.add_argument("--config", type=Path, help="Ruta a config.json")
+    parser.add_argument(
+        "--convertir", action="store_true",
+        help="Convierte el CSV a .trace binario y termina"
+    )
+    parser.set_defaults(intervalo_ms=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Función principal de la reproducción de trazas.
+
+    Args:
+        argv: Argumentos de línea de comandos (opcional).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    args = parsear_argumentos(argv)
+
+    if args.convertir:
+        destino = convert_csv_to_binary(args.traza)
+        logger.info("Traza convertida: %s", destino)
+        return 0
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    factory = ComponenteFactory(construir_config(args))
+    traza = open_trace(args.traza)
+    generador = factory.crear_generador_traza(traza, args.velocidad, args.bucle)
+    servicio = factory.crear_servicio(generador, factory.crear_cliente())
+
+    def salir_al_vaciar() -> None:
+        """Termina cuando no queda un envío en curso."""
+        if servicio.envio_en_curso:
+            QTimer.singleShot(50, salir_al_vaciar)
+        else:
+            app.quit()
+
+    generador.traza_finalizada.connect(salir_al_vaciar)
+    if args.duracion is not None:
+        QTimer.singleShot(int(args.duracion * 1000), app.quit)
+
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    senales = QTimer()
+    senales.timeout.connect(lambda: None)
+    senales.start(INTERVALO_SENALES_MS)
+
+    servicio.iniciar()
+    app.exec()
+    if servicio.activo:
+        servicio.detener()
+    traza.close()
+
+    reproductor = generador.reproductor
+    logger.info(
+        "Reproducción finalizada: %d muestras, %d bucles, %d reemplazadas",
+        reproductor.emitted, reproductor.loops, servicio.muestras_reemplazadas
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -48,6 +48,7 @@ def mock_ephemeral_client(qtbot):
         """Mock con signals PyQt6 reales."""
         data_sent = pyqtSignal()
         error_occurred = pyqtSignal(str)
+        send_dropped = pyqtSignal()
 
         def __init__(self):
             super().__init__()
@@ -130,6 +130,20 @@ class TestConfigManagerCargar:
         assert config.voltaje_maximo == 14.0
         assert config.voltaje_inicial == 12.5
 
+    def test_cargar_velocidad_simulacion(self):
+        """cargar() lee velocidad_simulacion (1.0 si falta)."""
+        manager = ConfigManager.obtener_instancia()
+        fake_path = Path("/fake/config.json")
+        json_content = '{"simulador_bateria": {"velocidad_simulacion": 0}}'
+
+        with patch.object(manager, '_buscar_config_json', return_value=fake_path), \
+             patch.object(Path, 'exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=json_content)):
+            config = manager.cargar()
+
+        assert config.velocidad_simulacion == 0
+        assert ConfigSimuladorBateria.desde_defaults().velocidad_simulacion == 1.0
+
     def test_cargar_property_cachea_resultado(self):
         """Property config cachea el resultado de cargar()."""
         manager = ConfigManager.obtener_instancia()
@@ -4,8 +4,11 @@ CRITICO: Verifica creacion de todos los componentes del simulador.
 """
 
 import pytest
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 
+from compartido.scheduling import VirtualClock
+
 from app.configuracion.config import ConfigSimuladorBateria
 from app.factory import ComponenteFactory
 from app.dominio.generador_bateria import GeneradorBateria
@@ -73,6 +76,14 @@ class TestComponenteFactoryCrearGenerador:
 
         assert gen1 is not gen2
 
+    def test_crear_generador_con_velocidad_virtual(self, config, qtbot):
+        """velocidad_simulacion=0 inyecta un VirtualClock."""
+        factory = ComponenteFactory(replace(config, velocidad_simulacion=0))
+
+        generador = factory.crear_generador()
+
+        assert isinstance(generador.reloj, VirtualClock)
+
 
 class TestComponenteFactoryCrearCliente:
     """Tests de crear_cliente."""
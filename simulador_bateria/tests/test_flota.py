@@ -0,0 +1,38 @@
+"""Tests unitarios para la flota de sensores de batería."""
+import pytest
+
+from app.configuracion.config import ConfigSimuladorBateria
+from app.flota import crear_sensores_bateria, sensor_bateria
+
+
+@pytest.fixture
+def config():
+    """Configuración estándar para tests."""
+    return ConfigSimuladorBateria.desde_defaults()
+
+
+class TestFlotaBateria:
+    """Tests de construcción de sensores."""
+
+    def test_sensor_envia_voltaje_constante(self):
+        """Verifica que la fuente retorne siempre el mismo voltaje."""
+        sensor = sensor_bateria("b", 3.3, "127.0.0.1", 11000, 1000)
+
+        assert sensor.source(0.0) == sensor.source(100.0) == 3.3
+        assert sensor.interval == 1.0
+
+    def test_voltajes_dentro_del_rango(self, config):
+        """Verifica que los voltajes al azar respeten el rango."""
+        sensores = crear_sensores_bateria(config, 100)
+
+        assert len({s.name for s in sensores}) == 100
+        assert all(
+            config.voltaje_minimo <= s.source(0.0) <= config.voltaje_maximo
+            for s in sensores
+        )
+
+    def test_destino_por_defecto(self, config):
+        """Verifica que el destino por defecto sea el de la configuración."""
+        sensores = crear_sensores_bateria(config, 3)
+
+        assert all((s.host, s.port) == (config.host, config.puerto) for s in sensores)
@@ -185,6 +185,19 @@ class TestGeneradorBateriaTimer:
         # Debe haber ~2-3 emisiones, no 6-9
         assert 2 <= len(signal_spy) <= 4
 
+    def test_estadisticas_timer_registran_ticks(self, generador, qtbot):
+        """Las estadisticas del timer cuentan cada emision periodica."""
+        signal_spy = []
+        generador.valor_generado.connect(lambda x: signal_spy.append(x))
+
+        generador.iniciar()
+        qtbot.wait(250)
+        generador.detener()
+
+        stats = generador.estadisticas_timer
+        assert stats.ticks == len(signal_spy)
+        assert stats.max_lateness_ms >= stats.mean_lateness_ms >= 0
+
 
 class TestGeneradorBateriaIntegracion:
     """Tests de integración."""
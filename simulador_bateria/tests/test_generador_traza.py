@@ -0,0 +1,84 @@
+"""Tests unitarios para GeneradorTrazaBateria y run_traza.
+
+Cubre:
+- Emision de los valores de la traza con validacion de rango
+- Conexion con ServicioEnvioBateria
+- Factory y conversion CSV -> .trace desde run_traza
+"""
+import pytest
+
+from compartido.replay import BinaryTrace, CsvTrace
+from compartido.scheduling import VirtualClock
+
+from app.comunicacion.servicio_envio import ServicioEnvioBateria
+from app.dominio.generador_traza import GeneradorTrazaBateria
+from app.factory import ComponenteFactory
+import run_traza
+
+
+@pytest.fixture
+def traza_csv(tmp_path):
+    """Traza CSV de descarga de bateria (una fila fuera de rango)."""
+    ruta = tmp_path / "descarga.csv"
+    ruta.write_text("t,v\n0,14.2\n60,13.9\n120,9.5\n", encoding="utf-8")
+    return ruta
+
+
+class TestGeneradorTrazaBateria:
+    """Tests del generador por reproduccion de trazas."""
+
+    def test_emite_estados_sin_clampear(self, config, traza_csv, qtbot):
+        """Los valores fuera de rango se marcan pero no se clampean."""
+        generador = GeneradorTrazaBateria(
+            config, CsvTrace(traza_csv), reloj=VirtualClock()
+        )
+        estados = []
+        generador.valor_generado.connect(estados.append)
+
+        with qtbot.waitSignal(generador.traza_finalizada, timeout=1000):
+            generador.iniciar()
+
+        assert [e.voltaje for e in estados] == pytest.approx([14.2, 13.9, 9.5])
+        assert [e.en_rango for e in estados] == [True, True, False]
+        assert generador.voltaje_actual == pytest.approx(9.5)
+
+    def test_se_conecta_al_servicio_de_envio(
+        self, config, traza_csv, mock_cliente, mock_ephemeral_client, qtbot
+    ):
+        """La traza se envia a traves de ServicioEnvioBateria."""
+        def enviar_y_confirmar(_mensaje):
+            mock_ephemeral_client.data_sent.emit()
+            return True
+
+        mock_ephemeral_client.send_async.side_effect = enviar_y_confirmar
+        generador = GeneradorTrazaBateria(
+            config, CsvTrace(traza_csv), reloj=VirtualClock()
+        )
+        servicio = ServicioEnvioBateria(generador, mock_cliente)
+
+        with qtbot.waitSignal(generador.traza_finalizada, timeout=1000):
+            servicio.iniciar()
+
+        enviados = [c[0][0] for c in mock_ephemeral_client.send_async.call_args_list]
+        assert enviados == ["14.20", "13.90", "9.50"]
+
+    def test_factory_crea_generador_traza(self, config, traza_csv, qtbot):
+        """crear_generador_traza() configura velocidad y bucle."""
+        generador = ComponenteFactory(config).crear_generador_traza(
+            CsvTrace(traza_csv), velocidad=5.0, en_bucle=True
+        )
+
+        assert isinstance(generador, GeneradorTrazaBateria)
+        assert generador.reproductor.speed == 5.0
+        assert generador.reproductor.loop is True
+
+
+class TestRunTraza:
+    """Tests del punto de entrada run_traza."""
+
+    def test_convertir(self, traza_csv):
+        """--convertir escribe la traza binaria junto al CSV."""
+        assert run_traza.main([str(traza_csv), "--convertir"]) == 0
+
+        with BinaryTrace(traza_csv.with_suffix(".trace")) as traza:
+            assert len(traza) == 3
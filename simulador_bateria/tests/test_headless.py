@@ -0,0 +1,112 @@
+"""Tests unitarios para SimuladorBateriaHeadless y run_headless."""
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.configuracion.config import ConfigSimuladorBateria
+from app.headless import SimuladorBateriaHeadless
+from compartido.scheduling import PeriodicScheduler
+
+
+@pytest.fixture
+def config():
+    """Configuración con intervalo corto para tests."""
+    return ConfigSimuladorBateria(
+        host="127.0.0.1",
+        puerto=11000,
+        intervalo_envio_ms=20,
+        voltaje_minimo=0.0,
+        voltaje_maximo=5.0,
+        voltaje_inicial=4.2,
+    )
+
+
+@pytest.fixture
+def mock_cliente():
+    """Cliente con envío síncrono exitoso."""
+    cliente = MagicMock()
+    cliente.enviar_estado.return_value = True
+    return cliente
+
+
+class TestSimuladorBateriaHeadless:
+    """Tests del simulador sin interfaz gráfica."""
+
+    def test_generar_valor_usa_voltaje_actual(self, config, mock_cliente):
+        """Verifica que el valor generado sea el voltaje configurado."""
+        simulador = SimuladorBateriaHeadless(config, cliente=mock_cliente)
+        estado = simulador.generar_valor()
+
+        assert estado.voltaje == 4.2
+        assert estado.en_rango is True
+
+    def test_set_voltaje_acota_al_rango(self, config, mock_cliente):
+        """Verifica el clamp de set_voltaje."""
+        simulador = SimuladorBateriaHeadless(config, cliente=mock_cliente)
+        simulador.set_voltaje(9.0)
+
+        assert simulador.voltaje_actual == 5.0
+
+    def test_ejecutar_envia_periodicamente(self, config, mock_cliente):
+        """Verifica los envíos durante una ejecución acotada."""
+        simulador = SimuladorBateriaHeadless(config, cliente=mock_cliente)
+        simulador.ejecutar(duracion=0.11)
+
+        assert mock_cliente.enviar_estado.call_count >= 4
+        assert simulador.enviados == mock_cliente.enviar_estado.call_count
+        assert simulador.fallidos == 0
+
+    def test_cuenta_fallidos(self, config, mock_cliente):
+        """Verifica el conteo de envíos fallidos."""
+        mock_cliente.enviar_estado.return_value = False
+        simulador = SimuladorBateriaHeadless(config, cliente=mock_cliente)
+        simulador.ejecutar(duracion=0.05)
+
+        assert simulador.fallidos >= 1
+        assert simulador.enviados == 0
+
+    def test_detener_cancela_tarea(self, config, mock_cliente):
+        """Verifica que detener() quite la tarea del planificador."""
+        scheduler = PeriodicScheduler()
+        simulador = SimuladorBateriaHeadless(
+            config, cliente=mock_cliente, scheduler=scheduler
+        )
+        simulador.iniciar()
+        assert scheduler.task_count() == 1
+
+        simulador.detener()
+        assert scheduler.task_count() == 0
+
+
+class TestRunHeadless:
+    """Tests del punto de entrada headless."""
+
+    def test_no_importa_widgets(self):
+        """Verifica que el modo headless no cargue QtWidgets ni pyqtgraph."""
+        raiz = Path(__file__).parent.parent
+        codigo = (
+            "import sys; import run_headless; "
+            "print([m for m in sys.modules "
+            "if m.startswith(('PyQt6.QtWidgets', 'pyqtgraph'))])"
+        )
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=raiz,
+            capture_output=True, text=True, timeout=30, check=True
+        )
+        assert salida.stdout.strip() == "[]"
+
+    def test_argumentos_sobrescriben_config(self):
+        """Verifica que los argumentos tengan prioridad sobre config.json."""
+        import run_headless
+
+        args = run_headless.parsear_argumentos(
+            ["--host", "10.0.0.9", "--puerto", "15000", "--persistente"]
+        )
+        config = run_headless.construir_config(args)
+
+        assert config.host == "10.0.0.9"
+        assert config.puerto == 15000
+        assert config.conexion_persistente is True
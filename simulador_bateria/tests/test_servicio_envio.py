@@ -8,6 +8,8 @@ Cubre:
 """
 import pytest
 
+from compartido.scheduling import VirtualClock
+
 from app.comunicacion.servicio_envio import ServicioEnvioBateria
 from app.dominio.estado_bateria import EstadoBateria
 
@@ -250,3 +252,109 @@ class TestServicioEnvioBateriaErrorHandling:
         assert servicio.activo is True
 
         servicio.detener()
+
+
+class TestServicioEnvioBateriaCoalescencia:
+    """Tests de coalescencia del último valor bajo contrapresión."""
+
+    def test_valores_intermedios_se_reemplazan(self, servicio, generador, mock_ephemeral_client):
+        """Solo se envían el valor en curso y el último pendiente."""
+        mock_ephemeral_client.send_async.return_value = True
+        servicio.iniciar()
+        generador.detener()
+
+        for voltaje in (12.0, 12.5, 13.0, 13.5):
+            servicio._on_valor_generado(EstadoBateria(voltaje=voltaje))
+
+        assert mock_ephemeral_client.send_async.call_count == 1
+        assert servicio.muestras_reemplazadas == 2
+
+        mock_ephemeral_client.data_sent.emit()
+
+        llamadas = [c[0][0] for c in mock_ephemeral_client.send_async.call_args_list]
+        assert llamadas == ["12.00", "13.50"]
+
+    def test_confirmacion_sincrona_no_bloquea(self, servicio, generador, mock_ephemeral_client):
+        """Una confirmación dentro de send_async libera el destino."""
+        def enviar_y_confirmar(_mensaje):
+            mock_ephemeral_client.data_sent.emit()
+            return True
+
+        mock_ephemeral_client.send_async.side_effect = enviar_y_confirmar
+        servicio.iniciar()
+        generador.detener()
+
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.0))
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.5))
+
+        assert servicio.envio_en_curso is False
+        assert mock_ephemeral_client.send_async.call_count == 2
+        assert servicio.muestras_reemplazadas == 0
+
+
+class TestServicioEnvioBateriaReloj:
+    """Tests de la retención del reloj de simulación durante los envíos."""
+
+    def test_envio_en_curso_retiene_reloj(self, config, mock_cliente, mock_ephemeral_client, qtbot):
+        """El reloj virtual queda retenido hasta la confirmación."""
+        from app.dominio.generador_bateria import GeneradorBateria
+
+        reloj = VirtualClock()
+        servicio = ServicioEnvioBateria(
+            GeneradorBateria(config), mock_cliente, reloj=reloj
+        )
+        mock_ephemeral_client.send_async.return_value = True
+        servicio.iniciar()
+        servicio.generador.detener()
+
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.0))
+        assert reloj.held
+
+        mock_ephemeral_client.data_sent.emit()
+        assert not reloj.held
+
+    def test_error_en_envio_libera_reloj(self, generador, mock_cliente, mock_ephemeral_client):
+        """Una excepción del cliente no deja el reloj retenido."""
+        reloj = VirtualClock()
+        servicio = ServicioEnvioBateria(generador, mock_cliente, reloj=reloj)
+        mock_ephemeral_client.send_async.side_effect = OSError("sin red")
+        servicio.iniciar()
+        generador.detener()
+
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.0))
+
+        assert not reloj.held
+
+    def test_envio_desalojado_libera_reloj(self, generador, mock_cliente, mock_ephemeral_client):
+        """Un envío encolado que el ejecutor desaloja libera destino y reloj."""
+        reloj = VirtualClock()
+        servicio = ServicioEnvioBateria(generador, mock_cliente, reloj=reloj)
+        mock_ephemeral_client.send_async.return_value = True
+        servicio.iniciar()
+        generador.detener()
+
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.0))
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.5))
+        mock_ephemeral_client.send_dropped.emit()
+
+        # El valor pendiente se envía en lugar del desalojado
+        llamadas = [c[0][0] for c in mock_ephemeral_client.send_async.call_args_list]
+        assert llamadas == ["12.00", "12.50"]
+
+        mock_ephemeral_client.send_dropped.emit()
+        assert servicio.envio_en_curso is False
+        assert not reloj.held
+
+    def test_detener_libera_reloj(self, generador, mock_cliente, mock_ephemeral_client):
+        """detener() con un envío sin confirmar no deja el reloj retenido."""
+        reloj = VirtualClock()
+        servicio = ServicioEnvioBateria(generador, mock_cliente, reloj=reloj)
+        mock_ephemeral_client.send_async.return_value = True
+        servicio.iniciar()
+        generador.detener()
+
+        servicio._on_valor_generado(EstadoBateria(voltaje=12.0))
+        servicio.detener()
+
+        assert servicio.envio_en_curso is False
+        assert not reloj.held
@@ -8,7 +8,7 @@ from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from compartido.networking import EphemeralSocketClient
+from compartido.networking import ConnectionPool, EphemeralSocketClient
 from ..dominio.estado_temperatura import EstadoTemperatura
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,9 @@ class ClienteTemperatura(QObject):
             Parámetro: float con la temperatura enviada.
         error_conexion: Emitida cuando ocurre un error de conexión.
             Parámetro: str con el mensaje de error.
+        envio_descartado: Emitida cuando un envío asíncrono ya encolado
+            se descarta sin ejecutarse (no habrá dato_enviado ni
+            error_conexion para ese valor).
 
     Example:
         >>> cliente = ClienteTemperatura("127.0.0.1", 12000)
@@ -38,12 +41,14 @@ class ClienteTemperatura(QObject):
 
     dato_enviado = pyqtSignal(float)
     error_conexion = pyqtSignal(str)
+    envio_descartado = pyqtSignal()
 
     def __init__(
         self,
         host: str,
         port: int,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        pool: Optional[ConnectionPool] = None
     ) -> None:
         """Inicializa el cliente de temperatura.
 
@@ -51,14 +56,16 @@ class ClienteTemperatura(QObject):
             host: Dirección IP del servidor ISSE_Termostato.
             port: Puerto TCP del servidor (default 12000).
             parent: Objeto padre Qt opcional.
+            pool: Pool de conexiones keep-alive (None = conexión por envío).
         """
         super().__init__(parent)
         self._host = host
         self._port = port
-        self._cliente = EphemeralSocketClient(host, port, self)
+        self._cliente = EphemeralSocketClient(host, port, self, pool=pool)
 
         self._cliente.data_sent.connect(self._on_data_sent)
         self._cliente.error_occurred.connect(self._on_error)
+        self._cliente.send_dropped.connect(self._on_send_dropped)
 
         self._ultimo_valor: Optional[float] = None
 
@@ -95,7 +102,7 @@ class ClienteTemperatura(QObject):
         logger.debug("Enviando temperatura: %s", mensaje)
         return self._cliente.send(mensaje)
 
-    def enviar_temperatura_async(self, temperatura: float) -> None:
+    def enviar_temperatura_async(self, temperatura: float) -> bool:
         """Envía un valor de temperatura de forma asíncrona.
 
         Similar a enviar_temperatura pero no bloquea. El resultado
@@ -103,12 +110,15 @@ class ClienteTemperatura(QObject):
 
         Args:
             temperatura: Valor de temperatura en grados Celsius.
+
+        Returns:
+            True si el envío quedó encolado, False si fue descartado.
         """
         self._ultimo_valor = temperatura
         mensaje = f"{temperatura:.2f}"
 
         logger.debug("Enviando temperatura (async): %s", mensaje)
-        self._cliente.send_async(mensaje)
+        return self._cliente.send_async(mensaje)
 
     def enviar_estado(self, estado: EstadoTemperatura) -> bool:
         """Envía un EstadoTemperatura al servidor.
@@ -124,13 +134,16 @@ class ClienteTemperatura(QObject):
         """
         return self.enviar_temperatura(estado.temperatura)
 
-    def enviar_estado_async(self, estado: EstadoTemperatura) -> None:
+    def enviar_estado_async(self, estado: EstadoTemperatura) -> bool:
         """Envía un EstadoTemperatura de forma asíncrona.
 
         Args:
             estado: Objeto EstadoTemperatura con el valor a enviar.
+
+        Returns:
+            True si el envío quedó encolado, False si fue descartado.
         """
-        self.enviar_temperatura_async(estado.temperatura)
+        return self.enviar_temperatura_async(estado.temperatura)
 
     def _on_data_sent(self) -> None:
         """Callback interno cuando los datos se envían exitosamente."""
@@ -148,3 +161,11 @@ class ClienteTemperatura(QObject):
             self._host, self._port, mensaje
         )
         self.error_conexion.emit(mensaje)
+
+    def _on_send_dropped(self) -> None:
+        """Callback interno cuando el ejecutor descarta un envío encolado."""
+        logger.warning(
+            "Envío descartado antes de ejecutarse -> %s:%d",
+            self._host, self._port
+        )
+        self.envio_descartado.emit()
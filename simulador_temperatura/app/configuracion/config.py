@@ -16,12 +16,22 @@ from .constantes import (
     DEFAULT_PASO_VARIACION,
     DEFAULT_VARIACION_AMPLITUD,
     DEFAULT_VARIACION_PERIODO,
+    DEFAULT_CONEXION_PERSISTENTE,
+    DEFAULT_VELOCIDAD_SIMULACION,
 )
 
 
 @dataclass(frozen=True)
 class ConfigSimuladorTemperatura:
-    """Configuracion tipada del simulador de temperatura."""
+    """Configuracion tipada del simulador de temperatura.
+
+    `conexion_persistente` activa el pool de conexiones keep-alive
+    del cliente TCP en lugar de una conexion por envio.
+
+    `velocidad_simulacion` acelera el reloj del generador: 1 = tiempo
+    real, >1 = acelerado (x10, x1000), 0 = tiempo virtual tan rapido
+    como lo admita el servidor.
+    """
 
     ip_raspberry: str
     puerto: int
@@ -33,6 +43,8 @@ class ConfigSimuladorTemperatura:
     paso_variacion: float
     variacion_amplitud: float
     variacion_periodo_segundos: float
+    conexion_persistente: bool = DEFAULT_CONEXION_PERSISTENTE
+    velocidad_simulacion: float = DEFAULT_VELOCIDAD_SIMULACION
 
     @classmethod
     def desde_defaults(cls) -> "ConfigSimuladorTemperatura":
@@ -128,6 +140,12 @@ class ConfigManager:
             variacion_periodo_segundos=simulador.get(
                 "variacion_periodo_segundos", DEFAULT_VARIACION_PERIODO
             ),
+            conexion_persistente=simulador.get(
+                "conexion_persistente", DEFAULT_CONEXION_PERSISTENTE
+            ),
+            velocidad_simulacion=simulador.get(
+                "velocidad_simulacion", DEFAULT_VELOCIDAD_SIMULACION
+            ),
         )
 
     @property
@@ -15,6 +15,8 @@ DEFAULT_RUIDO_AMPLITUD: float = 0.5
 DEFAULT_PASO_VARIACION: float = 0.1
 DEFAULT_VARIACION_AMPLITUD: float = 5.0
 DEFAULT_VARIACION_PERIODO: float = 60.0  # segundos
+DEFAULT_CONEXION_PERSISTENTE: bool = False  # Pool keep-alive (opt-in)
+DEFAULT_VELOCIDAD_SIMULACION: float = 1.0  # 1 = real, >1 = acelerado, 0 = virtual
 
 # Rutas
 CONFIG_FILENAME: str = "config.json"
@@ -5,13 +5,19 @@ Contiene:
     - EstadoTemperatura: Modelo de datos para el estado de temperatura
     - VariacionSenoidal: Logica de variacion senoidal de temperatura
     - GeneradorTemperatura: Genera valores simulados con variacion senoidal
+    - GeneradorTrazaTemperatura: Reproduce una traza grabada
+
+La evaluacion vectorizada por lotes (NumPy) esta en `lote_senoidal` y se
+importa explicitamente para no cargar NumPy en el modo headless.
 """
 from .estado_temperatura import EstadoTemperatura
 from .variacion_senoidal import VariacionSenoidal
 from .generador_temperatura import GeneradorTemperatura
+from .generador_traza import GeneradorTrazaTemperatura
 
 __all__ = [
     "EstadoTemperatura",
     "VariacionSenoidal",
     "GeneradorTemperatura",
+    "GeneradorTrazaTemperatura",
 ]
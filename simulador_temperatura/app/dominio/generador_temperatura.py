@@ -1,10 +1,12 @@
 """Generador de valores de temperatura simulados."""
-import time
 from typing import Optional
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from compartido.scheduling import Clock, MonotonicTimer, RealClock, TickStats
 
 from .estado_temperatura import EstadoTemperatura
+from .tabla_senoidal import CacheTablasSenoidales
 from .variacion_senoidal import VariacionSenoidal
 from ..configuracion.config import ConfigSimuladorTemperatura
 
@@ -16,6 +18,14 @@ class GeneradorTemperatura(QObject):
     - Automático: Genera temperaturas siguiendo una curva senoidal
     - Manual: Retorna un valor fijo definido por el usuario
 
+    En modo automático la curva se evalúa con una TablaSenoidal
+    precalculada (caché LRU compartido) en lugar de `math.sin`. La
+    emisión periódica usa un MonotonicTimer, sin deriva acumulada.
+
+    El tiempo de la curva y los ticks se miden con un Clock inyectable:
+    con un ScaledClock o un VirtualClock un periodo de 24 h se recorre
+    en minutos.
+
     Signals:
         valor_generado: Emitido cada vez que se genera un nuevo valor.
         temperatura_cambiada: Emitido cuando la temperatura cambia.
@@ -27,27 +37,34 @@ class GeneradorTemperatura(QObject):
     def __init__(
         self,
         config: ConfigSimuladorTemperatura,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        cache: Optional[CacheTablasSenoidales] = None,
+        reloj: Optional[Clock] = None
     ) -> None:
         """Inicializa el generador de temperatura.
 
         Args:
             config: Configuración del simulador.
             parent: Objeto padre Qt opcional.
+            cache: Caché de tablas senoidales. Si es None, usa el compartido.
+            reloj: Reloj de simulación. Si es None, usa tiempo real.
         """
         super().__init__(parent)
         self._config = config
+        self._reloj: Clock = reloj or RealClock(self)
         self._modo_manual = False
         self._temperatura_manual: float = config.temperatura_inicial
-        self._tiempo_inicio = time.time()
+        self._tiempo_inicio = self._reloj.now()
 
         self._variacion = VariacionSenoidal(
             temperatura_base=config.temperatura_inicial,
             amplitud=config.variacion_amplitud,
             periodo_segundos=config.variacion_periodo_segundos,
         )
+        self._cache = cache or CacheTablasSenoidales.compartida()
+        self._tabla = self._cache.obtener(self._variacion)
 
-        self._timer = QTimer(self)
+        self._timer = MonotonicTimer(self, clock=self._reloj)
         self._timer.timeout.connect(self._on_timer_timeout)
 
         self._ultima_temperatura: Optional[float] = None
@@ -57,13 +74,23 @@ class GeneradorTemperatura(QObject):
         """Indica si está en modo manual."""
         return self._modo_manual
 
+    @property
+    def reloj(self) -> Clock:
+        """Reloj de simulación."""
+        return self._reloj
+
+    @property
+    def estadisticas_timer(self) -> TickStats:
+        """Puntualidad de la emisión periódica (atraso por tick)."""
+        return self._timer.stats
+
     @property
     def temperatura_actual(self) -> float:
         """Retorna la temperatura actual según el modo."""
         if self._modo_manual:
             return self._temperatura_manual
-        tiempo = time.time() - self._tiempo_inicio
-        return self._variacion.calcular_temperatura(tiempo)
+        tiempo = self._reloj.now() - self._tiempo_inicio
+        return self._tabla.calcular_temperatura(tiempo)
 
     def set_temperatura_manual(self, temperatura: float) -> None:
         """Establece una temperatura manual y cambia a modo manual.
@@ -78,7 +105,7 @@ class GeneradorTemperatura(QObject):
     def set_modo_automatico(self) -> None:
         """Cambia a modo automático (variación senoidal)."""
         self._modo_manual = False
-        self._tiempo_inicio = time.time()
+        self._tiempo_inicio = self._reloj.now()
 
     def actualizar_variacion(
         self,
@@ -93,11 +120,13 @@ class GeneradorTemperatura(QObject):
             amplitud: Amplitud de variación en grados.
             periodo_segundos: Periodo de la onda senoidal.
         """
+        self._cache.invalidar(self._variacion)
         self._variacion = VariacionSenoidal(
             temperatura_base=temperatura_base,
             amplitud=amplitud,
             periodo_segundos=periodo_segundos,
         )
+        self._tabla = self._cache.obtener(self._variacion)
 
     def generar_valor(self) -> EstadoTemperatura:
         """Genera un nuevo valor de temperatura.
@@ -121,7 +150,7 @@ class GeneradorTemperatura(QObject):
 
     def iniciar(self) -> None:
         """Inicia la generación periódica de valores."""
-        self._tiempo_inicio = time.time()
+        self._tiempo_inicio = self._reloj.now()
         self._timer.start(self._config.intervalo_envio_ms)
 
     def detener(self) -> None:
@@ -0,0 +1,113 @@
+"""Generador de temperaturas que reproduce una traza grabada."""
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from compartido.replay import TraceReader, TraceReplayer
+from compartido.scheduling import Clock, RealClock
+
+from .estado_temperatura import EstadoTemperatura
+from ..configuracion.config import ConfigSimuladorTemperatura
+
+
+class GeneradorTrazaTemperatura(QObject):
+    """Reproduce temperaturas grabadas en campo en lugar de la curva senoidal.
+
+    Expone la misma interfaz que usa ServicioEnvioTemperatura de
+    GeneradorTemperatura (`valor_generado`, `iniciar`, `detener`,
+    `reloj`), por lo que se conecta al servicio sin cambios. Cada valor
+    se emite en el instante de su marca de tiempo dividida por
+    `velocidad`; la traza se lee de forma perezosa (CSV línea a línea o
+    binaria con mmap).
+
+    Signals:
+        valor_generado: Emitido con cada muestra de la traza.
+        temperatura_cambiada: Emitido cuando la temperatura cambia.
+        traza_finalizada: Emitido al terminar la traza (sin bucle).
+
+    Example:
+        >>> traza = open_trace("sala_3.trace")
+        >>> generador = GeneradorTrazaTemperatura(config, traza, velocidad=60)
+        >>> servicio = ServicioEnvioTemperatura(generador, cliente)
+        >>> servicio.iniciar()
+    """
+
+    valor_generado = pyqtSignal(object)  # EstadoTemperatura
+    temperatura_cambiada = pyqtSignal(float)
+    traza_finalizada = pyqtSignal()
+
+    def __init__(
+        self,
+        config: ConfigSimuladorTemperatura,
+        traza: TraceReader,
+        velocidad: float = 1.0,
+        en_bucle: bool = False,
+        parent: Optional[QObject] = None,
+        reloj: Optional[Clock] = None
+    ) -> None:
+        """Inicializa el generador detenido.
+
+        Args:
+            config: Configuración del simulador (rango de validación).
+            traza: Traza de temperaturas (°C) a reproducir.
+            velocidad: Factor sobre los tiempos de la traza.
+            en_bucle: Si True, reinicia la traza al terminar.
+            parent: Objeto padre Qt opcional.
+            reloj: Reloj de simulación. Si es None, usa tiempo real.
+
+        Raises:
+            ValueError: Si la velocidad no es positiva.
+        """
+        super().__init__(parent)
+        self._config = config
+        self._reloj: Clock = reloj or RealClock(self)
+        self._reproductor = TraceReplayer(
+            traza, speed=velocidad, loop=en_bucle, clock=self._reloj, parent=self
+        )
+        self._reproductor.sample_ready.connect(self._on_muestra)
+        self._reproductor.finished.connect(self.traza_finalizada)
+        self._temperatura_actual: float = config.temperatura_inicial
+
+    @property
+    def reloj(self) -> Clock:
+        """Reloj de simulación."""
+        return self._reloj
+
+    @property
+    def reproductor(self) -> TraceReplayer:
+        """Reproductor subyacente (velocidad, bucles y muestras emitidas)."""
+        return self._reproductor
+
+    @property
+    def temperatura_actual(self) -> float:
+        """Última temperatura reproducida (la inicial antes de empezar)."""
+        return self._temperatura_actual
+
+    def generar_valor(self) -> EstadoTemperatura:
+        """Emite la temperatura actual sin avanzar la traza.
+
+        Returns:
+            EstadoTemperatura con el valor actual.
+        """
+        estado = EstadoTemperatura(temperatura=self._temperatura_actual)
+        estado.validar_rango(
+            self._config.temperatura_minima,
+            self._config.temperatura_maxima
+        )
+        self.valor_generado.emit(estado)
+        return estado
+
+    def iniciar(self) -> None:
+        """Inicia la reproducción desde el principio de la traza."""
+        self._reproductor.start()
+
+    def detener(self) -> None:
+        """Detiene la reproducción."""
+        self._reproductor.stop()
+
+    def _on_muestra(self, temperatura: float) -> None:
+        """Callback del reproductor con la muestra vencida."""
+        if temperatura != self._temperatura_actual:
+            self._temperatura_actual = temperatura
+            self.temperatura_cambiada.emit(temperatura)
+        self.generar_valor()
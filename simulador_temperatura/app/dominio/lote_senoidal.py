@@ -0,0 +1,84 @@
+"""Evaluación vectorizada (NumPy) de variaciones senoidales.
+
+Calcula muchas temperaturas de una vez (muchos sensores y/o muchos
+instantes) con broadcasting, para flotas y para pregenerar trazas
+largas. Usa la misma fórmula y el mismo orden de operaciones que
+VariacionSenoidal.calcular_temperatura, pero np.sin y math.sin pueden
+diferir en el último bit según la plataforma: los valores coinciden con
+la versión escalar con error relativo menor a 1e-12, no bit a bit.
+"""
+from typing import Iterable, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .variacion_senoidal import VariacionSenoidal
+
+
+def calcular_lote(
+    temperatura_base: ArrayLike,
+    amplitud: ArrayLike,
+    periodo_segundos: ArrayLike,
+    tiempos: ArrayLike
+) -> np.ndarray:
+    """Calcula temperaturas para arrays de parámetros y tiempos.
+
+    Los argumentos se combinan con las reglas de broadcasting de NumPy:
+    parámetros de forma (n, 1) y tiempos de forma (m,) producen una
+    matriz (n, m) con una fila por sensor.
+
+    Args:
+        temperatura_base: Temperatura central de cada onda (°C).
+        amplitud: Amplitud de cada onda (°C).
+        periodo_segundos: Periodo de cada onda (segundos).
+        tiempos: Tiempos transcurridos desde el inicio (segundos).
+
+    Returns:
+        Array float64 con las temperaturas calculadas.
+    """
+    base = np.asarray(temperatura_base, dtype=np.float64)
+    amp = np.asarray(amplitud, dtype=np.float64)
+    periodo = np.asarray(periodo_segundos, dtype=np.float64)
+    t = np.asarray(tiempos, dtype=np.float64)
+
+    angulo = 2 * np.pi * t / periodo
+    return base + amp * np.sin(angulo)
+
+
+def parametros_lote(
+    variaciones: Iterable[VariacionSenoidal]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Agrupa los parámetros de varias variaciones en columnas (n, 1).
+
+    Args:
+        variaciones: Variaciones senoidales de cada sensor.
+
+    Returns:
+        Tupla (bases, amplitudes, periodos), lista para `calcular_lote`
+        con un array de tiempos de forma (m,).
+    """
+    parametros = np.array(
+        [
+            (v.temperatura_base, v.amplitud, v.periodo_segundos)
+            for v in variaciones
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    return parametros[:, 0:1], parametros[:, 1:2], parametros[:, 2:3]
+
+
+def calcular_lote_variaciones(
+    variaciones: Iterable[VariacionSenoidal],
+    tiempos: ArrayLike
+) -> np.ndarray:
+    """Calcula la matriz (sensores × tiempos) para varias variaciones.
+
+    Args:
+        variaciones: Variaciones senoidales de cada sensor.
+        tiempos: Tiempos transcurridos desde el inicio (segundos).
+
+    Returns:
+        Array (n, m) con una fila por variación.
+    """
+    bases, amplitudes, periodos = parametros_lote(variaciones)
+    return calcular_lote(bases, amplitudes, periodos, np.ravel(tiempos))
@@ -1,6 +1,11 @@
 """Lógica de variación senoidal para simulación de temperatura."""
 import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 
 @dataclass
@@ -33,6 +38,25 @@ class VariacionSenoidal:
         angulo = 2 * math.pi * tiempo_segundos / self.periodo_segundos
         return self.temperatura_base + self.amplitud * math.sin(angulo)
 
+    def calcular_temperaturas(self, tiempos: "ArrayLike") -> "np.ndarray":
+        """Calcula la temperatura para un array de tiempos (NumPy).
+
+        Equivale a aplicar `calcular_temperatura` a cada tiempo. Los
+        valores pueden diferir de los escalares en el último bit (np.sin
+        frente a math.sin), con error relativo menor a 1e-12.
+
+        Args:
+            tiempos: Array de tiempos transcurridos (segundos).
+
+        Returns:
+            numpy.ndarray con las temperaturas calculadas.
+        """
+        # Import diferido: NumPy solo se carga al usar la API por lotes
+        from .lote_senoidal import calcular_lote
+        return calcular_lote(
+            self.temperatura_base, self.amplitud, self.periodo_segundos, tiempos
+        )
+
     @property
     def temperatura_maxima(self) -> float:
         """Temperatura máxima alcanzable (base + amplitud)."""
@@ -6,8 +6,13 @@ permitiendo configuración flexible y facilitando el testing.
 
 from typing import Dict, Optional
 
+from compartido.networking import ConnectionPool
+from compartido.replay import TraceReader
+from compartido.scheduling import Clock, create_clock
+
 from .configuracion.config import ConfigSimuladorTemperatura
 from .dominio.generador_temperatura import GeneradorTemperatura
+from .dominio.generador_traza import GeneradorTrazaTemperatura
 from .comunicacion.cliente_temperatura import ClienteTemperatura
 from .comunicacion.servicio_envio import ServicioEnvioTemperatura
 from .presentacion.paneles.estado import PanelEstadoControlador
@@ -49,7 +54,27 @@ class ComponenteFactory:
         Returns:
             Nueva instancia de GeneradorTemperatura configurada.
         """
-        return GeneradorTemperatura(self._config)
+        return GeneradorTemperatura(self._config, reloj=self._crear_reloj())
+
+    def crear_generador_traza(
+        self,
+        traza: TraceReader,
+        velocidad: float = 1.0,
+        en_bucle: bool = False
+    ) -> GeneradorTrazaTemperatura:
+        """Crea un generador que reproduce una traza grabada.
+
+        Args:
+            traza: Traza abierta con `compartido.replay.open_trace`.
+            velocidad: Factor sobre los tiempos de la traza.
+            en_bucle: Si True, reinicia la traza al terminar.
+
+        Returns:
+            Nueva instancia de GeneradorTrazaTemperatura detenida.
+        """
+        return GeneradorTrazaTemperatura(
+            self._config, traza, velocidad, en_bucle, reloj=self._crear_reloj()
+        )
 
     # -- Componentes de Comunicación --
 
@@ -65,13 +90,25 @@ class ComponenteFactory:
             port: Puerto del servidor (usa config si no se especifica).
 
         Returns:
-            Nueva instancia de ClienteTemperatura.
+            Nueva instancia de ClienteTemperatura. Si la configuración
+            tiene `conexion_persistente`, usa el pool compartido.
         """
         return ClienteTemperatura(
             host=host or self._config.ip_raspberry,
-            port=port or self._config.puerto
+            port=port or self._config.puerto,
+            pool=self._crear_pool()
         )
 
+    def _crear_reloj(self) -> Clock:
+        """Crea el reloj de simulación según `velocidad_simulacion`."""
+        return create_clock(self._config.velocidad_simulacion)
+
+    def _crear_pool(self) -> Optional[ConnectionPool]:
+        """Retorna el pool keep-alive compartido si está habilitado."""
+        if self._config.conexion_persistente:
+            return ConnectionPool.shared()
+        return None
+
     def crear_servicio(
         self,
         generador: GeneradorTemperatura,
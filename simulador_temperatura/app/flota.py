@@ -0,0 +1,98 @@
+"""Flota de sensores de temperatura para pruebas de carga.
+
+Construye SensorStream independientes, cada uno con su propia
+VariacionSenoidal, para ejecutarlos con compartido.fleet.SensorFleet
+desde un único proceso. Cada sensor evalúa su curva con una
+TablaSenoidal precalculada.
+"""
+import random
+from typing import List, Optional
+
+from compartido.fleet import SensorStream
+
+from .configuracion.config import ConfigSimuladorTemperatura
+from .dominio.tabla_senoidal import CacheTablasSenoidales
+from .dominio.variacion_senoidal import VariacionSenoidal
+
+DISPERSION_BASE = 2.0
+"""Desvío máximo (°C) de la temperatura base de cada sensor."""
+
+DISPERSION_PERIODO = 0.2
+"""Desvío relativo máximo del periodo de cada sensor."""
+
+
+def sensor_temperatura(
+    nombre: str,
+    variacion: VariacionSenoidal,
+    host: str,
+    puerto: int,
+    intervalo_ms: int,
+    cache: Optional[CacheTablasSenoidales] = None
+) -> SensorStream:
+    """Crea la definición de un sensor de temperatura.
+
+    El sensor retiene su tabla: el desalojo LRU del caché no lo afecta.
+
+    Args:
+        nombre: Identificador del sensor.
+        variacion: Curva senoidal que sigue el sensor.
+        host: IP del servidor destino.
+        puerto: Puerto TCP destino.
+        intervalo_ms: Intervalo de envío en milisegundos.
+        cache: Caché de tablas. Si es None, usa el compartido.
+
+    Returns:
+        SensorStream con el mismo formato que ClienteTemperatura.
+    """
+    tabla = (cache or CacheTablasSenoidales.compartida()).obtener(variacion)
+    return SensorStream(
+        name=nombre,
+        host=host,
+        port=puerto,
+        interval=intervalo_ms / 1000.0,
+        source=tabla.calcular_temperatura,
+        decimals=2,
+    )
+
+
+def crear_sensores_temperatura(
+    config: ConfigSimuladorTemperatura,
+    cantidad: int,
+    host: Optional[str] = None,
+    puerto: Optional[int] = None,
+    semilla: int = 0
+) -> List[SensorStream]:
+    """Crea `cantidad` sensores con parámetros senoidales dispersos.
+
+    Cada sensor parte de la variación de la configuración con la base y
+    el periodo desplazados al azar (reproducible con `semilla`), para
+    que las habitaciones simuladas no envíen valores idénticos.
+
+    Args:
+        config: Configuración base del simulador.
+        cantidad: Cantidad de sensores.
+        host: IP destino. Si es None, usa la de la configuración.
+        puerto: Puerto destino. Si es None, usa el de la configuración.
+        semilla: Semilla para la dispersión de parámetros.
+
+    Returns:
+        Lista de SensorStream con nombres "temperatura-<n>".
+    """
+    rng = random.Random(semilla)
+    host = host or config.ip_raspberry
+    puerto = puerto or config.puerto
+
+    sensores = []
+    for indice in range(cantidad):
+        variacion = VariacionSenoidal(
+            temperatura_base=config.temperatura_inicial
+            + rng.uniform(-DISPERSION_BASE, DISPERSION_BASE),
+            amplitud=config.variacion_amplitud,
+            periodo_segundos=config.variacion_periodo_segundos
+            * (1 + rng.uniform(-DISPERSION_PERIODO, DISPERSION_PERIODO)),
+        )
+        sensores.append(sensor_temperatura(
+            f"temperatura-{indice}", variacion, host, puerto,
+            config.intervalo_envio_ms
+        ))
+    return sensores
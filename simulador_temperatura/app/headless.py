@@ -0,0 +1,142 @@
+"""Ejecución headless del Simulador de Temperatura.
+
+Genera y envía temperaturas sin QApplication ni widgets: reutiliza el
+dominio (VariacionSenoidal, EstadoTemperatura) y el ClienteTemperatura,
+y usa un PeriodicScheduler en lugar de QTimer. Pensado para CI y para
+hosts de carga donde solo interesa el plano de datos.
+"""
+import logging
+import time
+from typing import Optional
+
+from compartido.networking import ConnectionPool
+from compartido.scheduling import PeriodicScheduler
+
+from .comunicacion.cliente_temperatura import ClienteTemperatura
+from .configuracion.config import ConfigSimuladorTemperatura
+from .dominio.estado_temperatura import EstadoTemperatura
+from .dominio.tabla_senoidal import CacheTablasSenoidales
+from .dominio.variacion_senoidal import VariacionSenoidal
+
+logger = logging.getLogger(__name__)
+
+
+class SimuladorTemperaturaHeadless:
+    """Simulador de temperatura sin interfaz gráfica.
+
+    Los envíos son síncronos y se ejecutan en el hilo del planificador:
+    como el cliente y el planificador comparten hilo, las señales del
+    cliente se entregan de forma directa sin event loop.
+
+    Attributes:
+        enviados (int): Valores enviados con éxito.
+        fallidos (int): Envíos que fallaron.
+
+    Example:
+        >>> config = ConfigManager().cargar()
+        >>> simulador = SimuladorTemperaturaHeadless(config)
+        >>> simulador.ejecutar(duracion=10.0)
+    """
+
+    def __init__(
+        self,
+        config: ConfigSimuladorTemperatura,
+        cliente: Optional[ClienteTemperatura] = None,
+        scheduler: Optional[PeriodicScheduler] = None
+    ) -> None:
+        """Inicializa el simulador headless.
+
+        Args:
+            config: Configuración del simulador.
+            cliente: Cliente TCP. Si es None, se crea según la configuración.
+            scheduler: Planificador a usar. Si es None, se crea uno propio.
+        """
+        self._config = config
+        self._cliente = cliente or self._crear_cliente()
+        self._scheduler = scheduler or PeriodicScheduler()
+        self._tabla = CacheTablasSenoidales.compartida().obtener(VariacionSenoidal(
+            temperatura_base=config.temperatura_inicial,
+            amplitud=config.variacion_amplitud,
+            periodo_segundos=config.variacion_periodo_segundos,
+        ))
+        self._tiempo_inicio = time.monotonic()
+        self._tarea: Optional[int] = None
+        self.enviados = 0
+        self.fallidos = 0
+
+    @property
+    def cliente(self) -> ClienteTemperatura:
+        """Cliente TCP asociado."""
+        return self._cliente
+
+    @property
+    def scheduler(self) -> PeriodicScheduler:
+        """Planificador que dispara los envíos."""
+        return self._scheduler
+
+    def generar_valor(self) -> EstadoTemperatura:
+        """Genera la temperatura correspondiente al instante actual.
+
+        Returns:
+            EstadoTemperatura con el valor generado.
+        """
+        tiempo = time.monotonic() - self._tiempo_inicio
+        estado = EstadoTemperatura(
+            temperatura=self._tabla.calcular_temperatura(tiempo)
+        )
+        estado.validar_rango(
+            self._config.temperatura_minima,
+            self._config.temperatura_maxima
+        )
+        return estado
+
+    def iniciar(self) -> None:
+        """Programa la generación periódica en el planificador."""
+        if self._tarea is not None:
+            return
+        self._tiempo_inicio = time.monotonic()
+        self._tarea = self._scheduler.schedule(
+            self._config.intervalo_envio_ms / 1000.0, self._on_tick
+        )
+        logger.info(
+            "Simulador headless iniciado -> %s:%d cada %d ms",
+            self._cliente.host, self._cliente.port,
+            self._config.intervalo_envio_ms
+        )
+
+    def detener(self) -> None:
+        """Cancela la generación periódica."""
+        if self._tarea is None:
+            return
+        self._scheduler.cancel(self._tarea)
+        self._tarea = None
+        logger.info(
+            "Simulador headless detenido (%d enviados, %d fallidos)",
+            self.enviados, self.fallidos
+        )
+
+    def ejecutar(self, duracion: Optional[float] = None) -> None:
+        """Inicia el simulador y bloquea hasta `duracion` o `scheduler.stop()`.
+
+        Args:
+            duracion: Segundos de ejecución. None = hasta detener.
+        """
+        self.iniciar()
+        try:
+            self._scheduler.run(duration=duracion)
+        finally:
+            self.detener()
+
+    def _crear_cliente(self) -> ClienteTemperatura:
+        """Crea el cliente TCP según la configuración."""
+        pool = ConnectionPool.shared() if self._config.conexion_persistente else None
+        return ClienteTemperatura(
+            self._config.ip_raspberry, self._config.puerto, pool=pool
+        )
+
+    def _on_tick(self) -> None:
+        """Genera un valor y lo envía de forma síncrona."""
+        if self._cliente.enviar_estado(self.generar_valor()):
+            self.enviados += 1
+        else:
+            self.fallidos += 1
@@ -6,7 +6,7 @@ Coordina la comunicación entre el modelo de datos y la vista.
 import time
 from typing import Optional, List, Tuple
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from ..base import ControladorBase
 from .modelo import DatosGrafico, ConfigGrafico
@@ -18,6 +18,11 @@ class GraficoControlador(ControladorBase[DatosGrafico, GraficoTemperaturaVista])
 
     Gestiona la adición de puntos y la actualización de la vista.
 
+    Los puntos se agregan al modelo de inmediato, pero la vista se
+    redibuja a lo sumo una vez por `config.intervalo_refresco_ms` (un
+    QTimer de un solo disparo agrupa todos los puntos recibidos en el
+    intervalo). Con `intervalo_refresco_ms=0` se redibuja en cada punto.
+
     Signals:
         punto_agregado: Emitido cuando se agrega un punto (timestamp, temp).
         grafico_limpiado: Emitido cuando se limpia el gráfico.
@@ -46,6 +51,11 @@ class GraficoControlador(ControladorBase[DatosGrafico, GraficoTemperaturaVista])
         vista = vista or GraficoTemperaturaVista(config=config)
         super().__init__(modelo, vista, parent)
 
+        self._timer_refresco = QTimer(self)
+        self._timer_refresco.setSingleShot(True)
+        self._timer_refresco.setInterval(modelo.config.intervalo_refresco_ms)
+        self._timer_refresco.timeout.connect(self.refrescar)
+
     def _conectar_signals(self) -> None:
         """Conecta las señales (no hay señales de entrada en esta vista)."""
         pass
@@ -62,13 +72,31 @@ class GraficoControlador(ControladorBase[DatosGrafico, GraficoTemperaturaVista])
         if timestamp is None:
             timestamp = time.time()
 
-        tiempo_relativo = self._modelo.agregar_punto(temperatura, timestamp)
-        self._actualizar_vista()
+        self._modelo.agregar_punto(temperatura, timestamp)
+        self._programar_refresco()
         self.punto_agregado.emit(timestamp, temperatura)
         self.modelo_cambiado.emit(self._modelo)
 
+    def refrescar(self) -> None:
+        """Redibuja ya la vista con los puntos pendientes."""
+        self._timer_refresco.stop()
+        self._vista.actualizar(self._modelo)
+
+    @property
+    def hay_refresco_pendiente(self) -> bool:
+        """Indica si hay puntos aún no dibujados."""
+        return self._timer_refresco.isActive()
+
+    def _programar_refresco(self) -> None:
+        """Redibuja ahora o al vencer el intervalo de refresco."""
+        if self._modelo.config.intervalo_refresco_ms <= 0:
+            self.refrescar()
+        elif not self._timer_refresco.isActive():
+            self._timer_refresco.start()
+
     def limpiar(self) -> None:
         """Limpia todos los datos del gráfico."""
+        self._timer_refresco.stop()
         self._modelo.limpiar()
         self._vista.limpiar()
         self.grafico_limpiado.emit()
@@ -89,7 +117,7 @@ class GraficoControlador(ControladorBase[DatosGrafico, GraficoTemperaturaVista])
             self._modelo.temp_min_referencia = temp_min
         if temp_max is not None:
             self._modelo.temp_max_referencia = temp_max
-        self._actualizar_vista()
+        self._programar_refresco()
         self.modelo_cambiado.emit(self._modelo)
 
     def obtener_datos(self) -> Tuple[List[float], List[float]]:
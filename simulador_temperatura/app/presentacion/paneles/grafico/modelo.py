@@ -3,10 +3,11 @@
 Contiene el buffer de datos de temperatura y configuración.
 """
 
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
 
+import numpy as np
+
 from ..base import ModeloBase
 
 
@@ -21,6 +22,7 @@ class ConfigGrafico:
     color_linea: str = "#4fc3f7"
     color_referencia: str = "#ff5252"
     ancho_linea: int = 2
+    intervalo_refresco_ms: int = 33  # ~30 fps; 0 redibuja en cada punto
 
 
 @dataclass
@@ -35,6 +37,13 @@ class PuntoTemperatura:
 class DatosGrafico(ModeloBase):
     """Modelo que almacena los datos del gráfico.
 
+    Los puntos se guardan en un buffer circular NumPy preasignado de
+    `2 * max_puntos` posiciones: cada punto se escribe en `i` y en
+    `i + max_puntos`, por lo que la ventana actual siempre es un tramo
+    contiguo. `agregar_punto()` es O(1) sin asignaciones y
+    `obtener_arrays()` retorna vistas sin copia, listas para
+    `PlotDataItem.setData`.
+
     Attributes:
         config: Configuración visual del gráfico.
         temp_min_referencia: Línea de referencia inferior.
@@ -47,10 +56,19 @@ class DatosGrafico(ModeloBase):
 
     def __post_init__(self) -> None:
         """Inicializa los buffers circulares."""
-        self._timestamps: deque[float] = deque(maxlen=self.config.max_puntos)
-        self._temperaturas: deque[float] = deque(maxlen=self.config.max_puntos)
+        capacidad = self.config.max_puntos
+        self._timestamps = np.zeros(2 * capacidad, dtype=np.float64)
+        self._temperaturas = np.zeros(2 * capacidad, dtype=np.float64)
+        self._siguiente = 0
+        self._cantidad = 0
+        self._version = 0
         self._tiempo_inicio: Optional[float] = None
 
+    @property
+    def version(self) -> int:
+        """Contador que cambia cada vez que cambian los puntos."""
+        return self._version
+
     def agregar_punto(self, temperatura: float, timestamp: float) -> float:
         """Agrega un nuevo punto de datos.
 
@@ -65,45 +83,74 @@ class DatosGrafico(ModeloBase):
             self._tiempo_inicio = timestamp
 
         tiempo_relativo = timestamp - self._tiempo_inicio
-        self._timestamps.append(tiempo_relativo)
-        self._temperaturas.append(temperatura)
+        capacidad = self.config.max_puntos
+        i = self._siguiente
+        self._timestamps[i] = self._timestamps[i + capacidad] = tiempo_relativo
+        self._temperaturas[i] = self._temperaturas[i + capacidad] = temperatura
+
+        self._siguiente = (i + 1) % capacidad
+        if self._cantidad < capacidad:
+            self._cantidad += 1
+        self._version += 1
 
         return tiempo_relativo
 
     def limpiar(self) -> None:
         """Limpia todos los datos del buffer."""
-        self._timestamps.clear()
-        self._temperaturas.clear()
+        self._siguiente = 0
+        self._cantidad = 0
+        self._version += 1
         self._tiempo_inicio = None
 
+    def obtener_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retorna los datos actuales como vistas sin copia.
+
+        Las vistas son de solo lectura y reflejan el buffer: un nuevo
+        `agregar_punto()` con el buffer lleno sobrescribe su primer
+        elemento. Para conservarlas, copiarlas.
+
+        Returns:
+            Tupla con (tiempos, temperaturas) en orden cronológico.
+        """
+        fin = self._siguiente + self.config.max_puntos
+        inicio = fin - self._cantidad
+        tiempos = self._timestamps[inicio:fin]
+        temperaturas = self._temperaturas[inicio:fin]
+        tiempos.flags.writeable = False
+        temperaturas.flags.writeable = False
+        return tiempos, temperaturas
+
     def obtener_datos(self) -> Tuple[List[float], List[float]]:
         """Retorna los datos actuales.
 
         Returns:
             Tupla con (tiempos, temperaturas).
         """
-        return list(self._timestamps), list(self._temperaturas)
+        tiempos, temperaturas = self.obtener_arrays()
+        return tiempos.tolist(), temperaturas.tolist()
 
     @property
     def cantidad_puntos(self) -> int:
         """Retorna la cantidad de puntos almacenados."""
-        return len(self._timestamps)
+        return self._cantidad
 
     @property
     def ultima_temperatura(self) -> Optional[float]:
         """Retorna la última temperatura registrada."""
-        if self._temperaturas:
-            return self._temperaturas[-1]
-        return None
+        return self._ultimo(self._temperaturas)
 
     @property
     def ultimo_tiempo(self) -> Optional[float]:
         """Retorna el último tiempo registrado."""
-        if self._timestamps:
-            return self._timestamps[-1]
-        return None
+        return self._ultimo(self._timestamps)
 
     @property
     def tiene_datos(self) -> bool:
         """Indica si hay datos en el buffer."""
-        return len(self._timestamps) > 0
+        return self._cantidad > 0
+
+    def _ultimo(self, buffer: np.ndarray) -> Optional[float]:
+        """Retorna el último valor de un buffer como float (None si vacío)."""
+        if not self._cantidad:
+            return None
+        return float(buffer[self._siguiente + self.config.max_puntos - 1])
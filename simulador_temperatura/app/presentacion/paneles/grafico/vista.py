@@ -3,8 +3,9 @@
 Responsable de la visualización del gráfico de temperatura.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
 
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 import pyqtgraph as pg
 
@@ -18,6 +19,10 @@ class GraficoTemperaturaVista(QWidget):
     Muestra la evolución de la temperatura con líneas de referencia
     para los límites mínimo y máximo.
 
+    `actualizar()` es incremental: solo pasa a la curva los puntos de la
+    ventana visible y solo cuando cambiaron (según `DatosGrafico.version`),
+    y no toca el rango X ni las líneas de referencia si no cambiaron.
+
     Implementa la interfaz de VistaBase sin herencia directa
     para evitar conflictos de metaclase con QWidget.
     """
@@ -37,6 +42,8 @@ class GraficoTemperaturaVista(QWidget):
         self._config = config or ConfigGrafico()
         self._linea_min: Optional[pg.InfiniteLine] = None
         self._linea_max: Optional[pg.InfiniteLine] = None
+        self._version_dibujada: Optional[Tuple[int, int]] = None
+        self._rango_x: Optional[Tuple[float, float]] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -101,26 +108,53 @@ class GraficoTemperaturaVista(QWidget):
         if not isinstance(modelo, DatosGrafico):
             return
 
-        # Actualizar datos de la curva
-        tiempos, temperaturas = modelo.obtener_datos()
-        self._curva.setData(tiempos, temperaturas)
-
-        # Ajustar eje X para mostrar ventana de tiempo
-        if tiempos:
-            tiempo_actual = tiempos[-1]
-            x_min = max(0, tiempo_actual - modelo.config.ventana_segundos)
-            x_max = max(modelo.config.ventana_segundos, tiempo_actual)
-            self._plot_widget.setXRange(x_min, x_max)
+        # Actualizar datos de la curva solo si cambiaron los puntos
+        version = (id(modelo), modelo.version)
+        if version != self._version_dibujada:
+            self._version_dibujada = version
+            self._dibujar_ventana(*modelo.obtener_arrays(), modelo.config.ventana_segundos)
 
         # Actualizar líneas de referencia
         self._actualizar_linea_referencia_min(modelo.temp_min_referencia)
         self._actualizar_linea_referencia_max(modelo.temp_max_referencia)
 
+    def _dibujar_ventana(
+        self, tiempos: np.ndarray, temperaturas: np.ndarray, ventana_segundos: float
+    ) -> None:
+        """Dibuja los puntos de la ventana visible y ajusta el eje X.
+
+        Args:
+            tiempos: Tiempos relativos en orden creciente.
+            temperaturas: Temperaturas de cada tiempo.
+            ventana_segundos: Ancho de la ventana visible.
+        """
+        if not len(tiempos):
+            self._curva.setData([], [])
+            return
+
+        tiempo_actual = float(tiempos[-1])
+        x_min = max(0, tiempo_actual - ventana_segundos)
+        x_max = max(ventana_segundos, tiempo_actual)
+
+        # Conservar un punto previo a la ventana para que la línea llegue al borde
+        inicio = max(0, int(np.searchsorted(tiempos, x_min, side="right")) - 1)
+        # Copiar: setData no copia, y el buffer circular reescribe la
+        # primera posición de la vista en el próximo punto con el buffer lleno
+        self._curva.setData(tiempos[inicio:].copy(), temperaturas[inicio:].copy())
+        self._ajustar_rango_x(x_min, x_max)
+
+    def _ajustar_rango_x(self, x_min: float, x_max: float) -> None:
+        """Ajusta el rango X solo si cambió."""
+        if self._rango_x != (x_min, x_max):
+            self._rango_x = (x_min, x_max)
+            self._plot_widget.setXRange(x_min, x_max)
+
     def _actualizar_linea_referencia_min(self, valor: Optional[float]) -> None:
         """Actualiza la línea de referencia mínima."""
         if valor is not None:
             if self._linea_min is not None:
-                self._linea_min.setValue(valor)
+                if self._linea_min.value() != valor:
+                    self._linea_min.setValue(valor)
             else:
                 self._linea_min = self._crear_linea_referencia(valor)
                 self._plot_widget.addItem(self._linea_min)
@@ -132,7 +166,8 @@ class GraficoTemperaturaVista(QWidget):
         """Actualiza la línea de referencia máxima."""
         if valor is not None:
             if self._linea_max is not None:
-                self._linea_max.setValue(valor)
+                if self._linea_max.value() != valor:
+                    self._linea_max.setValue(valor)
             else:
                 self._linea_max = self._crear_linea_referencia(valor)
                 self._plot_widget.addItem(self._linea_max)
@@ -141,24 +176,28 @@ class GraficoTemperaturaVista(QWidget):
             self._linea_max = None
 
     def dibujar_datos(
-        self, tiempos: List[float], temperaturas: List[float]
+        self,
+        tiempos: Union[List[float], np.ndarray],
+        temperaturas: Union[List[float], np.ndarray],
     ) -> None:
         """Dibuja los datos directamente en el gráfico.
 
         Args:
-            tiempos: Lista de tiempos relativos.
-            temperaturas: Lista de temperaturas.
+            tiempos: Tiempos relativos (lista o array).
+            temperaturas: Temperaturas (lista o array).
         """
+        self._version_dibujada = None
         self._curva.setData(tiempos, temperaturas)
 
-        if tiempos:
-            tiempo_actual = tiempos[-1]
+        if len(tiempos):
+            tiempo_actual = float(tiempos[-1])
             x_min = max(0, tiempo_actual - self._config.ventana_segundos)
             x_max = max(self._config.ventana_segundos, tiempo_actual)
-            self._plot_widget.setXRange(x_min, x_max)
+            self._ajustar_rango_x(x_min, x_max)
 
     def limpiar(self) -> None:
         """Limpia el gráfico."""
+        self._version_dibujada = None
         self._curva.setData([], [])
 
     @property
@@ -181,6 +181,19 @@ class TestConfigManagerCargar:
         assert config.puerto == DEFAULT_PUERTO
         assert config.intervalo_envio_ms == DEFAULT_INTERVALO_MS
 
+    def test_cargar_velocidad_simulacion(self, tmp_path):
+        """Verifica la lectura de velocidad_simulacion y su default."""
+        archivo_config = tmp_path / "config.json"
+        archivo_config.write_text(
+            json.dumps({"simulador_temperatura": {"velocidad_simulacion": 1000}}),
+            encoding="utf-8"
+        )
+
+        config = ConfigManager().cargar(archivo_config)
+
+        assert config.velocidad_simulacion == 1000
+        assert ConfigSimuladorTemperatura.desde_defaults().velocidad_simulacion == 1.0
+
     def test_cargar_con_ruta_none_busca_config(self):
         """Verifica que con ruta None busca config.json."""
         manager = ConfigManager()
@@ -0,0 +1,46 @@
+"""Tests unitarios para la flota de sensores de temperatura."""
+import pytest
+
+from app.configuracion.config import ConfigSimuladorTemperatura
+from app.dominio import VariacionSenoidal
+from app.flota import crear_sensores_temperatura, sensor_temperatura
+
+
+@pytest.fixture
+def config():
+    """Configuración estándar para tests."""
+    return ConfigSimuladorTemperatura.desde_defaults()
+
+
+class TestFlotaTemperatura:
+    """Tests de construcción de sensores."""
+
+    def test_sensor_usa_variacion(self):
+        """Verifica que la fuente del sensor sea la curva senoidal."""
+        variacion = VariacionSenoidal(20.0, 5.0, 60.0)
+        sensor = sensor_temperatura("s", variacion, "127.0.0.1", 12000, 500)
+
+        assert sensor.source(15.0) == pytest.approx(25.0)
+        assert sensor.interval == 0.5
+        assert sensor.port == 12000
+
+    def test_crear_sensores_con_parametros_propios(self, config):
+        """Verifica nombres únicos y parámetros dispersos por sensor."""
+        sensores = crear_sensores_temperatura(config, 50)
+
+        assert len({s.name for s in sensores}) == 50
+        assert len({s.source(1.0) for s in sensores}) == 50
+        assert all(s.host == config.ip_raspberry for s in sensores)
+
+    def test_semilla_reproducible(self, config):
+        """Verifica que la misma semilla genere los mismos parámetros."""
+        a = crear_sensores_temperatura(config, 5, semilla=7)
+        b = crear_sensores_temperatura(config, 5, semilla=7)
+
+        assert [s.source(3.0) for s in a] == [s.source(3.0) for s in b]
+
+    def test_destino_explicito(self, config):
+        """Verifica que host y puerto explícitos tengan prioridad."""
+        sensores = crear_sensores_temperatura(config, 2, host="10.0.0.1", puerto=15000)
+
+        assert all((s.host, s.port) == ("10.0.0.1", 15000) for s in sensores)
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock
 
 from PyQt6.QtCore import QCoreApplication
 
+from compartido.scheduling import VirtualClock
+
 from app.dominio import GeneradorTemperatura, EstadoTemperatura
 from app.configuracion.config import ConfigSimuladorTemperatura
 
@@ -238,6 +240,48 @@ class TestGeneradorTemperaturaTimer:
         # No deberían haberse emitido más señales
         assert len(signal_spy) == count_after_stop
 
+    def test_estadisticas_timer_registran_ticks(self, generador, qtbot):
+        """Verifica que las estadísticas del timer cuenten cada emisión."""
+        signal_spy = []
+        generador.valor_generado.connect(lambda x: signal_spy.append(x))
+
+        generador.iniciar()
+        qtbot.wait(250)
+        generador.detener()
+
+        stats = generador.estadisticas_timer
+        assert stats.ticks == len(signal_spy)
+        assert stats.max_lateness_ms >= stats.mean_lateness_ms >= 0
+
+
+class TestGeneradorTemperaturaReloj:
+    """Tests del reloj de simulación inyectable."""
+
+    def test_curva_sigue_el_reloj(self, config, qtbot):
+        """Verifica que la curva se evalúe en tiempo del reloj."""
+        reloj = VirtualClock()
+        generador = GeneradorTemperatura(config, reloj=reloj)
+
+        reloj.advance(15.0)  # Cuarto de periodo (60 s): máximo de la onda
+
+        assert generador.reloj is reloj
+        assert generador.temperatura_actual == pytest.approx(25.0, abs=1e-4)
+
+    def test_reloj_virtual_acelera_la_emision(self, config, qtbot):
+        """Verifica que con VirtualClock los ticks no esperen tiempo real."""
+        reloj = VirtualClock()
+        generador = GeneradorTemperatura(config, reloj=reloj)
+        valores = []
+        generador.valor_generado.connect(valores.append)
+
+        generador.iniciar()
+        qtbot.waitUntil(lambda: len(valores) >= 150, timeout=2000)
+        generador.detener()
+
+        # 150 ticks de 100 ms = 15 s virtuales: un cuarto de periodo
+        assert reloj.now() >= 15.0
+        assert max(v.temperatura for v in valores) == pytest.approx(25.0, abs=1e-3)
+
 
 class TestGeneradorTemperaturaIntegracion:
     """Tests de integración con otros componentes."""
@@ -0,0 +1,139 @@
+"""Tests unitarios para GeneradorTrazaTemperatura y run_traza."""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from compartido.replay import BinaryTrace, CsvTrace
+from compartido.scheduling import VirtualClock
+
+from app.comunicacion import ClienteTemperatura, ServicioEnvioTemperatura
+from app.configuracion.config import ConfigSimuladorTemperatura
+from app.dominio import GeneradorTrazaTemperatura
+from app.factory import ComponenteFactory
+import run_traza
+
+
+@pytest.fixture
+def config():
+    """Fixture con configuración estándar para tests."""
+    return ConfigSimuladorTemperatura(
+        ip_raspberry="127.0.0.1",
+        puerto=12000,
+        intervalo_envio_ms=100,
+        temperatura_minima=-10.0,
+        temperatura_maxima=50.0,
+        temperatura_inicial=20.0,
+        ruido_amplitud=0.5,
+        paso_variacion=0.1,
+        variacion_amplitud=5.0,
+        variacion_periodo_segundos=60.0,
+    )
+
+
+@pytest.fixture
+def traza_csv(tmp_path):
+    """Traza CSV de cuatro muestras cada 30 s."""
+    ruta = tmp_path / "sala.csv"
+    ruta.write_text("t,temp\n0,21.0\n30,21.5\n60,21.5\n90,60.0\n", encoding="utf-8")
+    return ruta
+
+
+class TestGeneradorTrazaTemperatura:
+    """Tests del generador por reproducción de trazas."""
+
+    def test_emite_estados_de_la_traza(self, config, traza_csv, qtbot):
+        """Verifica los valores emitidos y la validación de rango."""
+        generador = GeneradorTrazaTemperatura(
+            config, CsvTrace(traza_csv), reloj=VirtualClock()
+        )
+        estados = []
+        generador.valor_generado.connect(estados.append)
+
+        with qtbot.waitSignal(generador.traza_finalizada, timeout=1000):
+            generador.iniciar()
+
+        assert [e.temperatura for e in estados] == [21.0, 21.5, 21.5, 60.0]
+        assert [e.en_rango for e in estados] == [True, True, True, False]
+        assert generador.temperatura_actual == 60.0
+
+    def test_temperatura_cambiada_solo_con_cambios(self, config, traza_csv, qtbot):
+        """Verifica que valores repetidos no emitan temperatura_cambiada."""
+        generador = GeneradorTrazaTemperatura(
+            config, CsvTrace(traza_csv), reloj=VirtualClock()
+        )
+        cambios = []
+        generador.temperatura_cambiada.connect(cambios.append)
+
+        with qtbot.waitSignal(generador.traza_finalizada, timeout=1000):
+            generador.iniciar()
+
+        assert cambios == [21.0, 21.5, 60.0]
+
+    def test_velocidad_y_bucle(self, config, traza_csv, qtbot):
+        """Verifica que velocidad y bucle lleguen al reproductor."""
+        reloj = VirtualClock()
+        generador = GeneradorTrazaTemperatura(
+            config, CsvTrace(traza_csv), velocidad=30, en_bucle=True, reloj=reloj
+        )
+        estados = []
+        generador.valor_generado.connect(estados.append)
+        generador.valor_generado.connect(
+            lambda _e: len(estados) == 6 and generador.detener()
+        )
+
+        generador.iniciar()
+        qtbot.waitUntil(lambda: len(estados) == 6, timeout=1000)
+
+        assert generador.reproductor.loops == 1
+        assert reloj.now() == pytest.approx(5.0)  # 6 muestras cada 30 s / 30
+
+    def test_se_conecta_al_servicio_de_envio(self, config, traza_csv, qtbot):
+        """Verifica el envío de la traza a través de ServicioEnvioTemperatura."""
+        with patch('app.comunicacion.cliente_temperatura.EphemeralSocketClient') as mock_class:
+            mock_instance = MagicMock()
+            mock_instance.send_async.return_value = True
+            mock_class.return_value = mock_instance
+            cliente = ClienteTemperatura("127.0.0.1", 12000)
+
+        generador = GeneradorTrazaTemperatura(
+            config, CsvTrace(traza_csv), reloj=VirtualClock()
+        )
+        servicio = ServicioEnvioTemperatura(generador, cliente)
+        mock_instance.send_async.side_effect = lambda _m: (
+            cliente.dato_enviado.emit(0.0) or True
+        )
+
+        with qtbot.waitSignal(generador.traza_finalizada, timeout=1000):
+            servicio.iniciar()
+
+        enviados = [c[0][0] for c in mock_instance.send_async.call_args_list]
+        assert enviados == ["21.00", "21.50", "21.50", "60.00"]
+
+    def test_factory_crea_generador_traza(self, config, traza_csv, qtbot):
+        """Verifica crear_generador_traza() de la factory."""
+        generador = ComponenteFactory(config).crear_generador_traza(
+            CsvTrace(traza_csv), velocidad=2.0, en_bucle=True
+        )
+
+        assert isinstance(generador, GeneradorTrazaTemperatura)
+        assert generador.reproductor.speed == 2.0
+        assert generador.reproductor.loop is True
+
+
+class TestRunTraza:
+    """Tests del punto de entrada run_traza."""
+
+    def test_parsear_argumentos(self, traza_csv):
+        """Verifica los argumentos y sus valores por defecto."""
+        args = run_traza.parsear_argumentos([str(traza_csv), "--velocidad", "60", "--bucle"])
+
+        assert args.traza == traza_csv
+        assert args.velocidad == 60.0
+        assert args.bucle is True
+        assert args.convertir is False
+
+    def test_convertir(self, traza_csv):
+        """Verifica la conversión de CSV a .trace."""
+        assert run_traza.main([str(traza_csv), "--convertir"]) == 0
+
+        with BinaryTrace(traza_csv.with_suffix(".trace")) as traza:
+            assert len(traza) == 4
@@ -0,0 +1,68 @@
+"""Tests unitarios para la evaluación vectorizada de VariacionSenoidal."""
+import numpy as np
+import pytest
+
+from app.dominio import VariacionSenoidal
+from app.dominio.lote_senoidal import (
+    calcular_lote,
+    calcular_lote_variaciones,
+    parametros_lote,
+)
+
+
+@pytest.fixture
+def variaciones():
+    """Variaciones con parámetros distintos."""
+    return [
+        VariacionSenoidal(20.0, 5.0, 60.0),
+        VariacionSenoidal(18.5, 2.0, 3600.0),
+        VariacionSenoidal(25.0, 0.0, 10.0),
+    ]
+
+
+@pytest.fixture
+def tiempos():
+    """Tiempos regulares e irregulares."""
+    return np.concatenate([np.arange(0.0, 120.0, 0.25), [1e6 + 0.123, 86399.9]])
+
+
+class TestCalcularLote:
+    """Tests de la API por lotes."""
+
+    def test_coincide_con_escalar(self, variaciones, tiempos):
+        """Verifica que cada valor coincida con la versión escalar.
+
+        np.sin y math.sin pueden diferir en el último bit según la
+        plataforma, por eso se compara con tolerancia relativa estricta.
+        """
+        matriz = calcular_lote_variaciones(variaciones, tiempos)
+
+        esperado = np.array([
+            [v.calcular_temperatura(float(t)) for t in tiempos]
+            for v in variaciones
+        ])
+        assert matriz.shape == (3, len(tiempos))
+        np.testing.assert_allclose(matriz, esperado, rtol=1e-12)
+
+    def test_metodo_de_variacion(self, variaciones, tiempos):
+        """Verifica calcular_temperaturas sobre una sola variación."""
+        v = variaciones[0]
+        resultado = v.calcular_temperaturas(tiempos)
+
+        np.testing.assert_allclose(
+            resultado, [v.calcular_temperatura(float(t)) for t in tiempos],
+            rtol=1e-12
+        )
+
+    def test_broadcasting_un_tiempo_muchos_sensores(self, variaciones):
+        """Verifica la evaluación de muchos sensores en un mismo instante."""
+        bases, amplitudes, periodos = parametros_lote(variaciones)
+        resultado = calcular_lote(bases[:, 0], amplitudes[:, 0], periodos[:, 0], 15.0)
+
+        assert resultado.shape == (3,)
+        assert resultado[0] == pytest.approx(25.0)
+        assert resultado[2] == 25.0
+
+    def test_parametros_vacios(self, tiempos):
+        """Verifica que una lista vacía produzca una matriz vacía."""
+        assert calcular_lote_variaciones([], tiempos).shape == (0, len(tiempos))
@@ -1,6 +1,8 @@
 """Tests para el Panel de Gráfico MVC."""
 
 import time
+from unittest.mock import Mock
+
 import pytest
 
 from app.presentacion.paneles.grafico import (
@@ -108,6 +110,55 @@ class TestDatosGrafico:
         assert datos.cantidad_puntos == 0
         assert datos.tiene_datos is False
 
+    def test_buffer_circular_conserva_los_ultimos(self):
+        """Al superar max_puntos se descartan los puntos más antiguos."""
+        datos = DatosGrafico(config=ConfigGrafico(max_puntos=4))
+
+        for i in range(7):
+            datos.agregar_punto(20.0 + i, 100.0 + i)
+
+        tiempos, temps = datos.obtener_datos()
+        assert tiempos == [3.0, 4.0, 5.0, 6.0]
+        assert temps == [23.0, 24.0, 25.0, 26.0]
+        assert datos.cantidad_puntos == 4
+        assert datos.ultima_temperatura == 26.0
+        assert datos.ultimo_tiempo == 6.0
+
+    def test_obtener_datos_retorna_listas(self):
+        """obtener_datos mantiene su API de listas de float."""
+        datos = DatosGrafico()
+        datos.agregar_punto(20.0, 10.0)
+
+        tiempos, temps = datos.obtener_datos()
+
+        assert isinstance(tiempos, list) and isinstance(temps, list)
+        assert type(temps[0]) is float
+
+    def test_obtener_arrays_sin_copia(self):
+        """obtener_arrays retorna vistas contiguas de solo lectura."""
+        datos = DatosGrafico(config=ConfigGrafico(max_puntos=4))
+        for i in range(6):
+            datos.agregar_punto(20.0 + i, float(i))
+
+        tiempos, temps = datos.obtener_arrays()
+
+        assert temps.tolist() == [22.0, 23.0, 24.0, 25.0]
+        assert not temps.flags.owndata
+        assert temps.flags.c_contiguous and tiempos.flags.c_contiguous
+        with pytest.raises(ValueError):
+            temps[0] = 0.0
+
+    def test_limpiar_reinicia_tiempo_relativo(self):
+        """Tras limpiar, el siguiente punto vuelve a tener tiempo 0."""
+        datos = DatosGrafico()
+        datos.agregar_punto(20.0, 10.0)
+        datos.agregar_punto(21.0, 11.0)
+
+        datos.limpiar()
+
+        assert datos.agregar_punto(22.0, 50.0) == 0.0
+        assert datos.obtener_datos() == ([0.0], [22.0])
+
     def test_limites_referencia(self):
         """Los límites de referencia se configuran correctamente."""
         datos = DatosGrafico(
@@ -151,8 +202,8 @@ class TestGraficoTemperaturaVista:
         vista.actualizar(datos)
 
         # Verificar que la curva tiene datos
-        # (pyqtgraph no expone fácilmente los datos, pero no debe fallar)
-        assert True
+        _, ys = vista._curva.getData()
+        assert list(ys) == [20.0, 25.0]
 
     def test_dibujar_datos(self, qtbot):
         """dibujar_datos dibuja datos directamente."""
@@ -266,3 +317,101 @@ class TestGraficoControlador:
 
         assert controlador.cantidad_puntos == 10
         assert controlador.ultima_temperatura == 29.0
+
+
+class TestRefrescoAgrupado:
+    """Tests del redibujado agrupado e incremental del gráfico."""
+
+    def test_rafaga_se_dibuja_una_vez(self, qtbot):
+        """Los puntos de un intervalo se dibujan en un único refresco."""
+        controlador = GraficoControlador(config=ConfigGrafico(intervalo_refresco_ms=20))
+        qtbot.addWidget(controlador.vista)
+        controlador.vista.actualizar = Mock(wraps=controlador.vista.actualizar)
+
+        for i in range(50):
+            controlador.agregar_punto(20.0 + i * 0.1, timestamp=1000.0 + i * 0.01)
+
+        assert controlador.cantidad_puntos == 50
+        assert controlador.hay_refresco_pendiente
+        controlador.vista.actualizar.assert_not_called()
+
+        qtbot.waitUntil(lambda: not controlador.hay_refresco_pendiente, timeout=1000)
+        controlador.vista.actualizar.assert_called_once_with(controlador.modelo)
+
+    def test_intervalo_cero_dibuja_cada_punto(self, qtbot):
+        """Con intervalo_refresco_ms=0 se redibuja en cada punto."""
+        controlador = GraficoControlador(config=ConfigGrafico(intervalo_refresco_ms=0))
+        qtbot.addWidget(controlador.vista)
+        controlador.vista.actualizar = Mock()
+
+        controlador.agregar_punto(20.0)
+        controlador.agregar_punto(21.0)
+
+        assert controlador.vista.actualizar.call_count == 2
+
+    def test_refrescar_dibuja_pendientes(self, qtbot):
+        """refrescar() dibuja de inmediato y cancela el refresco programado."""
+        controlador = GraficoControlador()
+        qtbot.addWidget(controlador.vista)
+        controlador.agregar_punto(20.0, timestamp=1000.0)
+
+        controlador.refrescar()
+
+        assert not controlador.hay_refresco_pendiente
+        _, ys = controlador.vista._curva.getData()
+        assert list(ys) == [20.0]
+
+    def test_vista_dibuja_solo_ventana_visible(self, qtbot):
+        """La curva recibe los puntos visibles más uno previo al borde."""
+        config = ConfigGrafico(ventana_segundos=10, max_puntos=100)
+        vista = GraficoTemperaturaVista(config=config)
+        qtbot.addWidget(vista)
+        datos = DatosGrafico(config=config)
+        for i in range(30):
+            datos.agregar_punto(float(i), 1000.0 + i)
+        datos.agregar_punto(30.0, 1029.5)
+
+        vista.actualizar(datos)
+
+        xs, _ = vista._curva.getData()
+        assert list(xs) == [float(t) for t in range(19, 30)] + [29.5]
+
+    def test_curva_no_cambia_al_agregar_con_buffer_lleno(self, qtbot):
+        """Un punto nuevo con el buffer lleno no altera la curva ya dibujada."""
+        config = ConfigGrafico(ventana_segundos=60, max_puntos=5)
+        vista = GraficoTemperaturaVista(config=config)
+        qtbot.addWidget(vista)
+        datos = DatosGrafico(config=config)
+        for i in range(5):
+            datos.agregar_punto(20.0 + i, 1000.0 + i)
+        vista.actualizar(datos)
+
+        datos.agregar_punto(99.0, 1100.0)
+
+        xs, ys = vista._curva.getData()
+        assert list(xs) == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert list(ys) == [20.0, 21.0, 22.0, 23.0, 24.0]
+
+    def test_vista_omite_trabajo_sin_cambios(self, qtbot):
+        """Sin puntos ni límites nuevos no se vuelve a dibujar nada."""
+        vista = GraficoTemperaturaVista()
+        qtbot.addWidget(vista)
+        datos = DatosGrafico(temp_min_referencia=15.0, temp_max_referencia=30.0)
+        datos.agregar_punto(20.0, 1000.0)
+        vista.actualizar(datos)
+        vista._curva.setData = Mock()
+        vista._linea_min.setValue = Mock()
+        vista._plot_widget.setXRange = Mock()
+
+        vista.actualizar(datos)
+
+        vista._curva.setData.assert_not_called()
+        vista._linea_min.setValue.assert_not_called()
+        vista._plot_widget.setXRange.assert_not_called()
+
+        datos.agregar_punto(21.0, 1001.0)
+        datos.temp_min_referencia = 16.0
+        vista.actualizar(datos)
+
+        vista._curva.setData.assert_called_once()
+        vista._linea_min.setValue.assert_called_once_with(16.0)
@@ -1,7 +1,12 @@
 """Tests unitarios para ServicioEnvioTemperatura."""
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from compartido.networking import DropPolicy, SendExecutor
+from compartido.scheduling import VirtualClock
+
 from app.comunicacion import ServicioEnvioTemperatura, ClienteTemperatura
 from app.dominio import GeneradorTemperatura, EstadoTemperatura
 from app.configuracion.config import ConfigSimuladorTemperatura
@@ -164,3 +169,197 @@ class TestServicioEnvioIntegracion:
             servicio.detener()
 
             mock_instance.send_async.assert_called_with("22.50")
+
+
+class TestServicioEnvioCoalescencia:
+    """Tests de coalescencia del último valor bajo contrapresión."""
+
+    @pytest.fixture
+    def mock_instance(self):
+        """EphemeralSocketClient mockeado que acepta todos los envíos."""
+        with patch('app.comunicacion.cliente_temperatura.EphemeralSocketClient') as mock_class:
+            mock_instance = MagicMock()
+            mock_instance.send_async.return_value = True
+            mock_class.return_value = mock_instance
+            yield mock_instance
+
+    @pytest.fixture
+    def servicio_activo(self, generador, mock_instance, qtbot):
+        """Servicio iniciado con el generador detenido (valores manuales)."""
+        cliente = ClienteTemperatura("127.0.0.1", 12000)
+        servicio = ServicioEnvioTemperatura(generador, cliente)
+        servicio.iniciar()
+        generador.detener()
+        return servicio
+
+    def test_un_solo_envio_en_curso(self, servicio_activo, mock_instance):
+        """Verifica que no se encolen envíos mientras hay uno en curso."""
+        for valor in (20.0, 21.0, 22.0, 23.0):
+            servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=valor))
+
+        assert mock_instance.send_async.call_count == 1
+        assert servicio_activo.envio_en_curso is True
+        assert servicio_activo.muestras_reemplazadas == 2
+
+    def test_al_confirmar_se_envia_el_ultimo_valor(self, servicio_activo, mock_instance):
+        """Verifica que al completarse el envío se mande el valor más reciente."""
+        for valor in (20.0, 21.0, 22.0):
+            servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=valor))
+
+        servicio_activo.cliente.dato_enviado.emit(20.0)
+
+        assert mock_instance.send_async.call_args_list[-1][0][0] == "22.00"
+        assert mock_instance.send_async.call_count == 2
+
+        servicio_activo.cliente.dato_enviado.emit(22.0)
+        assert servicio_activo.envio_en_curso is False
+
+    def test_error_libera_el_destino(self, servicio_activo, mock_instance):
+        """Verifica que un error de conexión no bloquee los envíos."""
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=20.0))
+        servicio_activo.cliente.error_conexion.emit("Connection refused")
+
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=21.0))
+        assert mock_instance.send_async.call_count == 2
+
+    def test_envio_descartado_no_queda_en_curso(self, servicio_activo, mock_instance):
+        """Verifica que un envío rechazado por el cliente no bloquee."""
+        mock_instance.send_async.return_value = False
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=20.0))
+
+        assert servicio_activo.envio_en_curso is False
+
+
+class TestServicioEnvioReloj:
+    """Tests de la retención del reloj de simulación durante los envíos."""
+
+    @pytest.fixture
+    def reloj(self, qapp):
+        """Reloj virtual compartido por generador y servicio."""
+        return VirtualClock()
+
+    @pytest.fixture
+    def mock_instance(self):
+        """EphemeralSocketClient mockeado que acepta todos los envíos."""
+        with patch('app.comunicacion.cliente_temperatura.EphemeralSocketClient') as mock_class:
+            mock_instance = MagicMock()
+            mock_instance.send_async.return_value = True
+            mock_class.return_value = mock_instance
+            yield mock_instance
+
+    @pytest.fixture
+    def servicio_activo(self, config, reloj, mock_instance, qtbot):
+        """Servicio iniciado con generador sobre el reloj virtual."""
+        generador = GeneradorTemperatura(config, reloj=reloj)
+        servicio = ServicioEnvioTemperatura(
+            generador, ClienteTemperatura("127.0.0.1", 12000)
+        )
+        servicio.iniciar()
+        return servicio
+
+    def test_usa_reloj_del_generador(self, servicio_activo, reloj):
+        """Verifica que por defecto se retenga el reloj del generador."""
+        assert servicio_activo.generador.reloj is reloj
+
+    def test_envio_en_curso_retiene_el_reloj(self, servicio_activo, reloj, qtbot):
+        """Verifica que el tiempo no avance mientras hay un envío en curso."""
+        qtbot.waitUntil(lambda: servicio_activo.envio_en_curso, timeout=1000)
+        instante = reloj.now()
+
+        qtbot.wait(30)
+
+        assert reloj.held
+        assert reloj.now() == instante
+        assert servicio_activo.muestras_reemplazadas == 0
+
+    def test_confirmacion_libera_el_reloj(self, servicio_activo, reloj, mock_instance, qtbot):
+        """Verifica que cada confirmación deje avanzar exactamente un tick."""
+        qtbot.waitUntil(lambda: servicio_activo.envio_en_curso, timeout=1000)
+
+        for esperado in (2, 3, 4):
+            servicio_activo.cliente.dato_enviado.emit(0.0)
+            qtbot.waitUntil(
+                lambda: mock_instance.send_async.call_count == esperado,
+                timeout=1000
+            )
+
+        # 100 ms de intervalo: cuatro envíos en 0.4 s virtuales, sin pérdidas
+        assert reloj.now() == pytest.approx(0.4)
+        assert servicio_activo.muestras_reemplazadas == 0
+
+    def test_detener_con_envio_descartado_no_retiene(self, servicio_activo, reloj, mock_instance):
+        """Verifica que un envío rechazado por el cliente libere el reloj."""
+        servicio_activo.detener()
+        mock_instance.send_async.return_value = False
+        servicio_activo.iniciar()
+        servicio_activo.generador.generar_valor()
+
+        assert not servicio_activo.envio_en_curso
+        assert not reloj.held
+
+    def test_detener_libera_el_reloj(self, servicio_activo, reloj, qtbot):
+        """Verifica que detener con un envío sin confirmar libere el reloj."""
+        qtbot.waitUntil(lambda: servicio_activo.envio_en_curso, timeout=1000)
+
+        servicio_activo.detener()
+
+        assert not servicio_activo.envio_en_curso
+        assert not reloj.held
+
+
+class TestServicioEnvioDesalojo:
+    """Tests del descarte de un envío encolado por el ejecutor compartido."""
+
+    @pytest.fixture
+    def ejecutor(self, qtbot):
+        """Ejecutor de un hilo, ocupado, con lugar para un solo envío en cola."""
+        bloqueo = threading.Event()
+        ejecutor = SendExecutor(
+            max_workers=1, queue_depth=1, policy=DropPolicy.DROP_OLDEST
+        )
+        ejecutor.submit(bloqueo.wait)
+        qtbot.waitUntil(lambda: ejecutor.stats.in_flight == 1, timeout=1000)
+        with patch.object(SendExecutor, "shared", return_value=ejecutor):
+            yield ejecutor
+        ejecutor.shutdown(wait=False)
+        bloqueo.set()
+
+    @pytest.fixture
+    def reloj(self, qapp):
+        """Reloj virtual retenido por el servicio durante los envíos."""
+        return VirtualClock()
+
+    @pytest.fixture
+    def servicio_activo(self, generador, ejecutor, reloj, qtbot):
+        """Servicio con reloj virtual sobre el ejecutor ocupado."""
+        servicio = ServicioEnvioTemperatura(
+            generador, ClienteTemperatura("127.0.0.1", 12000), reloj=reloj
+        )
+        servicio.iniciar()
+        generador.detener()
+        return servicio
+
+    def test_envio_desalojado_libera_destino_y_reloj(self, servicio_activo, ejecutor, reloj):
+        """Verifica que un envío desalojado de la cola no deje el destino ocupado."""
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=20.0))
+        assert servicio_activo.envio_en_curso
+        assert ejecutor.stats.queued == 1
+
+        # Otro envío por el mismo ejecutor desaloja al del servicio
+        ejecutor.submit(lambda: None)
+
+        assert ejecutor.stats.dropped == 1
+        assert not servicio_activo.envio_en_curso
+        assert not reloj.held
+
+    def test_envio_desalojado_envia_el_pendiente(self, servicio_activo, ejecutor):
+        """Verifica que tras el desalojo se encole el último valor pendiente."""
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=20.0))
+        servicio_activo._on_valor_generado(EstadoTemperatura(temperatura=21.0))
+
+        ejecutor.submit(lambda: None)
+
+        # El reenvío del pendiente desaloja a su vez al envío ajeno
+        assert servicio_activo.envio_en_curso
+        assert ejecutor.stats.queued == 1
+        assert ejecutor.stats.dropped == 2
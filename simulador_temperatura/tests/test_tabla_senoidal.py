@@ -0,0 +1,99 @@
+"""Tests unitarios para TablaSenoidal y CacheTablasSenoidales."""
+import pytest
+
+from app.configuracion.config import ConfigSimuladorTemperatura
+from app.dominio import GeneradorTemperatura, VariacionSenoidal
+from app.dominio.tabla_senoidal import CacheTablasSenoidales, TablaSenoidal
+
+
+class TestTablaSenoidal:
+    """Tests de la tabla precalculada."""
+
+    @pytest.mark.parametrize("variacion", [
+        VariacionSenoidal(20.0, 5.0, 60.0),
+        VariacionSenoidal(18.0, 10.0, 86400.0),
+        VariacionSenoidal(25.0, 0.0, 1.0),
+    ])
+    def test_aproxima_la_version_escalar(self, variacion):
+        """Verifica el error de interpolación en un rango amplio de tiempos."""
+        tabla = TablaSenoidal(variacion, 1024)
+        periodo = variacion.periodo_segundos
+
+        for i in range(2000):
+            t = i * periodo / 997.0 - periodo
+            assert tabla.calcular_temperatura(t) == pytest.approx(
+                variacion.calcular_temperatura(t), abs=1e-4
+            )
+
+    def test_puntos_exactos(self):
+        """Verifica los máximos y mínimos muestreados exactamente."""
+        tabla = TablaSenoidal(VariacionSenoidal(20.0, 5.0, 60.0), 1024)
+
+        assert tabla.calcular_temperatura(15.0) == pytest.approx(25.0)
+        assert tabla.calcular_temperatura(45.0) == pytest.approx(15.0)
+        assert tabla.calcular_temperatura(60.0) == pytest.approx(20.0)
+
+    def test_resolucion_invalida(self):
+        """Verifica que se rechace una resolución degenerada."""
+        with pytest.raises(ValueError):
+            TablaSenoidal(VariacionSenoidal(20.0, 5.0, 60.0), 1)
+
+
+class TestCacheTablasSenoidales:
+    """Tests del caché LRU de tablas."""
+
+    def test_reutiliza_tabla_por_parametros(self):
+        """Verifica que parámetros iguales compartan la tabla."""
+        cache = CacheTablasSenoidales()
+        a = cache.obtener(VariacionSenoidal(20.0, 5.0, 60.0))
+        b = cache.obtener(VariacionSenoidal(20.0, 5.0, 60.0))
+
+        assert a is b
+        assert (cache.aciertos, cache.fallos) == (1, 1)
+
+    def test_desalojo_lru(self):
+        """Verifica que se descarte la tabla menos usada."""
+        cache = CacheTablasSenoidales(max_tablas=2)
+        v1 = VariacionSenoidal(20.0, 5.0, 60.0)
+        v2 = VariacionSenoidal(21.0, 5.0, 60.0)
+        v3 = VariacionSenoidal(22.0, 5.0, 60.0)
+
+        t1 = cache.obtener(v1)
+        cache.obtener(v2)
+        cache.obtener(v1)  # v1 pasa a ser la más reciente
+        cache.obtener(v3)
+
+        assert len(cache) == 2
+        assert cache.desalojos == 1
+        assert cache.obtener(v1) is t1
+        assert cache.invalidar(v2) is False
+
+    def test_invalidar(self):
+        """Verifica que invalidar fuerce una tabla nueva."""
+        cache = CacheTablasSenoidales()
+        v = VariacionSenoidal(20.0, 5.0, 60.0)
+        tabla = cache.obtener(v)
+
+        assert cache.invalidar(v) is True
+        assert cache.obtener(v) is not tabla
+
+
+class TestGeneradorUsaTablas:
+    """Tests de integración con GeneradorTemperatura."""
+
+    def test_actualizar_variacion_invalida_tabla(self, qtbot):
+        """Verifica que actualizar_variacion reemplace la tabla."""
+        cache = CacheTablasSenoidales()
+        generador = GeneradorTemperatura(
+            ConfigSimuladorTemperatura.desde_defaults(), cache=cache
+        )
+        anterior = VariacionSenoidal(
+            generador._variacion.temperatura_base,
+            generador._variacion.amplitud,
+            generador._variacion.periodo_segundos,
+        )
+
+        generador.actualizar_variacion(30.0, 0.0, 60.0)
+
+        assert cache.invalidar(anterior) is False
+        assert generador.temperatura_actual == pytest.approx(30.0)
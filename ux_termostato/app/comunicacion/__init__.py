@@ -5,12 +5,30 @@ Este módulo contiene los componentes de comunicación TCP bidireccional
 con el Raspberry Pi:
 - ServidorEstado: Recibe estado del termostato (puerto 14001)
 - ClienteComandos: Envía comandos al termostato (puerto 14000)
+
+Y las herramientas para reproducir capturas de estado:
+- ReproductorCapturas: Envía una captura a un ServidorEstado
+- MedidorIngesta: Mide cuándo la UX procesa cada estado
+- ResultadoIngesta / calcular_resultado: Throughput y latencias
+- cargar_captura: Lee capturas (TrafficRecorder o JSON Lines)
 """
 
 from .servidor_estado import ServidorEstado
 from .cliente_comandos import ClienteComandos
+from .reproductor_capturas import (
+    ReproductorCapturas,
+    MedidorIngesta,
+    ResultadoIngesta,
+    calcular_resultado,
+    cargar_captura,
+)
 
 __all__ = [
     "ServidorEstado",
     "ClienteComandos",
+    "ReproductorCapturas",
+    "MedidorIngesta",
+    "ResultadoIngesta",
+    "calcular_resultado",
+    "cargar_captura",
 ]
@@ -6,11 +6,11 @@ comandos JSON al termostato. Cada comando se envía en una conexión nueva.
 """
 import json
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt6.QtCore import QObject
 
-from compartido.networking import EphemeralSocketClient
+from compartido.networking import ConnectionPool, EphemeralSocketClient
 from ..dominio import ComandoTermostato
 
 logger = logging.getLogger(__name__)
@@ -26,8 +26,10 @@ class ClienteComandos(QObject):
     - Patrón fire-and-forget (no espera respuesta)
     - Manejo robusto de errores (no lanza excepciones)
 
-    El cliente encapsula un EphemeralSocketClient y se enfoca en la
-    serialización de comandos y logging apropiado.
+    El cliente encapsula un EphemeralSocketClient por puerto destino
+    (creado una sola vez y reutilizado) y se enfoca en la serialización
+    de comandos y logging apropiado. Con un ConnectionPool, los comandos
+    reutilizan además la conexión TCP (modo keep-alive).
 
     Example:
         >>> cliente = ClienteComandos("192.168.1.50", 14000)
@@ -41,7 +43,8 @@ class ClienteComandos(QObject):
         self,
         host: str,
         port: int = 14000,
-        parent: Optional[QObject] = None
+        parent: Optional[QObject] = None,
+        pool: Optional[ConnectionPool] = None
     ):
         """
         Inicializa el cliente de comandos.
@@ -50,6 +53,7 @@ class ClienteComandos(QObject):
             host: Dirección IP del servidor RPi.
             port: Puerto TCP base (default: 14000, no usado con protocolo texto).
             parent: Objeto padre Qt opcional.
+            pool: Pool de conexiones keep-alive (None = conexión por comando).
 
         Note:
             El puerto se determina dinámicamente según el tipo de comando:
@@ -59,6 +63,8 @@ class ClienteComandos(QObject):
         super().__init__(parent)
         self._host = host
         self._port = port  # Puerto base (no usado con protocolo adaptado)
+        self._pool = pool
+        self._clientes: Dict[int, EphemeralSocketClient] = {}
 
         logger.info(
             "ClienteComandos inicializado: %s (puertos dinámicos)",
@@ -118,10 +124,10 @@ class ClienteComandos(QObject):
                 mensaje_texto.strip()
             )
 
-            # 3. Crear cliente efímero con puerto correcto
-            cliente = EphemeralSocketClient(self._host, puerto, self)
+            # 3. Obtener el cliente del puerto correcto (reutilizado)
+            cliente = self._obtener_cliente(puerto)
 
-            # 4. Enviar texto plano (conectar → enviar → cerrar)
+            # 4. Enviar texto plano (conectar → enviar → cerrar, o vía pool)
             exito = cliente.send(mensaje_texto)
 
             if exito:
@@ -150,6 +156,24 @@ class ClienteComandos(QObject):
             )
             return False
 
+    def _obtener_cliente(self, puerto: int) -> EphemeralSocketClient:
+        """
+        Retorna el cliente TCP del puerto, creándolo la primera vez.
+
+        Args:
+            puerto: Puerto destino del comando.
+
+        Returns:
+            EphemeralSocketClient reutilizable para ese puerto.
+        """
+        cliente = self._clientes.get(puerto)
+        if cliente is None:
+            cliente = EphemeralSocketClient(
+                self._host, puerto, self, pool=self._pool
+            )
+            self._clientes[puerto] = cliente
+        return cliente
+
     def _adaptar_comando_a_texto(self, datos_json: dict) -> tuple[Optional[str], int]:
         """
         Adapta un comando JSON al formato texto plano de ISSE_Termostato.
@@ -0,0 +1,342 @@
+"""
+Reproducción de capturas de estado hacia un ServidorEstado.
+
+Herramientas para medir el rendimiento de ingesta de la UX con sesiones
+reales en lugar de fixtures escritos a mano:
+
+- cargar_captura: Lee una captura (log de TrafficRecorder o JSON Lines).
+- ReproductorCapturas: Envía la captura por TCP, con su temporización
+  original (escalada) o a máxima velocidad.
+- MedidorIngesta: Registra cuándo cada estado termina de procesarse
+  en la UX.
+- calcular_resultado: Throughput y latencias socket → coordinador.
+"""
+import json
+import logging
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from PyQt6.QtCore import QObject
+
+from compartido.networking import TrafficLogReader
+
+from .servidor_estado import ServidorEstado
+
+logger = logging.getLogger(__name__)
+
+MensajeCapturado = Tuple[Optional[float], bytes]
+"""Mensaje de una captura: (tiempo en segundos o None, JSON en bytes)."""
+
+_MAGIC_TRAFICO = b"ISTL"
+
+
+def cargar_captura(ruta: Union[str, Path]) -> Iterator[MensajeCapturado]:
+    """
+    Itera de forma perezosa los mensajes de una captura.
+
+    Acepta dos formatos (se detecta por contenido):
+    - Log binario de TrafficRecorder (`ruta_captura` de la UX),
+      incluidos sus archivos rotados. El tiempo es el de recepción.
+    - JSON Lines: un EstadoTermostato por línea. El tiempo se toma del
+      campo "timestamp" si existe; si no, el mensaje no tiene tiempo.
+
+    Args:
+        ruta: Ruta de la captura.
+
+    Yields:
+        Tuplas (tiempo_s, mensaje) en el orden de la captura.
+
+    Raises:
+        FileNotFoundError: Si la captura no existe.
+    """
+    ruta = Path(ruta)
+    with open(ruta, "rb") as archivo:
+        es_log_binario = archivo.read(len(_MAGIC_TRAFICO)) == _MAGIC_TRAFICO
+
+    if es_log_binario:
+        for registro in TrafficLogReader(ruta):
+            yield registro.timestamp_ns / 1e9, registro.payload
+        return
+
+    with open(ruta, "rb") as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if linea:
+                yield _tiempo_de_estado(linea), linea
+
+
+def _tiempo_de_estado(mensaje: bytes) -> Optional[float]:
+    """Extrae el timestamp de un estado JSON en segundos (None si no hay)."""
+    try:
+        valor = json.loads(mensaje)["timestamp"]
+        return datetime.fromisoformat(valor.replace("Z", "+00:00")).timestamp()
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+class ReproductorCapturas:
+    """
+    Envía una captura de estados a un ServidorEstado por TCP.
+
+    Usa una única conexión persistente (como el RPi) y envía cada
+    mensaje con `sendall()`, registrando el instante de envío
+    (time.monotonic_ns) para medir latencias. Con `velocidad=None`
+    envía a máxima velocidad; si no, respeta los tiempos de la captura
+    divididos por `velocidad`. Los mensajes sin tiempo se envían sin
+    espera.
+
+    El envío corre en un hilo propio para no bloquear el event loop
+    de Qt que procesa los estados recibidos.
+
+    Example:
+        >>> reproductor = ReproductorCapturas(cargar_captura("sesion.bin"),
+        ...                                   "127.0.0.1", 14001, velocidad=None)
+        >>> reproductor.iniciar()
+        >>> reproductor.esperar()
+    """
+
+    TIMEOUT_CONEXION = 5.0
+
+    def __init__(
+        self,
+        mensajes: Iterable[MensajeCapturado],
+        host: str,
+        puerto: int,
+        velocidad: Optional[float] = 1.0
+    ) -> None:
+        """
+        Inicializa el reproductor.
+
+        Args:
+            mensajes: Mensajes a enviar (p.ej. de cargar_captura()).
+            host: IP del ServidorEstado.
+            puerto: Puerto del ServidorEstado.
+            velocidad: Factor sobre los tiempos de la captura, o None
+                para enviar a máxima velocidad.
+
+        Raises:
+            ValueError: Si la velocidad no es positiva.
+        """
+        if velocidad is not None and velocidad <= 0:
+            raise ValueError(f"velocidad debe ser positiva: {velocidad}")
+
+        self._mensajes = mensajes
+        self._host = host
+        self._puerto = puerto
+        self._velocidad = velocidad
+        self._tiempos_envio_ns: List[int] = []
+        self._error: Optional[Exception] = None
+        self._hilo: Optional[threading.Thread] = None
+        self._detenido = threading.Event()
+
+    @property
+    def tiempos_envio_ns(self) -> List[int]:
+        """Instante de envío (monotonic_ns) de cada mensaje enviado."""
+        return self._tiempos_envio_ns
+
+    @property
+    def enviados(self) -> int:
+        """Cantidad de mensajes enviados."""
+        return len(self._tiempos_envio_ns)
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Error que interrumpió el envío (None si no hubo)."""
+        return self._error
+
+    def iniciar(self) -> None:
+        """Inicia el envío en un hilo separado."""
+        self._hilo = threading.Thread(target=self.ejecutar, daemon=True)
+        self._hilo.start()
+
+    def esperar(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que termine el envío.
+
+        Args:
+            timeout: Segundos máximos de espera (None: sin límite).
+
+        Returns:
+            True si el envío terminó.
+        """
+        if self._hilo is None:
+            return True
+        self._hilo.join(timeout)
+        return not self._hilo.is_alive()
+
+    def detener(self) -> None:
+        """Interrumpe el envío tras el mensaje en curso."""
+        self._detenido.set()
+
+    def ejecutar(self) -> None:
+        """Envía la captura completa (bloqueante)."""
+        try:
+            with socket.create_connection(
+                (self._host, self._puerto), timeout=self.TIMEOUT_CONEXION
+            ) as conexion:
+                conexion.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._enviar_todos(conexion)
+        except OSError as e:
+            self._error = e
+            logger.error("Reproducción interrumpida: %s", e)
+
+    def _enviar_todos(self, conexion: socket.socket) -> None:
+        """Envía cada mensaje esperando su instante si corresponde."""
+        origen_ns = time.monotonic_ns()
+        tiempo_inicial: Optional[float] = None
+
+        for tiempo, mensaje in self._mensajes:
+            if self._detenido.is_set():
+                return
+            if self._velocidad is not None and tiempo is not None:
+                if tiempo_inicial is None:
+                    tiempo_inicial = tiempo
+                vencimiento_ns = origen_ns + int(
+                    (tiempo - tiempo_inicial) / self._velocidad * 1e9
+                )
+                espera_ns = vencimiento_ns - time.monotonic_ns()
+                if espera_ns > 0 and self._detenido.wait(espera_ns / 1e9):
+                    return
+            self._tiempos_envio_ns.append(time.monotonic_ns())
+            conexion.sendall(mensaje)
+
+
+class MedidorIngesta(QObject):
+    """
+    Registra cuándo la UX termina de procesar cada mensaje recibido.
+
+    Se conecta a `estado_recibido` y `error_parsing` del ServidorEstado.
+    Debe crearse después del UXCoordinator: Qt invoca los slots en el
+    orden de conexión, por lo que cada marca se toma cuando
+    `UXCoordinator._on_estado_recibido` ya distribuyó el estado a los
+    paneles.
+
+    Cada mensaje enviado produce exactamente un estado o un error de
+    parsing, por lo que el i-ésimo evento corresponde al i-ésimo envío.
+    """
+
+    def __init__(
+        self,
+        servidor: ServidorEstado,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Inicializa el medidor conectado al servidor.
+
+        Args:
+            servidor: Servidor cuyos mensajes se miden.
+            parent: Objeto padre Qt opcional.
+        """
+        super().__init__(parent)
+        self._eventos: List[Tuple[int, bool]] = []
+        servidor.estado_recibido.connect(self._on_estado)
+        servidor.error_parsing.connect(self._on_error)
+
+    @property
+    def procesados(self) -> int:
+        """Mensajes procesados (estados válidos y errores)."""
+        return len(self._eventos)
+
+    @property
+    def eventos(self) -> List[Tuple[int, bool]]:
+        """(monotonic_ns, es_estado_valido) por mensaje, en orden."""
+        return self._eventos
+
+    def _on_estado(self, _estado) -> None:
+        """Marca un estado procesado."""
+        self._eventos.append((time.monotonic_ns(), True))
+
+    def _on_error(self, _mensaje: str) -> None:
+        """Marca un mensaje rechazado."""
+        self._eventos.append((time.monotonic_ns(), False))
+
+
+@dataclass(frozen=True)
+class ResultadoIngesta:
+    """
+    Métricas de una reproducción.
+
+    Attributes:
+        enviados: Mensajes enviados.
+        procesados: Mensajes procesados por la UX (válidos o no).
+        errores: Mensajes rechazados por error_parsing.
+        duracion_s: Desde el primer envío hasta el último procesado.
+        mensajes_por_segundo: procesados / duracion_s.
+        latencia_p50_ms: Mediana de la latencia envío → coordinador.
+        latencia_p95_ms: Percentil 95 de la latencia.
+        latencia_p99_ms: Percentil 99 de la latencia.
+        latencia_max_ms: Latencia máxima.
+    """
+
+    enviados: int
+    procesados: int
+    errores: int
+    duracion_s: float
+    mensajes_por_segundo: float
+    latencia_p50_ms: float
+    latencia_p95_ms: float
+    latencia_p99_ms: float
+    latencia_max_ms: float
+
+    def resumen(self) -> str:
+        """Retorna el resultado como texto de una línea por métrica."""
+        return "\n".join([
+            f"Mensajes enviados:    {self.enviados}",
+            f"Mensajes procesados:  {self.procesados} ({self.errores} con error)",
+            f"Duración:             {self.duracion_s:.3f} s",
+            f"Throughput:           {self.mensajes_por_segundo:.1f} msg/s",
+            f"Latencia p50/p95/p99: {self.latencia_p50_ms:.2f} / "
+            f"{self.latencia_p95_ms:.2f} / {self.latencia_p99_ms:.2f} ms",
+            f"Latencia máxima:      {self.latencia_max_ms:.2f} ms",
+        ])
+
+
+def calcular_resultado(
+    tiempos_envio_ns: List[int],
+    eventos: List[Tuple[int, bool]]
+) -> ResultadoIngesta:
+    """
+    Calcula throughput y latencias de una reproducción.
+
+    Args:
+        tiempos_envio_ns: ReproductorCapturas.tiempos_envio_ns.
+        eventos: MedidorIngesta.eventos.
+
+    Returns:
+        ResultadoIngesta (con ceros si no se procesó ningún mensaje).
+    """
+    pares = list(zip(tiempos_envio_ns, eventos))
+    latencias = sorted(
+        (procesado - enviado) / 1e6
+        for enviado, (procesado, valido) in pares if valido
+    )
+    errores = sum(1 for _, valido in eventos if not valido)
+
+    if not pares:
+        return ResultadoIngesta(len(tiempos_envio_ns), 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    duracion_s = (pares[-1][1][0] - pares[0][0]) / 1e9
+    return ResultadoIngesta(
+        enviados=len(tiempos_envio_ns),
+        procesados=len(eventos),
+        errores=errores,
+        duracion_s=duracion_s,
+        mensajes_por_segundo=len(eventos) / duracion_s if duracion_s > 0 else 0.0,
+        latencia_p50_ms=_percentil(latencias, 50),
+        latencia_p95_ms=_percentil(latencias, 95),
+        latencia_p99_ms=_percentil(latencias, 99),
+        latencia_max_ms=latencias[-1] if latencias else 0.0,
+    )
+
+
+def _percentil(ordenados: List[float], percentil: float) -> float:
+    """Percentil por rango más cercano de una lista ordenada."""
+    if not ordenados:
+        return 0.0
+    indice = max(0, -(-len(ordenados) * percentil // 100) - 1)
+    return ordenados[int(indice)]
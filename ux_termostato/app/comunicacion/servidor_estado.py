@@ -11,8 +11,8 @@ from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from compartido.networking import BaseSocketServer
-from ..dominio import EstadoTermostato
+from compartido.networking import BaseSocketServer, JsonObjectFramer, MessageFramer
+from ..dominio import DecodificadorEstado, EstadoTermostato
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ class ServidorEstado(BaseSocketServer):
     Responsabilidades:
     - Escuchar conexiones en puerto configurado (default 14001)
     - Recibir mensajes JSON con estado del termostato
+    - Delimitar los mensajes por objeto JSON (ráfagas o mensajes partidos)
     - Parsear JSON a objetos EstadoTermostato
     - Emitir señales PyQt para notificar actualizaciones
 
@@ -69,6 +70,7 @@ class ServidorEstado(BaseSocketServer):
             parent: Objeto padre Qt opcional.
         """
         super().__init__(host, port, parent)
+        self._decodificador = DecodificadorEstado()
 
         # Conectar señales de BaseSocketServer a nuestros handlers
         self.data_received.connect(self._procesar_mensaje)
@@ -123,6 +125,19 @@ class ServidorEstado(BaseSocketServer):
         """
         return self.is_running()
 
+    def _create_framer(self) -> MessageFramer:
+        """
+        Crea el delimitador de mensajes para cada sesión del RPi.
+
+        Varios estados enviados seguidos pueden llegar en un mismo
+        `recv()`, y un estado puede llegar partido en varios segmentos
+        TCP; el framer JSON entrega exactamente un objeto por mensaje.
+
+        Returns:
+            JsonObjectFramer para la sesión.
+        """
+        return JsonObjectFramer()
+
     def _procesar_mensaje(self, data: str) -> None:
         """
         Procesa un mensaje JSON recibido del RPi.
@@ -137,11 +152,11 @@ class ServidorEstado(BaseSocketServer):
         logger.info("📥 Mensaje recibido (%d bytes)", len(data))
         try:
             # 1. Parsear JSON a diccionario
-            datos = json.loads(data.strip())
+            datos = json.loads(data)
             logger.debug("JSON parseado: %s", datos)
 
             # 2. Crear EstadoTermostato desde el diccionario
-            estado = EstadoTermostato.from_json(datos)
+            estado = self._decodificador.desde_dict(datos)
 
             # 3. Emitir señal con el estado
             logger.info(
@@ -6,7 +6,7 @@ de la aplicación, incluyendo comunicación con el RPi y parámetros de UI.
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
@@ -23,6 +23,9 @@ class ConfigUX:
         temperatura_min_setpoint: Temperatura mínima configurable (°C)
         temperatura_max_setpoint: Temperatura máxima configurable (°C)
         temperatura_setpoint_inicial: Temperatura inicial (°C)
+        historial_max_puntos: Estados recibidos que conserva el historial
+        conexion_persistente: Reutiliza conexiones TCP al enviar comandos
+        ruta_captura: Archivo donde capturar el tráfico recibido (None: sin captura)
     """
 
     # Comunicación
@@ -36,6 +39,11 @@ class ConfigUX:
     temperatura_min_setpoint: float
     temperatura_max_setpoint: float
     temperatura_setpoint_inicial: float
+    historial_max_puntos: int = 100
+
+    # Comunicación (opcional)
+    conexion_persistente: bool = False
+    ruta_captura: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Valida la configuración después de la inicialización."""
@@ -60,6 +68,11 @@ class ConfigUX:
                 f"{self.intervalo_actualizacion_ui_ms}"
             )
 
+        if self.historial_max_puntos <= 0:
+            raise ValueError(
+                f"historial_max_puntos debe ser positivo: {self.historial_max_puntos}"
+            )
+
         # Validar temperaturas
         if self.temperatura_min_setpoint >= self.temperatura_max_setpoint:
             raise ValueError(
@@ -110,6 +123,9 @@ class ConfigUX:
             temperatura_min_setpoint=data["ux_termostato"]["temperatura_minima_setpoint"],
             temperatura_max_setpoint=data["ux_termostato"]["temperatura_maxima_setpoint"],
             temperatura_setpoint_inicial=data["ux_termostato"]["temperatura_setpoint_inicial"],
+            historial_max_puntos=data["ux_termostato"].get("historial_max_puntos", 100),
+            conexion_persistente=data["ux_termostato"].get("conexion_persistente", False),
+            ruta_captura=data["ux_termostato"].get("ruta_captura"),
         )
 
     @classmethod
@@ -6,22 +6,38 @@ eliminando la necesidad de que componentes superiores gestionen callbacks manual
 """
 
 import logging
-from typing import Optional
+from dataclasses import fields
+from typing import FrozenSet, Optional
 
 from PyQt6.QtCore import QObject
 
 from .comunicacion import ServidorEstado, ClienteComandos
 from .dominio import (
     EstadoTermostato,
+    HistorialEstados,
     ComandoPower,
     ComandoSetTemp,
     ComandoAumentar,
     ComandoDisminuir,
     ComandoSetModoDisplay,
 )
+from .presentacion.limitador_ui import LimitadorActualizacionUI
 
 logger = logging.getLogger(__name__)
 
+CAMPOS_ESTADO = tuple(f.name for f in fields(EstadoTermostato) if f.name != "timestamp")
+"""Campos de EstadoTermostato que se comparan entre estados (no el timestamp)."""
+
+ENTRADAS_PANEL = {
+    "display": frozenset(
+        {"encendido", "temperatura_actual", "temperatura_deseada", "falla_sensor"}
+    ),
+    "climatizador": frozenset({"modo_climatizador"}),
+    "indicadores": frozenset({"falla_sensor", "bateria_baja"}),
+    "power": frozenset({"encendido"}),
+}
+"""Campos del estado de los que depende cada panel."""
+
 
 class UXCoordinator(QObject):
     """
@@ -33,6 +49,20 @@ class UXCoordinator(QObject):
     - Power → Controles (habilitar/deshabilitar)
 
     Este patrón evita dependencias circulares y centraliza la orquestación.
+
+    El coordinador recuerda el último EstadoTermostato aplicado y solo
+    actualiza los paneles cuyos campos de entrada (`ENTRADAS_PANEL`)
+    cambiaron, para que un flujo de 10-50 Hz con valores repetidos no
+    vuelva a renderizar toda la ventana. Una nueva conexión del RPi
+    fuerza la actualización completa del siguiente estado. El panel
+    power cambia su propio modelo al hacer clic, por eso tras un clic se
+    vuelve a sincronizar con el siguiente estado aunque `encendido` no
+    haya cambiado (p.ej. si el RPi ignoró el comando).
+
+    Con un LimitadorActualizacionUI los estados pasan por él antes de
+    llegar a los paneles, que se actualizan a lo sumo una vez por
+    intervalo con el estado más reciente. Con un HistorialEstados, en
+    cambio, se registra cada estado recibido, sin limitar.
     """
 
     def __init__(
@@ -41,6 +71,8 @@ class UXCoordinator(QObject):
         servidor_estado: ServidorEstado,
         cliente_comandos: ClienteComandos,
         parent: Optional[QObject] = None,
+        limitador: Optional[LimitadorActualizacionUI] = None,
+        historial: Optional[HistorialEstados] = None,
     ) -> None:
         """
         Inicializa el coordinador.
@@ -55,11 +87,19 @@ class UXCoordinator(QObject):
             servidor_estado: Servidor TCP que recibe estado del RPi
             cliente_comandos: Cliente TCP que envía comandos al RPi
             parent: Objeto padre Qt opcional
+            limitador: Limitador de frecuencia entre el servidor y los
+                paneles (None: cada estado se aplica al recibirse)
+            historial: Historial donde registrar cada estado recibido
         """
         super().__init__(parent)
         self._paneles = paneles
         self._servidor = servidor_estado
         self._cliente = cliente_comandos
+        self._limitador = limitador
+        self._historial = historial
+        self._ultimo_estado: Optional[EstadoTermostato] = None
+        # `encendido` aplicado al panel power (None: desincronizado)
+        self._encendido_aplicado: Optional[bool] = None
 
         # Conectar todas las señales
         self._conectar_signals()
@@ -85,9 +125,26 @@ class UXCoordinator(QObject):
 
     def _conectar_servidor_estado(self) -> None:
         """Conecta señales del servidor que recibe estado del RPi."""
-        # Servidor → Paneles (distribuir estado)
-        self._servidor.estado_recibido.connect(self._on_estado_recibido)
-        logger.info("✓ Señal estado_recibido conectada a _on_estado_recibido")
+        # Servidor → Historial (todos los estados, antes de limitar)
+        if self._historial is not None:
+            self._servidor.estado_recibido.connect(self._historial.agregar)
+
+        # Servidor → Paneles (distribuir estado), pasando por el limitador si hay
+        if self._limitador is not None:
+            self._servidor.estado_recibido.connect(self._limitador.recibir)
+            self._limitador.estado_listo.connect(self._on_estado_recibido)
+            logger.info(
+                "✓ Señal estado_recibido conectada a _on_estado_recibido (cada %d ms)",
+                self._limitador.intervalo_ms
+            )
+        else:
+            self._servidor.estado_recibido.connect(self._on_estado_recibido)
+            logger.info("✓ Señal estado_recibido conectada a _on_estado_recibido")
+
+        # Display: al cambiar el modo de vista se vuelve a aplicar el último estado
+        ctrl_display = self._paneles["display"][2]
+        if hasattr(ctrl_display, "modo_vista_cambiado"):
+            ctrl_display.modo_vista_cambiado.connect(self._on_display_modo_vista_cambiado)
 
         # Servidor → Logging (conexión establecida/perdida)
         self._servidor.conexion_establecida.connect(self._on_conexion_establecida)
@@ -155,41 +212,91 @@ class UXCoordinator(QObject):
 
     # -- Callbacks --
 
+    @property
+    def limitador(self) -> Optional[LimitadorActualizacionUI]:
+        """Limitador de frecuencia de actualización (None si no hay)."""
+        return self._limitador
+
+    @property
+    def historial(self) -> Optional[HistorialEstados]:
+        """Historial de estados recibidos (None si no hay)."""
+        return self._historial
+
+    @property
+    def ultimo_estado(self) -> Optional[EstadoTermostato]:
+        """Último estado aplicado a los paneles (None antes del primero)."""
+        return self._ultimo_estado
+
+    def invalidar_estado(self) -> None:
+        """Fuerza que el próximo estado se distribuya a todos los paneles."""
+        self._ultimo_estado = None
+        self._encendido_aplicado = None
+
+    @staticmethod
+    def campos_cambiados(
+        anterior: Optional[EstadoTermostato], nuevo: EstadoTermostato
+    ) -> FrozenSet[str]:
+        """
+        Calcula los campos que difieren entre dos estados.
+
+        Args:
+            anterior: Último estado aplicado (None: todos cambiaron)
+            nuevo: Estado recibido
+
+        Returns:
+            Nombres de los campos de CAMPOS_ESTADO con valor distinto
+        """
+        if anterior is None:
+            return frozenset(CAMPOS_ESTADO)
+        return frozenset(
+            campo for campo in CAMPOS_ESTADO
+            if getattr(anterior, campo) != getattr(nuevo, campo)
+        )
+
     def _on_estado_recibido(self, estado: EstadoTermostato) -> None:
         """
-        Distribuye estado del RPi a todos los paneles.
+        Distribuye estado del RPi a los paneles cuyas entradas cambiaron.
 
         Args:
             estado: Estado completo del termostato recibido del RPi
         """
-        logger.info("🔄 Distribuyendo estado a paneles: temp=%.1f°C, modo=%s",
-                   estado.temperatura_actual, estado.modo_climatizador)
+        cambios = self.campos_cambiados(self._ultimo_estado, estado)
+        self._ultimo_estado = estado
+        sincronizar_power = estado.encendido != self._encendido_aplicado
+        if not cambios and not sincronizar_power:
+            logger.debug("Estado sin cambios: no se actualizan paneles")
+            return
+
+        logger.debug("🔄 Distribuyendo estado a paneles: cambios=%s", sorted(cambios))
 
         # Display: actualizar temperatura según modo
-        ctrl_display = self._paneles["display"][2]
-        logger.debug("Actualizando Display...")
-        ctrl_display.actualizar_desde_estado(estado)
+        if cambios & ENTRADAS_PANEL["display"]:
+            self._paneles["display"][2].actualizar_desde_estado(estado)
 
         # Climatizador: actualizar modo
-        ctrl_climatizador = self._paneles["climatizador"][2]
-        logger.debug("Actualizando Climatizador...")
-        ctrl_climatizador.actualizar_desde_estado(estado)
+        if cambios & ENTRADAS_PANEL["climatizador"]:
+            self._paneles["climatizador"][2].actualizar_desde_estado(estado)
 
         # Indicadores: actualizar alertas
-        ctrl_indicadores = self._paneles["indicadores"][2]
-        logger.debug("Actualizando Indicadores...")
-        ctrl_indicadores.actualizar_desde_estado(
-            falla_sensor=estado.falla_sensor, bateria_baja=estado.bateria_baja
-        )
-
-        # Power: sincronizar estado (sin emitir señal para evitar loop)
+        if cambios & ENTRADAS_PANEL["indicadores"]:
+            self._paneles["indicadores"][2].actualizar_desde_estado(
+                falla_sensor=estado.falla_sensor, bateria_baja=estado.bateria_baja
+            )
+
+        # Power: sincronizar estado (sin emitir señal para evitar loop).
+        # Se compara con lo aplicado al panel y no con el estado anterior,
+        # porque un clic local cambia el modelo del panel sin pasar por aquí
         ctrl_power = self._paneles["power"][2]
-        if hasattr(ctrl_power, "actualizar_modelo"):
-            logger.debug("Actualizando Power...")
-            # Usar actualizar_modelo que NO genera comando
-            ctrl_power.actualizar_modelo(estado.encendido)
+        if sincronizar_power:
+            if hasattr(ctrl_power, "actualizar_modelo"):
+                # Usar actualizar_modelo que NO genera comando
+                ctrl_power.actualizar_modelo(estado.encendido)
+            self._encendido_aplicado = estado.encendido
 
-        logger.info("✅ Estado distribuido correctamente")
+    def _on_display_modo_vista_cambiado(self, _modo: str) -> None:
+        """Vuelve a aplicar el último estado al display con el nuevo modo."""
+        if self._ultimo_estado is not None:
+            self._paneles["display"][2].actualizar_desde_estado(self._ultimo_estado)
 
     def _on_power_cambiado(self, encendido: bool) -> None:
         """
@@ -198,6 +305,10 @@ class UXCoordinator(QObject):
         Args:
             encendido: True para encender, False para apagar
         """
+        # El panel ya cambió su modelo: re-sincronizarlo con el próximo
+        # estado del RPi, haya aceptado o no el comando
+        self._encendido_aplicado = None
+
         # Crear comando del dominio
         cmd = ComandoPower(estado=encendido)
 
@@ -256,6 +367,8 @@ class UXCoordinator(QObject):
             direccion: Dirección IP:puerto del cliente conectado
         """
         logger.info("Conexión establecida con %s", direccion)
+        # Un RPi (re)conectado puede traer cualquier estado: forzar actualización completa
+        self.invalidar_estado()
         # Nota: US-015 conecta automáticamente este callback en _conectar_estado_conexion()
 
     def _on_conexion_perdida(self, direccion: str) -> None:
@@ -3,10 +3,14 @@ Módulo de dominio del termostato.
 
 Este módulo contiene la lógica de negocio pura del termostato:
 - EstadoTermostato: Modelo de datos del estado del sistema
+- DecodificadorEstado: Decodificador rápido de mensajes de estado
+- HistorialEstados: Buffer circular de estados en columnas NumPy
 - Comandos: Jerarquía de comandos para acciones del usuario
 """
 
 from .estado_termostato import EstadoTermostato
+from .decodificador_estado import DecodificadorEstado
+from .historial_estados import HistorialEstados, VentanaHistorial
 from .comandos import (
     ComandoTermostato,
     ComandoPower,
@@ -18,6 +22,9 @@ from .comandos import (
 
 __all__ = [
     "EstadoTermostato",
+    "DecodificadorEstado",
+    "HistorialEstados",
+    "VentanaHistorial",
     "ComandoTermostato",
     "ComandoPower",
     "ComandoSetTemp",
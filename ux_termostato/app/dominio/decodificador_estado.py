@@ -0,0 +1,188 @@
+"""
+Decodificador especializado de mensajes de estado del termostato.
+
+Alternativa rápida a `json.loads` + `EstadoTermostato.from_json` para el
+esquema fijo de 8 campos que envía el Raspberry Pi. Produce objetos y
+errores idénticos a ese camino.
+"""
+
+import json
+from datetime import datetime
+from json.scanner import make_scanner
+from typing import Any, Dict, List, Sequence, Union
+
+from .estado_termostato import EstadoTermostato, MODOS_CLIMATIZADOR, MODOS_DISPLAY
+
+_crear_instancia = object.__new__
+_asignar = object.__setattr__
+# Escáner de json (en C si está disponible), sin el envoltorio de json.loads
+_escanear = make_scanner(json.JSONDecoder())
+
+
+class DecodificadorEstado:
+    """
+    Decodifica mensajes JSON a EstadoTermostato sin pasos genéricos.
+
+    Respecto de `EstadoTermostato.from_json(json.loads(mensaje))`:
+    - Evita las conversiones `float()`/`bool()`/`str()` cuando el JSON ya
+      trae el tipo correcto.
+    - Valida con los frozensets precalculados del dominio y construye el
+      objeto sin volver a validar en `__post_init__`.
+    - Cachea el parseo de timestamps: el RPi envía marcas con resolución
+      de segundos, por lo que a 10-50 Hz se repiten muchas veces.
+    - `decodificar_lote()` parsea cada mensaje directamente con el
+      escáner de `json`, sin el costo por llamada de `json.loads`.
+
+    Los campos se leen y validan en el mismo orden que `from_json`, y las
+    validaciones usan `EstadoTermostato.validar`, por lo que un mensaje
+    inválido lanza la misma excepción con el mismo mensaje.
+
+    Example:
+        >>> decodificador = DecodificadorEstado()
+        >>> estado = decodificador.decodificar('{"temperatura_actual": 22.5, ...}')
+    """
+
+    MAX_TIMESTAMPS_CACHE = 1024
+
+    def __init__(self, max_timestamps_cache: int = MAX_TIMESTAMPS_CACHE) -> None:
+        """
+        Inicializa el decodificador.
+
+        Args:
+            max_timestamps_cache: Timestamps distintos a recordar; al
+                superarlo la caché se vacía.
+        """
+        self._max_timestamps = max_timestamps_cache
+        self._timestamps: Dict[str, datetime] = {}
+
+    def decodificar(self, mensaje: Union[str, bytes]) -> EstadoTermostato:
+        """
+        Decodifica un mensaje JSON.
+
+        Args:
+            mensaje: Objeto JSON con el estado del termostato.
+
+        Returns:
+            Instancia de EstadoTermostato
+
+        Raises:
+            json.JSONDecodeError: Si el JSON está malformado
+            KeyError: Si falta un campo requerido
+            ValueError: Si algún valor está fuera de rango o es inválido
+        """
+        return self.desde_dict(json.loads(mensaje))
+
+    def decodificar_lote(
+        self, mensajes: Sequence[str]
+    ) -> List[Union[EstadoTermostato, Exception]]:
+        """
+        Decodifica varios mensajes delimitados.
+
+        Cada mensaje se parsea por separado con el escáner de `json`, que
+        debe consumirlo completo; así un mensaje inválido nunca se combina
+        con sus vecinos. Los mensajes que el escáner no acepta (malformados,
+        con espacios alrededor, bytes) pasan por `decodificar()` para
+        reportar el error exacto.
+
+        Args:
+            mensajes: Mensajes JSON, uno por objeto (p.ej. los registros
+                de un JsonObjectFramer).
+
+        Returns:
+            Por cada mensaje, en orden, el EstadoTermostato o la excepción
+            que hubiera lanzado `decodificar()`.
+        """
+        resultados: List[Union[EstadoTermostato, Exception]] = []
+        for mensaje in mensajes:
+            try:
+                data, fin = _escanear(mensaje, 0)
+                completo = fin == len(mensaje)
+            except (StopIteration, TypeError, ValueError):
+                completo = False
+            if completo:
+                resultados.append(self._capturar(self.desde_dict, data))
+            else:
+                resultados.append(self._capturar(self.decodificar, mensaje))
+        return resultados
+
+    def desde_dict(self, data: Dict[str, Any]) -> EstadoTermostato:
+        """
+        Construye un EstadoTermostato desde el diccionario ya parseado.
+
+        Equivalente a `EstadoTermostato.from_json(data)`.
+
+        Args:
+            data: Diccionario con los datos del estado
+
+        Returns:
+            Instancia de EstadoTermostato
+
+        Raises:
+            KeyError: Si falta un campo requerido
+            ValueError: Si algún valor está fuera de rango o es inválido
+        """
+        timestamp = data["timestamp"]
+        if type(timestamp) is str:  # pylint: disable=unidiomatic-typecheck
+            timestamp = self._parsear_timestamp(timestamp)
+
+        temperatura_actual = data["temperatura_actual"]
+        if type(temperatura_actual) is not float:  # pylint: disable=unidiomatic-typecheck
+            temperatura_actual = float(temperatura_actual)
+        temperatura_deseada = data["temperatura_deseada"]
+        if type(temperatura_deseada) is not float:  # pylint: disable=unidiomatic-typecheck
+            temperatura_deseada = float(temperatura_deseada)
+        modo_climatizador = data["modo_climatizador"]
+        if type(modo_climatizador) is not str:  # pylint: disable=unidiomatic-typecheck
+            modo_climatizador = str(modo_climatizador)
+        falla_sensor = data["falla_sensor"]
+        if falla_sensor is not True and falla_sensor is not False:
+            falla_sensor = bool(falla_sensor)
+        bateria_baja = data["bateria_baja"]
+        if bateria_baja is not True and bateria_baja is not False:
+            bateria_baja = bool(bateria_baja)
+        encendido = data["encendido"]
+        if encendido is not True and encendido is not False:
+            encendido = bool(encendido)
+        modo_display = data["modo_display"]
+        if type(modo_display) is not str:  # pylint: disable=unidiomatic-typecheck
+            modo_display = str(modo_display)
+
+        if not (-40 <= temperatura_actual <= 85
+                and 15 <= temperatura_deseada <= 35
+                and modo_climatizador in MODOS_CLIMATIZADOR
+                and modo_display in MODOS_DISPLAY):
+            # Camino lento solo para construir el error idéntico
+            EstadoTermostato.validar(
+                temperatura_actual, temperatura_deseada, modo_climatizador, modo_display
+            )
+
+        estado = _crear_instancia(EstadoTermostato)
+        _asignar(estado, "__dict__", {
+            "temperatura_actual": temperatura_actual,
+            "temperatura_deseada": temperatura_deseada,
+            "modo_climatizador": modo_climatizador,
+            "falla_sensor": falla_sensor,
+            "bateria_baja": bateria_baja,
+            "encendido": encendido,
+            "modo_display": modo_display,
+            "timestamp": timestamp,
+        })
+        return estado
+
+    def _parsear_timestamp(self, texto: str) -> datetime:
+        """Parsea un timestamp ISO 8601 reutilizando resultados previos."""
+        timestamp = self._timestamps.get(texto)
+        if timestamp is None:
+            timestamp = datetime.fromisoformat(texto.replace("Z", "+00:00"))
+            if len(self._timestamps) >= self._max_timestamps:
+                self._timestamps.clear()
+            self._timestamps[texto] = timestamp
+        return timestamp
+
+    @staticmethod
+    def _capturar(funcion, argumento) -> Union[EstadoTermostato, Exception]:
+        """Aplica la función retornando la excepción en lugar de lanzarla."""
+        try:
+            return funcion(argumento)
+        except Exception as e:  # pylint: disable=broad-except
+            return e
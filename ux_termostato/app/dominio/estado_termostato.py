@@ -8,6 +8,12 @@ toda la información del estado del sistema recibida desde el Raspberry Pi.
 from dataclasses import dataclass
 from datetime import datetime
 
+MODOS_CLIMATIZADOR = frozenset({"calentando", "enfriando", "reposo", "apagado"})
+"""Valores válidos de `modo_climatizador`."""
+
+MODOS_DISPLAY = frozenset({"ambiente", "deseada"})
+"""Valores válidos de `modo_display`."""
+
 
 @dataclass(frozen=True)
 class EstadoTermostato:
@@ -46,37 +52,58 @@ class EstadoTermostato:
         """
         Valida los valores del estado después de la inicialización.
 
+        Raises:
+            ValueError: Si algún valor está fuera del rango o es inválido
+        """
+        self.validar(
+            self.temperatura_actual,
+            self.temperatura_deseada,
+            self.modo_climatizador,
+            self.modo_display,
+        )
+
+    @staticmethod
+    def validar(
+        temperatura_actual: float,
+        temperatura_deseada: float,
+        modo_climatizador: str,
+        modo_display: str,
+    ) -> None:
+        """
+        Valida los campos con restricciones del estado.
+
+        Compartido por `__post_init__` y DecodificadorEstado para que
+        ambos caminos reporten los mismos errores.
+
         Raises:
             ValueError: Si algún valor está fuera del rango o es inválido
         """
         # Validar temperatura actual (rango del sensor)
-        if not -40 <= self.temperatura_actual <= 85:
+        if not -40 <= temperatura_actual <= 85:
             raise ValueError(
                 f"temperatura_actual fuera de rango (-40 a 85°C): "
-                f"{self.temperatura_actual}"
+                f"{temperatura_actual}"
             )
 
         # Validar temperatura deseada (rango operativo)
-        if not 15 <= self.temperatura_deseada <= 35:
+        if not 15 <= temperatura_deseada <= 35:
             raise ValueError(
                 f"temperatura_deseada fuera de rango (15 a 35°C): "
-                f"{self.temperatura_deseada}"
+                f"{temperatura_deseada}"
             )
 
         # Validar modo climatizador
-        modos_validos = {"calentando", "enfriando", "reposo", "apagado"}
-        if self.modo_climatizador not in modos_validos:
+        if modo_climatizador not in MODOS_CLIMATIZADOR:
             raise ValueError(
-                f"modo_climatizador inválido: {self.modo_climatizador}. "
-                f"Debe ser uno de: {modos_validos}"
+                f"modo_climatizador inválido: {modo_climatizador}. "
+                f"Debe ser uno de: {set(MODOS_CLIMATIZADOR)}"
             )
 
         # Validar modo display
-        modos_display_validos = {"ambiente", "deseada"}
-        if self.modo_display not in modos_display_validos:
+        if modo_display not in MODOS_DISPLAY:
             raise ValueError(
-                f"modo_display inválido: {self.modo_display}. "
-                f"Debe ser uno de: {modos_display_validos}"
+                f"modo_display inválido: {modo_display}. "
+                f"Debe ser uno de: {set(MODOS_DISPLAY)}"
             )
 
     @classmethod
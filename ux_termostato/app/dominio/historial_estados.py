@@ -0,0 +1,226 @@
+"""
+Historial acotado de estados del termostato.
+
+Guarda los últimos N EstadoTermostato recibidos en columnas NumPy
+paralelas (float, bool y códigos de enumeración) en lugar de una cola
+de dataclasses, para que un panel de tendencia o un exportador lea
+ventanas sin copiar el historial completo.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .estado_termostato import EstadoTermostato
+
+CODIGOS_MODO_CLIMATIZADOR: Tuple[str, ...] = ("apagado", "reposo", "calentando", "enfriando")
+"""Modo de climatizador de cada código de la columna `modo_climatizador`."""
+
+CODIGOS_MODO_DISPLAY: Tuple[str, ...] = ("ambiente", "deseada")
+"""Modo de display de cada código de la columna `modo_display`."""
+
+_CODIGO_CLIMATIZADOR = {modo: i for i, modo in enumerate(CODIGOS_MODO_CLIMATIZADOR)}
+_CODIGO_DISPLAY = {modo: i for i, modo in enumerate(CODIGOS_MODO_DISPLAY)}
+
+_COLUMNAS = (
+    ("tiempo", np.float64),
+    ("temperatura_actual", np.float64),
+    ("temperatura_deseada", np.float64),
+    ("falla_sensor", np.bool_),
+    ("bateria_baja", np.bool_),
+    ("encendido", np.bool_),
+    ("modo_climatizador", np.uint8),
+    ("modo_display", np.uint8),
+)
+
+Instante = Union[datetime, float]
+"""Instante de una consulta: datetime o segundos desde la época."""
+
+
+@dataclass(frozen=True)
+class VentanaHistorial:
+    """
+    Tramo contiguo del historial en orden cronológico.
+
+    Los arrays son vistas de solo lectura sobre el almacenamiento del
+    historial (sin copia). Una ventana de n estados no cambia durante los
+    siguientes `capacidad - n` agregados; para conservarla más tiempo
+    hay que copiar los arrays.
+
+    Attributes:
+        tiempo: Timestamp de cada estado (segundos desde la época).
+        temperatura_actual: Temperatura medida (°C).
+        temperatura_deseada: Temperatura objetivo (°C).
+        falla_sensor: Falla del sensor.
+        bateria_baja: Batería baja.
+        encendido: Termostato encendido.
+        modo_climatizador: Códigos de CODIGOS_MODO_CLIMATIZADOR.
+        modo_display: Códigos de CODIGOS_MODO_DISPLAY.
+    """
+
+    tiempo: np.ndarray
+    temperatura_actual: np.ndarray
+    temperatura_deseada: np.ndarray
+    falla_sensor: np.ndarray
+    bateria_baja: np.ndarray
+    encendido: np.ndarray
+    modo_climatizador: np.ndarray
+    modo_display: np.ndarray
+
+    def __len__(self) -> int:
+        """Cantidad de estados de la ventana."""
+        return len(self.tiempo)
+
+    def modos_climatizador(self) -> np.ndarray:
+        """Retorna los modos de climatizador como texto (copia)."""
+        return np.asarray(CODIGOS_MODO_CLIMATIZADOR)[self.modo_climatizador]
+
+    def modos_display(self) -> np.ndarray:
+        """Retorna los modos de display como texto (copia)."""
+        return np.asarray(CODIGOS_MODO_DISPLAY)[self.modo_display]
+
+
+class HistorialEstados:
+    """
+    Buffer circular de estados del termostato en columnas NumPy.
+
+    Cada columna tiene el doble de la capacidad y cada estado se escribe
+    en las posiciones `i` e `i + capacidad`. Así, los últimos N estados
+    (N <= capacidad) siempre ocupan un tramo contiguo y las ventanas son
+    slices sin copia, con `agregar()` en O(1).
+
+    Las consultas por tiempo usan búsqueda binaria sobre la columna
+    `tiempo`, por lo que asumen timestamps no decrecientes (el orden en
+    que el Raspberry Pi los envía).
+
+    Example:
+        >>> historial = HistorialEstados(capacidad=100)
+        >>> servidor.estado_recibido.connect(historial.agregar)
+        >>> ventana = historial.ventana(20)
+        >>> ventana.temperatura_actual.mean()
+    """
+
+    def __init__(self, capacidad: int) -> None:
+        """
+        Inicializa el historial vacío.
+
+        Args:
+            capacidad: Cantidad máxima de estados a conservar.
+
+        Raises:
+            ValueError: Si la capacidad no es positiva.
+        """
+        if capacidad <= 0:
+            raise ValueError(f"capacidad debe ser positiva: {capacidad}")
+
+        self._capacidad = capacidad
+        self._columnas = {
+            nombre: np.zeros(2 * capacidad, dtype=dtype) for nombre, dtype in _COLUMNAS
+        }
+        self._siguiente = 0
+        self._cantidad = 0
+        self._total = 0
+
+    @property
+    def capacidad(self) -> int:
+        """Cantidad máxima de estados conservados."""
+        return self._capacidad
+
+    @property
+    def total_agregados(self) -> int:
+        """Estados agregados desde la creación (incluidos los ya descartados)."""
+        return self._total
+
+    def __len__(self) -> int:
+        """Cantidad de estados conservados."""
+        return self._cantidad
+
+    def agregar(self, estado: EstadoTermostato) -> None:
+        """
+        Agrega un estado, descartando el más antiguo si está lleno.
+
+        Args:
+            estado: Estado recibido del Raspberry Pi.
+        """
+        i = self._siguiente
+        j = i + self._capacidad
+        valores = (
+            estado.timestamp.timestamp(),
+            estado.temperatura_actual,
+            estado.temperatura_deseada,
+            estado.falla_sensor,
+            estado.bateria_baja,
+            estado.encendido,
+            _CODIGO_CLIMATIZADOR[estado.modo_climatizador],
+            _CODIGO_DISPLAY[estado.modo_display],
+        )
+        for columna, valor in zip(self._columnas.values(), valores):
+            columna[i] = valor
+            columna[j] = valor
+
+        self._siguiente = (i + 1) % self._capacidad
+        if self._cantidad < self._capacidad:
+            self._cantidad += 1
+        self._total += 1
+
+    def limpiar(self) -> None:
+        """Descarta todos los estados."""
+        self._siguiente = 0
+        self._cantidad = 0
+
+    def ventana(self, n: Optional[int] = None) -> VentanaHistorial:
+        """
+        Retorna los últimos n estados sin copiarlos.
+
+        Args:
+            n: Cantidad de estados (None: todos los conservados).
+
+        Returns:
+            VentanaHistorial en orden cronológico (menos de n si no los hay).
+        """
+        n = self._cantidad if n is None else max(0, min(n, self._cantidad))
+        fin = self._siguiente + self._capacidad
+        return self._tramo(fin - n, fin)
+
+    def rango(
+        self, desde: Optional[Instante] = None, hasta: Optional[Instante] = None
+    ) -> VentanaHistorial:
+        """
+        Retorna los estados con timestamp en [desde, hasta] sin copiarlos.
+
+        Args:
+            desde: Instante inicial inclusive (None: desde el más antiguo).
+            hasta: Instante final inclusive (None: hasta el más reciente).
+
+        Returns:
+            VentanaHistorial en orden cronológico (vacía si no hay estados).
+        """
+        fin = self._siguiente + self._capacidad
+        inicio = fin - self._cantidad
+        tiempos = self._columnas["tiempo"][inicio:fin]
+
+        primero = 0 if desde is None else int(
+            np.searchsorted(tiempos, _a_segundos(desde), side="left")
+        )
+        ultimo = len(tiempos) if hasta is None else int(
+            np.searchsorted(tiempos, _a_segundos(hasta), side="right")
+        )
+        return self._tramo(inicio + primero, inicio + max(primero, ultimo))
+
+    def _tramo(self, inicio: int, fin: int) -> VentanaHistorial:
+        """Construye una ventana con vistas de solo lectura de [inicio, fin)."""
+        vistas = {}
+        for nombre, columna in self._columnas.items():
+            vista = columna[inicio:fin]
+            vista.flags.writeable = False
+            vistas[nombre] = vista
+        return VentanaHistorial(**vistas)
+
+
+def _a_segundos(instante: Instante) -> float:
+    """Convierte un instante a segundos desde la época."""
+    if isinstance(instante, datetime):
+        return instante.timestamp()
+    return float(instante)
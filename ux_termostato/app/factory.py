@@ -8,8 +8,12 @@ permitiendo configuración consistente y facilitando el testing.
 import logging
 from typing import Optional
 
+from compartido.networking import ConnectionPool, TrafficRecorder
+
 from .configuracion import ConfigUX
 from .comunicacion import ServidorEstado, ClienteComandos
+from .dominio import HistorialEstados
+from .presentacion.limitador_ui import LimitadorActualizacionUI
 from .presentacion.paneles.display import DisplayModelo, DisplayVista, DisplayControlador
 from .presentacion.paneles.climatizador import (
     ClimatizadorModelo,
@@ -84,9 +88,12 @@ class ComponenteFactoryUX:
             parent: Objeto padre Qt opcional
 
         Returns:
-            Nueva instancia de ServidorEstado configurada
+            Nueva instancia de ServidorEstado configurada (con captura
+            de tráfico si `ruta_captura` está configurada)
         """
         servidor = ServidorEstado(host=host, port=self._config.puerto_recv, parent=parent)
+        if self._config.ruta_captura:
+            servidor.set_recorder(self.crear_grabador_trafico())
         logger.info(
             "ServidorEstado creado en %s:%d (recibe estado del RPi)",
             host,
@@ -94,6 +101,22 @@ class ComponenteFactoryUX:
         )
         return servidor
 
+    def crear_grabador_trafico(self) -> TrafficRecorder:
+        """
+        Crea el grabador que captura los mensajes recibidos del RPi.
+
+        Returns:
+            TrafficRecorder sobre `ruta_captura` (se continúa si ya existe)
+
+        Raises:
+            ValueError: Si `ruta_captura` no está configurada
+        """
+        if not self._config.ruta_captura:
+            raise ValueError("ruta_captura no está configurada")
+        grabador = TrafficRecorder(self._config.ruta_captura)
+        logger.info("Capturando tráfico recibido en %s", grabador.path)
+        return grabador
+
     def crear_cliente_comandos(
         self, host: Optional[str] = None, parent: Optional[object] = None
     ) -> ClienteComandos:
@@ -105,10 +128,14 @@ class ComponenteFactoryUX:
             parent: Objeto padre Qt opcional
 
         Returns:
-            Nueva instancia de ClienteComandos configurada
+            Nueva instancia de ClienteComandos configurada (con el pool
+            keep-alive compartido si `conexion_persistente` está activo)
         """
         ip_destino = host or self._config.ip_raspberry
-        cliente = ClienteComandos(host=ip_destino, port=self._config.puerto_send, parent=parent)
+        pool = ConnectionPool.shared() if self._config.conexion_persistente else None
+        cliente = ClienteComandos(
+            host=ip_destino, port=self._config.puerto_send, parent=parent, pool=pool
+        )
         logger.info(
             "ClienteComandos creado para %s:%d (envía comandos al RPi)",
             ip_destino,
@@ -116,6 +143,38 @@ class ComponenteFactoryUX:
         )
         return cliente
 
+    # -- Dominio --
+
+    def crear_historial_estados(self) -> HistorialEstados:
+        """
+        Crea el historial de estados recibidos del RPi.
+
+        Returns:
+            HistorialEstados con capacidad `historial_max_puntos`
+        """
+        return HistorialEstados(capacidad=self._config.historial_max_puntos)
+
+    # -- Presentación --
+
+    def crear_limitador_ui(self, parent: Optional[object] = None) -> LimitadorActualizacionUI:
+        """
+        Crea el limitador de frecuencia de actualización de los paneles.
+
+        Args:
+            parent: Objeto padre Qt opcional
+
+        Returns:
+            LimitadorActualizacionUI con `intervalo_actualizacion_ui_ms`
+        """
+        limitador = LimitadorActualizacionUI(
+            intervalo_ms=self._config.intervalo_actualizacion_ui_ms, parent=parent
+        )
+        logger.debug(
+            "LimitadorActualizacionUI creado (%d ms)",
+            self._config.intervalo_actualizacion_ui_ms,
+        )
+        return limitador
+
     # -- Paneles MVC de Presentación --
 
     def crear_panel_display(self) -> tuple[DisplayModelo, DisplayVista, DisplayControlador]:
@@ -1,6 +1,7 @@
 """Módulo de presentación - Interfaz de usuario."""
 
+from .limitador_ui import LimitadorActualizacionUI
 from .ui_compositor import UICompositor
 from .ui_principal import VentanaPrincipalUX
 
-__all__ = ["UICompositor", "VentanaPrincipalUX"]
+__all__ = ["LimitadorActualizacionUI", "UICompositor", "VentanaPrincipalUX"]
@@ -0,0 +1,138 @@
+"""
+Limitador de la frecuencia de actualización de la UI.
+
+Etapa entre `ServidorEstado.estado_recibido` y el UXCoordinator que
+conserva solo el último estado recibido y lo entrega a lo sumo una vez
+por `intervalo_actualizacion_ui_ms`.
+"""
+
+import time
+from typing import Any, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+
+class LimitadorActualizacionUI(QObject):
+    """
+    Entrega estados a la UI a un ritmo máximo fijo.
+
+    El primer estado tras un período sin actualizaciones se entrega de
+    inmediato. Los que llegan antes de que venza el intervalo se guardan
+    como pendientes (solo el último) y se entregan cuando el intervalo
+    vence. Así, las ráfagas del Raspberry Pi no saturan el event loop de
+    Qt, y el último estado siempre llega a los paneles.
+
+    Los estados reemplazados antes de entregarse se cuentan como
+    descartados.
+
+    Signals:
+        estado_listo(object): Estado a aplicar a los paneles.
+
+    Example:
+        >>> limitador = LimitadorActualizacionUI(intervalo_ms=100)
+        >>> coordinador = UXCoordinator(paneles, servidor, cliente,
+        ...                             limitador=limitador)
+    """
+
+    estado_listo = pyqtSignal(object)
+
+    def __init__(self, intervalo_ms: int, parent: Optional[QObject] = None) -> None:
+        """
+        Inicializa el limitador.
+
+        Args:
+            intervalo_ms: Intervalo mínimo entre entregas (ms).
+            parent: Objeto padre Qt opcional.
+
+        Raises:
+            ValueError: Si el intervalo no es positivo.
+        """
+        super().__init__(parent)
+        if intervalo_ms <= 0:
+            raise ValueError(f"intervalo_ms debe ser positivo: {intervalo_ms}")
+
+        self._intervalo_ms = intervalo_ms
+        self._pendiente: Any = None
+        self._hay_pendiente = False
+        self._ultima_entrega_ns: Optional[int] = None
+        self._recibidos = 0
+        self._entregados = 0
+        self._descartados = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.vaciar)
+
+    @property
+    def intervalo_ms(self) -> int:
+        """Intervalo mínimo entre entregas (ms)."""
+        return self._intervalo_ms
+
+    @property
+    def recibidos(self) -> int:
+        """Estados recibidos."""
+        return self._recibidos
+
+    @property
+    def entregados(self) -> int:
+        """Estados entregados por `estado_listo`."""
+        return self._entregados
+
+    @property
+    def descartados(self) -> int:
+        """Estados reemplazados por uno más nuevo antes de entregarse."""
+        return self._descartados
+
+    @property
+    def hay_pendiente(self) -> bool:
+        """True si hay un estado esperando el próximo intervalo."""
+        return self._hay_pendiente
+
+    def recibir(self, estado: Any) -> None:
+        """
+        Recibe un estado nuevo (slot para `estado_recibido`).
+
+        Args:
+            estado: Estado recibido del RPi.
+        """
+        self._recibidos += 1
+        if self._hay_pendiente:
+            self._descartados += 1
+        self._pendiente = estado
+        self._hay_pendiente = True
+
+        if self._timer.isActive():
+            return
+
+        restante_ms = self._restante_ms()
+        if restante_ms <= 0:
+            self.vaciar()
+        else:
+            self._timer.start(restante_ms)
+
+    def vaciar(self) -> None:
+        """Entrega ya el estado pendiente, si hay uno."""
+        self._timer.stop()
+        if not self._hay_pendiente:
+            return
+
+        estado = self._pendiente
+        self._pendiente = None
+        self._hay_pendiente = False
+        self._ultima_entrega_ns = time.monotonic_ns()
+        self._entregados += 1
+        self.estado_listo.emit(estado)
+
+    def reiniciar_contadores(self) -> None:
+        """Pone en cero los contadores de recibidos, entregados y descartados."""
+        self._recibidos = 0
+        self._entregados = 0
+        self._descartados = 0
+
+    def _restante_ms(self) -> int:
+        """Milisegundos hasta que se permita la próxima entrega."""
+        if self._ultima_entrega_ns is None:
+            return 0
+        transcurrido_ms = (time.monotonic_ns() - self._ultima_entrega_ns) // 1_000_000
+        return self._intervalo_ms - transcurrido_ms
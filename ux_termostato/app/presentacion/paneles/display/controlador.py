@@ -124,30 +124,29 @@ class DisplayControlador(QObject):
         Actualiza el display desde un objeto EstadoTermostato completo.
 
         Este método es útil para integración con el servidor que recibe
-        datos del Raspberry Pi.
+        datos del Raspberry Pi. Aplica encendido, temperatura y error de
+        sensor en un único reemplazo del modelo y renderiza una sola vez.
 
         Args:
             estado_termostato: Instancia de EstadoTermostato con datos del RPi
         """
-        logger.info("🔄 Display actualizando desde estado: modo_vista=%s, encendido=%s",
-                   self._modelo.modo_vista, estado_termostato.encendido)
-
-        # CRÍTICO: Actualizar estado de encendido primero
-        self.set_encendido(estado_termostato.encendido)
-
         # Determinar qué temperatura mostrar según modo actual
         if self._modelo.modo_vista == "ambiente":
             temperatura = estado_termostato.temperatura_actual
         else:
             temperatura = estado_termostato.temperatura_deseada
 
-        logger.info("📊 Actualizando temperatura a %.1f°C (falla_sensor=%s)",
-                   temperatura, estado_termostato.falla_sensor)
-
-        # Actualizar temperatura
-        self.actualizar_temperatura(temperatura)
-
-        # Actualizar estado de error sensor
-        self.set_error_sensor(estado_termostato.falla_sensor)
+        logger.debug(
+            "Display actualizando desde estado: temp=%s, encendido=%s, falla_sensor=%s",
+            temperatura, estado_termostato.encendido, estado_termostato.falla_sensor
+        )
+
+        self._modelo = replace(
+            self._modelo,
+            encendido=estado_termostato.encendido,
+            temperatura=temperatura,
+            error_sensor=estado_termostato.falla_sensor,
+        )
+        self._vista.actualizar(self._modelo)
 
-        logger.info("✅ Display actualizado correctamente")
+        self.temperatura_actualizada.emit(temperatura)
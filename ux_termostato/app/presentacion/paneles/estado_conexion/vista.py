@@ -1,23 +1,29 @@
 """Vista del panel de estado de conexión."""
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import QTimer
 
+from compartido.widgets.animation_clock import AnimationClock
 from compartido.widgets.led_indicator import LEDIndicator
 from compartido.widgets.led_color_provider import LEDColor
 from .modelo import EstadoConexionModelo
 
+PERIODO_PULSO_MS = 500
+
 
 class EstadoConexionVista(QWidget):
     """Vista del estado de conexión.
 
     Muestra un LED indicador y texto del estado actual de conexión con el RPi.
-    Soporta animación pulsante para el estado "conectando".
+    Soporta animación pulsante para el estado "conectando", sincronizada con
+    el resto de los LEDs a través del AnimationClock compartido.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, reloj_animacion: AnimationClock | None = None):
         super().__init__(parent)
-        self._timer_pulso = None
+        self._reloj_animacion = (
+            reloj_animacion if reloj_animacion is not None else AnimationClock.shared()
+        )
+        self._suscripcion_pulso = None
         self._pulso_activo = False
         self._inicializar_ui()
 
@@ -75,18 +81,19 @@ class EstadoConexionVista(QWidget):
     def _iniciar_pulso(self):
         """Inicia animación pulsante del LED."""
         self._pulso_activo = True
-        self._timer_pulso = QTimer(self)
-        self._timer_pulso.timeout.connect(self._toggle_pulso)
-        self._timer_pulso.start(500)  # 500ms
+        if self._suscripcion_pulso is None:
+            self._suscripcion_pulso = self._reloj_animacion.subscribe(
+                self._toggle_pulso, PERIODO_PULSO_MS
+            )
 
     def _detener_pulso(self):
         """Detiene animación pulsante del LED."""
-        if self._timer_pulso:
-            self._timer_pulso.stop()
-            self._timer_pulso = None
+        if self._suscripcion_pulso is not None:
+            self._reloj_animacion.unsubscribe(self._suscripcion_pulso)
+            self._suscripcion_pulso = None
         self._pulso_activo = False
 
-    def _toggle_pulso(self):
-        """Toggle del LED para efecto de animación."""
+    def _toggle_pulso(self, fase: int):
+        """Enciende el LED en las fases pares y lo apaga en las impares."""
         if self._pulso_activo:
-            self._led.set_state(not self._led.state)
+            self._led.set_state(fase % 2 == 0)
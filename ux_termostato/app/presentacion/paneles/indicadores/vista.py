@@ -7,28 +7,37 @@ de alerta del termostato (falla sensor y batería baja).
 # pylint: disable=no-name-in-module,import-error
 
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from compartido.widgets import LEDIndicator
+from compartido.widgets import AnimationClock, LEDIndicator
 from compartido.widgets.led_color_provider import LEDColor
 
 from .modelo import IndicadoresModelo
 
+PERIODO_PULSO_MS = 500
+
 
 class AlertLED(QWidget):
     """
     Widget que combina un LEDIndicator con un label y animación pulsante.
 
     Este widget encapsula la funcionalidad de un LED de alerta que puede
-    parpadear cuando está activo.
+    parpadear cuando está activo. El parpadeo se suscribe al AnimationClock
+    compartido, por lo que todas las alertas activas parpadean al unísono.
 
     Attributes:
         led: El indicador LED
         label: Label descriptivo del LED
     """
 
-    def __init__(self, label_text: str, color: LEDColor, size: int = 24):
+    def __init__(
+        self,
+        label_text: str,
+        color: LEDColor,
+        size: int = 24,
+        reloj_animacion: AnimationClock | None = None
+    ):
         """
         Inicializa el AlertLED.
 
@@ -36,10 +45,15 @@ class AlertLED(QWidget):
             label_text: Texto del label (ej: "Sensor", "Batería")
             color: Color del LED cuando está activo
             size: Tamaño del LED en píxeles
+            reloj_animacion: Reloj del parpadeo (por defecto el compartido)
         """
         super().__init__()
         self._color = color
         self._animacion_activa = False
+        self._reloj_animacion = (
+            reloj_animacion if reloj_animacion is not None else AnimationClock.shared()
+        )
+        self._suscripcion_pulso = None
 
         # Crear layout vertical (LED arriba, label abajo)
         layout = QVBoxLayout()
@@ -63,11 +77,6 @@ class AlertLED(QWidget):
 
         self.setLayout(layout)
 
-        # Timer para animación pulsante (toggle cada 500ms)
-        self._timer_pulso = QTimer(self)
-        self._timer_pulso.setInterval(500)
-        self._timer_pulso.timeout.connect(self._pulsar)
-
     def set_estado(self, activo: bool, pulsar: bool = False):
         """
         Establece el estado del LED.
@@ -87,18 +96,21 @@ class AlertLED(QWidget):
         """Inicia la animación pulsante del LED."""
         if not self._animacion_activa:
             self._animacion_activa = True
-            self._timer_pulso.start()
+            self._suscripcion_pulso = self._reloj_animacion.subscribe(
+                self._pulsar, PERIODO_PULSO_MS
+            )
 
     def _detener_pulso(self):
         """Detiene la animación pulsante del LED."""
         if self._animacion_activa:
             self._animacion_activa = False
-            self._timer_pulso.stop()
+            self._reloj_animacion.unsubscribe(self._suscripcion_pulso)
+            self._suscripcion_pulso = None
             self.led.set_state(False)
 
-    def _pulsar(self):
-        """Toggle del estado del LED para crear efecto pulsante."""
-        self.led.toggle()
+    def _pulsar(self, fase: int):
+        """Enciende el LED en las fases pares y lo apaga en las impares."""
+        self.led.set_state(fase % 2 == 0)
 
 
 class IndicadoresVista(QWidget):
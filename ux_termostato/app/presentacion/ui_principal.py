@@ -176,7 +176,9 @@ class VentanaPrincipalUX(QMainWindow):
                 paneles=self._componentes,
                 servidor_estado=self._servidor_estado,
                 cliente_comandos=self._cliente_comandos,
-                parent=self
+                parent=self,
+                limitador=self._factory.crear_limitador_ui(parent=self),
+                historial=self._factory.crear_historial_estados()
             )
 
             logger.info(
@@ -296,7 +298,7 @@ class VentanaPrincipalUX(QMainWindow):
     def cerrar(self) -> None:
         """Cierra la aplicación y limpia recursos.
 
-        - Detiene el ServidorEstado
+        - Detiene el ServidorEstado (y su captura de tráfico, si hay)
         - Cierra conexiones activas
         - Logging de cierre
         """
@@ -307,6 +309,8 @@ class VentanaPrincipalUX(QMainWindow):
             if self._servidor_estado:
                 self._servidor_estado.stop()
                 logger.info("ServidorEstado detenido")
+                if self._servidor_estado.recorder is not None:
+                    self._servidor_estado.recorder.close()
 
             # Aquí se podrían cerrar más recursos si es necesario
             # (por ahora no hay conexiones persistentes que cerrar)
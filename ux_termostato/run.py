@@ -82,6 +82,9 @@ def cargar_configuracion() -> ConfigUX:
         temperatura_min_setpoint=ux_config.get('temperatura_minima_setpoint', 15.0),
         temperatura_max_setpoint=ux_config.get('temperatura_maxima_setpoint', 35.0),
         temperatura_setpoint_inicial=ux_config.get('temperatura_setpoint_inicial', 24.0),
+        ruta_captura=os.getenv('RUTA_CAPTURA', ux_config.get('ruta_captura')),
+        historial_max_puntos=ux_config.get('historial_max_puntos', 100),
+        conexion_persistente=ux_config.get('conexion_persistente', False),
     )
 
     logger.info(
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Reproduce una captura de estados contra la UX y mide la ingesta.
+
+Levanta en el mismo proceso un ServidorEstado con el UXCoordinator y
+todos los paneles (sin mostrar la ventana), envía la captura por TCP y
+reporta el throughput y la latencia desde el socket hasta que
+`UXCoordinator._on_estado_recibido` distribuyó cada estado.
+
+Con --destino solo envía la captura a una UX ya en ejecución (sin
+medir latencias).
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python run_replay.py sesion.bin --maximo
+    python run_replay.py estados.jsonl --velocidad 10
+    python run_replay.py sesion.bin --destino 192.168.1.50:14001
+"""
+import argparse
+import logging
+import socket
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# pylint: disable=wrong-import-position
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from app.comunicacion import (
+    MedidorIngesta,
+    ReproductorCapturas,
+    calcular_resultado,
+    cargar_captura,
+)
+from app.configuracion import ConfigUX
+from app.coordinator import UXCoordinator
+from app.factory import ComponenteFactoryUX
+# pylint: enable=wrong-import-position
+
+logger = logging.getLogger(__name__)
+
+INTERVALO_SONDEO_MS = 10
+"""Cada cuánto se verifica si la reproducción terminó."""
+
+
+def parsear_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos.
+
+    Args:
+        argv: Argumentos a parsear. Si es None, usa sys.argv.
+
+    Returns:
+        Namespace con los argumentos.
+    """
+    parser = argparse.ArgumentParser(
+        description="Reproduce una captura de estados y mide la ingesta de la UX"
+    )
+    parser.add_argument(
+        "captura", type=Path,
+        help="Log de TrafficRecorder o JSON Lines con un estado por línea"
+    )
+    velocidad = parser.add_mutually_exclusive_group()
+    velocidad.add_argument(
+        "--velocidad", type=float, default=1.0,
+        help="Factor sobre los tiempos de la captura (default: 1)"
+    )
+    velocidad.add_argument(
+        "--maximo", action="store_true",
+        help="Envía a máxima velocidad, ignorando los tiempos"
+    )
+    parser.add_argument(
+        "--destino", help="host:puerto de una UX en ejecución (solo envía)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60.0,
+        help="Segundos máximos de espera (default: 60)"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Muestra los logs INFO de la UX"
+    )
+    return parser.parse_args(argv)
+
+
+def _parsear_destino(destino: str) -> Tuple[str, int]:
+    """Separa 'host:puerto'."""
+    host, _, puerto = destino.rpartition(":")
+    return host, int(puerto)
+
+
+def _puerto_libre() -> int:
+    """Obtiene un puerto libre en localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def enviar_a_destino(args: argparse.Namespace) -> int:
+    """Envía la captura a una UX externa y reporta lo enviado.
+
+    Args:
+        args: Argumentos de línea de comandos.
+
+    Returns:
+        Código de salida del proceso.
+    """
+    host, puerto = _parsear_destino(args.destino)
+    reproductor = ReproductorCapturas(
+        cargar_captura(args.captura), host, puerto,
+        velocidad=None if args.maximo else args.velocidad
+    )
+    inicio = time.monotonic()
+    reproductor.ejecutar()
+    duracion = time.monotonic() - inicio
+
+    print(f"Mensajes enviados:    {reproductor.enviados}")
+    print(f"Duración:             {duracion:.3f} s")
+    return 1 if reproductor.error else 0
+
+
+def medir_ingesta(args: argparse.Namespace) -> int:
+    """Reproduce la captura contra una UX en proceso y reporta métricas.
+
+    Args:
+        args: Argumentos de línea de comandos.
+
+    Returns:
+        Código de salida: 0 si todos los mensajes se procesaron.
+    """
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    puerto = _puerto_libre()
+    factory = ComponenteFactoryUX(replace(ConfigUX.defaults(), puerto_recv=puerto))
+
+    paneles = factory.crear_todos_paneles()
+    servidor = factory.crear_servidor_estado(host="127.0.0.1")
+    cliente = factory.crear_cliente_comandos()
+    coordinador = UXCoordinator(paneles, servidor, cliente)
+    # Después del coordinador: mide cuando _on_estado_recibido ya terminó
+    medidor = MedidorIngesta(servidor)
+
+    if not servidor.start():
+        logger.error("No se pudo iniciar ServidorEstado en el puerto %d", puerto)
+        return 1
+
+    reproductor = ReproductorCapturas(
+        cargar_captura(args.captura), "127.0.0.1", puerto,
+        velocidad=None if args.maximo else args.velocidad
+    )
+    limite = time.monotonic() + args.timeout
+    bucle = QEventLoop()
+
+    def verificar_fin() -> None:
+        """Termina cuando la UX procesó todo lo enviado (o vence el timeout)."""
+        enviado = reproductor.esperar(0)
+        if (enviado and medidor.procesados >= reproductor.enviados) \
+                or time.monotonic() > limite:
+            bucle.quit()
+
+    sondeo = QTimer()
+    sondeo.timeout.connect(verificar_fin)
+    sondeo.start(INTERVALO_SONDEO_MS)
+    reproductor.iniciar()
+    bucle.exec()
+    sondeo.stop()
+    reproductor.detener()
+    servidor.stop()
+
+    resultado = calcular_resultado(reproductor.tiempos_envio_ns, medidor.eventos)
+    print(resultado.resumen())
+
+    if reproductor.error or resultado.procesados < resultado.enviados:
+        logger.error(
+            "Reproducción incompleta: %d de %d mensajes procesados",
+            resultado.procesados, resultado.enviados
+        )
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Función principal de la reproducción de capturas.
+
+    Args:
+        argv: Argumentos de línea de comandos (opcional).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    args = parsear_argumentos(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if args.destino:
+        return enviar_a_destino(args)
+    return medir_ingesta(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
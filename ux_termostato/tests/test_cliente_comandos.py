@@ -263,3 +263,19 @@ class TestMultiplesEnvios:
         assert json_enviados[1]["comando"] == "set_temp_deseada"
         assert json_enviados[2]["comando"] == "set_modo_display"
         assert json_enviados[3]["comando"] == "power"
+
+
+class TestReutilizacionClientes:
+    """Tests de reutilización del cliente TCP por puerto."""
+
+    def test_mismo_puerto_reutiliza_cliente(self, qapp):
+        """Verifica que no se cree un EphemeralSocketClient por comando."""
+        with patch('app.comunicacion.cliente_comandos.EphemeralSocketClient') as mock:
+            mock.return_value.send = Mock(return_value=True)
+            cliente = ClienteComandos("192.168.1.50", 14000)
+
+            cliente.enviar_comando(ComandoSetModoDisplay(modo="ambiente"))
+            cliente.enviar_comando(ComandoSetModoDisplay(modo="deseada"))
+
+            assert mock.call_count == 1
+            assert mock.return_value.send.call_count == 2
@@ -5,6 +5,8 @@ Valida la creación, parsing desde dict, validaciones y valores por defecto
 de la configuración de la aplicación UX Termostato.
 """
 
+from dataclasses import replace
+
 import pytest
 
 from app.configuracion import ConfigUX
@@ -72,6 +74,26 @@ class TestFromDict:
         assert config.temperatura_min_setpoint == 10.0
         assert config.temperatura_max_setpoint == 35.0
         assert config.temperatura_setpoint_inicial == 25.0
+        assert config.ruta_captura is None
+
+    def test_from_dict_con_ruta_captura(self):
+        """Debe leer la ruta de captura de tráfico opcional."""
+        data = {
+            "raspberry_pi": {"ip": "127.0.0.1"},
+            "puertos": {"visualizador_temperatura": 14001, "selector_temperatura": 14000},
+            "ux_termostato": {
+                "intervalo_recepcion_ms": 500,
+                "intervalo_actualizacion_ui_ms": 100,
+                "temperatura_minima_setpoint": 15.0,
+                "temperatura_maxima_setpoint": 30.0,
+                "temperatura_setpoint_inicial": 22.0,
+                "ruta_captura": "capturas/sesion.bin",
+            },
+        }
+
+        config = ConfigUX.from_dict(data)
+
+        assert config.ruta_captura == "capturas/sesion.bin"
 
     def test_from_dict_con_estructura_real_config_json(self):
         """Debe parsear estructura real de config.json del proyecto."""
@@ -100,11 +122,17 @@ class TestFromDict:
         assert config.ip_raspberry == "127.0.0.1"
         assert config.puerto_recv == 14001
         assert config.puerto_send == 14000
+        assert config.historial_max_puntos == 100
 
 
 class TestValidaciones:
     """Tests de validaciones de rangos y valores."""
 
+    def test_historial_max_puntos_no_positivo(self):
+        """Debe lanzar ValueError si historial_max_puntos <= 0."""
+        with pytest.raises(ValueError, match="historial_max_puntos debe ser positivo"):
+            replace(ConfigUX.defaults(), historial_max_puntos=0)
+
     def test_puerto_recv_fuera_de_rango_bajo(self):
         """Debe lanzar ValueError si puerto_recv < 1."""
         with pytest.raises(ValueError, match="puerto_recv fuera de rango"):
@@ -9,7 +9,8 @@ import pytest
 from PyQt6.QtCore import pyqtSignal, QObject
 
 from app.coordinator import UXCoordinator
-from app.dominio import EstadoTermostato, ComandoPower, ComandoSetTemp
+from app.presentacion import LimitadorActualizacionUI
+from app.dominio import EstadoTermostato, ComandoPower, ComandoSetTemp, HistorialEstados
 from datetime import datetime
 
 
@@ -35,6 +36,7 @@ class MockControlador(QObject):
 
     power_cambiado = pyqtSignal(bool)
     temperatura_cambiada = pyqtSignal(float)
+    accion_temperatura = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
@@ -348,3 +350,163 @@ class TestDistribucionEstado:
         mock_paneles["indicadores"][2].actualizar_desde_estado.assert_called_with(
             falla_sensor=True, bateria_baja=True
         )
+
+
+def crear_estado(**cambios):
+    """Crea un EstadoTermostato base con los cambios indicados."""
+    datos = dict(
+        temperatura_actual=22.0,
+        temperatura_deseada=24.0,
+        modo_climatizador="reposo",
+        falla_sensor=False,
+        bateria_baja=False,
+        encendido=True,
+        modo_display="ambiente",
+        timestamp=datetime(2026, 1, 23, 10, 30),
+    )
+    datos.update(cambios)
+    return EstadoTermostato(**datos)
+
+
+class MockControladorDisplay(MockControlador):
+    """Mock de DisplayControlador con cambio de modo de vista."""
+
+    modo_vista_cambiado = pyqtSignal(str)
+
+
+class TestDistribucionDiferencial:
+    """Tests de la distribución solo de campos cambiados."""
+
+    @staticmethod
+    def llamadas(mock_paneles):
+        """Cantidad de actualizaciones recibidas por cada panel."""
+        return {
+            "display": mock_paneles["display"][2].actualizar_desde_estado.call_count,
+            "climatizador": mock_paneles["climatizador"][2].actualizar_desde_estado.call_count,
+            "indicadores": mock_paneles["indicadores"][2].actualizar_desde_estado.call_count,
+            "power": mock_paneles["power"][2].actualizar_modelo.call_count,
+        }
+
+    def test_estado_repetido_no_actualiza_paneles(
+        self, coordinator, mock_servidor, mock_paneles
+    ):
+        """Un estado igual (salvo timestamp) no debe volver a actualizar paneles."""
+        mock_servidor.estado_recibido.emit(crear_estado())
+        mock_servidor.estado_recibido.emit(crear_estado(timestamp=datetime(2026, 1, 1)))
+
+        assert self.llamadas(mock_paneles) == {
+            "display": 1, "climatizador": 1, "indicadores": 1, "power": 1
+        }
+
+    @pytest.mark.parametrize("cambios, esperado", [
+        ({"temperatura_actual": 23.0}, {"display"}),
+        ({"temperatura_deseada": 25.0}, {"display"}),
+        ({"modo_climatizador": "enfriando"}, {"climatizador"}),
+        ({"bateria_baja": True}, {"indicadores"}),
+        ({"falla_sensor": True}, {"display", "indicadores"}),
+        ({"encendido": False}, {"display", "power"}),
+        ({"modo_display": "deseada"}, set()),
+    ])
+    def test_solo_actualiza_paneles_afectados(
+        self, coordinator, mock_servidor, mock_paneles, cambios, esperado
+    ):
+        """Cada campo cambiado debe actualizar solo los paneles que lo usan."""
+        mock_servidor.estado_recibido.emit(crear_estado())
+        mock_servidor.estado_recibido.emit(crear_estado(**cambios))
+
+        actualizados = {
+            panel for panel, n in self.llamadas(mock_paneles).items() if n == 2
+        }
+        assert actualizados == esperado
+        assert coordinator.ultimo_estado == crear_estado(**cambios)
+
+    def test_conexion_establecida_fuerza_actualizacion(
+        self, coordinator, mock_servidor, mock_paneles
+    ):
+        """Tras una reconexión el siguiente estado debe llegar a todos los paneles."""
+        mock_servidor.estado_recibido.emit(crear_estado())
+        mock_servidor.conexion_establecida.emit("192.168.1.50:5000")
+        mock_servidor.estado_recibido.emit(crear_estado())
+
+        assert self.llamadas(mock_paneles) == {
+            "display": 2, "climatizador": 2, "indicadores": 2, "power": 2
+        }
+
+    def test_clic_power_resincroniza_con_estado_sin_cambios(
+        self, coordinator, mock_servidor, mock_paneles
+    ):
+        """Tras un clic local, un estado igual del RPi debe restaurar el panel power."""
+        ctrl_power = mock_paneles["power"][2]
+        mock_servidor.estado_recibido.emit(crear_estado(encendido=True))
+
+        # Clic local: el panel ya se muestra apagado, pero el RPi lo ignora
+        ctrl_power.power_cambiado.emit(False)
+        mock_servidor.estado_recibido.emit(crear_estado(encendido=True))
+
+        assert ctrl_power.actualizar_modelo.call_count == 2
+        ctrl_power.actualizar_modelo.assert_called_with(True)
+
+        # Ya sincronizado: los estados repetidos no lo vuelven a actualizar
+        mock_servidor.estado_recibido.emit(crear_estado(encendido=True))
+        assert ctrl_power.actualizar_modelo.call_count == 2
+        assert mock_paneles["display"][2].actualizar_desde_estado.call_count == 1
+
+    def test_cambio_modo_vista_reaplica_ultimo_estado(
+        self, mock_paneles, mock_servidor, mock_cliente, qapp
+    ):
+        """Al cambiar el modo de vista el display debe recibir el último estado."""
+        ctrl_display = MockControladorDisplay()
+        mock_paneles["display"] = (None, None, ctrl_display)
+        coordinator = UXCoordinator(mock_paneles, mock_servidor, mock_cliente)
+        estado = crear_estado()
+
+        ctrl_display.modo_vista_cambiado.emit("deseada")
+        assert not ctrl_display.actualizar_desde_estado.called
+
+        mock_servidor.estado_recibido.emit(estado)
+        ctrl_display.modo_vista_cambiado.emit("deseada")
+
+        assert ctrl_display.actualizar_desde_estado.call_count == 2
+        ctrl_display.actualizar_desde_estado.assert_called_with(coordinator.ultimo_estado)
+
+
+class TestLimitador:
+    """Tests de la distribución a través de LimitadorActualizacionUI."""
+
+    def test_estados_pasan_por_el_limitador(
+        self, mock_paneles, mock_servidor, mock_cliente, qtbot
+    ):
+        """Una ráfaga debe llegar a los paneles como el primer y el último estado."""
+        limitador = LimitadorActualizacionUI(intervalo_ms=50)
+        coordinator = UXCoordinator(
+            mock_paneles, mock_servidor, mock_cliente, limitador=limitador
+        )
+        ctrl_display = mock_paneles["display"][2]
+
+        for temperatura in (20.0, 21.0, 22.0, 23.0):
+            mock_servidor.estado_recibido.emit(crear_estado(temperatura_actual=temperatura))
+
+        assert ctrl_display.actualizar_desde_estado.call_count == 1
+        qtbot.waitUntil(lambda: ctrl_display.actualizar_desde_estado.call_count == 2)
+        assert coordinator.ultimo_estado.temperatura_actual == 23.0
+        assert coordinator.limitador.descartados == 2
+
+
+class TestHistorial:
+    """Tests del registro de estados en HistorialEstados."""
+
+    def test_registra_todos_los_estados(
+        self, mock_paneles, mock_servidor, mock_cliente, qapp
+    ):
+        """Cada estado recibido debe registrarse, aunque se limite o no cambie."""
+        historial = HistorialEstados(capacidad=10)
+        coordinator = UXCoordinator(
+            mock_paneles, mock_servidor, mock_cliente,
+            limitador=LimitadorActualizacionUI(intervalo_ms=1000), historial=historial
+        )
+
+        for temperatura in (20.0, 21.0, 21.0):
+            mock_servidor.estado_recibido.emit(crear_estado(temperatura_actual=temperatura))
+
+        assert coordinator.historial is historial
+        assert historial.ventana().temperatura_actual.tolist() == [20.0, 21.0, 21.0]
@@ -0,0 +1,190 @@
+"""
+Tests unitarios para DecodificadorEstado.
+
+Verifica que el decodificador produzca los mismos objetos y errores que
+`EstadoTermostato.from_json(json.loads(mensaje))`.
+"""
+import json
+
+import pytest
+
+from app.dominio import DecodificadorEstado, EstadoTermostato
+
+
+@pytest.fixture
+def decodificador():
+    """Decodificador nuevo para cada test."""
+    return DecodificadorEstado()
+
+
+@pytest.fixture
+def datos_validos():
+    """Diccionario de estado válido."""
+    return {
+        "temperatura_actual": 22.5,
+        "temperatura_deseada": 24.0,
+        "modo_climatizador": "calentando",
+        "falla_sensor": False,
+        "bateria_baja": False,
+        "encendido": True,
+        "modo_display": "ambiente",
+        "timestamp": "2026-01-23T10:30:00Z",
+    }
+
+
+def decodificar_generico(mensaje):
+    """Camino de referencia: json.loads + from_json."""
+    return EstadoTermostato.from_json(json.loads(mensaje))
+
+
+def resultado(funcion, *args):
+    """Retorna el valor o (tipo, mensaje) de la excepción lanzada."""
+    try:
+        return funcion(*args)
+    except Exception as e:  # pylint: disable=broad-except
+        return type(e), str(e)
+
+
+class TestEquivalencia:
+    """Tests de equivalencia con from_json."""
+
+    def test_estado_valido_identico(self, decodificador, datos_validos):
+        """Verifica igualdad de campos, tipos y repr."""
+        mensaje = json.dumps(datos_validos)
+
+        esperado = decodificar_generico(mensaje)
+        obtenido = decodificador.decodificar(mensaje)
+
+        assert obtenido == esperado
+        assert repr(obtenido) == repr(esperado)
+        assert hash(obtenido) == hash(esperado)
+        assert type(obtenido) is EstadoTermostato
+
+    @pytest.mark.parametrize("cambios", [
+        {"temperatura_actual": 22, "temperatura_deseada": 24},
+        {"falla_sensor": 1, "bateria_baja": 0, "encendido": "si"},
+        {"timestamp": "2026-01-23T10:30:00.123456+00:00"},
+        {"timestamp": "2026-01-23T10:30:00"},
+        {"modo_climatizador": "reposo", "modo_display": "deseada"},
+    ])
+    def test_conversiones_identicas(self, decodificador, datos_validos, cambios):
+        """Verifica las mismas conversiones de tipo que from_json."""
+        mensaje = json.dumps({**datos_validos, **cambios})
+
+        esperado = decodificar_generico(mensaje)
+        obtenido = decodificador.decodificar(mensaje)
+
+        assert obtenido == esperado
+        assert [type(v) for v in vars(obtenido).values()] == \
+            [type(v) for v in vars(esperado).values()]
+
+    @pytest.mark.parametrize("cambios", [
+        {"temperatura_actual": 90.0},
+        {"temperatura_actual": "NaN"},
+        {"temperatura_actual": "calor"},
+        {"temperatura_actual": None},
+        {"temperatura_deseada": 10.0},
+        {"modo_climatizador": "turbo"},
+        {"modo_display": "exterior"},
+        {"timestamp": "ayer"},
+        {"temperatura_actual": 90.0, "modo_display": "exterior"},
+    ])
+    def test_errores_identicos(self, decodificador, datos_validos, cambios):
+        """Verifica el mismo tipo y mensaje de error."""
+        mensaje = json.dumps({**datos_validos, **cambios})
+
+        esperado = resultado(decodificar_generico, mensaje)
+        obtenido = resultado(decodificador.decodificar, mensaje)
+
+        assert isinstance(esperado, tuple)
+        assert obtenido == esperado
+
+    @pytest.mark.parametrize("campo", [
+        "timestamp", "temperatura_actual", "modo_climatizador", "encendido",
+    ])
+    def test_campo_faltante_identico(self, decodificador, datos_validos, campo):
+        """Verifica el KeyError por campo faltante."""
+        del datos_validos[campo]
+        mensaje = json.dumps(datos_validos)
+
+        assert resultado(decodificador.decodificar, mensaje) == \
+            resultado(decodificar_generico, mensaje)
+
+    @pytest.mark.parametrize("mensaje", ['{"temperatura_actual": ', "[1, 2]", "42"])
+    def test_json_invalido_identico(self, decodificador, mensaje):
+        """Verifica los errores de JSON malformado o que no es un objeto."""
+        assert resultado(decodificador.decodificar, mensaje) == \
+            resultado(decodificar_generico, mensaje)
+
+
+class TestCacheTimestamps:
+    """Tests de la caché de timestamps."""
+
+    def test_reutiliza_timestamp_repetido(self, decodificador, datos_validos):
+        """Verifica que un timestamp repetido no se vuelva a parsear."""
+        primero = decodificador.desde_dict(datos_validos)
+        segundo = decodificador.desde_dict({**datos_validos, "temperatura_actual": 23.0})
+
+        assert segundo.timestamp is primero.timestamp
+
+    def test_cache_acotada(self, datos_validos):
+        """Verifica que la caché no crezca sin límite."""
+        decodificador = DecodificadorEstado(max_timestamps_cache=4)
+
+        for segundo in range(10):
+            decodificador.desde_dict(
+                {**datos_validos, "timestamp": f"2026-01-23T10:30:{segundo:02d}Z"}
+            )
+
+        assert len(decodificador._timestamps) <= 4  # pylint: disable=protected-access
+
+
+class TestDecodificarLote:
+    """Tests de decodificación por lotes."""
+
+    def test_lote_valido(self, decodificador, datos_validos):
+        """Verifica un estado por mensaje, en orden."""
+        mensajes = [
+            json.dumps({**datos_validos, "temperatura_actual": t})
+            for t in (20.0, 21.0, 22.0)
+        ]
+
+        estados = decodificador.decodificar_lote(mensajes)
+
+        assert estados == [decodificar_generico(m) for m in mensajes]
+
+    def test_lote_con_errores_los_reporta_en_su_posicion(
+        self, decodificador, datos_validos
+    ):
+        """Verifica que los errores no afecten al resto del lote."""
+        mensajes = [
+            json.dumps(datos_validos),
+            json.dumps({**datos_validos, "modo_display": "exterior"}),
+            '{"temperatura_actual": ',
+            json.dumps(datos_validos),
+        ]
+
+        resultados = decodificador.decodificar_lote(mensajes)
+
+        assert resultados[0] == decodificar_generico(mensajes[0])
+        assert resultados[3] == decodificar_generico(mensajes[3])
+        for indice in (1, 2):
+            esperado = resultado(decodificar_generico, mensajes[indice])
+            assert (type(resultados[indice]), str(resultados[indice])) == esperado
+
+    @pytest.mark.parametrize("mensajes", [
+        ["1,2", "[3", "4]"],
+        ['{"a": "}', '{"}', "{},{}"],
+        [" {} ", "{}\n", b"{}"],
+    ])
+    def test_mensajes_incompletos_no_se_combinan(self, decodificador, mensajes):
+        """Verifica errores idénticos aunque los mensajes unidos formen JSON válido."""
+        resultados = decodificador.decodificar_lote(mensajes)
+
+        assert [(type(r), str(r)) for r in resultados] == [
+            resultado(decodificar_generico, m) for m in mensajes
+        ]
+
+    def test_lote_vacio(self, decodificador):
+        """Verifica un lote vacío."""
+        assert decodificador.decodificar_lote([]) == []
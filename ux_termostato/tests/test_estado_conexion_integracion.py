@@ -118,12 +118,12 @@ class TestIntegracionMVC:
         # Iniciar pulso
         controlador.conectando()
         assert vista._pulso_activo is True
-        assert vista._timer_pulso is not None
+        assert vista._suscripcion_pulso is not None
 
         # Cambiar a conectado (debe detener pulso)
         controlador.conexion_establecida("192.168.1.50")
         assert vista._pulso_activo is False
-        assert vista._timer_pulso is None
+        assert vista._suscripcion_pulso is None
 
     def test_multiples_reconexiones(self, qapp, qtbot):
         """Múltiples ciclos de conexión/desconexión."""
@@ -5,8 +5,9 @@ Valida creación de widgets, actualización desde modelo y animaciones.
 """
 
 import pytest
-from PyQt6.QtCore import QTimer
 
+from compartido.scheduling import VirtualClock
+from compartido.widgets.animation_clock import AnimationClock
 from compartido.widgets.led_indicator import LEDIndicator
 from compartido.widgets.led_color_provider import LEDColor
 from app.presentacion.paneles.estado_conexion import (
@@ -144,8 +145,7 @@ class TestActualizacionConectando:
         vista.actualizar(modelo)
 
         assert vista._pulso_activo is True
-        assert vista._timer_pulso is not None
-        assert vista._timer_pulso.isActive()
+        assert vista._suscripcion_pulso is not None
 
         # Limpiar
         vista._detener_pulso()
@@ -154,28 +154,46 @@ class TestActualizacionConectando:
 class TestAnimacionPulso:
     """Tests de animación de pulso."""
 
-    def test_iniciar_pulso_crea_timer(self, qapp):
-        """Iniciar pulso debe crear timer."""
-        vista = EstadoConexionVista()
+    @pytest.fixture
+    def reloj_virtual(self, qapp):
+        """Reloj virtual que solo avanza con advance()."""
+        return VirtualClock()
+
+    @pytest.fixture
+    def reloj_animacion(self, reloj_virtual):
+        """Reloj de animación sobre el reloj virtual."""
+        return AnimationClock(clock=reloj_virtual)
 
+    def test_iniciar_pulso_suscribe_al_reloj(self, qapp, reloj_animacion):
+        """Iniciar pulso debe suscribirse al reloj de animación."""
+        vista = EstadoConexionVista(reloj_animacion=reloj_animacion)
+
+        vista._iniciar_pulso()
         vista._iniciar_pulso()
 
-        assert vista._timer_pulso is not None
-        assert isinstance(vista._timer_pulso, QTimer)
-        assert vista._timer_pulso.isActive()
+        assert vista._suscripcion_pulso is not None
+        assert reloj_animacion.subscriber_count == 1
+        assert reloj_animacion.active
 
         # Limpiar
         vista._detener_pulso()
 
-    def test_detener_pulso_para_timer(self, qapp):
-        """Detener pulso debe parar timer."""
-        vista = EstadoConexionVista()
+    def test_detener_pulso_cancela_suscripcion(self, qapp, reloj_animacion):
+        """Detener pulso debe cancelar la suscripción y dejar el reloj inactivo."""
+        vista = EstadoConexionVista(reloj_animacion=reloj_animacion)
 
         vista._iniciar_pulso()
         vista._detener_pulso()
 
         assert vista._pulso_activo is False
-        assert vista._timer_pulso is None
+        assert vista._suscripcion_pulso is None
+        assert not reloj_animacion.active
+
+    def test_usa_reloj_compartido_por_defecto(self, qapp):
+        """Sin reloj inyectado se usa el AnimationClock compartido."""
+        vista = EstadoConexionVista()
+
+        assert vista._reloj_animacion is AnimationClock.shared()
 
     def test_cambio_a_conectado_detiene_pulso(self, qapp):
         """Cambio de conectando a conectado debe detener pulso."""
@@ -190,23 +208,20 @@ class TestAnimacionPulso:
         modelo_conectado = EstadoConexionModelo(estado="conectado")
         vista.actualizar(modelo_conectado)
         assert vista._pulso_activo is False
-        assert vista._timer_pulso is None
+        assert vista._suscripcion_pulso is None
 
-    def test_toggle_pulso_cambia_estado_led(self, qapp, qtbot):
-        """Toggle pulso debe cambiar estado del LED."""
-        vista = EstadoConexionVista()
+    def test_toggle_pulso_cambia_estado_led(self, qapp, reloj_animacion, reloj_virtual):
+        """Toggle pulso debe cambiar estado del LED en cada periodo."""
+        vista = EstadoConexionVista(reloj_animacion=reloj_animacion)
         modelo = EstadoConexionModelo(estado="conectando")
 
         vista.actualizar(modelo)
 
-        # Guardar estado inicial
-        estado_inicial = vista._led.state
-
-        # Esperar un toggle (500ms)
-        qtbot.wait(600)
-
-        # Estado debe haber cambiado
-        assert vista._led.state != estado_inicial
+        # Fase 1 (impar): apagado; fase 2 (par): encendido
+        reloj_virtual.advance(0.5)
+        assert vista._led.state is False
+        reloj_virtual.advance(0.5)
+        assert vista._led.state is True
 
         # Limpiar
         vista._detener_pulso()
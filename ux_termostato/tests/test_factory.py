@@ -4,11 +4,17 @@ Tests del módulo Factory (ComponenteFactoryUX).
 Valida la creación de componentes de comunicación y paneles MVC.
 """
 
+from dataclasses import replace
+
 import pytest
 
+from compartido.networking import TrafficRecorder
+
 from app.factory import ComponenteFactoryUX
 from app.configuracion import ConfigUX
 from app.comunicacion import ServidorEstado, ClienteComandos
+from app.dominio import HistorialEstados
+from app.presentacion import LimitadorActualizacionUI
 from app.presentacion.paneles.display import DisplayModelo, DisplayVista, DisplayControlador
 from app.presentacion.paneles.climatizador import (
     ClimatizadorModelo,
@@ -85,6 +91,30 @@ class TestCrearServidor:
 
         assert isinstance(servidor, ServidorEstado)
 
+    def test_crear_servidor_estado_sin_captura(self, factory, qapp):
+        """Sin ruta_captura el servidor no graba tráfico."""
+        servidor = factory.crear_servidor_estado()
+
+        assert servidor.recorder is None
+
+    def test_crear_servidor_estado_con_captura(self, config, tmp_path, qapp):
+        """Con ruta_captura el servidor graba en ese archivo."""
+        ruta = tmp_path / "sesion.bin"
+        factory = ComponenteFactoryUX(replace(config, ruta_captura=str(ruta)))
+
+        servidor = factory.crear_servidor_estado()
+
+        try:
+            assert isinstance(servidor.recorder, TrafficRecorder)
+            assert servidor.recorder.path == ruta
+        finally:
+            servidor.recorder.close()
+
+    def test_crear_grabador_trafico_sin_ruta_falla(self, factory):
+        """crear_grabador_trafico() requiere ruta_captura."""
+        with pytest.raises(ValueError):
+            factory.crear_grabador_trafico()
+
 
 class TestCrearCliente:
     """Tests de creación de ClienteComandos."""
@@ -105,6 +135,28 @@ class TestCrearCliente:
         assert cliente.host == "192.168.1.100"
 
 
+class TestCrearHistorial:
+    """Tests de creación de HistorialEstados."""
+
+    def test_crear_historial_usa_historial_max_puntos(self, factory):
+        """Debe crear el historial con la capacidad de config."""
+        historial = factory.crear_historial_estados()
+
+        assert isinstance(historial, HistorialEstados)
+        assert historial.capacidad == factory.config.historial_max_puntos
+
+
+class TestCrearLimitador:
+    """Tests de creación de LimitadorActualizacionUI."""
+
+    def test_crear_limitador_usa_intervalo_de_config(self, factory, qapp):
+        """Debe crear el limitador con intervalo_actualizacion_ui_ms."""
+        limitador = factory.crear_limitador_ui()
+
+        assert isinstance(limitador, LimitadorActualizacionUI)
+        assert limitador.intervalo_ms == factory.config.intervalo_actualizacion_ui_ms
+
+
 class TestCrearPaneles:
     """Tests de creación de paneles MVC."""
 
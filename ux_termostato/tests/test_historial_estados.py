@@ -0,0 +1,171 @@
+"""
+Tests unitarios para HistorialEstados.
+
+Verifica el buffer circular en columnas, las ventanas sin copia y las
+consultas por rango de tiempo.
+"""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.dominio import EstadoTermostato, HistorialEstados
+
+INICIO = datetime(2026, 1, 23, 10, 30, tzinfo=timezone.utc)
+
+
+def crear_estado(segundo, **cambios):
+    """Estado con timestamp INICIO + segundo y temperatura 20 + segundo."""
+    datos = dict(
+        temperatura_actual=20.0 + segundo,
+        temperatura_deseada=24.0,
+        modo_climatizador="calentando",
+        falla_sensor=False,
+        bateria_baja=False,
+        encendido=True,
+        modo_display="ambiente",
+        timestamp=INICIO + timedelta(seconds=segundo),
+    )
+    datos.update(cambios)
+    return EstadoTermostato(**datos)
+
+
+def llenar(historial, cantidad):
+    """Agrega estados con segundos 0..cantidad-1."""
+    for segundo in range(cantidad):
+        historial.agregar(crear_estado(segundo))
+
+
+class TestCreacion:
+    """Tests de creación."""
+
+    def test_vacio(self):
+        """Verifica el historial recién creado."""
+        historial = HistorialEstados(capacidad=5)
+
+        assert len(historial) == 0
+        assert historial.capacidad == 5
+        assert len(historial.ventana()) == 0
+        assert len(historial.rango()) == 0
+
+    @pytest.mark.parametrize("capacidad", [0, -1])
+    def test_capacidad_invalida(self, capacidad):
+        """Verifica que la capacidad deba ser positiva."""
+        with pytest.raises(ValueError, match="capacidad"):
+            HistorialEstados(capacidad=capacidad)
+
+
+class TestAgregar:
+    """Tests del buffer circular."""
+
+    def test_columnas(self):
+        """Verifica que cada campo quede en su columna."""
+        historial = HistorialEstados(capacidad=5)
+        historial.agregar(crear_estado(0))
+        historial.agregar(crear_estado(
+            1, modo_climatizador="enfriando", modo_display="deseada",
+            falla_sensor=True, bateria_baja=True, encendido=False,
+        ))
+
+        ventana = historial.ventana()
+
+        assert ventana.tiempo.tolist() == [INICIO.timestamp(), INICIO.timestamp() + 1]
+        assert ventana.temperatura_actual.tolist() == [20.0, 21.0]
+        assert ventana.temperatura_deseada.tolist() == [24.0, 24.0]
+        assert ventana.falla_sensor.tolist() == [False, True]
+        assert ventana.bateria_baja.tolist() == [False, True]
+        assert ventana.encendido.tolist() == [True, False]
+        assert ventana.modos_climatizador().tolist() == ["calentando", "enfriando"]
+        assert ventana.modos_display().tolist() == ["ambiente", "deseada"]
+
+    @pytest.mark.parametrize("cantidad", [3, 5, 7, 12])
+    def test_conserva_los_ultimos(self, cantidad):
+        """Verifica el descarte de los más antiguos al dar la vuelta."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, cantidad)
+
+        esperado = [20.0 + s for s in range(max(0, cantidad - 5), cantidad)]
+        assert historial.ventana().temperatura_actual.tolist() == esperado
+        assert len(historial) == min(cantidad, 5)
+        assert historial.total_agregados == cantidad
+
+    def test_limpiar(self):
+        """Verifica el descarte de todos los estados."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 7)
+
+        historial.limpiar()
+        historial.agregar(crear_estado(30))
+
+        assert historial.ventana().temperatura_actual.tolist() == [50.0]
+
+
+class TestVentana:
+    """Tests de ventanas sin copia."""
+
+    def test_ultimos_n(self):
+        """Verifica la ventana de los últimos n estados tras dar la vuelta."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 8)
+
+        assert historial.ventana(3).temperatura_actual.tolist() == [25.0, 26.0, 27.0]
+        assert len(historial.ventana(50)) == 5
+        assert len(historial.ventana(0)) == 0
+
+    def test_sin_copia_y_solo_lectura(self):
+        """Verifica que la ventana sea una vista de solo lectura."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 8)
+
+        ventana = historial.ventana()
+
+        assert not ventana.temperatura_actual.flags.owndata
+        assert ventana.temperatura_actual.flags.c_contiguous
+        with pytest.raises(ValueError):
+            ventana.temperatura_actual[0] = 0.0
+
+    def test_ventana_estable_mientras_quede_capacidad(self):
+        """Una ventana de n estados no cambia en los siguientes capacidad - n agregados."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 7)
+        ventana = historial.ventana(2)
+        antes = ventana.temperatura_actual.copy()
+
+        for segundo in range(7, 10):
+            historial.agregar(crear_estado(segundo))
+
+        np.testing.assert_array_equal(ventana.temperatura_actual, antes)
+
+
+class TestRango:
+    """Tests de consultas por tiempo."""
+
+    def test_rango_inclusivo(self):
+        """Verifica los extremos inclusivos con datetime."""
+        historial = HistorialEstados(capacidad=10)
+        llenar(historial, 10)
+
+        ventana = historial.rango(
+            INICIO + timedelta(seconds=3), INICIO + timedelta(seconds=5)
+        )
+
+        assert ventana.temperatura_actual.tolist() == [23.0, 24.0, 25.0]
+
+    def test_rango_abierto_y_en_segundos(self):
+        """Verifica límites omitidos y expresados en segundos."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 8)
+
+        desde = historial.rango(desde=INICIO.timestamp() + 6.5)
+        hasta = historial.rango(hasta=INICIO + timedelta(seconds=4))
+
+        assert desde.temperatura_actual.tolist() == [27.0]
+        assert hasta.temperatura_actual.tolist() == [23.0, 24.0]
+
+    def test_rango_sin_estados(self):
+        """Verifica un rango fuera del historial o invertido."""
+        historial = HistorialEstados(capacidad=5)
+        llenar(historial, 5)
+
+        assert len(historial.rango(desde=INICIO + timedelta(hours=1))) == 0
+        assert len(historial.rango(INICIO + timedelta(seconds=3), INICIO)) == 0
@@ -6,7 +6,9 @@ verificando la creación de widgets, actualización visual y estilos.
 """
 
 import pytest
-from PyQt6.QtCore import QTimer
+
+from compartido.scheduling import VirtualClock
+from compartido.widgets import AnimationClock
 
 from app.presentacion.paneles.indicadores.modelo import IndicadoresModelo
 from app.presentacion.paneles.indicadores.vista import IndicadoresVista, AlertLED
@@ -81,7 +83,7 @@ class TestAlertLED:
 
         assert alert.led.state is True
         assert alert._animacion_activa is True
-        assert alert._timer_pulso.isActive()
+        assert alert._suscripcion_pulso is not None
 
     def test_detener_pulso(self, qapp):
         """Verifica que se pueda detener la animación pulsante."""
@@ -94,7 +96,27 @@ class TestAlertLED:
         # Detener pulso
         alert.set_estado(activo=False, pulsar=False)
         assert alert._animacion_activa is False
-        assert not alert._timer_pulso.isActive()
+        assert alert._suscripcion_pulso is None
+
+    def test_alertas_pulsan_sincronizadas(self, qapp):
+        """Dos alertas pulsantes comparten el reloj y parpadean al unísono."""
+        reloj_virtual = VirtualClock()
+        reloj = AnimationClock(clock=reloj_virtual)
+        sensor = AlertLED("Sensor", LEDColor.RED, reloj_animacion=reloj)
+        bateria = AlertLED("Batería", LEDColor.YELLOW, reloj_animacion=reloj)
+        sensor.set_estado(activo=True, pulsar=True)
+        reloj_virtual.advance(0.2)
+        bateria.set_estado(activo=True, pulsar=True)
+
+        for _ in range(3):
+            reloj_virtual.advance(0.5)
+            assert sensor.led.state == bateria.led.state
+
+        assert reloj.wakeups == 3
+
+        sensor.set_estado(activo=False)
+        bateria.set_estado(activo=False)
+        assert not reloj.active
 
 
 class TestActualizacion:
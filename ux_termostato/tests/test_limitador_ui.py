@@ -0,0 +1,98 @@
+"""
+Tests unitarios para LimitadorActualizacionUI.
+
+Verifica la entrega inmediata, la coalescencia de ráfagas y los
+contadores de estados descartados.
+"""
+import pytest
+
+from app.presentacion import LimitadorActualizacionUI
+
+
+@pytest.fixture
+def limitador(qapp):
+    """Limitador de 50 ms con registro de los estados entregados."""
+    limitador = LimitadorActualizacionUI(intervalo_ms=50)
+    limitador.entregas = []
+    limitador.estado_listo.connect(limitador.entregas.append)
+    return limitador
+
+
+class TestCreacion:
+    """Tests de creación."""
+
+    def test_intervalo(self, limitador):
+        """Verifica el intervalo y los contadores iniciales."""
+        assert limitador.intervalo_ms == 50
+        assert (limitador.recibidos, limitador.entregados, limitador.descartados) == (0, 0, 0)
+        assert not limitador.hay_pendiente
+
+    @pytest.mark.parametrize("intervalo", [0, -10])
+    def test_intervalo_invalido(self, qapp, intervalo):
+        """Verifica que el intervalo deba ser positivo."""
+        with pytest.raises(ValueError, match="intervalo_ms"):
+            LimitadorActualizacionUI(intervalo_ms=intervalo)
+
+
+class TestEntrega:
+    """Tests de la entrega de estados."""
+
+    def test_primer_estado_inmediato(self, limitador):
+        """El primer estado se entrega sin esperar."""
+        limitador.recibir("a")
+
+        assert limitador.entregas == ["a"]
+        assert not limitador.hay_pendiente
+
+    def test_rafaga_entrega_el_ultimo(self, limitador, qtbot):
+        """Dentro del intervalo solo se conserva el último estado."""
+        for estado in "abcd":
+            limitador.recibir(estado)
+
+        assert limitador.entregas == ["a"]
+        assert limitador.hay_pendiente
+
+        qtbot.waitUntil(lambda: len(limitador.entregas) == 2, timeout=1000)
+
+        assert limitador.entregas == ["a", "d"]
+        assert (limitador.recibidos, limitador.entregados, limitador.descartados) == (4, 2, 2)
+
+    def test_respeta_intervalo(self, limitador, qtbot):
+        """Un estado pendiente no se entrega antes de que venza el intervalo."""
+        limitador.recibir("a")
+        limitador.recibir("b")
+
+        qtbot.wait(20)
+        assert limitador.entregas == ["a"]
+
+        qtbot.waitUntil(lambda: limitador.entregas == ["a", "b"], timeout=1000)
+
+    def test_estado_tras_intervalo_inmediato(self, limitador, qtbot):
+        """Pasado el intervalo, un estado nuevo se entrega sin esperar."""
+        limitador.recibir("a")
+        qtbot.wait(60)
+
+        limitador.recibir("b")
+
+        assert limitador.entregas == ["a", "b"]
+        assert limitador.descartados == 0
+
+    def test_vaciar_entrega_pendiente(self, limitador):
+        """vaciar() entrega el pendiente sin esperar y detiene el timer."""
+        limitador.recibir("a")
+        limitador.recibir("b")
+
+        limitador.vaciar()
+        limitador.vaciar()
+
+        assert limitador.entregas == ["a", "b"]
+
+    def test_reiniciar_contadores(self, limitador):
+        """Verifica la puesta en cero de los contadores."""
+        limitador.recibir("a")
+        limitador.recibir("b")
+
+        limitador.reiniciar_contadores()
+
+        assert (limitador.recibidos, limitador.entregados, limitador.descartados) == (0, 0, 0)
+        assert limitador.hay_pendiente
@@ -0,0 +1,187 @@
+"""
+Tests de la reproducción de capturas y la medición de ingesta.
+
+Usan sockets reales en localhost contra un ServidorEstado.
+"""
+import json
+import socket
+
+import pytest
+
+from compartido.networking import TrafficRecorder
+
+from app.comunicacion import (
+    MedidorIngesta,
+    ReproductorCapturas,
+    ServidorEstado,
+    calcular_resultado,
+    cargar_captura,
+)
+import run_replay
+
+
+def puerto_libre():
+    """Obtiene un puerto libre del sistema."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def estado_json(temperatura, segundo=0):
+    """Estado del termostato serializado como lo envía el RPi."""
+    return json.dumps({
+        "temperatura_actual": temperatura,
+        "temperatura_deseada": 24.0,
+        "modo_climatizador": "reposo",
+        "falla_sensor": False,
+        "bateria_baja": False,
+        "encendido": True,
+        "modo_display": "ambiente",
+        "timestamp": f"2026-01-23T10:30:{segundo:02d}Z",
+    })
+
+
+@pytest.fixture
+def captura_jsonl(tmp_path):
+    """Captura JSON Lines de cinco estados, uno por segundo."""
+    ruta = tmp_path / "estados.jsonl"
+    ruta.write_text(
+        "\n".join(estado_json(20.0 + i, segundo=i) for i in range(5)) + "\n",
+        encoding="utf-8",
+    )
+    return ruta
+
+
+@pytest.fixture
+def servidor(qapp):
+    """ServidorEstado iniciado en un puerto libre."""
+    servidor = ServidorEstado("127.0.0.1", puerto_libre())
+    servidor.start()
+    yield servidor
+    servidor.stop()
+
+
+class TestCargarCaptura:
+    """Tests de lectura de capturas."""
+
+    def test_jsonl_usa_timestamp_del_estado(self, captura_jsonl):
+        """Verifica mensajes y tiempos de una captura JSON Lines."""
+        mensajes = list(cargar_captura(captura_jsonl))
+
+        tiempos = [t - mensajes[0][0] for t, _ in mensajes]
+        assert tiempos == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert json.loads(mensajes[2][1])["temperatura_actual"] == 22.0
+
+    def test_jsonl_sin_timestamp(self, tmp_path):
+        """Verifica que un mensaje sin timestamp no tenga tiempo."""
+        ruta = tmp_path / "sin_tiempo.jsonl"
+        ruta.write_text('{"temperatura_actual": 20}\n\n', encoding="utf-8")
+
+        assert list(cargar_captura(ruta)) == [(None, b'{"temperatura_actual": 20}')]
+
+    def test_log_de_trafficrecorder(self, tmp_path):
+        """Verifica la lectura de una captura de ServidorEstado."""
+        ruta = tmp_path / "sesion.bin"
+        with TrafficRecorder(ruta) as grabador:
+            grabador.record("10.0.0.5:5000", estado_json(21.0))
+            grabador.record("10.0.0.5:5000", estado_json(22.0))
+
+        mensajes = list(cargar_captura(ruta))
+
+        assert [m for _, m in mensajes] == [
+            estado_json(21.0).encode(), estado_json(22.0).encode()
+        ]
+        assert mensajes[0][0] <= mensajes[1][0]
+
+
+class TestCalcularResultado:
+    """Tests de las métricas."""
+
+    def test_latencias_y_throughput(self):
+        """Verifica percentiles, errores y throughput."""
+        envios = [i * 10_000_000 for i in range(100)]           # cada 10 ms
+        eventos = [(t + (i + 1) * 1_000_000, True) for i, t in enumerate(envios)]
+        eventos[0] = (eventos[0][0], False)
+
+        resultado = calcular_resultado(envios, eventos)
+
+        assert resultado.enviados == 100
+        assert resultado.procesados == 100
+        assert resultado.errores == 1
+        assert resultado.latencia_p50_ms == 51.0
+        assert resultado.latencia_p95_ms == 96.0
+        assert resultado.latencia_max_ms == 100.0
+        assert resultado.mensajes_por_segundo == pytest.approx(100 / 1.09)
+
+    def test_sin_mensajes_procesados(self):
+        """Verifica el resultado vacío."""
+        resultado = calcular_resultado([1, 2], [])
+
+        assert resultado.enviados == 2
+        assert resultado.procesados == 0
+        assert resultado.mensajes_por_segundo == 0.0
+
+
+class TestReproduccion:
+    """Tests de envío y medición contra ServidorEstado."""
+
+    def test_maxima_velocidad_con_error(self, servidor, tmp_path, qtbot):
+        """Verifica que cada mensaje produzca un evento, válido o no."""
+        ruta = tmp_path / "mixta.jsonl"
+        ruta.write_text(
+            f"{estado_json(20.0)}\n{{\"temperatura_actual\": 1}}\n{estado_json(21.0)}\n",
+            encoding="utf-8",
+        )
+        medidor = MedidorIngesta(servidor)
+        reproductor = ReproductorCapturas(
+            cargar_captura(ruta), "127.0.0.1", servidor.port, velocidad=None
+        )
+
+        reproductor.iniciar()
+        qtbot.waitUntil(lambda: medidor.procesados == 3, timeout=3000)
+
+        assert reproductor.esperar(1.0)
+        assert reproductor.enviados == 3
+        assert [valido for _, valido in medidor.eventos] == [True, False, True]
+        resultado = calcular_resultado(reproductor.tiempos_envio_ns, medidor.eventos)
+        assert resultado.errores == 1
+        assert resultado.latencia_max_ms > 0
+
+    def test_respeta_tiempos_de_la_captura(self, servidor, captura_jsonl, qtbot):
+        """Verifica la separación de los envíos según la velocidad."""
+        medidor = MedidorIngesta(servidor)
+        reproductor = ReproductorCapturas(
+            cargar_captura(captura_jsonl), "127.0.0.1", servidor.port, velocidad=20
+        )
+
+        reproductor.iniciar()
+        qtbot.waitUntil(lambda: medidor.procesados == 5, timeout=3000)
+
+        envios = reproductor.tiempos_envio_ns
+        assert (envios[-1] - envios[0]) / 1e6 >= 195  # 4 s / 20 = 200 ms
+
+    def test_destino_inaccesible(self, qapp):
+        """Verifica que el error de conexión quede registrado."""
+        reproductor = ReproductorCapturas([(None, b"{}")], "127.0.0.1", puerto_libre())
+
+        reproductor.ejecutar()
+
+        assert isinstance(reproductor.error, OSError)
+        assert reproductor.enviados == 0
+
+    def test_velocidad_invalida(self):
+        """Verifica la validación de la velocidad."""
+        with pytest.raises(ValueError):
+            ReproductorCapturas([], "127.0.0.1", 14001, velocidad=0)
+
+
+class TestRunReplay:
+    """Tests del punto de entrada run_replay."""
+
+    def test_mide_ingesta_con_coordinador(self, captura_jsonl, qapp, capsys):
+        """Verifica la reproducción completa y el resumen impreso."""
+        assert run_replay.main([str(captura_jsonl), "--maximo"]) == 0
+
+        salida = capsys.readouterr().out
+        assert "Mensajes procesados:  5 (0 con error)" in salida
+        assert "Latencia p50/p95/p99" in salida
@@ -322,3 +322,38 @@ class TestRobustez:
 
             estado = blocker.args[0]
             assert estado.temperatura_actual == temp
+
+    def test_rafaga_tcp_se_delimita_por_objeto(
+        self, qapp, json_estado_valido, qtbot
+    ):
+        """Verifica que varios JSON en un mismo segmento se procesen por separado."""
+        import socket
+        import time
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            puerto = s.getsockname()[1]
+
+        servidor = ServidorEstado("127.0.0.1", puerto)
+        recibidos = []
+        servidor.estado_recibido.connect(recibidos.append)
+        servidor.iniciar()
+
+        try:
+            rafaga = b"".join(
+                json.dumps(
+                    {**json_estado_valido, "temperatura_actual": temp}
+                ).encode()
+                for temp in (20.0, 21.0, 22.0)
+            )
+            with socket.create_connection(("127.0.0.1", puerto)) as cliente:
+                # Ráfaga pegada + un mensaje partido en dos segmentos
+                cliente.sendall(rafaga + b'{"temperatura_actual": 23.0, ')
+                time.sleep(0.05)
+                resto = json.dumps(json_estado_valido)[1:]
+                cliente.sendall(resto.replace('"temperatura_actual": 22.5, ', "").encode())
+                qtbot.waitUntil(lambda: len(recibidos) == 4, timeout=2000)
+        finally:
+            servidor.detener()
+
+        assert [e.temperatura_actual for e in recibidos] == [20.0, 21.0, 22.0, 23.0]